@@ -7,6 +7,7 @@ import sys
 from PySide6.QtWidgets import QApplication
 
 from .ui.main_window import MainWindow
+from .ui.startup_metrics import get_startup_metrics, watch_first_paint
 from .ui.styles import apply_app_palette
 
 
@@ -30,9 +31,12 @@ def create_qt_app(existing: QApplication | None = None) -> QApplication:
 def run_app() -> int:
     """Launch the Qt application and return the exit code."""
 
+    metrics = get_startup_metrics()
     app = create_qt_app()
     apply_app_palette(app)
     window = MainWindow()
+    metrics.mark("window_constructed")
+    watch_first_paint(window, metrics)
     window.show()
     return app.exec()
 
@@ -199,7 +199,7 @@ class NFLDataRepository:
             "passing_tds", "passing_ints", "rushing_attempts", "rushing_yards",
             "rushing_tds", "receiving_targets", "receiving_receptions", "receiving_yards",
             "receiving_tds", "total_touchdowns", "def_tackles_solo", "def_tackle_assists",
-            "def_sacks", "def_interceptions", "def_tds",
+            "def_tackles_with_assist", "def_sacks", "def_interceptions", "def_tds",
         ]
         
         totals = {}
@@ -242,6 +242,43 @@ class NFLDataRepository:
             seasons=seasons,
         )
     
+    # -------------------------------------------------------------------------
+    # Rating Queries
+    # -------------------------------------------------------------------------
+    
+    def get_rating_baselines(self) -> pl.DataFrame:
+        """Get league mean/std per rating key and metric.
+        
+        Returns:
+            DataFrame with rating_key, metric, mean, std and sample_size columns.
+        """
+        self._ensure_initialized()
+        return self._store.load_rating_baselines()
+
+    def get_player_ratings(
+        self,
+        player_ids: Sequence[str] | None = None,
+        *,
+        seasons: Iterable[int] | None = None,
+        latest_only: bool = False,
+    ) -> pl.DataFrame:
+        """Get precomputed 20-80 ratings per player-season.
+
+        Args:
+            player_ids: Optional list of player IDs to filter.
+            seasons: Optional seasons to filter.
+            latest_only: Keep only each player's most recent rated season.
+
+        Returns:
+            DataFrame with overall/potential and per-metric rating columns.
+        """
+        self._ensure_initialized()
+        return self._store.get_player_ratings(
+            player_ids=player_ids,
+            seasons=seasons,
+            latest_only=latest_only,
+        )
+
     # -------------------------------------------------------------------------
     # Combined Queries
     # -------------------------------------------------------------------------
@@ -399,6 +436,31 @@ class NFLDataRepository:
         """Get current status of the data store."""
         return self._store.get_status()
     
+    def generation(self) -> int:
+        """Return the data store's generation (bumped on every table write).
+        
+        Costs one ``stat`` of metadata.json, so callers can check it before
+        every cache read.
+        """
+        return self._store.generation()
+    
+    def table_generations(self) -> dict[str, int]:
+        """Return the generation at which each store table was last written."""
+        return self._store.table_generations()
+    
+    def is_authoritative(
+        self,
+        tables: Iterable[str] = ("players", "player_seasons"),
+        *,
+        seasons: Iterable[int] | None = None,
+    ) -> bool:
+        """Return True when the store's coverage manifest marks ``tables`` complete.
+        
+        Reads only the cached metadata, so it is cheap enough to call before
+        every fallback decision.
+        """
+        return self._store.is_authoritative(tables, seasons=seasons)
+    
     # -------------------------------------------------------------------------
     # Compatibility Methods (for existing code)
     # -------------------------------------------------------------------------
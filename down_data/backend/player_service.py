@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from functools import cached_property
 import logging
 import math
 import re
+import threading
 
 import polars as pl
 
 from down_data.core import Player, PlayerProfile, PlayerQuery, PlayerNotFoundError
 from down_data.core.ratings import RatingBreakdown
+from down_data.data.player_ratings import (
+    DEFENSE_POSITIONS,
+    OFFENSE_POSITIONS,
+    RATING_BASELINE_SEASON_WINDOW,
+    RATING_CONFIG,
+    RATING_POSITION_GROUPS,
+    baselines_to_mapping,
+)
 from down_data.data.player_bio_cache import (
     load_player_bio_cache,
     upsert_player_bio_entries,
@@ -35,129 +44,25 @@ except ImportError:  # pragma: no cover - imported dynamically in some environme
 
 logger = logging.getLogger(__name__)
 
-_OFFENSE_POSITIONS = {
-    "QB",
-    "RB",
-    "FB",
-    "WR",
-    "TE",
-}
-
-_DEFENSE_POSITIONS = {
-    "DL",
-    "DE",
-    "DT",
-    "NT",
-    "LB",
-    "ILB",
-    "OLB",
-    "MLB",
-    "DB",
-    "CB",
-    "S",
-    "SS",
-    "FS",
-}
-
-_DEFAULT_RATING_SEASON_WINDOW = 3
-
-RATING_CONFIG: dict[str, list[dict[str, object]]] = {
-    "QB": [
-        {
-            "label": "Passing Production",
-            "metrics": [
-                {"label": "Pass Yards", "key": "pass_yards"},
-                {"label": "Total TD", "key": "total_touchdowns"},
-            ],
-        },
-        {
-            "label": "Rushing Threat",
-            "metrics": [
-                {"label": "Rush Yards", "key": "rush_yards"},
-            ],
-        },
-    ],
-    "RB": [
-        {
-            "label": "Rushing Impact",
-            "metrics": [
-                {"label": "Rush Yards", "key": "rush_yards"},
-                {"label": "Total TD", "key": "total_touchdowns"},
-            ],
-        },
-        {
-            "label": "Receiving Support",
-            "metrics": [
-                {"label": "Receiving Yards", "key": "receiving_yards"},
-            ],
-        },
-    ],
-    "WR": [
-        {
-            "label": "Receiving Production",
-            "metrics": [
-                {"label": "Receiving Yards", "key": "receiving_yards"},
-                {"label": "Total TD", "key": "total_touchdowns"},
-            ],
-        },
-        {
-            "label": "Open Field Threat",
-            "metrics": [
-                {"label": "Rush Yards", "key": "rush_yards"},
-            ],
-        },
-    ],
-    "TE": [
-        {
-            "label": "Receiving Production",
-            "metrics": [
-                {"label": "Receiving Yards", "key": "receiving_yards"},
-                {"label": "Total TD", "key": "total_touchdowns"},
-            ],
-        },
-        {
-            "label": "Versatility",
-            "metrics": [
-                {"label": "Rush Yards", "key": "rush_yards"},
-            ],
-        },
-    ],
-    "default_offense": [
-        {
-            "label": "Offensive Production",
-            "metrics": [
-                {"label": "Pass Yards", "key": "pass_yards"},
-                {"label": "Rush Yards", "key": "rush_yards"},
-                {"label": "Receiving Yards", "key": "receiving_yards"},
-                {"label": "Total TD", "key": "total_touchdowns"},
-            ],
-        },
-    ],
-    "defense": [
-        {
-            "label": "Tackling",
-            "metrics": [
-                {"label": "Total Tackles", "key": "def_tackles_total"},
-                {"label": "Solo Tackles", "key": "def_tackles_solo"},
-                {"label": "Assisted Tackles", "key": "def_tackles_assisted"},
-            ],
-        },
-        {
-            "label": "Playmaking",
-            "metrics": [
-                {"label": "Interceptions", "key": "def_interceptions"},
-            ],
-        },
-    ],
-}
-
-RATING_POSITION_GROUPS: dict[str, set[str]] = {
-    "QB": {"QB"},
-    "RB": {"RB", "FB"},
-    "WR": {"WR"},
-    "TE": {"TE"},
-    "default_offense": _OFFENSE_POSITIONS,
-    "defense": _DEFENSE_POSITIONS,
+# Players kept in each warm detail cache (most recently used are retained)
+DETAIL_CACHE_SIZE = 128
+
+# Data store tables each generation-keyed PlayerService cache derives from.
+# Network-backed caches follow player_seasons, which a season refresh rewrites.
+_CACHE_SOURCE_TABLES: dict[str, tuple[str, ...]] = {
+    "_summary_stats_cache": ("players", "player_seasons", "player_impacts", "player_summary"),
+    "_impact_frame_cache": ("player_impacts",),
+    "_qb_impact_cache": ("player_impacts",),
+    "_defense_impact_cache": ("player_impacts",),
+    "_skill_impact_cache": ("player_impacts",),
+    "_offensive_line_impact_cache": ("player_impacts",),
+    "_kicker_impact_cache": ("player_impacts",),
+    "_punter_impact_cache": ("player_impacts",),
+    "_rating_baselines": ("rating_baselines", "player_seasons"),
+    "_stored_rating_baselines": ("rating_baselines", "player_seasons"),
+    "_stats_cache": ("player_seasons",),
+    "_schedule_cache": ("player_seasons",),
+    "_team_record_cache": ("player_seasons",),
 }
 
 
@@ -179,12 +84,31 @@ class PlayerSummary:
         )
 
 
+def _lru_get(cache: OrderedDict, key: object) -> object | None:
+    """Return ``cache[key]`` (marking it most recently used) or ``None``."""
+
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key: object, value: object) -> None:
+    """Store ``value`` and evict the least recently used entries past ``DETAIL_CACHE_SIZE``."""
+
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > DETAIL_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
 class PlayerDirectory:
     """Caches the full nflreadpy player directory for quick search access."""
 
     def __init__(self) -> None:
         self._frame: pl.DataFrame | None = None
         self._contracts: pl.DataFrame | None = None
+        self._frame_lock = threading.Lock()
 
     @staticmethod
     def _to_polars(frame: object) -> pl.DataFrame:
@@ -273,8 +197,23 @@ class PlayerDirectory:
         self._contracts = shaped
         return self._contracts
 
-    @cached_property
+    @property
     def frame(self) -> pl.DataFrame:
+        """The normalised player directory, loaded once on first access.
+
+        The search and filter-option workers can both reach this at startup,
+        so the load runs under a lock and only the first caller performs it.
+        """
+
+        frame = self._frame
+        if frame is not None:
+            return frame
+        with self._frame_lock:
+            if self._frame is None:
+                self._frame = self._load_frame()
+            return self._frame
+
+    def _load_frame(self) -> pl.DataFrame:
         if load_players is None:
             logger.warning("nflreadpy.load_players is unavailable; returning empty frame")
             return pl.DataFrame()
@@ -372,6 +311,7 @@ class PlayerService:
         self.directory = directory or PlayerDirectory()
         self._stats_cache: dict[tuple[str, str, str, str], pl.DataFrame] = {}
         self._rating_baselines: dict[str, dict[str, tuple[float, float]]] = {}
+        self._stored_rating_baselines: dict[str, dict[str, tuple[float, float]]] | None = None
         self._rating_seasons = self._compute_rating_seasons()
         self._schedule_cache: dict[int, pl.DataFrame] = {}
         self._team_record_cache: dict[tuple[str, int, str], tuple[int, int, int]] = {}
@@ -386,8 +326,16 @@ class PlayerService:
         self._player_impact_repository = PlayerImpactRepository()
         self._player_summary_repository = PlayerSummaryRepository()
         self._player_bio_cache: pl.DataFrame | None = None
+        # Warm caches populated by detail loads and speculative prefetches,
+        # bounded to DETAIL_CACHE_SIZE players each
+        self._player_cache: OrderedDict[PlayerQuery, Player] = OrderedDict()
+        self._summary_stats_cache: OrderedDict[str, pl.DataFrame] = OrderedDict()
+        self._impact_frame_cache: OrderedDict[str, pl.DataFrame] = OrderedDict()
         # New unified data repository (preferred data source)
         self._nfl_data_repository: NFLDataRepository | None = None
+        # Data store generations the caches above were filled at
+        self._data_generation: int | None = None
+        self._table_generations: dict[str, int] = {}
 
     @property
     def nfl_data(self) -> NFLDataRepository:
@@ -404,6 +352,41 @@ class PlayerService:
         except Exception:
             return False
 
+    def _sync_data_generation(self) -> None:
+        """Drop cached results whose source tables changed since they were filled.
+
+        Costs a ``stat`` of the data store's metadata while the generation is
+        unchanged, so it runs before every cache read. When a refresh (in this
+        process or the build script) bumps it, only the caches derived from the
+        rewritten tables are cleared.
+        """
+        if not self._use_nfl_datastore():
+            return
+        try:
+            generation = self.nfl_data.generation()
+            if generation == self._data_generation:
+                return
+            table_generations = self.nfl_data.table_generations()
+        except Exception as exc:
+            logger.debug("Failed to read NFL data store generation: %s", exc)
+            return
+
+        if self._data_generation is not None:
+            changed = {
+                table
+                for table in set(table_generations) | set(self._table_generations)
+                if table_generations.get(table, 0) != self._table_generations.get(table, 0)
+            }
+            for name, tables in _CACHE_SOURCE_TABLES.items():
+                if changed.intersection(tables):
+                    cache = getattr(self, name)
+                    if isinstance(cache, dict):
+                        cache.clear()
+                    else:
+                        setattr(self, name, None)
+        self._data_generation = generation
+        self._table_generations = table_generations
+
     def get_all_players(self) -> pl.DataFrame:
         """Get the full player directory as a DataFrame for filtering."""
         return self.directory.frame
@@ -423,11 +406,19 @@ class PlayerService:
         return self.directory.search(name=name, team=team, position=position, limit=limit)
 
     def load_player(self, query: PlayerQuery | PlayerSummary) -> Player:
-        """Instantiate a full Player domain object."""
+        """Instantiate a full Player domain object.
+
+        Resolved players are memoised per query so repeated lookups (for
+        example a prefetch followed by opening the detail page) reuse the
+        same instance instead of resolving the player again.
+        """
 
         resolved_query = query.to_query() if isinstance(query, PlayerSummary) else query
+        cached = _lru_get(self._player_cache, resolved_query)
+        if cached is not None:
+            return cached
         try:
-            return Player(
+            player = Player(
                 name=resolved_query.name,
                 team=resolved_query.team,
                 draft_year=resolved_query.draft_year,
@@ -439,6 +430,36 @@ class PlayerService:
         except Exception:
             logger.exception("Unexpected error initialising Player from query: %s", resolved_query)
             raise
+        _lru_put(self._player_cache, resolved_query, player)
+        return player
+
+    def prefetch_player_detail(self, query: PlayerQuery | PlayerSummary) -> Player | None:
+        """Warm the caches used by the player detail page.
+
+        Resolves the player and loads the summary stats and cached impact rows
+        so a later detail view can be served from memory. Resolving reads the
+        nflreadpy player directory, which downloads it on a cold cache; stats
+        and impacts come from the data store or the local summary and impact
+        caches. Failures are logged and swallowed because prefetching is
+        purely speculative.
+        """
+
+        try:
+            player = self.load_player(query)
+        except Exception as exc:
+            logger.debug("Prefetch failed to resolve %s: %s", query, exc)
+            return None
+
+        player_id = player.profile.gsis_id
+        if not player_id:
+            return player
+
+        try:
+            self.get_player_summary_stats(player_id=player_id)
+            self._get_player_impact_frame(player_id)
+        except Exception as exc:
+            logger.debug("Prefetch failed to warm caches for %s: %s", player_id, exc)
+        return player
 
     def load_player_profile(self, query: PlayerQuery | PlayerSummary) -> PlayerProfile:
         """Convenience method to fetch only the profile information."""
@@ -477,6 +498,7 @@ class PlayerService:
     ) -> pl.DataFrame:
         """Fetch player stats with an internal cache."""
 
+        self._sync_data_generation()
         key = self._stats_cache_key(player, seasons, season_type, summary_level)
         if key in self._stats_cache:
             return self._stats_cache[key].clone()
@@ -546,6 +568,21 @@ class PlayerService:
             )
             return pl.DataFrame()
 
+    def has_authoritative_stats(self) -> bool:
+        """Return True when the local data store is complete for season stats.
+
+        When it is, a player with no stored rows (a rookie, an unknown ID)
+        genuinely has no stats, and callers should not fall back to loading
+        every weekly stat since 1999 over the network.
+        """
+        if not self._use_nfl_datastore():
+            return False
+        try:
+            return self.nfl_data.is_authoritative(("players", "player_seasons"))
+        except Exception as exc:
+            logger.debug("Failed to read NFL data store coverage: %s", exc)
+            return False
+
     def get_player_summary_stats(
         self,
         *,
@@ -561,24 +598,42 @@ class PlayerService:
         if not player_id:
             return pl.DataFrame()
 
+        # Only non-empty full-career results are memoised; that is what the
+        # detail page asks for, and an empty one may fill on the next refresh
+        self._sync_data_generation()
+        cacheable = seasons is None and not refresh_cache
+        cache_key = str(player_id)
+        cached = _lru_get(self._summary_stats_cache, cache_key) if cacheable else None
+        if cached is not None:
+            return cached.clone()
+
         # Try new data store first
         if self._use_nfl_datastore():
             try:
                 result = self.nfl_data.get_player_summary(player_id, seasons=seasons)
                 if result.height > 0:
+                    if cacheable:
+                        _lru_put(self._summary_stats_cache, cache_key, result.clone())
                     return result
             except Exception as exc:
                 logger.debug(
                     "Failed to query NFL data store for %s: %s", player_id, exc
                 )
+            else:
+                # A complete store is authoritative: no rows means no stats
+                if self.has_authoritative_stats():
+                    return result
 
         # Fall back to legacy repository
         try:
-            return self._player_summary_repository.query(
+            result = self._player_summary_repository.query(
                 player_ids=[str(player_id)],
                 seasons=seasons,
                 refresh=refresh_cache,
             )
+            if cacheable and result.height > 0:
+                _lru_put(self._summary_stats_cache, cache_key, result.clone())
+            return result
         except FileNotFoundError:
             logger.debug(
                 "Player summary cache missing; falling back to legacy stat sources."
@@ -648,10 +703,7 @@ class PlayerService:
             return pl.DataFrame()
 
     def _load_cached_impacts(self, player: Player, seasons: Sequence[int]) -> pl.DataFrame:
-        """Return cached impact rows for the player when available.
-        
-        Prefers the new NFL Data Store when available.
-        """
+        """Return cached impact rows for the player when available."""
         if not seasons:
             return pl.DataFrame()
 
@@ -659,38 +711,56 @@ class PlayerService:
         if not player_id:
             return pl.DataFrame()
 
+        frame = self._get_player_impact_frame(player_id)
+        if frame.is_empty() or "season" not in frame.columns:
+            return frame
+        targets = sorted({int(season) for season in seasons})
+        return frame.filter(pl.col("season").is_in(targets))
+
+    def _get_player_impact_frame(self, player_id: str) -> pl.DataFrame:
+        """Return every cached impact row for ``player_id`` across all seasons.
+
+        Prefers the new NFL Data Store when available. A non-empty frame is
+        memoised per player so the per-category impact lookups (and prefetches)
+        share a single read; an empty one is looked up again next time.
+        """
+        self._sync_data_generation()
+        cached = _lru_get(self._impact_frame_cache, player_id)
+        if cached is not None:
+            return cached
+
+        result = pl.DataFrame()
+
         # Try new data store first
         if self._use_nfl_datastore():
             try:
-                result = self.nfl_data.get_player_impacts(player_id, seasons=seasons)
-                if result.height > 0:
-                    return result
+                result = self.nfl_data.get_player_impacts(player_id)
             except Exception as exc:
                 logger.debug(
                     "Failed to query NFL data store impacts for %s: %s", player_id, exc
                 )
+                result = pl.DataFrame()
 
         # Fall back to legacy repository
         repo = getattr(self, "_player_impact_repository", None)
-        if repo is None:
-            return pl.DataFrame()
+        if result.height == 0 and repo is not None:
+            try:
+                result = repo.query(player_ids=[player_id])
+            except FileNotFoundError:
+                logger.debug("Player impact cache missing; falling back to live computations.")
+                result = pl.DataFrame()
+            except Exception as exc:
+                logger.debug("Failed to query player impact cache for %s: %s", player_id, exc)
+                result = pl.DataFrame()
 
-        try:
-            return repo.query(player_ids=[player_id], seasons=seasons)
-        except FileNotFoundError:
-            logger.debug("Player impact cache missing; falling back to live computations.")
-        except Exception as exc:
-            logger.debug(
-                "Failed to query player impact cache for %s (%s): %s",
-                player.profile.full_name,
-                player_id,
-                exc,
-            )
-        return pl.DataFrame()
+        if result.height > 0:
+            _lru_put(self._impact_frame_cache, player_id, result)
+        return result
 
     def _load_schedule(self, season: int) -> pl.DataFrame:
         """Fetch and cache the league schedule for the given season."""
 
+        self._sync_data_generation()
         if season in self._schedule_cache:
             return self._schedule_cache[season]
 
@@ -794,6 +864,7 @@ class PlayerService:
             return (0, 0, 0)
 
         cache_key = (team_key, season, season_type.upper())
+        self._sync_data_generation()
         if cache_key in self._team_record_cache:
             return self._team_record_cache[cache_key]
 
@@ -857,6 +928,7 @@ class PlayerService:
         identifier = player.profile.gsis_id or player.profile.full_name
         normalized_type = season_type.upper()
         cache_key = (identifier, normalized_type)
+        self._sync_data_generation()
         cache_map = self._qb_impact_cache.setdefault(cache_key, {})
 
         def _build_result(targets: list[int] | None) -> dict[int, dict[str, float]]:
@@ -996,6 +1068,7 @@ class PlayerService:
         identifier = player.profile.gsis_id or player.profile.full_name
         normalized_type = season_type.upper()
         cache_key = (identifier, normalized_type)
+        self._sync_data_generation()
         cache_map = self._skill_impact_cache.setdefault(cache_key, {})
 
         def _build_result(targets: list[int] | None) -> dict[int, dict[str, float]]:
@@ -1166,6 +1239,7 @@ class PlayerService:
         identifier = player.profile.gsis_id or player.profile.full_name
         normalized_type = season_type.upper()
         cache_key = (identifier, normalized_type)
+        self._sync_data_generation()
         cache_map = self._defense_impact_cache.setdefault(cache_key, {})
 
         def _build_result(targets: list[int] | None) -> dict[int, dict[str, float]]:
@@ -1311,6 +1385,7 @@ class PlayerService:
         identifier = player.profile.gsis_id or player.profile.full_name
         normalized_type = season_type.upper()
         cache_key = (identifier, normalized_type)
+        self._sync_data_generation()
         cache_map = cache_store.setdefault(cache_key, {})
 
         def _build_result(targets: list[int] | None) -> dict[int, dict[str, float]]:
@@ -1551,9 +1626,35 @@ class PlayerService:
 
         return ratings
 
+    def get_player_ratings(
+        self,
+        *,
+        player_ids: Sequence[str] | None = None,
+        seasons: Iterable[int] | None = None,
+        latest_only: bool = False,
+    ) -> pl.DataFrame:
+        """Return precomputed league-wide ratings (one row per player-season).
+
+        Ratings are computed in one batch when the data store is built, so
+        listing or sorting every player by rating needs no per-player work.
+        Returns an empty frame when the data store is unavailable.
+        """
+
+        if not self._use_nfl_datastore():
+            return pl.DataFrame()
+        try:
+            return self.nfl_data.get_player_ratings(
+                player_ids,
+                seasons=seasons,
+                latest_only=latest_only,
+            )
+        except Exception as exc:
+            logger.debug("Failed to load player ratings: %s", exc)
+            return pl.DataFrame()
+
     def _compute_rating_seasons(self) -> list[int]:
         current_year = datetime.now().year
-        start_year = max(1999, current_year - (_DEFAULT_RATING_SEASON_WINDOW - 1))
+        start_year = max(1999, current_year - (RATING_BASELINE_SEASON_WINDOW - 1))
         return list(range(start_year, current_year + 1))
 
     def _determine_rating_key(self, position: str, is_defensive: bool) -> str:
@@ -1571,14 +1672,36 @@ class PlayerService:
         metrics: Iterable[str],
     ) -> dict[str, tuple[float, float]]:
         metrics_tuple = tuple(metrics)
+        self._sync_data_generation()
         cached = self._rating_baselines.get(key)
         if cached and all(metric in cached for metric in metrics_tuple):
             return cached
 
+        stored = self._load_stored_rating_baselines().get(key)
+        if stored and all(metric in stored for metric in metrics_tuple):
+            self._rating_baselines[key] = stored
+            return stored
+
         baseline = self._build_rating_baseline(key, metrics_tuple)
         self._rating_baselines[key] = baseline
         return baseline
 
+    def _load_stored_rating_baselines(self) -> dict[str, dict[str, tuple[float, float]]]:
+        """Return baselines precomputed by the NFL data store build (read once per generation)."""
+
+        self._sync_data_generation()
+        if self._stored_rating_baselines is not None:
+            return self._stored_rating_baselines
+
+        baselines: dict[str, dict[str, tuple[float, float]]] = {}
+        if self._use_nfl_datastore():
+            try:
+                baselines = baselines_to_mapping(self.nfl_data.get_rating_baselines())
+            except Exception as exc:
+                logger.debug("Failed to load stored rating baselines: %s", exc)
+        self._stored_rating_baselines = baselines
+        return baselines
+
     def _build_rating_baseline(
         self,
         key: str,
@@ -1589,7 +1712,7 @@ class PlayerService:
 
         positions = RATING_POSITION_GROUPS.get(key)
         if not positions:
-            positions = _DEFENSE_POSITIONS if key == "defense" else _OFFENSE_POSITIONS
+            positions = DEFENSE_POSITIONS if key == "defense" else OFFENSE_POSITIONS
 
         try:
             stats = load_player_stats(seasons=self._rating_seasons)
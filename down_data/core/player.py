@@ -16,12 +16,19 @@ from typing import Any
 import polars as pl
 from nflreadpy import load_ff_playerids, load_nextgen_stats, load_pbp, load_player_stats, load_players, load_teams
 
+from down_data.data.pfr_advanced import PFR_ADVANCED_FILE_PREFIXES, scan_pfr_advanced_stats
+from down_data.data.player_stats_store import (
+    PlayerStatsStore,
+    current_season,
+    get_nextgen_stats_store,
+    get_player_stats_store,
+)
+
 logger = logging.getLogger(__name__)
 
 # NFLverse data availability constants
-# Player stats data is available from 1999 to present
+# Player stats data is available from 1999 through nflreadpy's current season
 EARLIEST_SEASON_AVAILABLE = 1999
-LATEST_SEASON_AVAILABLE = 2025  # Updated as new seasons become available
 
 # NextGen Stats availability (NFL's official advanced tracking metrics)
 EARLIEST_NEXTGEN_SEASON = 2016
@@ -424,11 +431,15 @@ class Player:
         draft_year: int | None = None,
         draft_team: str | None = None,
         position: str | None = None,
+        stats_store: PlayerStatsStore | None = None,
+        nextgen_store: PlayerStatsStore | None = None,
     ) -> None:
         self.query = PlayerQuery(name=name, team=team, draft_year=draft_year, draft_team=draft_team, position=position)
         self._raw_row = PlayerFinder.resolve(self.query)
         self.profile = PlayerProfile.from_row(self._raw_row)
         self._cache: dict[str, Any] = {}
+        self._stats_store = stats_store or get_player_stats_store()
+        self._nextgen_store = nextgen_store or get_nextgen_stats_store()
 
     def to_rich_table(self):
         """Render the player's profile as a Rich table."""
@@ -460,13 +471,19 @@ class Player:
         seasons: Iterable[int] | None = None,
         *,
         earliest: int = EARLIEST_SEASON_AVAILABLE,
-        latest: int = LATEST_SEASON_AVAILABLE,
+        latest: int | None = None,
     ) -> tuple[list[int], list[int]]:
-        """Split requested seasons into valid and invalid collections."""
+        """Split requested seasons into valid and invalid collections.
+
+        ``latest`` defaults to nflreadpy's current season.
+        """
 
         if seasons is None:
             return ([], [])
 
+        if latest is None:
+            latest = current_season()
+
         season_list = list(seasons)
         valid = [season for season in season_list if earliest <= season <= latest]
         invalid = [season for season in season_list if season < earliest or season > latest]
@@ -488,56 +505,59 @@ class Player:
     ) -> pl.DataFrame:
         """Return nflverse player stats for the supplied season filters.
 
+        Seasons already in the local player stats store are read from disk with
+        the player's ID pushed into the scan; only missing seasons are
+        downloaded, and those downloads are written back to the store (seasons
+        that come back empty are stored as empty, so they are not re-fetched).
+
         Args:
-            seasons: Iterable of season years, ``True`` for all seasons, or ``None``.
+            seasons: Iterable of season years, ``True`` for every season through
+                nflreadpy's current one, or ``None`` for the current season.
             season_type: Optional season type filter (e.g., "REG", "POST").
             summary_level: Optional nflreadpy summary level hint. Defaults to weekly data.
         """
 
+        latest = current_season()
         if seasons not in (None, True):
-            valid_seasons, invalid_seasons = self.validate_seasons(seasons)
+            valid_seasons, invalid_seasons = self.validate_seasons(seasons, latest=latest)
             if invalid_seasons:
                 raise SeasonNotAvailableError(
                     "Stats are available from "
-                    f"{EARLIEST_SEASON_AVAILABLE} to {LATEST_SEASON_AVAILABLE}; "
+                    f"{EARLIEST_SEASON_AVAILABLE} to {latest}; "
                     f"invalid seasons requested: {invalid_seasons}."
                 )
 
-        params: dict[str, Any] = {}
-        prepared_seasons = self._prepare_season_param(seasons)
-        if prepared_seasons is not None:
-            params["seasons"] = prepared_seasons
-        if summary_level:
-            params["summary_level"] = summary_level
-
-        try:
-            stats = load_player_stats(**params)
-        except TypeError as exc:
-            # Older versions of nflreadpy may not accept summary_level; fall back gracefully.
-            if "summary_level" in params:
-                fallback_params = dict(params)
-                fallback_params.pop("summary_level", None)
-                try:
-                    stats = load_player_stats(**fallback_params)
-                except TypeError:
-                    raise
-                logger.debug(
-                    "load_player_stats rejected summary_level=%s; using library defaults",
-                    summary_level,
-                )
-            else:
-                raise
-        except ConnectionError as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                raise SeasonNotAvailableError(
-                    f"Failed to download stats data. This may indicate the requested season is not available. "
-                    f"Stats are only available from {EARLIEST_SEASON_AVAILABLE} to {LATEST_SEASON_AVAILABLE}."
-                ) from e
-            raise
+        if seasons is True:
+            season_list = list(range(EARLIEST_SEASON_AVAILABLE, latest + 1))
+        elif seasons is None:
+            season_list = [latest]
+        else:
+            season_list = sorted(set(self._prepare_season_param(seasons)))  # type: ignore[arg-type]
+
+        store_level = summary_level or "week"
+        missing_seasons = self._stats_store.missing_seasons(season_list, store_level)
+        cached_seasons = [season for season in season_list if season not in missing_seasons]
+
+        frames: list[pl.DataFrame] = []
+        if cached_seasons:
+            cached_scan = self._stats_store.scan(
+                cached_seasons,
+                store_level,
+                player_id=self.profile.gsis_id,
+            )
+            if cached_scan is not None:
+                frames.append(cached_scan.collect())
+        if missing_seasons:
+            frames.append(
+                self._download_stats(missing_seasons, summary_level=summary_level)
+            )
 
-        if not isinstance(stats, pl.DataFrame):
-            stats = pl.DataFrame(stats)
+        if not frames:
+            stats = pl.DataFrame()
+        elif len(frames) == 1:
+            stats = frames[0]
+        else:
+            stats = pl.concat(frames, how="diagonal_relaxed")
 
         if stats.height == 0:
             filtered = stats
@@ -574,6 +594,57 @@ class Player:
         self._cache["stats"] = filtered
         return filtered
 
+    def _download_stats(
+        self,
+        seasons: list[int],
+        *,
+        summary_level: str | None,
+    ) -> pl.DataFrame:
+        """Download league-wide stats for ``seasons`` and write them to the store."""
+
+        params: dict[str, Any] = {"seasons": seasons}
+        if summary_level:
+            params["summary_level"] = summary_level
+
+        level_applied = True
+        try:
+            stats = load_player_stats(**params)
+        except TypeError as exc:
+            # Older versions of nflreadpy may not accept summary_level; fall back gracefully.
+            if "summary_level" in params:
+                fallback_params = dict(params)
+                fallback_params.pop("summary_level", None)
+                try:
+                    stats = load_player_stats(**fallback_params)
+                except TypeError:
+                    raise
+                level_applied = False
+                logger.debug(
+                    "load_player_stats rejected summary_level=%s; using library defaults",
+                    summary_level,
+                )
+            else:
+                raise
+        except ConnectionError as e:
+            error_msg = str(e)
+            if "404" in error_msg:
+                raise SeasonNotAvailableError(
+                    f"Failed to download stats data. This may indicate the requested season is not available. "
+                    f"Stats are only available from {EARLIEST_SEASON_AVAILABLE} to {current_season()}."
+                ) from e
+            raise
+
+        if not isinstance(stats, pl.DataFrame):
+            stats = pl.DataFrame(stats)
+
+        # Library defaults may not match the requested level, so only store exact matches
+        if level_applied:
+            try:
+                self._stats_store.write(stats, summary_level or "week", seasons=seasons)
+            except OSError as exc:
+                logger.warning("Unable to write player stats to the local store: %s", exc)
+        return stats
+
     def cached_stats(self) -> pl.DataFrame | None:
         """Return cached stats if they have been fetched previously."""
 
@@ -585,49 +656,85 @@ class Player:
         seasons: bool | Iterable[int] | None = None,
         stat_type: str = "passing",
     ) -> pl.DataFrame:
-        """Load NFL Next Gen Stats data (available from 2016 onwards)."""
+        """Load NFL Next Gen Stats data (available from 2016 onwards).
 
+        League tables come from the shared Next Gen store, which downloads each
+        season of a stat type once and keeps it decoded for the session. Rows
+        are matched on ``player_gsis_id``; the display name is only used when
+        the player has no GSIS ID.
+        """
+
+        latest = current_season()
         if seasons not in (None, True):
             valid_base, invalid_base = self.validate_seasons(
-                seasons, earliest=EARLIEST_SEASON_AVAILABLE, latest=LATEST_SEASON_AVAILABLE
+                seasons, earliest=EARLIEST_SEASON_AVAILABLE, latest=latest
             )
             invalid_nextgen = [season for season in valid_base if season < EARLIEST_NEXTGEN_SEASON]
             if invalid_base or invalid_nextgen:
                 invalid = sorted(set(invalid_base + invalid_nextgen))
                 raise SeasonNotAvailableError(
                     "Next Gen Stats are available from "
-                    f"{EARLIEST_NEXTGEN_SEASON} to {LATEST_SEASON_AVAILABLE}; "
+                    f"{EARLIEST_NEXTGEN_SEASON} to {latest}; "
                     f"invalid seasons requested: {invalid}."
                 )
 
-        params: dict[str, Any] = {"stat_type": stat_type}
-        prepared_seasons = self._prepare_season_param(seasons)
-        if prepared_seasons is not None:
-            params["seasons"] = prepared_seasons
-        
-        try:
-            nextgen_stats = load_nextgen_stats(**params)
-            
-            # NextGen stats use player_display_name - match against full_name
-            # This is less precise but NextGen doesn't always have GSIS IDs
-            player_name = self.profile.full_name
+        if seasons is True:
+            season_list = list(range(EARLIEST_NEXTGEN_SEASON, latest + 1))
+        elif seasons is None:
+            season_list = [latest]
+        else:
+            season_list = sorted(set(self._prepare_season_param(seasons)))  # type: ignore[arg-type]
+
+        gsis_id = self.profile.gsis_id
+        missing_seasons = self._nextgen_store.missing_seasons(season_list, stat_type)
+        cached_seasons = [season for season in season_list if season not in missing_seasons]
+
+        frames: list[pl.DataFrame] = []
+        if cached_seasons:
+            cached = self._nextgen_store.load(cached_seasons, stat_type, player_id=gsis_id)
+            if cached is not None:
+                frames.append(cached)
+        if missing_seasons:
+            try:
+                downloaded = load_nextgen_stats(stat_type=stat_type, seasons=missing_seasons)
+            except ConnectionError as e:
+                error_msg = str(e)
+                if "404" in error_msg:
+                    raise SeasonNotAvailableError(
+                        f"Failed to download NextGen stats. "
+                        f"Stats are only available from {EARLIEST_NEXTGEN_SEASON} onwards."
+                    ) from e
+                raise
+            if not isinstance(downloaded, pl.DataFrame):
+                downloaded = pl.DataFrame(downloaded)
+            try:
+                self._nextgen_store.write(downloaded, stat_type, seasons=missing_seasons)
+            except OSError as exc:
+                logger.warning("Unable to write Next Gen stats to the local store: %s", exc)
+            if gsis_id and "player_gsis_id" in downloaded.columns:
+                downloaded = downloaded.filter(pl.col("player_gsis_id") == gsis_id)
+            frames.append(downloaded)
+
+        if not frames:
+            nextgen_stats = pl.DataFrame()
+        elif len(frames) == 1:
+            nextgen_stats = frames[0]
+        else:
+            nextgen_stats = pl.concat(frames, how="diagonal_relaxed")
+
+        if gsis_id and "player_gsis_id" in nextgen_stats.columns:
+            filtered = nextgen_stats.filter(pl.col("player_gsis_id") == gsis_id)
+        elif "player_display_name" in nextgen_stats.columns:
             filtered = nextgen_stats.filter(
-                pl.col("player_display_name").str.to_lowercase() == player_name.lower()
+                pl.col("player_display_name").str.to_lowercase() == self.profile.full_name.lower()
             )
-            
-            # Cache with a key that includes the stat type
-            cache_key = f"nextgen_stats_{stat_type}"
-            self._cache[cache_key] = filtered
-            
-            return filtered
-        except ConnectionError as e:
-            error_msg = str(e)
-            if "404" in error_msg:
-                raise SeasonNotAvailableError(
-                    f"Failed to download NextGen stats. "
-                    f"Stats are only available from {EARLIEST_NEXTGEN_SEASON} onwards."
-                ) from e
-            raise
+        else:
+            filtered = nextgen_stats
+
+        # Cache with a key that includes the stat type
+        cache_key = f"nextgen_stats_{stat_type}"
+        self._cache[cache_key] = filtered
+        return filtered
 
     def cached_nextgen_stats(self, stat_type: str = "passing") -> pl.DataFrame | None:
         """Return cached NextGen stats if they have been fetched previously."""
@@ -640,7 +747,11 @@ class Player:
         seasons: Iterable[int] | None = None,
         stat_type: str = "passing",
     ) -> pl.DataFrame:
-        """Load PFR advanced stats from local CSV exports (available 2018–2024)."""
+        """Load PFR advanced stats (available 2018–2024).
+
+        Reads the consolidated per-stat-type parquet built from the local CSV
+        exports, with the player's ``pfr_id`` and the seasons pushed into the scan.
+        """
 
         if not self.profile.pfr_id:
             raise ValueError(
@@ -661,35 +772,23 @@ class Player:
                     f"invalid seasons requested: {invalid_seasons}."
                 )
 
-        file_prefix_map = {
-            "passing": "pfr_passing_advanced",
-            "rushing": "pfr_rushing_advanced",
-            "receiving": "pfr_receiving_advanced",
-            "defense": "pfr_defense_advanced",
-        }
-        if stat_type not in file_prefix_map:
-            options = ", ".join(file_prefix_map)
+        if stat_type not in PFR_ADVANCED_FILE_PREFIXES:
+            options = ", ".join(PFR_ADVANCED_FILE_PREFIXES)
             raise ValueError(f"Invalid stat_type '{stat_type}'. Choose one of: {options}.")
-        file_prefix = file_prefix_map[stat_type]
 
-        collected: list[pl.DataFrame] = []
-        for season in seasons_to_load:
-            csv_path = PFR_DATA_DIR / f"{file_prefix}_{season}.csv"
-            if not csv_path.exists():
-                logger.warning("PFR CSV file not found: %s", csv_path)
-                continue
-            try:
-                dataframe = pl.read_csv(csv_path)
-            except Exception as exc:  # pragma: no cover - I/O errors depend on deployment
-                logger.warning("Error reading %s: %s", csv_path, exc)
-                continue
-
-            pfr_id_column = dataframe.columns[-1]
-            player_data = dataframe.filter(pl.col(pfr_id_column) == self.profile.pfr_id)
-            if player_data.height > 0:
-                collected.append(player_data.with_columns(pl.lit(season).alias("season")))
+        try:
+            scan = scan_pfr_advanced_stats(
+                stat_type,
+                pfr_id=self.profile.pfr_id,
+                seasons=seasons_to_load,
+                directory=PFR_DATA_DIR,
+            )
+            combined = scan.collect() if scan is not None else pl.DataFrame()
+        except Exception as exc:  # pragma: no cover - I/O errors depend on deployment
+            logger.warning("Error reading PFR %s advanced stats: %s", stat_type, exc)
+            combined = pl.DataFrame()
 
-        if not collected:
+        if combined.height == 0:
             logger.info(
                 "No PFR %s data found for %s (%s) in seasons %s",
                 stat_type,
@@ -699,7 +798,6 @@ class Player:
             )
             return pl.DataFrame()
 
-        combined = pl.concat(collected, how="vertical_relaxed")
         cache_key = f"pfr_stats_{stat_type}"
         self._cache[cache_key] = combined
         return combined
@@ -721,7 +819,7 @@ class Player:
             if invalid_seasons:
                 raise SeasonNotAvailableError(
                     "Play-by-play data is available from "
-                    f"{EARLIEST_SEASON_AVAILABLE} to {LATEST_SEASON_AVAILABLE}; "
+                    f"{EARLIEST_SEASON_AVAILABLE} to {current_season()}; "
                     f"invalid seasons requested: {invalid_seasons}."
                 )
 
@@ -800,7 +898,7 @@ class Player:
             if invalid_seasons:
                 raise SeasonNotAvailableError(
                     "Play-by-play data is available from "
-                    f"{EARLIEST_SEASON_AVAILABLE} to {LATEST_SEASON_AVAILABLE}; "
+                    f"{EARLIEST_SEASON_AVAILABLE} to {current_season()}; "
                     f"invalid seasons requested: {invalid_seasons}."
                 )
 
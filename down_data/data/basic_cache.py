@@ -17,9 +17,11 @@ except ImportError:  # pragma: no cover - handled at runtime
     load_player_stats = None  # type: ignore[assignment]
     load_rosters = None  # type: ignore[assignment]
 
+from .pfr.archive import get_page_archive
 from .pfr.client import PFRClient
-from .pfr.snap_counts import fetch_team_snap_counts
+from .pfr.jobs import ScrapeJob
 from .pfr.players import fetch_player_bio_fields
+from .season_snap_counts import collect_season_snap_counts
 from .player_bio_cache import (
     load_player_bio_cache,
     upsert_player_bio_entries,
@@ -28,6 +30,7 @@ from .player_bio_cache import (
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 CACHE_DIRECTORY = PROJECT_ROOT / "data" / "cache"
 CACHE_PATH = CACHE_DIRECTORY / "basic_player_stats.parquet"
+SCRAPE_JOBS_DIRECTORY = CACHE_DIRECTORY / "scrape_jobs"
 DEFAULT_SEASONS = list(range(1999, datetime.now().year + 1))
 
 LOGGER = logging.getLogger(__name__)
@@ -114,6 +117,7 @@ NUMERIC_COLUMN_SOURCES: Mapping[str, Sequence[str]] = {
     "sack_fumbles_lost": ("sack_fumbles_lost",),
     "def_tackles_solo": ("def_tackles_solo", "solo_tackles"),
     "def_tackle_assists": ("def_tackle_assists", "assist_tackles"),
+    "def_tackles_with_assist": ("def_tackles_with_assist",),
     "def_tackles_for_loss": ("def_tackles_for_loss", "tackles_for_loss"),
     "def_sacks": ("def_sacks", "sacks"),
     "def_qb_hits": ("def_qb_hits", "qb_hits"),
@@ -164,34 +168,6 @@ def _map_team_to_pfr_slug(team: str | None) -> str | None:
     return TEAM_TO_PFR_SLUG.get(team.upper())
 
 
-def _fetch_snap_counts_with_retry(
-    client: PFRClient,
-    *,
-    team_abbr: str,
-    team_slug: str,
-    season: int,
-    retries: int = 4,
-) -> pl.DataFrame:
-    for attempt in range(retries):
-        try:
-            return fetch_team_snap_counts(client, team_slug=team_slug, season=season)
-        except HTTPError as exc:
-            status = getattr(exc.response, "status_code", None)
-            if status == 429 and attempt < retries - 1:
-                wait = 5.0 * (attempt + 1)
-                LOGGER.warning(
-                    "PFR rate-limited snap counts for %s (%s); retrying in %.1fs.",
-                    team_abbr,
-                    season,
-                    wait,
-                )
-                time.sleep(wait)
-                continue
-            raise
-    # Should never reach here because loop either returns or raises
-    raise RuntimeError("Exceeded retry attempts for PFR snap counts")
-
-
 def _fetch_player_bio_with_retry(
     client: PFRClient,
     *,
@@ -253,17 +229,17 @@ def build_basic_cache(
     target_seasons = list(seasons) if seasons else list(DEFAULT_SEASONS)
     LOGGER.info("Fetching nflverse player stats for seasons %s-%s.", target_seasons[0], target_seasons[-1])
     raw = load_player_stats(seasons=target_seasons)
-    frame = _to_polars(raw)
-    prepared = _prepare_for_aggregation(frame, target_seasons)
-    aggregated = _aggregate_player_seasons(prepared)
+    frame = to_polars(raw)
+    prepared = prepare_for_aggregation(frame, target_seasons)
+    aggregated = aggregate_player_seasons(prepared)
 
-    id_mapping = _build_player_id_mapping(target_seasons)
+    id_mapping = build_player_id_mapping(target_seasons)
 
     # Merge snap counts from separate source
-    aggregated = _merge_snap_counts(aggregated, target_seasons, id_mapping=id_mapping)
+    aggregated = merge_snap_counts(aggregated, target_seasons, id_mapping=id_mapping)
 
     # Merge player bio info from PFR
-    aggregated = _merge_player_bio(aggregated, id_mapping=id_mapping)
+    aggregated = merge_player_bio(aggregated, id_mapping=id_mapping)
 
     CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
     aggregated.write_parquet(CACHE_PATH, compression="zstd")
@@ -271,7 +247,9 @@ def build_basic_cache(
     return aggregated
 
 
-def _to_polars(frame: object) -> pl.DataFrame:
+def to_polars(frame: object) -> pl.DataFrame:
+    """Coerce an nflreadpy result into a Polars frame."""
+
     if isinstance(frame, pl.DataFrame):
         return frame
     try:
@@ -311,7 +289,9 @@ def _numeric_expr(
     return pl.coalesce(existing).alias(alias)
 
 
-def _prepare_for_aggregation(frame: pl.DataFrame, seasons: Sequence[int]) -> pl.DataFrame:
+def prepare_for_aggregation(frame: pl.DataFrame, seasons: Sequence[int]) -> pl.DataFrame:
+    """Keep regular-season weeks of ``seasons`` and normalise the stat columns."""
+
     filtered = frame.filter(pl.col("season").is_in(seasons))
     if "season_type" in filtered.columns:
         filtered = filtered.filter(pl.col("season_type") == "REG")
@@ -341,7 +321,9 @@ def _prepare_for_aggregation(frame: pl.DataFrame, seasons: Sequence[int]) -> pl.
     return prepared
 
 
-def _aggregate_player_seasons(frame: pl.DataFrame) -> pl.DataFrame:
+def aggregate_player_seasons(frame: pl.DataFrame) -> pl.DataFrame:
+    """Sum prepared weekly rows into one row per player, team and season."""
+
     numeric_columns = list(NUMERIC_COLUMN_SOURCES.keys())
     grouped = (
         frame.group_by(
@@ -383,7 +365,7 @@ def _aggregate_player_seasons(frame: pl.DataFrame) -> pl.DataFrame:
     return result
 
 
-def _build_player_id_mapping(seasons: Sequence[int]) -> pl.DataFrame | None:
+def build_player_id_mapping(seasons: Sequence[int]) -> pl.DataFrame | None:
     """Build a mapping from gsis_id to pfr_id using roster data."""
 
     if load_rosters is None:
@@ -391,7 +373,7 @@ def _build_player_id_mapping(seasons: Sequence[int]) -> pl.DataFrame | None:
 
     try:
         roster_raw = load_rosters(seasons=list(seasons))
-        roster_frame = _to_polars(roster_raw)
+        roster_frame = to_polars(roster_raw)
     except Exception as exc:  # pragma: no cover - network/runtime
         LOGGER.warning("Failed to load rosters for ID mapping: %s", exc)
         return None
@@ -411,13 +393,13 @@ def _build_player_id_mapping(seasons: Sequence[int]) -> pl.DataFrame | None:
     return mapping
 
 
-def _merge_snap_counts(
+def merge_snap_counts(
     aggregated: pl.DataFrame,
     seasons: Sequence[int],
     *,
     id_mapping: pl.DataFrame | None = None,
 ) -> pl.DataFrame:
-    """Merge snap counts scraped from Pro-Football-Reference into the stats."""
+    """Merge season snap counts (nflverse, PFR pages for gaps) into the stats."""
 
     if aggregated.is_empty():
         return aggregated
@@ -436,60 +418,28 @@ def _merge_snap_counts(
         )
         return aggregated
 
-    season_team_frame = (
-        aggregated.select(["season", "team"])
-        .filter(
-            pl.col("team").is_not_null()
-            & (pl.col("team").str.strip_chars() != "")
-        )
-        .unique()
-    )
+    season_team_frame = aggregated.select(["season", "team"]).filter(
+        pl.col("season").is_in(target_seasons)
+    ).unique()
     if season_team_frame.is_empty():
         return aggregated
 
-    snap_frames: list[pl.DataFrame] = []
-    with PFRClient(enable_cache=True, min_delay=1.5) as client:
-        for season in target_seasons:
-            teams = (
-                season_team_frame.filter(pl.col("season") == season)["team"].to_list()
-            )
-            if not teams:
-                continue
-            for team in teams:
-                slug = _map_team_to_pfr_slug(team)
-                if not slug:
-                    LOGGER.debug("No PFR slug mapping for team '%s'; skipping.", team)
-                    continue
-                try:
-                    team_snaps = _fetch_snap_counts_with_retry(
-                        client,
-                        team_abbr=team.upper(),
-                        team_slug=slug,
-                        season=season,
-                    )
-                except Exception as exc:  # pragma: no cover - network/runtime
-                    LOGGER.warning(
-                        "Failed to fetch PFR snap counts for %s (%s): %s",
-                        team,
-                        season,
-                        exc,
-                    )
-                    continue
-                if team_snaps.is_empty():
-                    continue
-                snap_frames.append(
-                    team_snaps.with_columns(
-                        pl.lit(team.upper()).alias("team"),
-                        pl.lit(season).alias("season"),
-                    )
-                )
+    # nflverse bulk files first; checkpointed PFR team pages only for gaps
+    job = ScrapeJob("pfr_snap_counts", directory=SCRAPE_JOBS_DIRECTORY)
+    snap_frame = collect_season_snap_counts(
+        season_team_frame,
+        team_to_slug=_map_team_to_pfr_slug,
+        job=job,
+    )
+    for key in job.failed():  # pragma: no cover - network/runtime
+        LOGGER.warning("Failed to fetch PFR snap counts for %s; will retry after retry_failed().", key)
 
-    if not snap_frames:
-        LOGGER.warning("PFR snap-count scrape returned no rows; leaving snaps at 0.")
+    if snap_frame.is_empty():
+        LOGGER.warning("No snap counts available for the requested seasons; leaving snaps at 0.")
         return aggregated
 
     snap_aggregated = (
-        pl.concat(snap_frames, how="vertical_relaxed")
+        snap_frame
         .filter(pl.col("pfr_id").is_not_null() & (pl.col("pfr_id") != ""))
         .select(
             [
@@ -559,26 +509,22 @@ def _merge_snap_counts(
     return merged
 
 
-def _merge_player_bio(
+def fetch_missing_player_bios(
     aggregated: pl.DataFrame,
     *,
     id_mapping: pl.DataFrame | None,
+    bio_cache: pl.DataFrame | None = None,
 ) -> pl.DataFrame:
-    """Attach PFR-derived bio info (handedness, birthplace) to the stats."""
+    """Fetch PFR bios for players in ``aggregated`` the bio cache lacks.
 
-    if aggregated.is_empty():
-        return aggregated
+    ``bio_cache`` is loaded from disk when not supplied. Returns the updated
+    cache, so callers merging several frames can pass it back in.
+    """
 
-    if id_mapping is None or id_mapping.is_empty():
-        LOGGER.warning("Could not build player ID mapping; bio fields will remain 'N/A'.")
-        return aggregated.with_columns(
-            pl.lit("N/A").alias("handedness"),
-            pl.lit("N/A").alias("birth_city"),
-            pl.lit("N/A").alias("birth_state"),
-            pl.lit("N/A").alias("birth_country"),
-        )
-
-    bio_cache = load_player_bio_cache()
+    if bio_cache is None:
+        bio_cache = load_player_bio_cache()
+    if aggregated.is_empty() or id_mapping is None or id_mapping.is_empty():
+        return bio_cache
 
     player_map = (
         aggregated.select(["player_id"])
@@ -599,7 +545,7 @@ def _merge_player_bio(
 
     new_entries: list[dict[str, str]] = []
     if missing.height > 0:
-        with PFRClient(enable_cache=True, min_delay=1.0) as client:
+        with PFRClient(enable_cache=True, min_delay=1.0, archive=get_page_archive()) as client:
             for row in missing.iter_rows(named=True):
                 pfr_id = row.get("pfr_id")
                 if not isinstance(pfr_id, str) or not pfr_id.strip():
@@ -621,6 +567,35 @@ def _merge_player_bio(
 
     if new_entries:
         bio_cache = upsert_player_bio_entries(bio_cache, new_entries)
+    return bio_cache
+
+
+def merge_player_bio(
+    aggregated: pl.DataFrame,
+    *,
+    id_mapping: pl.DataFrame | None,
+    bio_cache: pl.DataFrame | None = None,
+) -> pl.DataFrame:
+    """Attach PFR-derived bio info (handedness, birthplace) to the stats.
+
+    Missing bios are fetched first unless an up-to-date ``bio_cache`` (see
+    :func:`fetch_missing_player_bios`) is supplied.
+    """
+
+    if aggregated.is_empty():
+        return aggregated
+
+    if id_mapping is None or id_mapping.is_empty():
+        LOGGER.warning("Could not build player ID mapping; bio fields will remain 'N/A'.")
+        return aggregated.with_columns(
+            pl.lit("N/A").alias("handedness"),
+            pl.lit("N/A").alias("birth_city"),
+            pl.lit("N/A").alias("birth_state"),
+            pl.lit("N/A").alias("birth_country"),
+        )
+
+    if bio_cache is None:
+        bio_cache = fetch_missing_player_bios(aggregated, id_mapping=id_mapping)
 
     if bio_cache.height == 0:
         return aggregated.with_columns(
@@ -660,5 +635,12 @@ __all__ = [
     "scan_basic_cache",
     "load_basic_cache",
     "build_basic_cache",
+    "to_polars",
+    "prepare_for_aggregation",
+    "aggregate_player_seasons",
+    "build_player_id_mapping",
+    "merge_snap_counts",
+    "fetch_missing_player_bios",
+    "merge_player_bio",
 ]
 
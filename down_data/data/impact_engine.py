@@ -0,0 +1,515 @@
+"""Single play-by-play → player impact engine.
+
+Every path that derives EPA/WPA impacts from play-by-play (the legacy impact
+cache, the summary cache, :class:`NFLDataBuilder` and the Rich build script)
+calls into this module, so the attribution rules and the aggregation kernel
+live in one place:
+
+* Quarterbacks   – ``qb_epa``/``qb_wpa`` for the passer (or a QB rusher on
+  dropbacks), falling back to ``epa``/``wpa`` when the QB columns are absent.
+* Skill players  – ``skill_epa``/``skill_wpa`` for rushers on plays without a
+  receiver and for receivers/targets, plus 20+ yard and first-down counts.
+* Defense, offensive line (penalties), kickers and punters – ``epa``/``wpa``
+  for every player ID column of that role.
+
+A player credited more than once on the same play (e.g. listed as both
+receiver and target) counts once. The kernel is built as one lazy query per
+frame: each role's ID columns are unpivoted to long form, de-duplicated per
+play and summed per player-season. Because the query is lazy it also runs
+over a ``scan_parquet`` of a locally cached season (:mod:`pbp_cache`) with the
+streaming engine, reading only the columns it references.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+import logging
+from typing import TypeVar
+
+import polars as pl
+
+try:  # pragma: no cover - runtime dependency
+    from nflreadpy import load_pbp
+except ImportError:  # pragma: no cover - handled by callers
+    load_pbp = None  # type: ignore[assignment]
+
+from .pbp_cache import scan_pbp_season
+
+logger = logging.getLogger(__name__)
+
+IMPACT_SCHEMA: dict[str, pl.DataType] = {
+    "player_id": pl.Utf8,
+    "season": pl.Int16,
+    "qb_epa": pl.Float64,
+    "qb_wpa": pl.Float64,
+    "skill_epa": pl.Float64,
+    "skill_wpa": pl.Float64,
+    "skill_rush_20_plus": pl.Int32,
+    "skill_rec_20_plus": pl.Int32,
+    "skill_rec_first_downs": pl.Int32,
+    "def_epa": pl.Float64,
+    "def_wpa": pl.Float64,
+    "ol_epa": pl.Float64,
+    "ol_wpa": pl.Float64,
+    "kicker_epa": pl.Float64,
+    "kicker_wpa": pl.Float64,
+    "punter_epa": pl.Float64,
+    "punter_wpa": pl.Float64,
+}
+
+QB_RUSHER_COLUMNS = (
+    "rusher_player_id",
+    "lateral_rusher_player_id",
+)
+SKILL_RUSHER_COLUMNS = (
+    "rusher_player_id",
+    "lateral_rusher_player_id",
+)
+SKILL_RECEIVER_COLUMNS = (
+    "receiver_player_id",
+    "lateral_receiver_player_id",
+    "target_player_id",
+    "targeted_player_id",
+)
+DEFENSIVE_COLUMNS = (
+    "solo_tackle_1_player_id",
+    "solo_tackle_2_player_id",
+    "assist_tackle_1_player_id",
+    "assist_tackle_2_player_id",
+    "assist_tackle_3_player_id",
+    "assist_tackle_4_player_id",
+    "tackle_with_assist_1_player_id",
+    "tackle_with_assist_2_player_id",
+    "tackle_with_assist_3_player_id",
+    "tackle_with_assist_4_player_id",
+    "pass_defense_1_player_id",
+    "pass_defense_2_player_id",
+    "interception_player_id",
+    "sack_player_id",
+    "half_sack_1_player_id",
+    "half_sack_2_player_id",
+    "forced_fumble_player_1_player_id",
+    "forced_fumble_player_2_player_id",
+    "fumble_recovery_1_player_id",
+    "fumble_recovery_2_player_id",
+)
+OFFENSIVE_LINE_COLUMNS = (
+    "penalty_player_id",
+    "penalty_player_id_1",
+    "penalty_player_id_2",
+)
+KICKER_COLUMNS = (
+    "kicker_player_id",
+    "kickoff_player_id",
+)
+PUNTER_COLUMNS = ("punter_player_id",)
+
+# Role prefix -> player ID columns for the plain EPA/WPA roles
+ROLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "def": DEFENSIVE_COLUMNS,
+    "ol": OFFENSIVE_LINE_COLUMNS,
+    "kicker": KICKER_COLUMNS,
+    "punter": PUNTER_COLUMNS,
+}
+
+_KEY_COLUMNS = ["season", "_game", "_play"]
+
+
+@dataclass(frozen=True)
+class ImpactProgress:
+    """Progress event emitted once per season by :func:`compute_season_impacts`.
+
+    ``stage`` is ``"loading"`` before a season is read, then ``"done"``,
+    ``"skipped"`` (no impacts, e.g. no regular-season plays) or ``"failed"``.
+    """
+
+    season: int
+    stage: str
+    index: int
+    total: int
+    rows: int = 0
+    error: Exception | None = None
+
+
+ProgressCallback = Callable[[ImpactProgress], None]
+
+
+def empty_impact_frame() -> pl.DataFrame:
+    return pl.DataFrame(schema=IMPACT_SCHEMA)
+
+
+def to_polars(frame: object) -> pl.DataFrame:
+    if isinstance(frame, pl.DataFrame):
+        return frame
+    try:
+        return pl.DataFrame(frame)  # type: ignore[arg-type]
+    except (TypeError, ValueError) as exc:  # pragma: no cover - defensive helper
+        raise TypeError(f"Unsupported play-by-play frame type: {type(frame)!r}") from exc
+
+
+FrameT = TypeVar("FrameT", pl.DataFrame, pl.LazyFrame)
+
+
+def prepare_pbp_frame(frame: FrameT, *, seasons: Sequence[int] | None = None) -> FrameT:
+    """Limit play-by-play (eager or lazy) to regular-season plays of ``seasons``."""
+
+    columns = frame.collect_schema().names() if isinstance(frame, pl.LazyFrame) else frame.columns
+    if "season" not in columns:
+        raise ValueError("play-by-play data is missing the 'season' column.")
+
+    working = frame
+    if seasons:
+        working = working.filter(pl.col("season").is_in(list(seasons)))
+
+    if "season_type" in columns:
+        working = working.filter(pl.col("season_type").str.to_uppercase() == "REG")
+
+    if "_pbp_row_id" not in columns:
+        working = working.with_row_index("_pbp_row_id")
+
+    return working
+
+
+# ---------------------------------------------------------------------------
+# Kernel
+# ---------------------------------------------------------------------------
+
+
+def _numeric(columns: set[str], column: str, fallback: str | None = None) -> pl.Expr:
+    if column in columns:
+        return pl.col(column).cast(pl.Float64, strict=False).fill_null(0.0)
+    if fallback and fallback in columns:
+        return pl.col(fallback).cast(pl.Float64, strict=False).fill_null(0.0)
+    return pl.lit(0.0)
+
+
+def _flag(columns: set[str], column: str) -> pl.Expr:
+    if column in columns:
+        return pl.col(column).cast(pl.Int8, strict=False).fill_null(0) == 1
+    return pl.lit(False)
+
+
+def _key_exprs(columns: set[str]) -> list[pl.Expr]:
+    play = pl.col("play_id") if "play_id" in columns else pl.col("_pbp_row_id")
+    game = pl.col("game_id").cast(pl.Utf8, strict=False) if "game_id" in columns else pl.lit("")
+    return [
+        pl.col("season").cast(pl.Int16, strict=False).alias("season"),
+        game.alias("_game"),
+        play.alias("_play"),
+    ]
+
+
+def _long_ids(
+    lf: pl.LazyFrame,
+    id_exprs: dict[str, pl.Expr],
+    values: list[str],
+) -> pl.LazyFrame:
+    """Unpivot one row per (play, credited player ID column) and drop blanks."""
+
+    return (
+        lf.select(*_KEY_COLUMNS, *values, **id_exprs)
+        .unpivot(index=[*_KEY_COLUMNS, *values], on=list(id_exprs), value_name="player_id")
+        .drop("variable")
+        .filter(pl.col("player_id").is_not_null() & (pl.col("player_id") != ""))
+    )
+
+
+def _qb_impacts(lf: pl.LazyFrame, columns: set[str]) -> pl.LazyFrame | None:
+    candidates: list[pl.Expr] = []
+    if "passer_player_id" in columns:
+        candidates.append(pl.col("passer_player_id").cast(pl.Utf8, strict=False))
+    if "qb_epa" in columns:
+        dropback = pl.col("qb_epa").is_not_null()
+    elif "qb_dropback" in columns:
+        dropback = _flag(columns, "qb_dropback")
+    else:
+        dropback = pl.lit(False)
+    for column in QB_RUSHER_COLUMNS:
+        if column in columns:
+            candidates.append(pl.when(dropback).then(pl.col(column).cast(pl.Utf8, strict=False)))
+    if not candidates:
+        return None
+
+    return (
+        lf.select(
+            pl.col("season"),
+            pl.coalesce(candidates).alias("player_id"),
+            pl.col("_qb_epa"),
+            pl.col("_qb_wpa"),
+        )
+        .filter(pl.col("player_id").is_not_null() & (pl.col("player_id") != ""))
+        .group_by(["player_id", "season"])
+        .agg(
+            pl.col("_qb_epa").sum().alias("qb_epa"),
+            pl.col("_qb_wpa").sum().alias("qb_wpa"),
+        )
+    )
+
+
+def _skill_impacts(lf: pl.LazyFrame, columns: set[str]) -> pl.LazyFrame | None:
+    rushers = [column for column in SKILL_RUSHER_COLUMNS if column in columns]
+    receivers = [column for column in SKILL_RECEIVER_COLUMNS if column in columns]
+    if not rushers and not receivers:
+        return None
+
+    values = ["_epa", "_wpa", "_long", "_complete", "_first_down"]
+    parts: list[pl.LazyFrame] = []
+    if rushers:
+        # Rushers are credited only on plays without a receiver (run plays)
+        has_receiver = (
+            pl.any_horizontal([pl.col(column).is_not_null() for column in receivers])
+            if receivers
+            else pl.lit(False)
+        )
+        parts.append(
+            _long_ids(
+                lf,
+                {
+                    f"_rush_{index}": pl.when(~has_receiver).then(pl.col(column).cast(pl.Utf8, strict=False))
+                    for index, column in enumerate(rushers)
+                },
+                values,
+            ).with_columns(
+                pl.col("_long").cast(pl.Int32).alias("_rush_20"),
+                pl.lit(0, dtype=pl.Int32).alias("_rec_20"),
+                pl.lit(0, dtype=pl.Int32).alias("_rec_fd"),
+            )
+        )
+    if receivers:
+        parts.append(
+            _long_ids(
+                lf,
+                {
+                    f"_rec_{index}": pl.col(column).cast(pl.Utf8, strict=False)
+                    for index, column in enumerate(receivers)
+                },
+                values,
+            ).with_columns(
+                pl.lit(0, dtype=pl.Int32).alias("_rush_20"),
+                (pl.col("_long") & pl.col("_complete")).cast(pl.Int32).alias("_rec_20"),
+                (pl.col("_first_down") & pl.col("_complete")).cast(pl.Int32).alias("_rec_fd"),
+            )
+        )
+
+    return (
+        pl.concat(parts, how="vertical_relaxed")
+        .group_by([*_KEY_COLUMNS, "player_id"])
+        .agg(
+            pl.col("_epa").first(),
+            pl.col("_wpa").first(),
+            pl.col("_rush_20").max(),
+            pl.col("_rec_20").max(),
+            pl.col("_rec_fd").max(),
+        )
+        .group_by(["player_id", "season"])
+        .agg(
+            pl.col("_epa").sum().alias("skill_epa"),
+            pl.col("_wpa").sum().alias("skill_wpa"),
+            pl.col("_rush_20").sum().cast(pl.Int32).alias("skill_rush_20_plus"),
+            pl.col("_rec_20").sum().cast(pl.Int32).alias("skill_rec_20_plus"),
+            pl.col("_rec_fd").sum().cast(pl.Int32).alias("skill_rec_first_downs"),
+        )
+    )
+
+
+def _role_impacts(
+    lf: pl.LazyFrame,
+    columns: set[str],
+    role_columns: Sequence[str],
+    *,
+    prefix: str,
+) -> pl.LazyFrame | None:
+    available = [column for column in role_columns if column in columns]
+    if not available:
+        return None
+    return (
+        _long_ids(
+            lf,
+            {f"_{prefix}_{index}": pl.col(column).cast(pl.Utf8, strict=False) for index, column in enumerate(available)},
+            ["_epa", "_wpa"],
+        )
+        .unique(subset=[*_KEY_COLUMNS, "player_id"], keep="first")
+        .group_by(["player_id", "season"])
+        .agg(
+            pl.col("_epa").sum().alias(f"{prefix}_epa"),
+            pl.col("_wpa").sum().alias(f"{prefix}_wpa"),
+        )
+    )
+
+
+def _schema_names(parts: Sequence[pl.LazyFrame]) -> set[str]:
+    names: set[str] = set()
+    for part in parts:
+        names.update(part.collect_schema().names())
+    return names
+
+
+def impact_query(lf: pl.LazyFrame) -> pl.LazyFrame | None:
+    """Build the lazy aggregation over (prepared) play-by-play ``lf``.
+
+    Only the columns the kernel references are read, so scanning a parquet
+    file projects the ~370 play-by-play columns down to a few dozen. Returns
+    ``None`` when ``lf`` has no usable columns.
+    """
+
+    columns = set(lf.collect_schema().names())
+    if "season" not in columns:
+        return None
+    if "play_id" not in columns and "_pbp_row_id" not in columns:
+        lf = lf.with_row_index("_pbp_row_id")
+        columns.add("_pbp_row_id")
+
+    yards = _numeric(columns, "yards_gained")
+    base = lf.with_columns(
+        *_key_exprs(columns),
+        _numeric(columns, "epa").alias("_epa"),
+        _numeric(columns, "wpa").alias("_wpa"),
+        _numeric(columns, "qb_epa", fallback="epa").alias("_qb_epa"),
+        _numeric(columns, "qb_wpa", fallback="wpa").alias("_qb_wpa"),
+        (yards >= 20).alias("_long"),
+        _flag(columns, "complete_pass").alias("_complete"),
+        _flag(columns, "first_down").alias("_first_down"),
+    )
+
+    parts = [
+        _qb_impacts(base, columns),
+        _skill_impacts(base, columns),
+        *[
+            _role_impacts(base, columns, role_columns, prefix=prefix)
+            for prefix, role_columns in ROLE_COLUMNS.items()
+        ],
+    ]
+    parts = [part for part in parts if part is not None]
+    if not parts:
+        return None
+
+    # Diagonal concat lets every role combine with a single aggregation
+    produced = _schema_names(parts)
+    metric_columns = [column for column in IMPACT_SCHEMA if column not in {"player_id", "season"}]
+    return (
+        pl.concat(parts, how="diagonal_relaxed")
+        .group_by(["player_id", "season"])
+        .agg([pl.col(column).sum() for column in metric_columns if column in produced])
+        .select(
+            pl.col("player_id").cast(pl.Utf8),
+            pl.col("season").cast(pl.Int16, strict=False),
+            *[
+                (pl.col(column) if column in produced else pl.lit(0))
+                .cast(IMPACT_SCHEMA[column], strict=False)
+                .fill_null(0)
+                .alias(column)
+                for column in metric_columns
+            ],
+        )
+        .sort(["player_id", "season"])
+    )
+
+
+def collect_streaming(lf: pl.LazyFrame) -> pl.DataFrame:
+    """Collect ``lf`` with Polars' streaming engine (batched, bounded memory)."""
+
+    try:
+        return lf.collect(engine="streaming")
+    except TypeError:  # pragma: no cover - Polars < 1.0
+        return lf.collect(streaming=True)
+
+
+def aggregate_impacts(frame: pl.DataFrame | pl.LazyFrame, *, streaming: bool = False) -> pl.DataFrame:
+    """Aggregate (prepared) play-by-play rows into per-season impact metrics.
+
+    ``frame`` may be a lazy scan; with ``streaming`` it is collected in
+    batches instead of being materialised whole. Returns one row per
+    ``(player_id, season)`` with every :data:`IMPACT_SCHEMA` column; metrics
+    a player never accrued are zero.
+    """
+
+    if isinstance(frame, pl.DataFrame) and frame.is_empty():
+        return empty_impact_frame()
+
+    query = impact_query(frame.lazy())
+    if query is None:
+        return empty_impact_frame()
+    return collect_streaming(query) if streaming else query.collect()
+
+
+# ---------------------------------------------------------------------------
+# Season driver
+# ---------------------------------------------------------------------------
+
+
+def compute_season_impacts(
+    seasons: Iterable[int],
+    *,
+    loader: Callable[..., object] | None = None,
+    progress: ProgressCallback | None = None,
+    streaming: bool = False,
+    scanner: Callable[[int], pl.LazyFrame] | None = None,
+) -> pl.DataFrame:
+    """Load play-by-play one season at a time and aggregate impacts.
+
+    Args:
+        seasons: Seasons to process.
+        loader: ``loader(seasons=[season])`` returning play-by-play; defaults
+            to ``nflreadpy.load_pbp``. Ignored when ``streaming``.
+        progress: Called with an :class:`ImpactProgress` as each season starts
+            and finishes (e.g. to drive a progress bar).
+        streaming: Aggregate each season from a lazily scanned local parquet
+            with the streaming engine instead of loading it into memory.
+        scanner: ``scanner(season)`` returning a lazy play-by-play frame in
+            streaming mode; defaults to :func:`pbp_cache.scan_pbp_season`,
+            which downloads the season once into the local cache.
+
+    Returns:
+        Impacts for every season that loaded, in :data:`IMPACT_SCHEMA`.
+    """
+
+    load = loader or load_pbp
+    if not streaming and load is None:
+        raise RuntimeError("nflreadpy is not available; install dependencies to build player impacts.")
+    scan = scanner or scan_pbp_season
+
+    target = sorted({int(season) for season in seasons})
+    frames: list[pl.DataFrame] = []
+
+    def _emit(event: ImpactProgress) -> None:
+        if progress is not None:
+            progress(event)
+
+    for index, season in enumerate(target):
+        _emit(ImpactProgress(season, "loading", index, len(target)))
+        try:
+            if streaming:
+                impacts = aggregate_impacts(prepare_pbp_frame(scan(season), seasons=[season]), streaming=True)
+            else:
+                pbp = to_polars(load(seasons=[season]))
+                prepared = prepare_pbp_frame(pbp, seasons=[season]) if not pbp.is_empty() else pbp
+                del pbp
+                impacts = aggregate_impacts(prepared)
+        except Exception as exc:  # pragma: no cover - network/runtime fetch
+            logger.warning("Failed to build impacts for season %s: %s", season, exc)
+            _emit(ImpactProgress(season, "failed", index, len(target), error=exc))
+            continue
+        if impacts.is_empty():
+            _emit(ImpactProgress(season, "skipped", index, len(target)))
+            continue
+        frames.append(impacts)
+        logger.info("Aggregated impacts for %s (%s player-season rows).", season, impacts.height)
+        _emit(ImpactProgress(season, "done", index, len(target), rows=impacts.height))
+
+    if not frames:
+        return empty_impact_frame()
+    return pl.concat(frames, how="vertical_relaxed")
+
+
+__all__ = [
+    "IMPACT_SCHEMA",
+    "ImpactProgress",
+    "ProgressCallback",
+    "aggregate_impacts",
+    "collect_streaming",
+    "compute_season_impacts",
+    "empty_impact_frame",
+    "impact_query",
+    "prepare_pbp_frame",
+]
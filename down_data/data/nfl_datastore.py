@@ -13,13 +13,22 @@ Data Tables:
 - players: Static/slowly-changing player attributes (bio, birthplace, college, etc.)
 - player_seasons: Season-level statistics (games, snaps, stats)
 - player_impacts: EPA/WPA metrics by player-season
-- metadata.json: Schema version, date ranges, update timestamps, error log
+- rating_baselines: League mean/std per rating key and metric (derived from player_seasons)
+- player_ratings: 20-80 ratings for every player-season (derived from player_seasons + rating_baselines)
+- player_summary: Materialised view of player_seasons joined with bio columns and impacts,
+  sorted by player_id so a single player's rows are one row-group range read
+- metadata.json: Schema version, date ranges, update timestamps, data generation, error log
+
+Every table write bumps a monotonically increasing data generation in
+metadata.json (and records it per table), so in-memory caches here and in the
+service layer can tell cheaply whether the data behind them changed.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
@@ -29,6 +38,19 @@ from typing import Any, Iterable, Mapping, Sequence
 import polars as pl
 from requests import HTTPError
 
+from .impact_engine import (
+    ProgressCallback,
+    aggregate_impacts,
+    compute_season_impacts,
+    prepare_pbp_frame,
+)
+from .player_ratings import (
+    PLAYER_RATINGS_SCHEMA,
+    RATING_BASELINES_SCHEMA,
+    compute_player_ratings,
+    compute_rating_baselines,
+)
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -41,6 +63,9 @@ DATA_DIRECTORY = PROJECT_ROOT / "data" / "nflverse"
 PLAYERS_PATH = DATA_DIRECTORY / "players.parquet"
 PLAYER_SEASONS_PATH = DATA_DIRECTORY / "player_seasons.parquet"
 PLAYER_IMPACTS_PATH = DATA_DIRECTORY / "player_impacts.parquet"
+RATING_BASELINES_PATH = DATA_DIRECTORY / "rating_baselines.parquet"
+PLAYER_RATINGS_PATH = DATA_DIRECTORY / "player_ratings.parquet"
+PLAYER_SUMMARY_PATH = DATA_DIRECTORY / "player_summary.parquet"
 METADATA_PATH = DATA_DIRECTORY / "metadata.json"
 
 # Data availability constants
@@ -50,6 +75,20 @@ PFR_SNAP_MIN_SEASON = 2012
 
 SCHEMA_VERSION = "1.0.0"
 
+# Bio columns carried into the player_summary view
+PLAYER_SUMMARY_BIO_COLUMNS = (
+    "full_name", "birth_date", "birth_city", "birth_state",
+    "birth_country", "college", "handedness", "height", "weight",
+    "draft_year", "draft_round", "draft_pick", "draft_team",
+)
+# Small row groups keep per-player reads of the sorted view to a few pages
+PLAYER_SUMMARY_ROW_GROUP_SIZE = 4096
+# Tables computed from other tables; stale once any source is rewritten
+DERIVED_TABLE_SOURCES: dict[str, tuple[str, ...]] = {
+    "rating_baselines": ("player_seasons",),
+    "player_ratings": ("player_seasons", "rating_baselines"),
+}
+
 # ============================================================================
 # Schema Definitions
 # ============================================================================
@@ -136,6 +175,7 @@ PLAYER_SEASONS_SCHEMA: dict[str, pl.DataType] = {
     # Defensive stats
     "def_tackles_solo": pl.Int16,
     "def_tackle_assists": pl.Int16,
+    "def_tackles_with_assist": pl.Int16,
     "def_tackles_for_loss": pl.Int8,
     "def_sacks": pl.Float32,
     "def_qb_hits": pl.Int8,
@@ -239,9 +279,17 @@ class DataStoreMetadata:
     players_last_updated: str | None = None
     player_seasons_last_updated: str | None = None
     player_impacts_last_updated: str | None = None
+    rating_baselines_last_updated: str | None = None
+    player_ratings_last_updated: str | None = None
+    player_summary_last_updated: str | None = None
+    # Bumped on every table write; table_generations records each table's last bump
+    generation: int = 0
+    table_generations: dict[str, int] = field(default_factory=dict)
     total_players: int = 0
     total_player_seasons: int = 0
     total_impacts: int = 0
+    # Seasons each table was fully built for, e.g. {"player_seasons": [1999, ...]}
+    coverage: dict[str, list[int]] = field(default_factory=dict)
     errors: list[dict[str, Any]] = field(default_factory=list)
     
     def to_dict(self) -> dict[str, Any]:
@@ -254,6 +302,29 @@ class DataStoreMetadata:
         instance.errors = errors
         return instance
     
+    def bump_generation(self, table: str) -> int:
+        """Advance the data generation for a write to ``table`` and return it."""
+        self.generation += 1
+        self.table_generations[table] = self.generation
+        return self.generation
+    
+    def mark_covered(self, table: str, seasons: Iterable[int]) -> None:
+        """Record that ``table`` holds complete data for ``seasons``."""
+        covered = set(self.coverage.get(table, []))
+        covered.update(int(season) for season in seasons)
+        self.coverage[table] = sorted(covered)
+    
+    def covered_seasons(self, table: str) -> list[int]:
+        """Return the seasons ``table`` was fully built for."""
+        return list(self.coverage.get(table, []))
+    
+    def is_covered(self, table: str, seasons: Iterable[int]) -> bool:
+        """Return True when ``table`` is complete for every season in ``seasons``."""
+        covered = self.coverage.get(table)
+        if not covered:
+            return False
+        return set(int(season) for season in seasons).issubset(covered)
+    
     def add_error(self, operation: str, entity: str, error_type: str, message: str) -> None:
         error = RefreshError(
             timestamp=datetime.now().isoformat(),
@@ -293,6 +364,69 @@ def _empty_player_impacts_frame() -> pl.DataFrame:
     return pl.DataFrame(schema=PLAYER_IMPACTS_SCHEMA)
 
 
+def _empty_rating_baselines_frame() -> pl.DataFrame:
+    """Return an empty rating_baselines DataFrame with the correct schema."""
+    return pl.DataFrame(schema=RATING_BASELINES_SCHEMA)
+
+
+def _empty_player_ratings_frame() -> pl.DataFrame:
+    """Return an empty player_ratings DataFrame with the correct schema."""
+    return pl.DataFrame(schema=PLAYER_RATINGS_SCHEMA)
+
+
+def _compose_player_summary(
+    players: pl.LazyFrame,
+    player_seasons: pl.LazyFrame,
+    player_impacts: pl.LazyFrame,
+    *,
+    scope: pl.Expr | None = None,
+) -> pl.LazyFrame:
+    """Join player-seasons with bio columns and impacts, sorted by player.
+    
+    ``scope`` restricts the player-season rows composed. Seasons of players
+    missing from the players table are left out, as a detail page cannot
+    show them anyway.
+    """
+    if scope is not None:
+        player_seasons = player_seasons.filter(scope)
+    player_cols = set(players.collect_schema().names())
+    bio_cols = [c for c in PLAYER_SUMMARY_BIO_COLUMNS if c in player_cols]
+    impact_cols = [
+        c for c in player_impacts.collect_schema().names() if c not in {"player_id", "season", "_last_updated"}
+    ]
+    return (
+        player_seasons.join(
+            players.select(["player_id", *bio_cols]),
+            on="player_id",
+            how="inner",
+        )
+        .join(
+            player_impacts.select(["player_id", "season", *impact_cols]),
+            on=["player_id", "season"],
+            how="left",
+        )
+        .sort(["player_id", "season"])
+    )
+
+
+def _summary_scope(
+    seasons: Iterable[int] | None,
+    player_ids: Iterable[str] | None,
+) -> pl.Expr | None:
+    """Return a filter selecting the summary rows to rebuild (None means all)."""
+    exprs = []
+    if seasons is not None:
+        exprs.append(pl.col("season").is_in(sorted({int(s) for s in seasons if s is not None})))
+    if player_ids is not None:
+        exprs.append(pl.col("player_id").is_in(sorted({str(p) for p in player_ids if p is not None})))
+    if not exprs:
+        return None
+    scope = exprs[0]
+    for expr in exprs[1:]:
+        scope = scope | expr
+    return scope
+
+
 def _to_polars(frame: object) -> pl.DataFrame:
     """Convert various frame types to Polars DataFrame."""
     if isinstance(frame, pl.DataFrame):
@@ -344,6 +478,11 @@ class NFLDataStore:
         self._players_cache: pl.DataFrame | None = None
         self._seasons_cache: pl.DataFrame | None = None
         self._impacts_cache: pl.DataFrame | None = None
+        self._rating_baselines_cache: pl.DataFrame | None = None
+        self._player_ratings_cache: pl.DataFrame | None = None
+        # Table generation each in-memory frame was loaded at
+        self._cache_generations: dict[str, int] = {}
+        self._metadata_signature: tuple[int, int, int] | None = None
     
     @property
     def data_dir(self) -> Path:
@@ -361,10 +500,27 @@ class NFLDataStore:
     def player_impacts_path(self) -> Path:
         return self._data_dir / "player_impacts.parquet"
     
+    @property
+    def rating_baselines_path(self) -> Path:
+        return self._data_dir / "rating_baselines.parquet"
+    
+    @property
+    def player_ratings_path(self) -> Path:
+        return self._data_dir / "player_ratings.parquet"
+    
+    @property
+    def player_summary_path(self) -> Path:
+        return self._data_dir / "player_summary.parquet"
+    
     @property
     def metadata_path(self) -> Path:
         return self._data_dir / "metadata.json"
     
+    @property
+    def scrape_jobs_dir(self) -> Path:
+        """Directory holding checkpoints of resumable PFR scrapes."""
+        return self._data_dir / "scrape_jobs"
+    
     # -------------------------------------------------------------------------
     # Initialization and Metadata
     # -------------------------------------------------------------------------
@@ -378,7 +534,13 @@ class NFLDataStore:
         self._data_dir.mkdir(parents=True, exist_ok=True)
         
         if force or not self.metadata_path.exists():
-            self._metadata = DataStoreMetadata()
+            # Keep the generation monotonic across a forced reinitialisation
+            previous = self.load_metadata().generation
+            self._metadata = DataStoreMetadata(generation=previous)
+            if force:
+                for table in ("players", "player_seasons", "player_impacts", "rating_baselines", "player_ratings"):
+                    self._metadata.bump_generation(table)
+                self._invalidate_cache()
             self._save_metadata()
         
         if force or not self.players_path.exists():
@@ -390,6 +552,10 @@ class NFLDataStore:
         if force or not self.player_impacts_path.exists():
             _empty_player_impacts_frame().write_parquet(self.player_impacts_path, compression="zstd")
         
+        if force:
+            # The view is re-materialised by the first upsert into the fresh tables
+            self.player_summary_path.unlink(missing_ok=True)
+        
         logger.info("NFL Data Store initialized at %s", self._data_dir)
     
     def load_metadata(self) -> DataStoreMetadata:
@@ -402,9 +568,11 @@ class NFLDataStore:
             return self._metadata
         
         try:
+            signature = self._read_metadata_signature()
             with open(self.metadata_path, "r") as f:
                 data = json.load(f)
             self._metadata = DataStoreMetadata.from_dict(data)
+            self._metadata_signature = signature
         except Exception as exc:
             logger.warning("Failed to load metadata: %s", exc)
             self._metadata = DataStoreMetadata()
@@ -412,11 +580,58 @@ class NFLDataStore:
         return self._metadata
     
     def _save_metadata(self) -> None:
-        """Save metadata to disk."""
+        """Save metadata to disk (atomically, as other processes may read it)."""
         if self._metadata is None:
             return
-        with open(self.metadata_path, "w") as f:
+        tmp_path = self.metadata_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(self._metadata.to_dict(), f, indent=2)
+        os.replace(tmp_path, self.metadata_path)
+        self._metadata_signature = self._read_metadata_signature()
+    
+    def _read_metadata_signature(self) -> tuple[int, int, int] | None:
+        # Atomic replaces give every write a new inode, even within one mtime tick
+        try:
+            stat = self.metadata_path.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def generation(self) -> int:
+        """Return the current data generation.
+        
+        Costs one ``stat`` of metadata.json; the file is only re-read when
+        another process (e.g. the build script) has rewritten it.
+        """
+        if self._metadata is not None and self._read_metadata_signature() != self._metadata_signature:
+            self._metadata = None
+        return self.load_metadata().generation
+    
+    def table_generation(self, table: str) -> int:
+        """Return the generation at which ``table`` was last written."""
+        return self.table_generations().get(table, 0)
+    
+    def table_generations(self) -> dict[str, int]:
+        """Return the generation at which each table was last written."""
+        self.generation()
+        return dict(self.load_metadata().table_generations)
+    
+    def _cache_is_current(self, table: str) -> bool:
+        return self._cache_generations.get(table) == self.table_generation(table)
+    
+    def _remember_generation(self, table: str) -> None:
+        self._cache_generations[table] = self.table_generation(table)
+    
+    def _derived_table_is_current(self, table: str) -> bool:
+        """Return True when ``table`` exists and was written after its sources."""
+        if not (self._data_dir / f"{table}.parquet").exists():
+            return False
+        generations = self.table_generations()
+        table_generation = generations.get(table, 0)
+        return all(
+            generations.get(source, 0) <= table_generation
+            for source in DERIVED_TABLE_SOURCES[table]
+        )
     
     def get_status(self) -> dict[str, Any]:
         """Return current status of the data store."""
@@ -424,6 +639,7 @@ class NFLDataStore:
         return {
             "initialized": self.players_path.exists(),
             "schema_version": metadata.schema_version,
+            "generation": metadata.generation,
             "season_range": f"{metadata.season_start}-{metadata.season_end}",
             "total_players": metadata.total_players,
             "total_player_seasons": metadata.total_player_seasons,
@@ -433,8 +649,63 @@ class NFLDataStore:
                 "players": metadata.players_last_updated,
                 "player_seasons": metadata.player_seasons_last_updated,
                 "player_impacts": metadata.player_impacts_last_updated,
+                "rating_baselines": metadata.rating_baselines_last_updated,
+                "player_ratings": metadata.player_ratings_last_updated,
+                "player_summary": metadata.player_summary_last_updated,
             },
+            "coverage": {table: len(seasons) for table, seasons in metadata.coverage.items()},
+        }
+    
+    def record_coverage(self, table: str, seasons: Iterable[int]) -> list[int]:
+        """Mark ``table`` complete for the requested seasons it actually holds.
+        
+        Build steps call this after writing ``table``. Seasons whose rows are
+        missing (e.g. nflreadpy returned an empty frame) are not marked, so an
+        incomplete store never answers "no data" with authority. The players
+        table has no season column; it is marked only when non-empty.
+        
+        Returns:
+            The seasons marked.
+        """
+        requested = sorted({int(season) for season in seasons})
+        scans = {
+            "players": self.scan_players,
+            "player_seasons": self.scan_player_seasons,
+            "player_impacts": self.scan_player_impacts,
         }
+        lf = scans[table]()
+        if "season" in lf.collect_schema().names():
+            present = set(
+                lf.filter(pl.col("season").is_in(requested))
+                .select(pl.col("season").unique())
+                .collect()["season"]
+                .to_list()
+            )
+            marked = [season for season in requested if season in present]
+        else:
+            marked = requested if lf.select(pl.len()).collect().item() > 0 else []
+        if marked:
+            self.load_metadata().mark_covered(table, marked)
+        return marked
+    
+    def is_authoritative(
+        self,
+        tables: Iterable[str] = ("players", "player_seasons"),
+        *,
+        seasons: Iterable[int] | None = None,
+    ) -> bool:
+        """Return True when ``tables`` are complete for ``seasons``.
+        
+        A missing row in an authoritative table means the data does not
+        exist upstream either, so callers can answer "no data" without
+        falling back to a network load. ``seasons`` defaults to every season
+        nflverse publishes stats for, up to the newest season built.
+        """
+        metadata = self.load_metadata()
+        if seasons is None:
+            seasons = range(DEFAULT_SEASON_START, metadata.season_end + 1)
+        targets = list(seasons)
+        return all(metadata.is_covered(table, targets) for table in tables)
     
     # -------------------------------------------------------------------------
     # Table Loading (with caching)
@@ -442,13 +713,14 @@ class NFLDataStore:
     
     def load_players(self, *, refresh: bool = False) -> pl.DataFrame:
         """Load the players table."""
-        if self._players_cache is not None and not refresh:
+        if self._players_cache is not None and not refresh and self._cache_is_current("players"):
             return self._players_cache
         
         if not self.players_path.exists():
             return _empty_players_frame()
         
         self._players_cache = pl.read_parquet(self.players_path)
+        self._remember_generation("players")
         return self._players_cache
     
     def scan_players(self) -> pl.LazyFrame:
@@ -459,13 +731,14 @@ class NFLDataStore:
     
     def load_player_seasons(self, *, refresh: bool = False) -> pl.DataFrame:
         """Load the player_seasons table."""
-        if self._seasons_cache is not None and not refresh:
+        if self._seasons_cache is not None and not refresh and self._cache_is_current("player_seasons"):
             return self._seasons_cache
         
         if not self.player_seasons_path.exists():
             return _empty_player_seasons_frame()
         
         self._seasons_cache = pl.read_parquet(self.player_seasons_path)
+        self._remember_generation("player_seasons")
         return self._seasons_cache
     
     def scan_player_seasons(self) -> pl.LazyFrame:
@@ -476,13 +749,14 @@ class NFLDataStore:
     
     def load_player_impacts(self, *, refresh: bool = False) -> pl.DataFrame:
         """Load the player_impacts table."""
-        if self._impacts_cache is not None and not refresh:
+        if self._impacts_cache is not None and not refresh and self._cache_is_current("player_impacts"):
             return self._impacts_cache
         
         if not self.player_impacts_path.exists():
             return _empty_player_impacts_frame()
         
         self._impacts_cache = pl.read_parquet(self.player_impacts_path)
+        self._remember_generation("player_impacts")
         return self._impacts_cache
     
     def scan_player_impacts(self) -> pl.LazyFrame:
@@ -491,12 +765,61 @@ class NFLDataStore:
             return _empty_player_impacts_frame().lazy()
         return pl.scan_parquet(self.player_impacts_path)
     
+    def load_rating_baselines(self, *, refresh: bool = False) -> pl.DataFrame:
+        """Load the rating_baselines table.
+        
+        A missing table, or one written before the latest player_seasons
+        refresh, is recomputed from player_seasons and persisted.
+        """
+        is_current = self._derived_table_is_current("rating_baselines")
+        if (
+            self._rating_baselines_cache is not None
+            and not refresh
+            and is_current
+            and self._cache_is_current("rating_baselines")
+        ):
+            return self._rating_baselines_cache
+        
+        if is_current:
+            self._rating_baselines_cache = pl.read_parquet(self.rating_baselines_path)
+            self._remember_generation("rating_baselines")
+            return self._rating_baselines_cache
+        if self.player_seasons_path.exists() and self.rebuild_rating_baselines():
+            return self._rating_baselines_cache
+        return _empty_rating_baselines_frame()
+    
+    def load_player_ratings(self, *, refresh: bool = False) -> pl.DataFrame:
+        """Load the player_ratings table.
+        
+        A missing table, or one written before the latest player_seasons or
+        baselines refresh, is recomputed in one batch and persisted.
+        """
+        is_current = self._derived_table_is_current("player_ratings")
+        if (
+            self._player_ratings_cache is not None
+            and not refresh
+            and is_current
+            and self._cache_is_current("player_ratings")
+        ):
+            return self._player_ratings_cache
+        
+        if is_current:
+            self._player_ratings_cache = pl.read_parquet(self.player_ratings_path)
+            self._remember_generation("player_ratings")
+            return self._player_ratings_cache
+        if self.player_seasons_path.exists() and self.rebuild_player_ratings():
+            return self._player_ratings_cache
+        return _empty_player_ratings_frame()
+    
     def _invalidate_cache(self, tables: Iterable[str] | None = None) -> None:
         """Invalidate cached data."""
         if tables is None:
+            self._cache_generations.clear()
             self._players_cache = None
             self._seasons_cache = None
             self._impacts_cache = None
+            self._rating_baselines_cache = None
+            self._player_ratings_cache = None
             return
         
         for table in tables:
@@ -506,6 +829,10 @@ class NFLDataStore:
                 self._seasons_cache = None
             elif table == "player_impacts":
                 self._impacts_cache = None
+            elif table == "rating_baselines":
+                self._rating_baselines_cache = None
+            elif table == "player_ratings":
+                self._player_ratings_cache = None
     
     # -------------------------------------------------------------------------
     # Query Methods
@@ -594,72 +921,255 @@ class NFLDataStore:
         *,
         seasons: Iterable[int] | None = None,
     ) -> pl.DataFrame:
-        """Get combined player info, seasons, and impacts for a single player."""
-        players = self.get_players(player_ids=[player_id])
-        if players.height == 0:
-            return pl.DataFrame()
-        
-        player_seasons = self.get_player_seasons(player_id, seasons=seasons)
-        if player_seasons.height == 0:
-            return players
-        
-        impacts = self.get_player_impacts(player_id, seasons=seasons)
-        
-        # Join player info with seasons
-        combined = player_seasons.join(
-            players.select([
-                "player_id", "full_name", "birth_date", "birth_city", "birth_state",
-                "birth_country", "college", "handedness", "height", "weight",
-                "draft_year", "draft_round", "draft_pick", "draft_team"
-            ]),
-            on="player_id",
-            how="left",
-        )
+        """Get combined player info, seasons, and impacts for a single player.
         
-        # Join with impacts
-        if impacts.height > 0:
-            impact_cols = [c for c in impacts.columns if c not in {"player_id", "season", "_last_updated"}]
-            combined = combined.join(
-                impacts.select(["player_id", "season"] + impact_cols),
-                on=["player_id", "season"],
-                how="left",
+        Reads the materialised player_summary view. Stores built before the
+        view existed, or whose source tables were written without rebuilding
+        it, compose the same rows on the fly (without writing them back).
+        Players without season rows return their bio row alone.
+        """
+        if self.player_summary_is_current():
+            lf = pl.scan_parquet(self.player_summary_path)
+        else:
+            lf = _compose_player_summary(
+                self.scan_players(), self.scan_player_seasons(), self.scan_player_impacts()
             )
         
+        lf = lf.filter(pl.col("player_id") == player_id)
+        if seasons is not None:
+            season_list = list(seasons)
+            if season_list:
+                lf = lf.filter(pl.col("season").is_in(season_list))
+        
+        combined = lf.collect()
+        if combined.height == 0:
+            return self.get_players(player_ids=[player_id])
         return combined.sort("season")
     
+    def get_player_ratings(
+        self,
+        player_id: str | None = None,
+        *,
+        player_ids: Sequence[str] | None = None,
+        seasons: Iterable[int] | None = None,
+        latest_only: bool = False,
+    ) -> pl.DataFrame:
+        """Query player_ratings with optional filters.
+        
+        Args:
+            latest_only: Keep only each player's most recent rated season.
+        """
+        frame = self.load_player_ratings()
+        
+        if player_id:
+            frame = frame.filter(pl.col("player_id") == player_id)
+        elif player_ids:
+            frame = frame.filter(pl.col("player_id").is_in(list(player_ids)))
+        
+        if seasons is not None:
+            season_list = list(seasons)
+            if season_list:
+                frame = frame.filter(pl.col("season").is_in(season_list))
+        
+        if latest_only and frame.height:
+            frame = frame.sort(["player_id", "season"]).unique(
+                subset=["player_id"], keep="last", maintain_order=True
+            )
+        
+        return frame
+    
     # -------------------------------------------------------------------------
     # Save Methods
     # -------------------------------------------------------------------------
     
-    def _save_players(self, frame: pl.DataFrame) -> None:
-        """Save players table to disk."""
+    def _save_players(
+        self,
+        frame: pl.DataFrame,
+        *,
+        summary_player_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Save players table to disk and refresh the player_summary view.
+        
+        ``summary_player_ids`` limits the view rebuild to the players written;
+        without it the whole view is rebuilt.
+        """
+        summary_was_current = self.player_summary_is_current()
         frame.write_parquet(self.players_path, compression="zstd")
         self._players_cache = frame
         
         metadata = self.load_metadata()
+        self._cache_generations["players"] = metadata.bump_generation("players")
         metadata.players_last_updated = datetime.now().isoformat()
         metadata.total_players = frame.height
         self._save_metadata()
+        self._refresh_player_summary(summary_was_current, player_ids=summary_player_ids)
     
-    def _save_player_seasons(self, frame: pl.DataFrame) -> None:
-        """Save player_seasons table to disk."""
+    def _save_player_seasons(
+        self,
+        frame: pl.DataFrame,
+        *,
+        summary_seasons: Iterable[int] | None = None,
+    ) -> None:
+        """Save player_seasons table to disk and refresh the player_summary view.
+        
+        ``summary_seasons`` limits the view rebuild to the seasons written;
+        without it the whole view is rebuilt.
+        """
+        summary_was_current = self.player_summary_is_current()
         frame.write_parquet(self.player_seasons_path, compression="zstd")
         self._seasons_cache = frame
         
         metadata = self.load_metadata()
+        self._cache_generations["player_seasons"] = metadata.bump_generation("player_seasons")
         metadata.player_seasons_last_updated = datetime.now().isoformat()
         metadata.total_player_seasons = frame.height
         self._save_metadata()
+        self._refresh_player_summary(summary_was_current, seasons=summary_seasons)
+    
+    def _save_rating_baselines(self, frame: pl.DataFrame) -> None:
+        """Save rating_baselines table to disk."""
+        frame.write_parquet(self.rating_baselines_path, compression="zstd")
+        self._rating_baselines_cache = frame
+        
+        metadata = self.load_metadata()
+        self._cache_generations["rating_baselines"] = metadata.bump_generation("rating_baselines")
+        metadata.rating_baselines_last_updated = datetime.now().isoformat()
+        self._save_metadata()
+    
+    def rebuild_rating_baselines(self) -> int:
+        """Recompute rating baselines from player_seasons and persist them.
+        
+        Returns:
+            Number of (rating_key, metric) rows written.
+        """
+        baselines = compute_rating_baselines(self.scan_player_seasons())
+        if baselines.height == 0:
+            return 0
+        self._save_rating_baselines(baselines)
+        return baselines.height
+    
+    def _save_player_ratings(self, frame: pl.DataFrame) -> None:
+        """Save player_ratings table to disk."""
+        frame.write_parquet(self.player_ratings_path, compression="zstd")
+        self._player_ratings_cache = frame
+        
+        metadata = self.load_metadata()
+        self._cache_generations["player_ratings"] = metadata.bump_generation("player_ratings")
+        metadata.player_ratings_last_updated = datetime.now().isoformat()
+        self._save_metadata()
     
-    def _save_player_impacts(self, frame: pl.DataFrame) -> None:
-        """Save player_impacts table to disk."""
+    def rebuild_player_ratings(self) -> int:
+        """Rate every player-season against the stored baselines and persist them.
+        
+        Returns:
+            Number of player-season rating rows written.
+        """
+        ratings = compute_player_ratings(self.scan_player_seasons(), self.load_rating_baselines())
+        if ratings.height == 0:
+            return 0
+        self._save_player_ratings(ratings)
+        return ratings.height
+    
+    def _save_player_impacts(
+        self,
+        frame: pl.DataFrame,
+        *,
+        summary_seasons: Iterable[int] | None = None,
+    ) -> None:
+        """Save player_impacts table to disk and refresh the player_summary view.
+        
+        ``summary_seasons`` limits the view rebuild to the seasons written;
+        without it the whole view is rebuilt.
+        """
+        summary_was_current = self.player_summary_is_current()
         frame.write_parquet(self.player_impacts_path, compression="zstd")
         self._impacts_cache = frame
         
         metadata = self.load_metadata()
+        self._cache_generations["player_impacts"] = metadata.bump_generation("player_impacts")
         metadata.player_impacts_last_updated = datetime.now().isoformat()
         metadata.total_impacts = frame.height
         self._save_metadata()
+        self._refresh_player_summary(summary_was_current, seasons=summary_seasons)
+    
+    def _save_player_summary(self, frame: pl.DataFrame) -> None:
+        """Save the player_summary view to disk (atomically, as it is read while rebuilt)."""
+        tmp_path = self.player_summary_path.with_suffix(".parquet.tmp")
+        frame.write_parquet(
+            tmp_path,
+            compression="zstd",
+            statistics=True,
+            row_group_size=PLAYER_SUMMARY_ROW_GROUP_SIZE,
+        )
+        os.replace(tmp_path, self.player_summary_path)
+        
+        metadata = self.load_metadata()
+        metadata.bump_generation("player_summary")
+        metadata.player_summary_last_updated = datetime.now().isoformat()
+        self._save_metadata()
+    
+    def player_summary_is_current(self) -> bool:
+        """Return True when the view was rebuilt after every write to its sources.
+        
+        Every source-table save rebuilds the view, so this is False only when
+        the view is missing or a rebuild failed after its source was written.
+        The generation counters answer this without reading any parquet.
+        """
+        if not self.player_summary_path.exists():
+            return False
+        generations = self.table_generations()
+        view_generation = generations.get("player_summary", 0)
+        return all(
+            generations.get(table, 0) <= view_generation
+            for table in ("players", "player_seasons", "player_impacts")
+        )
+    
+    def _refresh_player_summary(
+        self,
+        was_current: bool,
+        *,
+        seasons: Iterable[int] | None = None,
+        player_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Rebuild the view after a source-table write.
+        
+        A scoped rebuild is only safe when the view was current before the
+        write; otherwise stale rows outside the scope would be kept.
+        """
+        if was_current and (seasons is not None or player_ids is not None):
+            self.rebuild_player_summary(seasons=seasons, player_ids=player_ids)
+        else:
+            self.rebuild_player_summary()
+    
+    def rebuild_player_summary(
+        self,
+        *,
+        seasons: Iterable[int] | None = None,
+        player_ids: Iterable[str] | None = None,
+    ) -> int:
+        """Materialise the player_summary view and persist it.
+        
+        With ``seasons`` and/or ``player_ids`` only the matching rows are
+        recomposed and spliced into the existing view; otherwise (or when no
+        view exists yet) the whole view is rebuilt.
+        
+        Returns:
+            Number of rows in the view.
+        """
+        scope = _summary_scope(seasons, player_ids)
+        if not self.player_summary_path.exists():
+            scope = None
+        
+        fresh = _compose_player_summary(
+            self.scan_players(), self.scan_player_seasons(), self.scan_player_impacts(), scope=scope
+        )
+        if scope is not None:
+            kept = pl.scan_parquet(self.player_summary_path).filter(~scope)
+            fresh = pl.concat([kept, fresh], how="diagonal_relaxed").sort(["player_id", "season"])
+        
+        summary = fresh.collect()
+        self._save_player_summary(summary)
+        return summary.height
     
     # -------------------------------------------------------------------------
     # Upsert Methods
@@ -677,7 +1187,7 @@ class NFLDataStore:
             new_data = new_data.with_columns(pl.lit(datetime.now()).alias("_last_updated"))
         
         if existing.height == 0:
-            self._save_players(new_data)
+            self._save_players(new_data, summary_player_ids=new_data["player_id"].unique())
             return new_data.height
         
         # Merge: new records override existing ones
@@ -685,7 +1195,7 @@ class NFLDataStore:
         merged = merged.unique(subset=["player_id"], keep="last")
         
         changes = merged.height - existing.height + new_data.height
-        self._save_players(merged)
+        self._save_players(merged, summary_player_ids=new_data["player_id"].unique())
         return changes
     
     def upsert_player_seasons(self, new_data: pl.DataFrame) -> int:
@@ -699,14 +1209,14 @@ class NFLDataStore:
             new_data = new_data.with_columns(pl.lit(datetime.now()).alias("_last_updated"))
         
         if existing.height == 0:
-            self._save_player_seasons(new_data)
+            self._save_player_seasons(new_data, summary_seasons=new_data["season"].unique())
             return new_data.height
         
         merged = pl.concat([existing, new_data], how="diagonal_relaxed")
         merged = merged.unique(subset=["player_id", "season"], keep="last")
         
         changes = merged.height - existing.height + new_data.height
-        self._save_player_seasons(merged)
+        self._save_player_seasons(merged, summary_seasons=new_data["season"].unique())
         return changes
     
     def upsert_player_impacts(self, new_data: pl.DataFrame) -> int:
@@ -720,14 +1230,14 @@ class NFLDataStore:
             new_data = new_data.with_columns(pl.lit(datetime.now()).alias("_last_updated"))
         
         if existing.height == 0:
-            self._save_player_impacts(new_data)
+            self._save_player_impacts(new_data, summary_seasons=new_data["season"].unique())
             return new_data.height
         
         merged = pl.concat([existing, new_data], how="diagonal_relaxed")
         merged = merged.unique(subset=["player_id", "season"], keep="last")
         
         changes = merged.height - existing.height + new_data.height
-        self._save_player_impacts(merged)
+        self._save_player_impacts(merged, summary_seasons=new_data["season"].unique())
         return changes
     
     # -------------------------------------------------------------------------
@@ -744,42 +1254,55 @@ class NFLDataStore:
         This is used for slowly-changing attributes like birthplace that
         only need to be fetched once.
         """
+        return self.update_player_bios({player_id: bio_fields}) > 0
+    
+    def update_player_bios(self, updates: Mapping[str, Mapping[str, str]]) -> int:
+        """Update bio fields for many players with a single write.
+        
+        Args:
+            updates: ``{player_id: {field: value}}``.
+        
+        Returns:
+            Number of players updated.
+        """
         players = self.load_players()
-        if players.height == 0:
-            return False
+        if players.height == 0 or not updates:
+            return 0
         
-        match_idx = players.filter(pl.col("player_id") == player_id)
-        if match_idx.height == 0:
-            return False
+        fields = sorted(
+            {field for bio in updates.values() for field in bio if field in players.columns}
+        )
+        if not fields:
+            return 0
         
-        update_exprs = []
-        for field, value in bio_fields.items():
-            if field in players.columns:
-                update_exprs.append(
-                    pl.when(pl.col("player_id") == player_id)
-                    .then(pl.lit(value))
-                    .otherwise(pl.col(field))
-                    .alias(field)
-                )
+        rows = [
+            {"player_id": player_id, **{f"_new_{field}": bio.get(field) for field in fields}}
+            for player_id, bio in updates.items()
+        ]
+        new_values = pl.DataFrame(
+            rows,
+            schema={"player_id": pl.Utf8, **{f"_new_{field}": pl.Utf8 for field in fields}},
+        )
+        matched = new_values.join(players.select("player_id"), on="player_id", how="semi").height
+        if matched == 0:
+            return 0
         
-        if update_exprs:
-            update_exprs.append(
-                pl.when(pl.col("player_id") == player_id)
-                .then(pl.lit(True))
-                .otherwise(pl.col("_bio_fetched"))
-                .alias("_bio_fetched")
-            )
-            update_exprs.append(
-                pl.when(pl.col("player_id") == player_id)
-                .then(pl.lit(datetime.now()))
-                .otherwise(pl.col("_last_updated"))
-                .alias("_last_updated")
+        players = (
+            players.join(new_values.with_columns(pl.lit(True).alias("_new_row")), on="player_id", how="left")
+            .with_columns(
+                [pl.coalesce(f"_new_{field}", field).alias(field) for field in fields]
+                + [
+                    pl.when(pl.col("_new_row")).then(pl.lit(True)).otherwise(pl.col("_bio_fetched")).alias("_bio_fetched"),
+                    pl.when(pl.col("_new_row"))
+                    .then(pl.lit(datetime.now()))
+                    .otherwise(pl.col("_last_updated"))
+                    .alias("_last_updated"),
+                ]
             )
-            players = players.with_columns(update_exprs)
-            self._save_players(players)
-            return True
-        
-        return False
+            .drop([f"_new_{field}" for field in fields] + ["_new_row"])
+        )
+        self._save_players(players, summary_player_ids=new_values["player_id"])
+        return matched
     
     def get_players_missing_bio(self) -> pl.DataFrame:
         """Get players that haven't had their bio fetched yet."""
@@ -819,6 +1342,7 @@ class NFLDataBuilder:
         force: bool = False,
         skip_bio: bool = False,
         skip_impacts: bool = False,
+        stream_pbp: bool = False,
     ) -> dict[str, Any]:
         """Build/refresh all data tables.
         
@@ -827,6 +1351,8 @@ class NFLDataBuilder:
             force: Force rebuild even if data exists.
             skip_bio: Skip fetching bio data from PFR.
             skip_impacts: Skip building impact metrics.
+            stream_pbp: Aggregate impacts from locally cached play-by-play
+                parquet with the streaming engine (bounded memory).
         
         Returns:
             Dictionary with build statistics.
@@ -844,6 +1370,9 @@ class NFLDataBuilder:
             "players_added": 0,
             "player_seasons_added": 0,
             "impacts_added": 0,
+            "rating_baselines": 0,
+            "player_ratings": 0,
+            "player_summary": 0,
             "bio_updated": 0,
             "errors": [],
         }
@@ -854,6 +1383,7 @@ class NFLDataBuilder:
         try:
             players_added = self._build_players(target_seasons)
             stats["players_added"] = players_added
+            self._store.record_coverage("players", target_seasons)
             logger.info("Added/updated %s players", players_added)
         except Exception as exc:
             logger.error("Failed to build players: %s", exc)
@@ -864,23 +1394,53 @@ class NFLDataBuilder:
         try:
             seasons_added = self._build_player_seasons(target_seasons)
             stats["player_seasons_added"] = seasons_added
+            self._store.record_coverage("player_seasons", target_seasons)
             logger.info("Added/updated %s player-season records", seasons_added)
         except Exception as exc:
             logger.error("Failed to build player_seasons: %s", exc)
             metadata.add_error("build_player_seasons", "all", type(exc).__name__, str(exc))
             stats["errors"].append({"table": "player_seasons", "error": str(exc)})
         
+        # Step 2b: Refresh rating baselines derived from player_seasons
+        try:
+            stats["rating_baselines"] = self._store.rebuild_rating_baselines()
+            logger.info("Computed %s rating baseline rows", stats["rating_baselines"])
+        except Exception as exc:
+            logger.error("Failed to build rating baselines: %s", exc)
+            metadata.add_error("build_rating_baselines", "all", type(exc).__name__, str(exc))
+            stats["errors"].append({"table": "rating_baselines", "error": str(exc)})
+        
+        # Step 2c: Re-rate every player-season against the refreshed baselines
+        try:
+            stats["player_ratings"] = self._store.rebuild_player_ratings()
+            logger.info("Computed %s player-season ratings", stats["player_ratings"])
+        except Exception as exc:
+            logger.error("Failed to build player ratings: %s", exc)
+            metadata.add_error("build_player_ratings", "all", type(exc).__name__, str(exc))
+            stats["errors"].append({"table": "player_ratings", "error": str(exc)})
+        
         # Step 3: Build player_impacts table
         if not skip_impacts:
             try:
-                impacts_added = self._build_player_impacts(target_seasons)
+                impacts_added = self._build_player_impacts(target_seasons, streaming=stream_pbp)
                 stats["impacts_added"] = impacts_added
+                self._store.record_coverage("player_impacts", target_seasons)
                 logger.info("Added/updated %s impact records", impacts_added)
             except Exception as exc:
                 logger.error("Failed to build player_impacts: %s", exc)
                 metadata.add_error("build_player_impacts", "all", type(exc).__name__, str(exc))
                 stats["errors"].append({"table": "player_impacts", "error": str(exc)})
         
+        # Step 3b: Materialise the player_summary view if no upsert left it current
+        if not self._store.player_summary_is_current():
+            try:
+                stats["player_summary"] = self._store.rebuild_player_summary()
+                logger.info("Materialised %s player summary rows", stats["player_summary"])
+            except Exception as exc:
+                logger.error("Failed to build player_summary: %s", exc)
+                metadata.add_error("build_player_summary", "all", type(exc).__name__, str(exc))
+                stats["errors"].append({"table": "player_summary", "error": str(exc)})
+        
         # Step 4: Update bio data
         if not skip_bio:
             try:
@@ -1097,6 +1657,7 @@ class NFLDataBuilder:
             "fumbles_lost": ["fumbles_lost"],
             "def_tackles_solo": ["def_tackles_solo"],
             "def_tackle_assists": ["def_tackle_assists"],
+            "def_tackles_with_assist": ["def_tackles_with_assist"],
             "def_sacks": ["def_sacks"],
             "def_interceptions": ["def_interceptions"],
             "def_pass_defended": ["def_pass_defended"],
@@ -1171,9 +1732,13 @@ class NFLDataBuilder:
         seasons: Sequence[int],
         id_mapping: pl.DataFrame,
     ) -> pl.DataFrame:
-        """Merge snap counts from PFR into the aggregated stats."""
-        from .pfr.client import PFRClient
-        from .pfr.snap_counts import fetch_team_snap_counts
+        """Merge season snap counts into the aggregated stats.
+        
+        nflverse bulk snap counts are the primary source; PFR team pages
+        fill in only the team-seasons those files do not cover.
+        """
+        from .pfr.jobs import ScrapeJob
+        from .season_snap_counts import collect_season_snap_counts
         
         TEAM_TO_PFR_SLUG: Mapping[str, str] = {
             "ARI": "crd", "ATL": "atl", "BAL": "rav", "BUF": "buf", "CAR": "car",
@@ -1192,34 +1757,22 @@ class NFLDataBuilder:
         
         season_teams = (
             aggregated.select(["season", "team"])
-            .filter(pl.col("team").is_not_null() & (pl.col("team") != ""))
+            .filter(pl.col("season").is_in(list(seasons)))
             .unique()
         )
         
-        snap_frames = []
-        with PFRClient(enable_cache=True, min_delay=1.5) as client:
-            for season in seasons:
-                teams = season_teams.filter(pl.col("season") == season)["team"].to_list()
-                for team in teams:
-                    slug = TEAM_TO_PFR_SLUG.get(team.upper())
-                    if not slug:
-                        continue
-                    try:
-                        snaps = fetch_team_snap_counts(client, team_slug=slug, season=season)
-                        if snaps.height > 0:
-                            snap_frames.append(snaps.with_columns([
-                                pl.lit(team.upper()).alias("team"),
-                                pl.lit(season).alias("season"),
-                            ]))
-                    except Exception as exc:
-                        logger.debug("Failed to fetch snaps for %s %s: %s", team, season, exc)
-        
-        if not snap_frames:
-            return aggregated
-        
-        snap_all = pl.concat(snap_frames, how="vertical_relaxed").filter(
-            pl.col("pfr_id").is_not_null() & (pl.col("pfr_id") != "")
+        # Gap-filling PFR pages are checkpointed, so an interrupted backfill resumes
+        job = ScrapeJob("pfr_snap_counts", directory=self._store.scrape_jobs_dir)
+        snap_all = collect_season_snap_counts(
+            season_teams,
+            team_to_slug=lambda team: TEAM_TO_PFR_SLUG.get(team.upper()),
+            job=job,
         )
+        if job.failed():
+            logger.warning("Snap-count pages parked after repeated failures: %s", ", ".join(job.failed()))
+        
+        if snap_all.is_empty():
+            return aggregated
         
         # Join with ID mapping
         aggregated_with_pfr = aggregated.join(
@@ -1231,7 +1784,9 @@ class NFLDataBuilder:
         # Merge snap data
         merged = aggregated_with_pfr.join(
             snap_all.select([
-                "pfr_id", "season", "team",
+                "pfr_id",
+                pl.col("season").cast(aggregated.schema["season"]),
+                "team",
                 pl.col("_snap_offense").alias("_pfr_offense_snaps"),
                 pl.col("_snap_defense").alias("_pfr_defense_snaps"),
                 pl.col("_snap_st").alias("_pfr_st_snaps"),
@@ -1260,222 +1815,41 @@ class NFLDataBuilder:
         drop_cols = [c for c in merged.columns if c.startswith("_pfr_") or c == "pfr_id"]
         return merged.drop(drop_cols)
     
-    def _build_player_impacts(self, seasons: Sequence[int]) -> int:
-        """Build/update the player_impacts table from play-by-play data."""
-        from nflreadpy import load_pbp
-        
-        aggregated_frames = []
-        
-        for season in seasons:
-            try:
-                pbp = _to_polars(load_pbp(seasons=[season]))
-                if pbp.is_empty():
-                    continue
-                
-                # Filter to regular season
-                if "season_type" in pbp.columns:
-                    pbp = pbp.filter(pl.col("season_type").str.to_uppercase() == "REG")
-                
-                impacts = self._aggregate_impacts_from_pbp(pbp, season)
-                if impacts.height > 0:
-                    aggregated_frames.append(impacts)
-                    logger.debug("Aggregated impacts for season %s: %s rows", season, impacts.height)
-                    
-            except Exception as exc:
-                logger.warning("Failed to build impacts for season %s: %s", season, exc)
-        
-        if not aggregated_frames:
+    def _build_player_impacts(
+        self,
+        seasons: Sequence[int],
+        *,
+        progress: ProgressCallback | None = None,
+        streaming: bool = False,
+    ) -> int:
+        """Build/update the player_impacts table from play-by-play data.
+
+        ``progress`` receives an :class:`ImpactProgress` per season, so callers
+        with a UI (the Rich build script) can report progress. ``streaming``
+        scans cached per-season parquet files instead of loading each season.
+        """
+        combined = compute_season_impacts(seasons, progress=progress, streaming=streaming)
+        if combined.is_empty():
             return 0
-        
-        combined = pl.concat(aggregated_frames, how="diagonal_relaxed")
+
         combined = combined.with_columns(pl.lit(datetime.now()).alias("_last_updated"))
-        
-        # Ensure schema columns
-        for col, dtype in PLAYER_IMPACTS_SCHEMA.items():
-            if col not in combined.columns:
-                combined = combined.with_columns(pl.lit(None).cast(dtype).alias(col))
-        
-        return self._store.upsert_player_impacts(combined)
+        return self._store.upsert_player_impacts(combined.select(list(PLAYER_IMPACTS_SCHEMA)))
     
     def _aggregate_impacts_from_pbp(self, pbp: pl.DataFrame, season: int) -> pl.DataFrame:
-        """Aggregate EPA/WPA metrics from play-by-play data."""
-        # This reuses logic from player_impacts.py but simplified
-        
-        def _numeric_expr(column: str) -> pl.Expr:
-            if column in pbp.columns:
-                return pl.col(column).cast(pl.Float64, strict=False).fill_null(0.0)
-            return pl.lit(0.0)
-        
-        frames = []
-        
-        # QB impacts - use wpa column if qb_wpa doesn't exist
-        if "passer_player_id" in pbp.columns:
-            # qb_epa is usually available, but qb_wpa might not be - use wpa instead
-            wpa_col = "qb_wpa" if "qb_wpa" in pbp.columns else "wpa"
-            epa_col = "qb_epa" if "qb_epa" in pbp.columns else "epa"
-            qb_data = (
-                pbp.filter(pl.col("passer_player_id").is_not_null())
-                .group_by("passer_player_id")
-                .agg([
-                    _numeric_expr(epa_col).sum().alias("qb_epa"),
-                    _numeric_expr(wpa_col).sum().alias("qb_wpa"),
-                ])
-                .rename({"passer_player_id": "player_id"})
-                .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-            )
-            frames.append(qb_data)
-        
-        # Skill impacts (rusher + receiver) with explosive play and first down counts
-        # First, prepare explosive play flags
-        yards_col = "yards_gained" if "yards_gained" in pbp.columns else None
-        complete_col = "complete_pass" if "complete_pass" in pbp.columns else None
-        first_down_col = "first_down" if "first_down" in pbp.columns else None
-        
-        # Rusher impacts
-        if "rusher_player_id" in pbp.columns:
-            rusher_aggs = [
-                _numeric_expr("epa").sum().alias("skill_epa"),
-                _numeric_expr("wpa").sum().alias("skill_wpa"),
-            ]
-            # Add 20+ yard rush count
-            if yards_col:
-                rusher_aggs.append(
-                    pl.when(pl.col(yards_col).cast(pl.Float64, strict=False).fill_null(0.0) >= 20)
-                    .then(1)
-                    .otherwise(0)
-                    .sum()
-                    .cast(pl.Int32)
-                    .alias("skill_rush_20_plus")
-                )
-            rusher_data = (
-                pbp.filter(pl.col("rusher_player_id").is_not_null())
-                .group_by("rusher_player_id")
-                .agg(rusher_aggs)
-                .rename({"rusher_player_id": "player_id"})
-                .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-            )
-            frames.append(rusher_data)
-        
-        # Receiver impacts
-        if "receiver_player_id" in pbp.columns:
-            receiver_aggs = [
-                _numeric_expr("epa").sum().alias("skill_epa"),
-                _numeric_expr("wpa").sum().alias("skill_wpa"),
-            ]
-            # Add 20+ yard reception count (only count completed passes)
-            if yards_col:
-                rec_20_condition = pl.col(yards_col).cast(pl.Float64, strict=False).fill_null(0.0) >= 20
-                if complete_col:
-                    rec_20_condition = rec_20_condition & (pl.col(complete_col) == 1)
-                receiver_aggs.append(
-                    pl.when(rec_20_condition)
-                    .then(1)
-                    .otherwise(0)
-                    .sum()
-                    .cast(pl.Int32)
-                    .alias("skill_rec_20_plus")
-                )
-            # Add first down count (only count completed passes that resulted in first downs)
-            if first_down_col:
-                first_down_condition = pl.col(first_down_col) == 1
-                if complete_col:
-                    first_down_condition = first_down_condition & (pl.col(complete_col) == 1)
-                receiver_aggs.append(
-                    pl.when(first_down_condition)
-                    .then(1)
-                    .otherwise(0)
-                    .sum()
-                    .cast(pl.Int32)
-                    .alias("skill_rec_first_downs")
-                )
-            receiver_data = (
-                pbp.filter(pl.col("receiver_player_id").is_not_null())
-                .group_by("receiver_player_id")
-                .agg(receiver_aggs)
-                .rename({"receiver_player_id": "player_id"})
-                .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-            )
-            frames.append(receiver_data)
-        
-        # Defensive impacts
-        def_cols = [
-            "solo_tackle_1_player_id", "interception_player_id",
-            "sack_player_id", "fumble_recovery_1_player_id"
-        ]
-        for col in def_cols:
-            if col in pbp.columns:
-                def_data = (
-                    pbp.filter(pl.col(col).is_not_null())
-                    .group_by(col)
-                    .agg([
-                        _numeric_expr("epa").sum().alias("def_epa"),
-                        _numeric_expr("wpa").sum().alias("def_wpa"),
-                    ])
-                    .rename({col: "player_id"})
-                    .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-                )
-                frames.append(def_data)
-        
-        # Kicker impacts
-        if "kicker_player_id" in pbp.columns:
-            kicker_data = (
-                pbp.filter(pl.col("kicker_player_id").is_not_null())
-                .group_by("kicker_player_id")
-                .agg([
-                    _numeric_expr("epa").sum().alias("kicker_epa"),
-                    _numeric_expr("wpa").sum().alias("kicker_wpa"),
-                ])
-                .rename({"kicker_player_id": "player_id"})
-                .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-            )
-            frames.append(kicker_data)
-        
-        # Punter impacts
-        if "punter_player_id" in pbp.columns:
-            punter_data = (
-                pbp.filter(pl.col("punter_player_id").is_not_null())
-                .group_by("punter_player_id")
-                .agg([
-                    _numeric_expr("epa").sum().alias("punter_epa"),
-                    _numeric_expr("wpa").sum().alias("punter_wpa"),
-                ])
-                .rename({"punter_player_id": "player_id"})
-                .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-            )
-            frames.append(punter_data)
-        
-        if not frames:
-            return pl.DataFrame(schema=PLAYER_IMPACTS_SCHEMA)
-        
-        # Merge all frames
-        merged = frames[0]
-        for frame in frames[1:]:
-            new_cols = [c for c in frame.columns if c not in {"player_id", "season"} and c not in merged.columns]
-            if new_cols:
-                merged = merged.join(
-                    frame.select(["player_id", "season"] + new_cols),
-                    on=["player_id", "season"],
-                    how="full",
-                    coalesce=True,
-                )
-            else:
-                # Aggregate duplicate metrics
-                merged = pl.concat([merged, frame], how="diagonal_relaxed").group_by(
-                    ["player_id", "season"]
-                ).agg([
-                    pl.col(c).sum() if c not in {"player_id", "season"} else pl.col(c).first()
-                    for c in merged.columns
-                ])
-        
-        return merged.filter(pl.col("player_id").is_not_null() & (pl.col("player_id") != ""))
+        """Aggregate EPA/WPA metrics for one season of play-by-play data."""
+        return aggregate_impacts(prepare_pbp_frame(pbp, seasons=[season]))
     
     def _update_bio_data(self, *, batch_size: int = 100) -> int:
         """Update bio data for players missing it.
         
         This fetches slowly-changing attributes like birthplace from PFR,
-        but only for players that haven't been fetched yet.
+        but only for players that haven't been fetched yet. Each fetched
+        player is checkpointed, so bios scraped by an interrupted run are
+        applied on the next run without requesting their pages again.
         """
+        from .pfr.archive import get_page_archive
         from .pfr.client import PFRClient
+        from .pfr.jobs import ScrapeJob
         from .pfr.players import fetch_player_bio_fields
         
         players = self._store.load_players()
@@ -1490,37 +1864,54 @@ class NFLDataBuilder:
         if missing.height == 0:
             return 0
         
-        # Limit batch size
-        to_fetch = missing.head(batch_size)
-        updated_count = 0
+        player_by_pfr: dict[str, str] = {}
+        for pfr_id, player_id in missing.select(["pfr_id", "player_id"]).iter_rows():
+            if pfr_id and player_id:
+                player_by_pfr.setdefault(pfr_id, player_id)
         
-        with PFRClient(enable_cache=True, min_delay=1.0) as client:
-            for row in to_fetch.iter_rows(named=True):
-                pfr_id = row.get("pfr_id")
-                player_id = row.get("player_id")
-                
-                if not pfr_id or not player_id:
-                    continue
-                
+        job = ScrapeJob("pfr_bio", directory=self._store.scrape_jobs_dir)
+        job.enqueue(player_by_pfr)
+        # Empty bios checkpointed by earlier runs get another attempt
+        job.reopen(
+            pfr_id for pfr_id, bio in job.completed().items() if pfr_id in player_by_pfr and not bio
+        )
+        
+        with PFRClient(enable_cache=True, min_delay=1.0, archive=get_page_archive()) as client:
+            for pfr_id in job.pending(player_by_pfr)[:batch_size]:
                 try:
-                    bio = fetch_player_bio_fields(client, pfr_id)
-                    if bio:
-                        self._store.update_player_bio(player_id, {
-                            "handedness": bio.get("handedness", "N/A"),
-                            "birth_city": bio.get("birth_city", "N/A"),
-                            "birth_state": bio.get("birth_state", "N/A"),
-                            "birth_country": bio.get("birth_country", "N/A"),
-                        })
-                        updated_count += 1
+                    bio = fetch_player_bio_fields(client, pfr_id) or {}
                 except HTTPError as exc:
                     if getattr(exc.response, "status_code", None) == 429:
                         logger.warning("Rate limited during bio fetch; stopping batch.")
                         break
                     logger.debug("Failed to fetch bio for %s: %s", pfr_id, exc)
+                    job.mark_failed(pfr_id, exc)
+                    continue
                 except Exception as exc:
                     logger.debug("Failed to fetch bio for %s: %s", pfr_id, exc)
-        
-        return updated_count
+                    job.mark_failed(pfr_id, exc)
+                    continue
+                if not bio:
+                    # Retried until max_attempts, then parked like other failures
+                    logger.debug("Empty bio result for %s", pfr_id)
+                    job.mark_failed(pfr_id, "empty bio result")
+                    continue
+                job.mark_done(pfr_id, bio)
+        
+        # Apply every checkpointed bio (this run's and any from earlier runs)
+        updates: dict[str, dict[str, str]] = {}
+        for pfr_id, bio in job.completed().items():
+            player_id = player_by_pfr.get(pfr_id)
+            if player_id is None or not bio:
+                continue
+            updates[player_id] = {
+                "handedness": bio.get("handedness", "N/A"),
+                "birth_city": bio.get("birth_city", "N/A"),
+                "birth_state": bio.get("birth_state", "N/A"),
+                "birth_country": bio.get("birth_country", "N/A"),
+            }
+        
+        return self._store.update_player_bios(updates)
 
 
 # ============================================================================
@@ -1549,6 +1940,7 @@ def build_store(
     force: bool = False,
     skip_bio: bool = False,
     skip_impacts: bool = False,
+    stream_pbp: bool = False,
 ) -> dict[str, Any]:
     """Build/refresh the default data store."""
     store = get_default_store()
@@ -1558,6 +1950,7 @@ def build_store(
         force=force,
         skip_bio=skip_bio,
         skip_impacts=skip_impacts,
+        stream_pbp=stream_pbp,
     )
 
 
@@ -1568,6 +1961,9 @@ __all__ = [
     "PLAYERS_SCHEMA",
     "PLAYER_SEASONS_SCHEMA", 
     "PLAYER_IMPACTS_SCHEMA",
+    "RATING_BASELINES_SCHEMA",
+    "PLAYER_RATINGS_SCHEMA",
+    "PLAYER_SUMMARY_BIO_COLUMNS",
     "get_default_store",
     "initialize_store",
     "build_store",
@@ -0,0 +1,138 @@
+"""Local per-season cache of nflverse play-by-play parquet files.
+
+``nflreadpy.load_pbp`` downloads a season and returns it fully materialised
+(~50k rows × ~370 columns). For builds, this module instead streams each
+season's release parquet to ``data/cache/pbp/play_by_play_<season>.parquet``
+once and hands out lazy ``scan_parquet`` frames, so aggregations read only the
+columns they need in batches and rebuilds reuse the local files.
+
+Completed seasons never expire. The current season is re-downloaded once its
+file is older than ``max_age``, matching :class:`PlayerStatsStore`.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import os
+from pathlib import Path
+from typing import Callable
+
+import polars as pl
+import requests
+
+from .player_stats_store import DEFAULT_CURRENT_SEASON_MAX_AGE, current_season
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PBP_CACHE_DIRECTORY = PROJECT_ROOT / "data" / "cache" / "pbp"
+PBP_URL_TEMPLATE = (
+    "https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{season}.parquet"
+)
+_CHUNK_SIZE = 1 << 20
+
+Downloader = Callable[[int, Path], None]
+
+
+def pbp_season_path(season: int, *, directory: Path | None = None) -> Path:
+    """Return the cache path for ``season``'s play-by-play parquet."""
+
+    return (directory or PBP_CACHE_DIRECTORY) / f"play_by_play_{int(season)}.parquet"
+
+
+def download_pbp_season(season: int, path: Path, *, timeout: float = 60.0) -> None:
+    """Stream the nflverse play-by-play release for ``season`` to ``path``.
+
+    The body is written in chunks to a temporary file and moved into place,
+    so an interrupted download never leaves a truncated parquet behind.
+    """
+
+    url = PBP_URL_TEMPLATE.format(season=int(season))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".parquet.tmp")
+    try:
+        with requests.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            with open(tmp_path, "wb") as handle:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    handle.write(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def is_pbp_season_fresh(
+    season: int,
+    *,
+    directory: Path | None = None,
+    max_age: timedelta = DEFAULT_CURRENT_SEASON_MAX_AGE,
+) -> bool:
+    """Return ``True`` when ``season`` is cached and does not need a refresh."""
+
+    path = pbp_season_path(season, directory=directory)
+    if not path.exists():
+        return False
+    if int(season) < current_season():
+        return True
+    modified = datetime.fromtimestamp(path.stat().st_mtime)
+    return datetime.now() - modified <= max_age
+
+
+def ensure_pbp_season(
+    season: int,
+    *,
+    directory: Path | None = None,
+    downloader: Downloader | None = None,
+    force_refresh: bool = False,
+    max_age: timedelta = DEFAULT_CURRENT_SEASON_MAX_AGE,
+) -> Path:
+    """Return the local parquet for ``season``, downloading it if missing or stale.
+
+    A stale current-season file is kept when its refresh fails, so builds
+    still run offline.
+    """
+
+    path = pbp_season_path(season, directory=directory)
+    if not force_refresh and is_pbp_season_fresh(season, directory=directory, max_age=max_age):
+        return path
+    logger.info("Downloading play-by-play for %s to %s", season, path)
+    try:
+        (downloader or download_pbp_season)(int(season), path)
+    except Exception as exc:
+        if force_refresh or not path.exists():
+            raise
+        logger.warning("Failed to refresh play-by-play for %s; using the cached file: %s", season, exc)
+    return path
+
+
+def scan_pbp_season(
+    season: int,
+    *,
+    directory: Path | None = None,
+    downloader: Downloader | None = None,
+    force_refresh: bool = False,
+    max_age: timedelta = DEFAULT_CURRENT_SEASON_MAX_AGE,
+) -> pl.LazyFrame:
+    """Return a lazy scan over ``season``'s cached play-by-play parquet."""
+
+    return pl.scan_parquet(
+        ensure_pbp_season(
+            season,
+            directory=directory,
+            downloader=downloader,
+            force_refresh=force_refresh,
+            max_age=max_age,
+        )
+    )
+
+
+__all__ = [
+    "PBP_CACHE_DIRECTORY",
+    "PBP_URL_TEMPLATE",
+    "download_pbp_season",
+    "ensure_pbp_season",
+    "is_pbp_season_fresh",
+    "pbp_season_path",
+    "scan_pbp_season",
+]
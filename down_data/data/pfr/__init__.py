@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from .archive import ArchivedPage, PageArchive, get_page_archive
 from .client import DEFAULT_USER_AGENT, PFRClient
+from .fetcher import ConcurrentPFRFetcher, FetchResult, TokenBucket
 from .html import (
     flatten_columns,
     list_table_ids,
@@ -10,11 +12,18 @@ from .html import (
     read_commented_table_by_id,
     read_table_by_id,
 )
+from .jobs import ScrapeJob
 from .players import fetch_player_page, fetch_player_tables
 
 __all__ = [
+    "ArchivedPage",
+    "ConcurrentPFRFetcher",
     "DEFAULT_USER_AGENT",
+    "FetchResult",
     "PFRClient",
+    "PageArchive",
+    "ScrapeJob",
+    "TokenBucket",
     "flatten_columns",
     "list_table_ids",
     "read_all_tables",
@@ -22,5 +31,6 @@ __all__ = [
     "read_table_by_id",
     "fetch_player_page",
     "fetch_player_tables",
+    "get_page_archive",
 ]
 
@@ -0,0 +1,260 @@
+"""Content-addressed, zstd-compressed archive of raw PFR pages.
+
+The ``requests_cache`` store behind :class:`PFRClient` keeps bodies
+uncompressed and can only be read back through the HTTP cache machinery. The
+archive keeps every fetched page body as its own zstd blob named by the
+SHA-256 of the HTML, plus an append-only index of ``(url, fetch date, digest)``
+entries. Identical bodies are stored once, and every stored page can be
+re-parsed offline and in parallel (:meth:`PageArchive.reparse`) when a parser
+changes, without touching the network.
+
+Layout::
+
+    data/cache/pfr_pages/index.jsonl
+    data/cache/pfr_pages/blobs/<digest[:2]>/<digest>.html.zst
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Callable, Iterable, TypeVar
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - fall back to pyarrow's codec
+    zstandard = None  # type: ignore[assignment]
+
+from .fetcher import FetchResult
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+PAGE_ARCHIVE_DIRECTORY = PROJECT_ROOT / "data" / "cache" / "pfr_pages"
+INDEX_FILENAME = "index.jsonl"
+DEFAULT_COMPRESSION_LEVEL = 10
+
+ResultT = TypeVar("ResultT")
+
+
+def _compress(data: bytes, level: int) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    import pyarrow as pa
+
+    return pa.Codec("zstd", compression_level=level).compress(data, asbytes=True)
+
+
+def _decompress(blob: bytes, size: int) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(blob, max_output_size=size)
+    import pyarrow as pa
+
+    return pa.Codec("zstd").decompress(blob, decompressed_size=size, asbytes=True)
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """Index entry for one stored fetch of ``url``."""
+
+    url: str
+    fetched_on: str
+    digest: str
+    size: int
+
+
+class PageArchive:
+    """Archive of raw page bodies keyed by URL and fetch date.
+
+    Args:
+        directory: Root directory of the archive.
+        level: zstd compression level for new blobs.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+    ) -> None:
+        self.directory = directory or PAGE_ARCHIVE_DIRECTORY
+        self.level = level
+        self._lock = threading.Lock()
+        self._entries: dict[str, list[ArchivedPage]] | None = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.directory / INDEX_FILENAME
+
+    def blob_path(self, digest: str) -> Path:
+        return self.directory / "blobs" / digest[:2] / f"{digest}.html.zst"
+
+    # ------------------------------------------------------------------
+    # Index
+
+    def _load_index(self) -> dict[str, list[ArchivedPage]]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, list[ArchivedPage]] = {}
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = ArchivedPage(**json.loads(line))
+                    except (json.JSONDecodeError, TypeError):
+                        # A crash mid-write can truncate the final line
+                        continue
+                    entries.setdefault(entry.url, []).append(entry)
+        self._entries = entries
+        return entries
+
+    def entries(self, urls: Iterable[str] | None = None, *, all_versions: bool = False) -> list[ArchivedPage]:
+        """Return index entries, by default only the latest fetch of each URL."""
+
+        with self._lock:
+            index = self._load_index()
+            selected = index if urls is None else {url: index[url] for url in urls if url in index}
+            if all_versions:
+                return [entry for versions in selected.values() for entry in versions]
+            return [versions[-1] for versions in selected.values() if versions]
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return bool(self._load_index().get(url))
+
+    # ------------------------------------------------------------------
+    # Writes
+
+    def put(self, url: str, html: str, *, fetched_on: date | None = None) -> ArchivedPage:
+        """Store ``html`` as fetched from ``url`` (deduplicated by content)."""
+
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        entry = ArchivedPage(
+            url=url,
+            fetched_on=(fetched_on or date.today()).isoformat(),
+            digest=digest,
+            size=len(data),
+        )
+
+        path = self.blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(_compress(data, self.level))
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            versions = self._load_index().setdefault(url, [])
+            latest = versions[-1] if versions else None
+            if latest is not None and latest.digest == digest and latest.fetched_on == entry.fetched_on:
+                return latest
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(asdict(entry)) + "\n")
+            versions.append(entry)
+        return entry
+
+    # ------------------------------------------------------------------
+    # Reads
+
+    def read(self, entry: ArchivedPage) -> str:
+        """Return the HTML stored for ``entry``."""
+
+        blob = self.blob_path(entry.digest).read_bytes()
+        return _decompress(blob, entry.size).decode("utf-8")
+
+    def get(self, url: str, *, fetched_on: date | None = None) -> str | None:
+        """Return the latest stored body for ``url`` (on or before ``fetched_on``)."""
+
+        with self._lock:
+            versions = list(self._load_index().get(url, []))
+        if fetched_on is not None:
+            cutoff = fetched_on.isoformat()
+            versions = [entry for entry in versions if entry.fetched_on <= cutoff]
+        if not versions:
+            return None
+        return self.read(versions[-1])
+
+    def reparse(
+        self,
+        parse: Callable[[ArchivedPage, str], ResultT],
+        *,
+        urls: Iterable[str] | None = None,
+        url_filter: Callable[[str], bool] | None = None,
+        max_workers: int | None = None,
+        processes: bool = False,
+    ) -> list[FetchResult[ArchivedPage, ResultT]]:
+        """Run ``parse`` over every archived page (latest fetch per URL).
+
+        Pages are decompressed and parsed in a thread pool, or a process pool
+        when ``processes`` is set (``parse`` must then be picklable). Failures
+        are reported per page rather than raised.
+        """
+
+        entries = [
+            entry
+            for entry in self.entries(urls)
+            if url_filter is None or url_filter(entry.url)
+        ]
+        if not entries:
+            return []
+
+        executor: Executor
+        if processes:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pfr-reparse")
+        with executor:
+            futures = [
+                (entry, executor.submit(_reparse_one, self.directory, entry, parse))
+                for entry in entries
+            ]
+            results: list[FetchResult[ArchivedPage, ResultT]] = []
+            for entry, future in futures:
+                try:
+                    results.append(FetchResult(key=entry, value=future.result()))
+                except Exception as exc:
+                    logger.debug("Re-parsing %s failed: %s", entry.url, exc)
+                    results.append(FetchResult(key=entry, error=exc))
+        logger.info("Re-parsed %s archived pages", len(results))
+        return results
+
+
+def _reparse_one(
+    directory: Path,
+    entry: ArchivedPage,
+    parse: Callable[[ArchivedPage, str], ResultT],
+) -> ResultT:
+    # Module-level so it can run in a process pool
+    return parse(entry, PageArchive(directory).read(entry))
+
+
+_default_archive: PageArchive | None = None
+
+
+def get_page_archive() -> PageArchive:
+    """Return the shared page archive."""
+
+    global _default_archive
+    if _default_archive is None:
+        _default_archive = PageArchive()
+    return _default_archive
+
+
+__all__ = [
+    "ArchivedPage",
+    "PAGE_ARCHIVE_DIRECTORY",
+    "PageArchive",
+    "get_page_archive",
+]
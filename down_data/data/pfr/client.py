@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urljoin
 
 import requests
@@ -14,6 +14,9 @@ try:  # pragma: no cover - optional dependency for caching
 except ImportError:  # pragma: no cover - cache support is optional
     requests_cache = None  # type: ignore[assignment]
 
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .archive import PageArchive
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.pro-football-reference.com"
@@ -31,6 +34,7 @@ class PFRClient:
     - identifying the application via a descriptive ``User-Agent``
     - enforcing a polite delay between requests
     - optional integration with :mod:`requests_cache` for local caching
+    - optionally storing every fetched body in a :class:`PageArchive`
     """
 
     def __init__(
@@ -44,8 +48,10 @@ class PFRClient:
         cache_name: str = "pfr_cache",
         cache_backend: str = "sqlite",
         cache_expire: Optional[int] = None,
+        archive: Optional["PageArchive"] = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self.archive = archive
         self.min_delay = max(0.0, min_delay)
         self.timeout = timeout
         self._last_request_ts: Optional[float] = None
@@ -110,6 +116,11 @@ class PFRClient:
         response = self.session.get(url, timeout=self.timeout, **kwargs)
         self._last_request_ts = time.time()
         response.raise_for_status()
+        if self.archive is not None:
+            try:
+                self.archive.put(url, response.text)
+            except OSError as exc:  # pragma: no cover - disk errors depend on deployment
+                logger.warning("Could not archive %s: %s", url, exc)
         return response
 
     def close(self) -> None:
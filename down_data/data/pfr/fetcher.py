@@ -0,0 +1,306 @@
+"""Concurrent, rate-limited page fetching for Pro-Football-Reference.
+
+:class:`PFRClient` enforces its delay by sleeping before every request, so a
+scrape runs strictly one page at a time and parsing adds to the wall clock.
+:class:`ConcurrentPFRFetcher` keeps several requests in flight while a shared
+:class:`TokenBucket` caps the overall request rate, and hands response bodies
+to a separate parser pool so HTML parsing overlaps with network waits.
+
+- Each network worker thread owns one :class:`PFRClient` (``requests`` sessions
+  are not thread-safe), so connections are reused across requests.
+- ``429 Too Many Requests`` responses back off exponentially (honouring
+  ``Retry-After``) and pause the shared bucket so every worker slows down.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Generic, Hashable, Iterable, TypeVar
+
+import requests
+from requests import HTTPError
+
+from .client import PFRClient
+
+if TYPE_CHECKING:  # pragma: no cover - imported for annotations only
+    from .archive import PageArchive
+
+logger = logging.getLogger(__name__)
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ResultT = TypeVar("ResultT")
+
+# Sustained request rate; matches the historical 1.5s delay between requests
+DEFAULT_REQUESTS_PER_SECOND = 1 / 1.5
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF_SECONDS = 5.0
+
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every fetch worker.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Maximum burst size.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.capacity), self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. after a 429)."""
+
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = now + seconds
+
+
+@dataclass(frozen=True)
+class FetchResult(Generic[KeyT, ResultT]):
+    """Outcome of one fetch: the parsed value or the error that stopped it."""
+
+    key: KeyT
+    value: ResultT | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ConcurrentPFRFetcher:
+    """Fetch many PFR pages concurrently under a shared rate limit.
+
+    Args:
+        rate: Sustained requests per second across all workers.
+        burst: Requests allowed back-to-back before the rate applies.
+        max_workers: Concurrent network requests.
+        parse_workers: Threads parsing response bodies.
+        retries: Attempts per page for rate limits and transient errors.
+        backoff: Base delay in seconds, doubled on each retry.
+        client_factory: Builds one :class:`PFRClient` per network worker.
+        archive: Raw page archive the default clients store bodies in.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = 1,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        parse_workers: int = 1,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF_SECONDS,
+        client_factory: Callable[[], PFRClient] | None = None,
+        limiter: TokenBucket | None = None,
+        archive: "PageArchive | None" = None,
+    ) -> None:
+        self.limiter = limiter or TokenBucket(rate, burst)
+        self.max_workers = max(1, max_workers)
+        self.parse_workers = max(1, parse_workers)
+        self.retries = max(1, retries)
+        self.backoff = max(0.0, backoff)
+        self._client_factory = client_factory or (
+            lambda: PFRClient(enable_cache=True, min_delay=0.0, archive=archive)
+        )
+        self._local = threading.local()
+        self._clients: list[PFRClient] = []
+        self._clients_lock = threading.Lock()
+        # Long-lived pools so worker threads (and their sessions) are reused
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pfr-fetch"
+        )
+        self._parse_pool = ThreadPoolExecutor(
+            max_workers=self.parse_workers, thread_name_prefix="pfr-parse"
+        )
+
+    # ------------------------------------------------------------------
+    # Network side
+
+    def _client(self) -> PFRClient:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._client_factory()
+            self._local.client = client
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def _retry_delay(self, attempt: int, response: requests.Response | None) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return self.backoff * (2 ** attempt)
+
+    @staticmethod
+    def _is_cached(client: PFRClient, path: str) -> bool:
+        cache = getattr(client.session, "cache", None)
+        if cache is None:
+            return False
+        try:
+            return bool(cache.contains(url=client.build_url(path)))
+        except Exception:  # pragma: no cover - depends on requests-cache version
+            return False
+
+    def fetch_text(self, path: str) -> str:
+        """Fetch ``path`` under the rate limit, retrying on 429 and transient errors."""
+
+        client = self._client()
+        cached = self._is_cached(client, path)
+        for attempt in range(self.retries):
+            # Responses served from the HTTP cache never reach PFR
+            if not cached or attempt:
+                self.limiter.acquire()
+            try:
+                return client.get(path).text
+            except HTTPError as exc:
+                response = exc.response
+                status = getattr(response, "status_code", None)
+                if status not in _RETRYABLE_STATUS or attempt == self.retries - 1:
+                    raise
+                wait = self._retry_delay(attempt, response)
+                if status == 429:
+                    self.limiter.pause(wait)
+                logger.warning("PFR returned %s for %s; retrying in %.1fs.", status, path, wait)
+                time.sleep(wait)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt == self.retries - 1:
+                    raise
+                wait = self._retry_delay(attempt, None)
+                logger.warning("PFR request for %s failed (%s); retrying in %.1fs.", path, exc, wait)
+                time.sleep(wait)
+        raise RuntimeError(f"Exceeded retry attempts for {path}")  # pragma: no cover - loop returns or raises
+
+    # ------------------------------------------------------------------
+    # Batch API
+
+    def fetch_many(
+        self,
+        items: Iterable[KeyT],
+        *,
+        path_for: Callable[[KeyT], str],
+        parse: Callable[[KeyT, str], ResultT],
+        on_result: Callable[[FetchResult[KeyT, ResultT]], None] | None = None,
+    ) -> list[FetchResult[KeyT, ResultT]]:
+        """Fetch and parse every item, returning results in input order.
+
+        ``path_for`` maps an item to the page to request; ``parse`` turns the
+        page body into a result on the parser pool. Failures are reported as
+        results with ``error`` set rather than raised. ``on_result`` is called
+        from a worker thread as soon as each item finishes (e.g. to checkpoint
+        it), so it must be thread-safe.
+        """
+
+        keys = list(items)
+
+        def _notify(result: FetchResult[KeyT, ResultT]) -> None:
+            if on_result is None:
+                return
+            try:
+                on_result(result)
+            except Exception as exc:  # pragma: no cover - callback errors are logged only
+                logger.warning("Result callback for %r failed: %s", result.key, exc)
+
+        def _parse(key: KeyT, text: str) -> ResultT:
+            try:
+                value = parse(key, text)
+            except Exception as exc:
+                _notify(FetchResult(key=key, error=exc))
+                raise
+            _notify(FetchResult(key=key, value=value))
+            return value
+
+        def _fetch(key: KeyT) -> Future[ResultT]:
+            try:
+                text = self.fetch_text(path_for(key))
+            except Exception as exc:
+                _notify(FetchResult(key=key, error=exc))
+                raise
+            # Hand the body to the parser pool and go straight back to the network
+            return self._parse_pool.submit(_parse, key, text)
+
+        fetch_futures = [(key, self._fetch_pool.submit(_fetch, key)) for key in keys]
+
+        results: list[FetchResult[KeyT, ResultT]] = []
+        for key, fetch_future in fetch_futures:
+            try:
+                value = fetch_future.result().result()
+            except Exception as exc:
+                logger.debug("Fetching %r failed: %s", key, exc)
+                results.append(FetchResult(key=key, error=exc))
+                continue
+            results.append(FetchResult(key=key, value=value))
+        return results
+
+    def close(self) -> None:
+        """Stop the worker pools and close every worker's client session."""
+
+        self._fetch_pool.shutdown(wait=True)
+        self._parse_pool.shutdown(wait=True)
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.close()
+
+    def __enter__(self) -> "ConcurrentPFRFetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+__all__ = [
+    "ConcurrentPFRFetcher",
+    "DEFAULT_REQUESTS_PER_SECOND",
+    "FetchResult",
+    "TokenBucket",
+]
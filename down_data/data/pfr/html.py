@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import io
-from typing import Iterable, Sequence, Optional
+import re
+from typing import Iterable, Sequence
 
 import pandas as pd
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup
+
+from . import tables as fast_tables
+
+_COMMENT_PATTERN = re.compile(r"<!--(.*?)-->", re.DOTALL)
 
 
 def read_all_tables(html: str) -> list[pd.DataFrame]:
@@ -24,34 +29,6 @@ def _read_single_table(table_html: str) -> pd.DataFrame:
     return tables[0]
 
 
-def _ensure_soup(html: str, soup: Optional[BeautifulSoup]) -> BeautifulSoup:
-    return soup if soup is not None else BeautifulSoup(html, "lxml")
-
-
-def _collect_table_ids_from_soup(source: BeautifulSoup, ids: set[str]) -> None:
-    """Populate ``ids`` with table identifiers discovered in ``source``."""
-
-    for container in source.find_all(
-        "div", id=lambda value: isinstance(value, str) and value.startswith("div_")
-    ):
-        ids.add(container["id"][4:])
-
-    for table in source.find_all("table"):
-        table_id = table.get("id")
-        if table_id:
-            ids.add(table_id)
-
-    for comment in source.find_all(string=lambda text: isinstance(text, Comment)):
-        try:
-            snippet = comment.strip()
-            if "div_" not in snippet and "<table" not in snippet:
-                continue
-            comment_soup = BeautifulSoup(comment, "lxml")
-        except Exception:
-            continue
-        _collect_table_ids_from_soup(comment_soup, ids)
-
-
 def read_table_by_id(
     html: str,
     table_id: str,
@@ -61,15 +38,16 @@ def read_table_by_id(
     """Return a table whose ``id`` attribute matches ``table_id``.
 
     The helper checks both regular tables and tables wrapped in HTML comments,
-    mirroring the layout conventions used across Sports Reference sites.
+    mirroring the layout conventions used across Sports Reference sites. The
+    table is located in the raw markup, so no soup is built; ``soup`` is
+    accepted for backwards compatibility and ignored. Callers that want a
+    Polars frame should use :func:`tables.read_table`, which skips pandas.
     """
 
-    soup = _ensure_soup(html, soup)
-    table = soup.find("table", id=table_id)
-    if table is not None:
-        return _read_single_table(str(table))
-
-    return read_commented_table_by_id(html, table_id, soup=soup)
+    fragment = fast_tables.find_table_html(html, table_id)
+    if fragment is None:
+        raise ValueError(f"Table '{table_id}' not found in supplied HTML.")
+    return _read_single_table(fragment)
 
 
 def read_commented_table_by_id(
@@ -80,22 +58,10 @@ def read_commented_table_by_id(
 ) -> pd.DataFrame:
     """Return a comment-wrapped table matching ``table_id``."""
 
-    soup = _ensure_soup(html, soup)
-    container = soup.find("div", id=f"div_{table_id}")
-    comments: Iterable[str]
-
-    if container is not None:
-        comments = container.find_all(
-            string=lambda text: isinstance(text, Comment)
-        )
-    else:
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-
-    for comment in comments:
-        comment_soup = BeautifulSoup(comment, "lxml")
-        table = comment_soup.find("table", id=table_id)
-        if table is not None:
-            return _read_single_table(str(table))
+    for comment in _COMMENT_PATTERN.finditer(html):
+        fragment = fast_tables.find_table_html(comment.group(1), table_id)
+        if fragment is not None:
+            return _read_single_table(fragment)
 
     raise ValueError(f"Table '{table_id}' not found in HTML comments.")
 
@@ -166,10 +132,11 @@ def select_table_with_columns(
 
 
 def list_table_ids(html: str, *, soup: BeautifulSoup | None = None) -> list[str]:
-    """Return the table identifiers exposed by ``div_*`` wrappers on the page."""
+    """Return the table identifiers exposed by ``div_*`` wrappers on the page.
+
+    Comment-wrapped tables are found by scanning the raw markup; ``soup`` is
+    accepted for backwards compatibility and ignored.
+    """
 
-    soup = _ensure_soup(html, soup)
-    table_ids: set[str] = set()
-    _collect_table_ids_from_soup(soup, table_ids)
-    return sorted(table_ids)
+    return fast_tables.list_table_ids(html)
 
@@ -0,0 +1,245 @@
+"""Durable, resumable work queues for long-running PFR scrapes.
+
+A :class:`ScrapeJob` keeps an append-only checkpoint log in its own directory
+(``<data dir>/scrape_jobs/<name>/``). Every enqueued item and every completed
+item is written (and flushed) as it happens, so a backfill interrupted after
+hours of work resumes with exactly the items that have not succeeded yet and
+never requests a completed page again.
+
+Small results (e.g. bio fields) are stored inline in the log; tabular results
+are written next to it as one parquet file per item.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import Any, Iterable
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "checkpoints.jsonl"
+RESULTS_DIRNAME = "results"
+
+# Items failing this many times are parked instead of retried forever
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class ScrapeJob:
+    """Work queue with per-item completion checkpoints stored on disk.
+
+    Args:
+        name: Job name; also the directory name under ``directory``.
+        directory: Parent directory holding job folders.
+        max_attempts: Failures after which an item stops being returned by
+            :meth:`pending` (until :meth:`retry_failed` is called).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        directory: Path,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        self.name = name
+        self.path = directory / name
+        self.max_attempts = max(1, max_attempts)
+        self._lock = threading.Lock()
+        self._order: list[str] = []
+        self._known: set[str] = set()
+        self._done: dict[str, Any] = {}
+        self._failures: dict[str, int] = {}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.path / CHECKPOINT_FILENAME
+
+    def _load(self) -> None:
+        if not self.checkpoint_path.exists():
+            return
+        with open(self.checkpoint_path, "r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can truncate the final line
+                    logger.warning(
+                        "Ignoring malformed checkpoint line %s in %s", line_number, self.checkpoint_path
+                    )
+                    continue
+                self._apply(record)
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        key = str(record.get("key"))
+        event = record.get("event")
+        if event == "enqueue":
+            if key not in self._known:
+                self._known.add(key)
+                self._order.append(key)
+        elif event == "done":
+            self._done[key] = record.get("result")
+        elif event == "failed":
+            self._failures[key] = self._failures.get(key, 0) + 1
+        elif event == "retry":
+            self._failures[key] = 0
+        elif event == "reopen":
+            self._done.pop(key, None)
+            self._failures[key] = 0
+
+    def _append(self, records: Iterable[dict[str, Any]]) -> None:
+        lines = [json.dumps(record, default=str) for record in records]
+        if not lines:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.checkpoint_path, "a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    # ------------------------------------------------------------------
+    # Queue API
+
+    def enqueue(self, keys: Iterable[str]) -> int:
+        """Add ``keys`` not already known to the job; returns how many were added."""
+
+        with self._lock:
+            new_keys = [key for key in dict.fromkeys(str(key) for key in keys) if key not in self._known]
+            timestamp = datetime.now().isoformat()
+            self._append({"event": "enqueue", "key": key, "at": timestamp} for key in new_keys)
+            for key in new_keys:
+                self._apply({"event": "enqueue", "key": key})
+            return len(new_keys)
+
+    def pending(self, keys: Iterable[str] | None = None) -> list[str]:
+        """Return queued items (optionally limited to ``keys``) still to be fetched."""
+
+        with self._lock:
+            candidates = self._order if keys is None else [str(key) for key in keys]
+            return [
+                key
+                for key in candidates
+                if key not in self._done and self._failures.get(key, 0) < self.max_attempts
+            ]
+
+    def is_done(self, key: str) -> bool:
+        with self._lock:
+            return key in self._done
+
+    def result(self, key: str) -> Any:
+        """Return the inline result stored for a completed item."""
+
+        with self._lock:
+            return self._done.get(key)
+
+    def completed(self) -> dict[str, Any]:
+        """Return ``{key: inline result}`` for every completed item."""
+
+        with self._lock:
+            return dict(self._done)
+
+    def failed(self) -> list[str]:
+        """Return items parked after reaching ``max_attempts`` failures."""
+
+        with self._lock:
+            return [
+                key
+                for key, count in self._failures.items()
+                if key not in self._done and count >= self.max_attempts
+            ]
+
+    def mark_done(self, key: str, result: Any = None) -> None:
+        """Checkpoint ``key`` as completed (durably, before returning)."""
+
+        record = {"event": "done", "key": key, "result": result, "at": datetime.now().isoformat()}
+        with self._lock:
+            self._append([record])
+            self._apply(record)
+
+    def mark_failed(self, key: str, error: BaseException | str) -> None:
+        record = {"event": "failed", "key": key, "error": str(error), "at": datetime.now().isoformat()}
+        with self._lock:
+            self._append([record])
+            self._apply(record)
+
+    def retry_failed(self) -> int:
+        """Return parked items to the queue; returns how many were reset."""
+
+        keys = self.failed()
+        records = [{"event": "retry", "key": key} for key in keys]
+        with self._lock:
+            self._append(records)
+            for record in records:
+                self._apply(record)
+        return len(keys)
+
+    def reopen(self, keys: Iterable[str]) -> int:
+        """Return completed items to the queue, e.g. when their result proved unusable.
+
+        Returns how many items were reopened.
+        """
+
+        with self._lock:
+            reopened = [key for key in dict.fromkeys(str(key) for key in keys) if key in self._done]
+            records = [{"event": "reopen", "key": key} for key in reopened]
+            self._append(records)
+            for record in records:
+                self._apply(record)
+            return len(reopened)
+
+    def reset(self) -> None:
+        """Delete every checkpoint and stored result for this job."""
+
+        with self._lock:
+            if self.path.exists():
+                shutil.rmtree(self.path)
+            self._order.clear()
+            self._known.clear()
+            self._done.clear()
+            self._failures.clear()
+
+    # ------------------------------------------------------------------
+    # Tabular results
+
+    def _frame_path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.path / RESULTS_DIRNAME / f"{digest}.parquet"
+
+    def complete_with_frame(self, key: str, frame: pl.DataFrame) -> None:
+        """Store ``frame`` as the result of ``key`` and checkpoint it as done."""
+
+        path = self._frame_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        frame.write_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+        self.mark_done(key, {"frame": path.name})
+
+    def load_frame(self, key: str) -> pl.DataFrame | None:
+        """Return the stored frame for a completed item, if any."""
+
+        result = self.result(key)
+        if not isinstance(result, dict) or "frame" not in result:
+            return None
+        path = self.path / RESULTS_DIRNAME / str(result["frame"])
+        if not path.exists():
+            return None
+        return pl.read_parquet(path)
+
+
+__all__ = ["ScrapeJob"]
@@ -7,7 +7,8 @@ from typing import Optional
 import polars as pl
 
 from .client import PFRClient
-from .html import flatten_columns, read_all_tables, read_table_by_id
+from .html import flatten_columns, read_all_tables
+from .tables import read_table
 
 
 def fetch_league_table(
@@ -24,15 +25,18 @@ def fetch_league_table(
     html = response.text
 
     if table_id:
-        table = read_table_by_id(html, table_id)
-    else:
-        tables = read_all_tables(html)
-        if table_index >= len(tables):
-            raise IndexError(
-                f"Table index {table_index} out of range for {path!r} "
-                f"(found {len(tables)} tables)."
-            )
-        table = tables[table_index]
+        frame = read_table(html, table_id)
+        if season is not None and "season" not in frame.columns:
+            frame = frame.with_columns(pl.lit(season).alias("season"))
+        return frame
+
+    tables = read_all_tables(html)
+    if table_index >= len(tables):
+        raise IndexError(
+            f"Table index {table_index} out of range for {path!r} "
+            f"(found {len(tables)} tables)."
+        )
+    table = tables[table_index]
 
     table = flatten_columns(table)
     if season is not None and "season" not in table.columns:
@@ -9,7 +9,7 @@ from bs4 import BeautifulSoup
 import re
 
 from .client import PFRClient
-from .html import flatten_columns, list_table_ids, read_table_by_id
+from .tables import list_table_ids, read_table
 
 _HAND_PATTERN = re.compile(r"(Throws|Shoots|Kicks):\s*([A-Za-z]+)", re.IGNORECASE)
 
@@ -28,17 +28,14 @@ def fetch_player_page(client: PFRClient, player_id: str) -> str:
 def extract_player_tables(html: str, table_ids: Iterable[str] | None = None) -> dict[str, pl.DataFrame]:
     """Parse all available tables from ``html`` and return Polars frames keyed by id."""
 
-    soup = BeautifulSoup(html, "lxml")
-    ids = list(table_ids) if table_ids is not None else list_table_ids(html, soup=soup)
+    ids = list(table_ids) if table_ids is not None else list_table_ids(html)
     tables: dict[str, pl.DataFrame] = {}
 
     for table_id in ids:
         try:
-            table = read_table_by_id(html, table_id, soup=soup)
+            tables[table_id] = read_table(html, table_id)
         except ValueError:
             continue
-        flattened = flatten_columns(table)
-        tables[table_id] = pl.from_pandas(flattened)
 
     return tables
 
@@ -2,91 +2,112 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import logging
+import re
+from typing import Callable, Iterable
 
 import polars as pl
-from bs4 import BeautifulSoup, Comment, Tag
+from lxml.html import HtmlElement
 
+from .archive import ArchivedPage, PageArchive, get_page_archive
 from .client import PFRClient
+from .fetcher import ConcurrentPFRFetcher, FetchResult
+from .jobs import ScrapeJob
+from .tables import body_rows, find_table_html, parse_table_element
 
-SNAP_COUNTS_TABLE_ID = "snap_counts"
-
-
-def _parse_int(value: str | None) -> int:
-    if value is None:
-        return 0
-    cleaned = value.replace(",", "").replace("%", "").strip()
-    if not cleaned:
-        return 0
-    try:
-        return int(float(cleaned))
-    except ValueError:
-        return 0
-
+logger = logging.getLogger(__name__)
 
-def _iter_snap_rows(table: Tag) -> Iterable[dict[str, object]]:
-    body = table.find("tbody")
-    if body is None:
-        return []
+SNAP_COUNTS_TABLE_ID = "snap_counts"
 
-    rows: list[dict[str, object]] = []
-    for row in body.find_all("tr"):
-        if "class" in row.attrs and "thead" in row["class"]:
-            continue
 
-        player_cell = row.find("th")
-        if player_cell is None:
+def _player_id_from_cell(cell: HtmlElement) -> str:
+    pfr_id = (cell.get("data-append-csv") or "").strip()
+    if pfr_id:
+        return pfr_id
+    hrefs = cell.xpath(".//a/@href")
+    if hrefs:
+        return hrefs[0].rstrip("/").split("/")[-1].replace(".htm", "")
+    return ""
+
+
+def _snap_count_expr(column: str) -> pl.Expr:
+    """Parse ``"1,024"``/``"85%"`` style cells to integers (blank -> 0)."""
+
+    return (
+        pl.col(column)
+        .str.replace_all(r"[,%]", "")
+        .str.strip_chars()
+        .cast(pl.Float64, strict=False)
+        .fill_null(0)
+        .cast(pl.Int64)
+    )
+
+
+def _extract_snap_table(html: str) -> HtmlElement:
+    fragment = find_table_html(html, SNAP_COUNTS_TABLE_ID)
+    if fragment is None:
+        raise ValueError("Snap-count table not found in supplied HTML.")
+    return parse_table_element(fragment)
+
+
+def _empty_snap_frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        schema=[
+            ("pfr_id", pl.Utf8),
+            ("player_name", pl.Utf8),
+            ("position", pl.Utf8),
+            ("_snap_offense", pl.Int64),
+            ("_snap_defense", pl.Int64),
+            ("_snap_st", pl.Int64),
+        ]
+    )
+
+
+def snap_counts_path(team_slug: str, season: int) -> str:
+    """Return the PFR path of the snap-count page for ``team_slug`` in ``season``."""
+
+    return f"/teams/{team_slug.lower()}/{season}-snap-counts.htm"
+
+
+def parse_snap_counts_html(html: str) -> pl.DataFrame:
+    """Parse a team snap-count page into one row per player."""
+
+    table = _extract_snap_table(html)
+    columns: dict[str, list[str]] = {
+        "pfr_id": [],
+        "player_name": [],
+        "position": [],
+        "_snap_offense": [],
+        "_snap_defense": [],
+        "_snap_st": [],
+    }
+    for row in body_rows(table):
+        player_cells = row.xpath("./th[1]")
+        if not player_cells:
             continue
-        player_name = player_cell.get_text(strip=True)
+        player_name = player_cells[0].text_content().strip()
         if not player_name or player_name.lower().startswith("team total"):
             continue
-
-        pfr_id = (player_cell.get("data-append-csv") or "").strip()
-        if not pfr_id:
-            link = player_cell.find("a")
-            if link and link.get("href"):
-                href = link["href"]
-                pfr_id = href.rstrip("/").split("/")[-1].replace(".htm", "")
+        pfr_id = _player_id_from_cell(player_cells[0])
         if not pfr_id:
             continue
-
-        cells = row.find_all("td")
+        cells = [cell.text_content().strip() for cell in row.xpath("./td")]
         if len(cells) < 6:
             continue
-
-        pos = cells[0].get_text(strip=True)
-        offense_snaps = _parse_int(cells[1].get_text(strip=True))
-        defense_snaps = _parse_int(cells[3].get_text(strip=True))
-        st_snaps = _parse_int(cells[5].get_text(strip=True))
-
-        rows.append(
-            {
-                "pfr_id": pfr_id,
-                "player_name": player_name,
-                "position": pos,
-                "_snap_offense": offense_snaps,
-                "_snap_defense": defense_snaps,
-                "_snap_st": st_snaps,
-            }
-        )
-    return rows
-
-
-def _extract_snap_table(html: str) -> Tag:
-    soup = BeautifulSoup(html, "lxml")
-    table = soup.find("table", id=SNAP_COUNTS_TABLE_ID)
-    if table is not None:
-        return table
-
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        try:
-            snippet = BeautifulSoup(comment, "lxml")
-        except Exception:
-            continue
-        table = snippet.find("table", id=SNAP_COUNTS_TABLE_ID)
-        if table is not None:
-            return table
-    raise ValueError("Snap-count table not found in supplied HTML.")
+        columns["pfr_id"].append(pfr_id)
+        columns["player_name"].append(player_name)
+        columns["position"].append(cells[0])
+        columns["_snap_offense"].append(cells[1])
+        columns["_snap_defense"].append(cells[3])
+        columns["_snap_st"].append(cells[5])
+
+    if not columns["pfr_id"]:
+        return _empty_snap_frame()
+    return pl.DataFrame(columns, schema={name: pl.Utf8 for name in columns}).with_columns(
+        _snap_count_expr("_snap_offense"),
+        _snap_count_expr("_snap_defense"),
+        _snap_count_expr("_snap_st"),
+    )
 
 
 def fetch_team_snap_counts(
@@ -97,21 +118,127 @@ def fetch_team_snap_counts(
 ) -> pl.DataFrame:
     """Return snap counts for ``team_slug`` (PFR team code) in ``season``."""
 
-    path = f"/teams/{team_slug.lower()}/{season}-snap-counts.htm"
-    response = client.get(path)
-    table = _extract_snap_table(response.text)
-    rows = list(_iter_snap_rows(table))
-    if not rows:
-        return pl.DataFrame(
-            schema=[
-                ("pfr_id", pl.Utf8),
-                ("player_name", pl.Utf8),
-                ("position", pl.Utf8),
-                ("_snap_offense", pl.Int64),
-                ("_snap_defense", pl.Int64),
-                ("_snap_st", pl.Int64),
-            ]
+    response = client.get(snap_counts_path(team_slug, season))
+    return parse_snap_counts_html(response.text)
+
+
+def fetch_snap_counts_many(
+    team_seasons: Iterable[tuple[str, int]],
+    *,
+    fetcher: ConcurrentPFRFetcher | None = None,
+    on_result: Callable[[FetchResult[tuple[str, int], pl.DataFrame]], None] | None = None,
+) -> list[FetchResult[tuple[str, int], pl.DataFrame]]:
+    """Fetch snap counts for many ``(team_slug, season)`` pairs concurrently.
+
+    Requests share one rate limit and parsing runs off the network threads.
+    A fetcher is created (and closed) when none is supplied; its pages are
+    kept in the shared raw page archive.
+    """
+
+    owns_fetcher = fetcher is None
+    active = fetcher or ConcurrentPFRFetcher(archive=get_page_archive())
+    try:
+        return active.fetch_many(
+            team_seasons,
+            path_for=lambda key: snap_counts_path(key[0], key[1]),
+            parse=lambda _key, html: parse_snap_counts_html(html),
+            on_result=on_result,
         )
-    return pl.from_dicts(rows)
+    finally:
+        if owns_fetcher:
+            active.close()
+
+
+def _job_key(team_slug: str, season: int) -> str:
+    return f"{team_slug.lower()}/{int(season)}"
+
+
+def fetch_snap_counts_resumable(
+    team_seasons: Iterable[tuple[str, int]],
+    job: ScrapeJob,
+    *,
+    fetcher: ConcurrentPFRFetcher | None = None,
+) -> dict[tuple[str, int], pl.DataFrame]:
+    """Fetch snap counts through a checkpointed :class:`ScrapeJob`.
+
+    Pages already completed by an earlier (possibly interrupted) run are read
+    from the job's stored results; only the remaining pages are requested, and
+    each one is checkpointed as soon as it has been parsed.
+
+    Returns:
+        ``{(team_slug, season): frame}`` for every page that is available.
+    """
+
+    requested = list(dict.fromkeys((slug, int(season)) for slug, season in team_seasons))
+    by_key = {_job_key(slug, season): (slug, season) for slug, season in requested}
+    job.enqueue(by_key)
+
+    pending = [by_key[key] for key in job.pending(by_key)]
+    if pending:
+        logger.info(
+            "Fetching %s snap-count pages (%s already checkpointed)",
+            len(pending),
+            len(requested) - len(pending),
+        )
+
+        def _checkpoint(result: FetchResult[tuple[str, int], pl.DataFrame]) -> None:
+            key = _job_key(*result.key)
+            if result.ok and result.value is not None:
+                job.complete_with_frame(key, result.value)
+            else:
+                job.mark_failed(key, result.error or "no result")
+
+        fetch_snap_counts_many(pending, fetcher=fetcher, on_result=_checkpoint)
 
+    frames: dict[tuple[str, int], pl.DataFrame] = {}
+    for key, team_season in by_key.items():
+        frame = job.load_frame(key)
+        if frame is not None:
+            frames[team_season] = frame
+    return frames
 
+
+_SNAP_COUNTS_URL = re.compile(r"/teams/([a-z0-9]+)/(\d{4})-snap-counts\.htm$")
+
+
+def _parse_archived_snap_counts(entry: ArchivedPage, html: str) -> pl.DataFrame:
+    match = _SNAP_COUNTS_URL.search(entry.url)
+    frame = parse_snap_counts_html(html)
+    return frame.with_columns(
+        pl.lit(match.group(1) if match else None, dtype=pl.Utf8).alias("team_slug"),
+        pl.lit(int(match.group(2)) if match else None, dtype=pl.Int64).alias("season"),
+    )
+
+
+def reparse_archived_snap_counts(
+    archive: PageArchive | None = None,
+    *,
+    max_workers: int | None = None,
+    processes: bool = True,
+) -> pl.DataFrame:
+    """Re-parse every archived snap-count page offline.
+
+    Returns one frame with ``team_slug`` and ``season`` columns added, so
+    parser fixes can be applied to past scrapes without network requests.
+    """
+
+    active = archive or get_page_archive()
+    results = active.reparse(
+        _parse_archived_snap_counts,
+        url_filter=lambda url: _SNAP_COUNTS_URL.search(url) is not None,
+        max_workers=max_workers,
+        processes=processes,
+    )
+    frames = []
+    for result in results:
+        if not result.ok:
+            logger.warning("Could not re-parse %s: %s", result.key.url, result.error)
+            continue
+        if result.value is not None and result.value.height:
+            frames.append(result.value)
+    if not frames:
+        return _empty_snap_frame().with_columns(
+            pl.lit(None, dtype=pl.Utf8).alias("team_slug"),
+            pl.lit(None, dtype=pl.Int64).alias("season"),
+        )
+    return pl.concat(frames, how="vertical_relaxed")
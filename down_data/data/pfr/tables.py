@@ -0,0 +1,191 @@
+"""Direct lxml parsing of Pro-Football-Reference tables into Polars.
+
+PFR pages are large and hide most tables inside HTML comments. Building a
+BeautifulSoup tree for the whole page, re-parsing every comment, and then
+round-tripping a table through ``pandas.read_html`` dominated scrape time.
+This module instead:
+
+- locates a table by its ``id`` with a regular expression over the raw page,
+  which finds comment-wrapped tables without parsing the comments;
+- parses only that table fragment with lxml;
+- reads cells with XPath straight into Polars columns.
+
+Header rows are flattened the same way as :func:`html.flatten_columns`
+(``"Group_Column"``), and numeric columns are typed like ``read_html`` would
+(thousands separators removed).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Sequence
+
+import polars as pl
+from lxml import html as lxml_html
+
+_TABLE_ID_PATTERN = re.compile(r"""<table\b[^>]*?\bid\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+_DIV_ID_PATTERN = re.compile(r"""<div\b[^>]*?\bid\s*=\s*["']div_([^"']+)["']""", re.IGNORECASE)
+_TABLE_END_PATTERN = re.compile(r"</table\s*>", re.IGNORECASE)
+
+# Rows PFR repeats mid-table as header separators
+_BODY_ROWS_XPATH = "./tbody/tr[not(contains(concat(' ', normalize-space(@class), ' '), ' thead '))]"
+
+
+def list_table_ids(html: str) -> list[str]:
+    """Return every table id on the page, including comment-wrapped tables."""
+
+    ids = {match.group(1) for match in _TABLE_ID_PATTERN.finditer(html)}
+    ids.update(match.group(1) for match in _DIV_ID_PATTERN.finditer(html))
+    return sorted(ids)
+
+
+def find_table_html(html: str, table_id: str) -> str | None:
+    """Return the ``<table>`` markup for ``table_id`` or ``None`` when absent.
+
+    Comment-wrapped tables are plain text in the page source, so the same
+    search covers both cases.
+    """
+
+    pattern = re.compile(
+        rf"""<table\b[^>]*?\bid\s*=\s*["']{re.escape(table_id)}["']""",
+        re.IGNORECASE,
+    )
+    start = pattern.search(html)
+    if start is None:
+        return None
+    end = _TABLE_END_PATTERN.search(html, start.end())
+    if end is None:
+        return None
+    return html[start.start() : end.end()]
+
+
+def parse_table_element(table_html: str) -> lxml_html.HtmlElement:
+    """Parse a single ``<table>`` fragment with lxml."""
+
+    return lxml_html.fragment_fromstring(table_html)
+
+
+def body_rows(table: lxml_html.HtmlElement) -> list[lxml_html.HtmlElement]:
+    """Return the data rows of ``table``, skipping repeated header rows."""
+
+    return table.xpath(_BODY_ROWS_XPATH) or table.xpath("./tr[td]")
+
+
+def _cell_text(cell: lxml_html.HtmlElement) -> str:
+    return cell.text_content().strip()
+
+
+def _span(cell: lxml_html.HtmlElement) -> int:
+    try:
+        return max(1, int(cell.get("colspan", 1)))
+    except ValueError:
+        return 1
+
+
+def _header_names(table: lxml_html.HtmlElement) -> list[str]:
+    header_rows = table.xpath("./thead/tr")
+    if not header_rows:
+        header_rows = table.xpath("./tr[th and not(td)][1]")
+    levels: list[list[str]] = []
+    for row in header_rows:
+        expanded: list[str] = []
+        for cell in row.xpath("./th|./td"):
+            expanded.extend([_cell_text(cell)] * _span(cell))
+        levels.append(expanded)
+    if not levels:
+        return []
+
+    width = max(len(level) for level in levels)
+    names: list[str] = []
+    for index in range(width):
+        parts = [level[index] for level in levels if index < len(level) and level[index]]
+        # Group labels repeat across spanned columns; keep each label once
+        names.append("_".join(dict.fromkeys(parts)))
+    return _dedupe(names)
+
+
+def _dedupe(names: Sequence[str]) -> list[str]:
+    seen: dict[str, int] = {}
+    final: list[str] = []
+    for index, name in enumerate(names):
+        if not name:
+            name = f"col_{index}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        else:
+            seen[name] = 0
+        final.append(name)
+    return final
+
+
+def _infer_column(values: pl.Series) -> pl.Series:
+    """Cast a string column to Int64/Float64 when every value is numeric."""
+
+    value = pl.col(values.name)
+    present = value.str.strip_chars() != ""
+    cleaned = pl.DataFrame([values]).select(
+        pl.when(present).then(value).alias("text"),
+        pl.when(present).then(value.str.replace_all(",", "").str.strip_chars()).alias("number"),
+    )
+    text = cleaned.get_column("text").alias(values.name)
+    number = cleaned.get_column("number").alias(values.name)
+    non_null = number.drop_nulls()
+    if non_null.len() == 0:
+        return text
+    if non_null.cast(pl.Int64, strict=False).null_count() == 0:
+        return number.cast(pl.Int64, strict=False)
+    if non_null.cast(pl.Float64, strict=False).null_count() == 0:
+        return number.cast(pl.Float64, strict=False)
+    return text
+
+
+def table_to_polars(table: lxml_html.HtmlElement, *, infer_types: bool = True) -> pl.DataFrame:
+    """Convert a parsed ``<table>`` element into a Polars frame."""
+
+    columns = _header_names(table)
+    rows = body_rows(table)
+    width = max([len(columns)] + [len(row.xpath("./th|./td")) for row in rows]) if rows else len(columns)
+    if len(columns) < width:
+        columns = _dedupe(columns + [""] * (width - len(columns)))
+
+    data: list[list[str | None]] = [[] for _ in range(width)]
+    for row in rows:
+        cells = row.xpath("./th|./td")
+        position = 0
+        for cell in cells:
+            text = _cell_text(cell)
+            for _ in range(_span(cell)):
+                if position < width:
+                    data[position].append(text)
+                position += 1
+        for index in range(position, width):
+            data[index].append(None)
+
+    series = [pl.Series(name, values, dtype=pl.Utf8) for name, values in zip(columns, data)]
+    if infer_types:
+        series = [_infer_column(values) for values in series]
+    return pl.DataFrame(series)
+
+
+def read_table(html: str, table_id: str, *, infer_types: bool = True) -> pl.DataFrame:
+    """Return the table ``table_id`` (plain or comment-wrapped) as a Polars frame.
+
+    Raises:
+        ValueError: If the page has no table with that id.
+    """
+
+    fragment = find_table_html(html, table_id)
+    if fragment is None:
+        raise ValueError(f"Table '{table_id}' not found in supplied HTML.")
+    return table_to_polars(parse_table_element(fragment), infer_types=infer_types)
+
+
+__all__ = [
+    "body_rows",
+    "find_table_html",
+    "list_table_ids",
+    "parse_table_element",
+    "read_table",
+    "table_to_polars",
+]
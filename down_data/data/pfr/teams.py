@@ -11,9 +11,9 @@ from .html import (
     flatten_columns,
     normalise_column_names,
     read_all_tables,
-    read_commented_table_by_id,
     select_table_with_columns,
 )
+from .tables import read_table
 
 
 def _team_path(team_abbr: str, season: int) -> str:
@@ -42,9 +42,7 @@ def parse_schedule_table(html: str) -> pl.DataFrame:
 def parse_team_stats_table(html: str, table_id: str = "team_stats") -> pl.DataFrame:
     """Extract a comment-wrapped team stats table."""
 
-    table = read_commented_table_by_id(html, table_id)
-    table = flatten_columns(table)
-    return pl.from_pandas(table)
+    return read_table(html, table_id)
 
 
 def fetch_team_schedule(client: PFRClient, team_abbr: str, season: int) -> pl.DataFrame:
@@ -0,0 +1,208 @@
+"""Consolidated parquet tables for the PFR advanced stats exports.
+
+The PFR advanced stats ship as one CSV per stat type and season
+(``pfr_<type>_advanced_<season>.csv``). Reading and filtering those files on
+every detail page load made CSV parsing the dominant cost, so each stat type is
+converted once into a single typed parquet file sorted by ``pfr_id`` with a
+``season`` column. Lookups are then a filtered scan that only decodes the row
+groups holding the requested player.
+
+The parquet is rebuilt automatically whenever a CSV export is newer than it.
+A rebuild that cannot read every export keeps the previous parquet, or dates a
+first partial build before the unreadable exports so it is retried.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Iterable
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+PFR_RAW_DIRECTORY = Path(__file__).resolve().parent / "raw" / "pfr"
+
+PFR_ADVANCED_FILE_PREFIXES: dict[str, str] = {
+    "passing": "pfr_passing_advanced",
+    "rushing": "pfr_rushing_advanced",
+    "receiving": "pfr_receiving_advanced",
+    "defense": "pfr_defense_advanced",
+}
+
+# Rows per parquet row group; keeps pfr_id statistics selective
+PFR_ADVANCED_ROW_GROUP_SIZE = 4_096
+
+_CHECKED_LOCK = threading.Lock()
+_checked_paths: set[Path] = set()
+
+
+def _file_prefix(stat_type: str) -> str:
+    if stat_type not in PFR_ADVANCED_FILE_PREFIXES:
+        options = ", ".join(PFR_ADVANCED_FILE_PREFIXES)
+        raise ValueError(f"Invalid stat_type '{stat_type}'. Choose one of: {options}.")
+    return PFR_ADVANCED_FILE_PREFIXES[stat_type]
+
+
+def pfr_advanced_parquet_path(stat_type: str, *, directory: Path | None = None) -> Path:
+    """Return the consolidated parquet path for ``stat_type``."""
+
+    return (directory or PFR_RAW_DIRECTORY) / f"{_file_prefix(stat_type)}.parquet"
+
+
+def _season_csvs(stat_type: str, directory: Path) -> dict[int, Path]:
+    prefix = _file_prefix(stat_type)
+    pattern = re.compile(rf"^{re.escape(prefix)}_(\d{{4}})\.csv$")
+    csvs: dict[int, Path] = {}
+    if not directory.exists():
+        return csvs
+    for path in directory.iterdir():
+        match = pattern.match(path.name)
+        if match:
+            csvs[int(match.group(1))] = path
+    return csvs
+
+
+def _parquet_is_current(parquet_path: Path, csvs: dict[int, Path]) -> bool:
+    if not parquet_path.exists():
+        return False
+    built_at = parquet_path.stat().st_mtime
+    return all(path.stat().st_mtime <= built_at for path in csvs.values())
+
+
+def build_pfr_advanced_parquet(
+    stat_type: str,
+    *,
+    directory: Path | None = None,
+    force: bool = False,
+) -> Path | None:
+    """Convert the per-season CSV exports for ``stat_type`` into one parquet file.
+
+    The last CSV column holds the PFR player ID and is renamed to ``pfr_id``.
+
+    Returns:
+        Path of the parquet file, or ``None`` when no exports exist.
+    """
+
+    source_dir = directory or PFR_RAW_DIRECTORY
+    parquet_path = pfr_advanced_parquet_path(stat_type, directory=source_dir)
+    csvs = _season_csvs(stat_type, source_dir)
+    if not csvs:
+        return parquet_path if parquet_path.exists() else None
+
+    if not force and _parquet_is_current(parquet_path, csvs):
+        return parquet_path
+
+    frames: list[pl.DataFrame] = []
+    failed: list[Path] = []
+    for season, csv_path in sorted(csvs.items()):
+        try:
+            frame = pl.read_csv(csv_path, infer_schema_length=None)
+        except Exception as exc:
+            logger.warning("Error reading %s: %s", csv_path, exc)
+            failed.append(csv_path)
+            continue
+        if frame.width == 0:
+            continue
+        id_column = frame.columns[-1]
+        if id_column != "pfr_id":
+            frame = frame.drop("pfr_id", strict=False).rename({id_column: "pfr_id"})
+        frames.append(
+            frame.with_columns(
+                pl.col("pfr_id").cast(pl.Utf8, strict=False),
+                pl.lit(season).cast(pl.Int16).alias("season"),
+            )
+        )
+
+    if failed and parquet_path.exists():
+        # Keep the previous build rather than dropping the unreadable seasons
+        return parquet_path
+    if not frames:
+        return None
+
+    combined = pl.concat(frames, how="diagonal_relaxed").sort(["pfr_id", "season"], nulls_last=True)
+    tmp_path = parquet_path.with_suffix(".parquet.tmp")
+    combined.write_parquet(
+        tmp_path,
+        compression="zstd",
+        statistics=True,
+        row_group_size=PFR_ADVANCED_ROW_GROUP_SIZE,
+    )
+    os.replace(tmp_path, parquet_path)
+    if failed:
+        # Date the partial build before the unreadable exports so it is retried
+        retry_before = min(path.stat().st_mtime for path in failed) - 1
+        os.utime(parquet_path, (retry_before, retry_before))
+    logger.info(
+        "Converted %s PFR %s CSV exports (%s rows) into %s",
+        len(frames),
+        stat_type,
+        combined.height,
+        parquet_path,
+    )
+    return parquet_path
+
+
+def convert_pfr_advanced_exports(
+    stat_types: Iterable[str] | None = None,
+    *,
+    directory: Path | None = None,
+    force: bool = False,
+) -> dict[str, Path | None]:
+    """Build the consolidated parquet for every (or the given) stat type."""
+
+    return {
+        stat_type: build_pfr_advanced_parquet(stat_type, directory=directory, force=force)
+        for stat_type in (stat_types or PFR_ADVANCED_FILE_PREFIXES)
+    }
+
+
+def scan_pfr_advanced_stats(
+    stat_type: str,
+    *,
+    pfr_id: str | None = None,
+    seasons: Iterable[int] | None = None,
+    directory: Path | None = None,
+) -> pl.LazyFrame | None:
+    """Scan the consolidated parquet with ``pfr_id``/season filters pushed down.
+
+    The parquet is (re)built from the CSV exports on first use in a process
+    when it is missing or older than the exports, and on every use until all
+    exports could be read. Returns ``None`` when neither exists.
+    """
+
+    source_dir = directory or PFR_RAW_DIRECTORY
+    parquet_path = pfr_advanced_parquet_path(stat_type, directory=source_dir)
+    with _CHECKED_LOCK:
+        needs_check = parquet_path not in _checked_paths
+    if needs_check:
+        built = build_pfr_advanced_parquet(stat_type, directory=source_dir)
+        # A partial build stays older than its exports; check again next time
+        if built is None or _parquet_is_current(built, _season_csvs(stat_type, source_dir)):
+            with _CHECKED_LOCK:
+                _checked_paths.add(parquet_path)
+        if built is None:
+            return None
+    if not parquet_path.exists():
+        return None
+
+    lf = pl.scan_parquet(parquet_path)
+    if pfr_id:
+        lf = lf.filter(pl.col("pfr_id") == pfr_id)
+    if seasons is not None:
+        lf = lf.filter(pl.col("season").is_in([int(season) for season in seasons]))
+    return lf
+
+
+__all__ = [
+    "PFR_ADVANCED_FILE_PREFIXES",
+    "PFR_RAW_DIRECTORY",
+    "build_pfr_advanced_parquet",
+    "convert_pfr_advanced_exports",
+    "pfr_advanced_parquet_path",
+    "scan_pfr_advanced_stats",
+]
@@ -0,0 +1,539 @@
+"""League baselines and batch computation for the 20–80 basic player ratings.
+
+The ratings shown on the player detail page compare a player's production with
+the distribution of their position group over the most recent seasons. This
+module derives those distributions (mean/std per metric and rating key) from
+the ``player_seasons`` table so they can be persisted next to the data store
+and loaded without touching the network, and rates every player-season in one
+vectorised pass so ratings can be listed and sorted league-wide.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+import polars as pl
+
+
+# ============================================================================
+# Rating Definitions
+# ============================================================================
+
+OFFENSE_POSITIONS: frozenset[str] = frozenset({"QB", "RB", "FB", "WR", "TE"})
+
+DEFENSE_POSITIONS: frozenset[str] = frozenset(
+    {"DL", "DE", "DT", "NT", "LB", "ILB", "OLB", "MLB", "DB", "CB", "S", "SS", "FS"}
+)
+
+# Rating key -> positions whose players form the comparison pool
+RATING_POSITION_GROUPS: dict[str, frozenset[str]] = {
+    "QB": frozenset({"QB"}),
+    "RB": frozenset({"RB", "FB"}),
+    "WR": frozenset({"WR"}),
+    "TE": frozenset({"TE"}),
+    "default_offense": OFFENSE_POSITIONS,
+    "defense": DEFENSE_POSITIONS,
+}
+
+# Number of trailing seasons that make up the baseline window
+RATING_BASELINE_SEASON_WINDOW = 3
+
+RATING_METRICS: tuple[str, ...] = (
+    "pass_yards",
+    "rush_yards",
+    "receiving_yards",
+    "total_touchdowns",
+    "def_tackles_total",
+    "def_tackles_solo",
+    "def_tackles_assisted",
+    "def_interceptions",
+)
+
+
+# Rating key -> rating groups shown on the detail page and their metrics
+RATING_CONFIG: dict[str, list[dict[str, object]]] = {
+    "QB": [
+        {
+            "label": "Passing Production",
+            "metrics": [
+                {"label": "Pass Yards", "key": "pass_yards"},
+                {"label": "Total TD", "key": "total_touchdowns"},
+            ],
+        },
+        {
+            "label": "Rushing Threat",
+            "metrics": [
+                {"label": "Rush Yards", "key": "rush_yards"},
+            ],
+        },
+    ],
+    "RB": [
+        {
+            "label": "Rushing Impact",
+            "metrics": [
+                {"label": "Rush Yards", "key": "rush_yards"},
+                {"label": "Total TD", "key": "total_touchdowns"},
+            ],
+        },
+        {
+            "label": "Receiving Support",
+            "metrics": [
+                {"label": "Receiving Yards", "key": "receiving_yards"},
+            ],
+        },
+    ],
+    "WR": [
+        {
+            "label": "Receiving Production",
+            "metrics": [
+                {"label": "Receiving Yards", "key": "receiving_yards"},
+                {"label": "Total TD", "key": "total_touchdowns"},
+            ],
+        },
+        {
+            "label": "Open Field Threat",
+            "metrics": [
+                {"label": "Rush Yards", "key": "rush_yards"},
+            ],
+        },
+    ],
+    "TE": [
+        {
+            "label": "Receiving Production",
+            "metrics": [
+                {"label": "Receiving Yards", "key": "receiving_yards"},
+                {"label": "Total TD", "key": "total_touchdowns"},
+            ],
+        },
+        {
+            "label": "Versatility",
+            "metrics": [
+                {"label": "Rush Yards", "key": "rush_yards"},
+            ],
+        },
+    ],
+    "default_offense": [
+        {
+            "label": "Offensive Production",
+            "metrics": [
+                {"label": "Pass Yards", "key": "pass_yards"},
+                {"label": "Rush Yards", "key": "rush_yards"},
+                {"label": "Receiving Yards", "key": "receiving_yards"},
+                {"label": "Total TD", "key": "total_touchdowns"},
+            ],
+        },
+    ],
+    "defense": [
+        {
+            "label": "Tackling",
+            "metrics": [
+                {"label": "Total Tackles", "key": "def_tackles_total"},
+                {"label": "Solo Tackles", "key": "def_tackles_solo"},
+                {"label": "Assisted Tackles", "key": "def_tackles_assisted"},
+            ],
+        },
+        {
+            "label": "Playmaking",
+            "metrics": [
+                {"label": "Interceptions", "key": "def_interceptions"},
+            ],
+        },
+    ],
+}
+
+
+RATING_BASELINES_SCHEMA: dict[str, pl.DataType] = {
+    "rating_key": pl.Utf8,
+    "metric": pl.Utf8,
+    "mean": pl.Float64,
+    "std": pl.Float64,
+    "sample_size": pl.Int32,
+    "season_start": pl.Int16,
+    "season_end": pl.Int16,
+}
+
+PLAYER_RATINGS_SCHEMA: dict[str, pl.DataType] = {
+    "player_id": pl.Utf8,
+    "season": pl.Int16,
+    "position": pl.Utf8,
+    "rating_key": pl.Utf8,
+    "overall": pl.Int16,
+    "potential": pl.Int16,
+    # Per-metric scores (null when the metric is not rated for the rating key)
+    **{f"rating_{metric}": pl.Int16 for metric in RATING_METRICS},
+}
+
+
+def _column_or_zero(columns: Sequence[str], name: str) -> pl.Expr:
+    if name in columns:
+        return pl.col(name).cast(pl.Float64, strict=False).fill_null(0.0)
+    return pl.lit(0.0)
+
+
+def rating_metric_exprs(columns: Sequence[str]) -> list[pl.Expr]:
+    """Return expressions deriving every rating metric from ``player_seasons`` columns."""
+
+    def col(name: str) -> pl.Expr:
+        return _column_or_zero(columns, name)
+
+    return [
+        col("passing_yards").alias("pass_yards"),
+        col("rushing_yards").alias("rush_yards"),
+        col("receiving_yards").alias("receiving_yards"),
+        (col("passing_tds") + col("rushing_tds") + col("receiving_tds")).alias("total_touchdowns"),
+        # Shared tackles count as assists, matching PFR's Comb = Solo + Ast
+        (col("def_tackles_solo") + col("def_tackle_assists") + col("def_tackles_with_assist")).alias(
+            "def_tackles_total"
+        ),
+        col("def_tackles_solo").alias("def_tackles_solo"),
+        (col("def_tackle_assists") + col("def_tackles_with_assist")).alias("def_tackles_assisted"),
+        col("def_interceptions").alias("def_interceptions"),
+    ]
+
+
+# ============================================================================
+# Baseline Computation
+# ============================================================================
+
+def _empty_baselines_frame() -> pl.DataFrame:
+    return pl.DataFrame(schema=RATING_BASELINES_SCHEMA)
+
+
+def compute_rating_baselines(
+    player_seasons: pl.DataFrame | pl.LazyFrame,
+    *,
+    seasons: Sequence[int] | None = None,
+    window: int = RATING_BASELINE_SEASON_WINDOW,
+) -> pl.DataFrame:
+    """Compute mean/std for every rating key and metric in a single pass.
+
+    Each player's production is summed over the baseline window (the last
+    ``window`` seasons present in the table unless ``seasons`` is given) and
+    the distribution is taken over the players whose position falls in the
+    rating key's group.
+
+    Returns:
+        Long frame with one row per ``(rating_key, metric)``.
+    """
+    lf = player_seasons.lazy() if isinstance(player_seasons, pl.DataFrame) else player_seasons
+    columns = lf.collect_schema().names()
+    if "player_id" not in columns or "season" not in columns:
+        return _empty_baselines_frame()
+
+    if seasons is None:
+        available = (
+            lf.select(pl.col("season").cast(pl.Int32, strict=False).drop_nulls().unique())
+            .collect()
+            .to_series()
+            .to_list()
+        )
+        if not available:
+            return _empty_baselines_frame()
+        season_end = max(available)
+        season_list = [season for season in available if season > season_end - max(window, 1)]
+    else:
+        season_list = sorted({int(season) for season in seasons})
+    if not season_list:
+        return _empty_baselines_frame()
+
+    position_sources = [pl.col(name) for name in ("position", "position_group") if name in columns]
+    position_expr = (
+        pl.coalesce(position_sources).fill_null("").str.to_uppercase()
+        if position_sources
+        else pl.lit("")
+    )
+
+    per_player = (
+        lf.filter(pl.col("season").cast(pl.Int32, strict=False).is_in(season_list))
+        .select(
+            pl.col("player_id"),
+            pl.col("season"),
+            position_expr.alias("_pos"),
+            *rating_metric_exprs(columns),
+        )
+        .sort("season")
+        .group_by("player_id")
+        .agg(
+            pl.col("_pos").last(),
+            *[pl.col(metric).sum() for metric in RATING_METRICS],
+        )
+    )
+
+    # Fan players out to every rating key whose position group they belong to
+    membership = pl.DataFrame(
+        [
+            {"rating_key": key, "_pos": position}
+            for key, positions in RATING_POSITION_GROUPS.items()
+            for position in sorted(positions)
+        ]
+    ).lazy()
+
+    stats = (
+        per_player.join(membership, on="_pos", how="inner")
+        .group_by("rating_key")
+        .agg(
+            pl.len().cast(pl.Int32).alias("sample_size"),
+            *[pl.col(metric).mean().alias(f"{metric}__mean") for metric in RATING_METRICS],
+            *[pl.col(metric).std().alias(f"{metric}__std") for metric in RATING_METRICS],
+        )
+        .collect()
+    )
+    if stats.height == 0:
+        return _empty_baselines_frame()
+
+    long = pl.concat(
+        [
+            stats.select(
+                pl.col("rating_key"),
+                pl.lit(metric).alias("metric"),
+                pl.col(f"{metric}__mean").alias("mean"),
+                pl.col(f"{metric}__std").alias("std"),
+                pl.col("sample_size"),
+            )
+            for metric in RATING_METRICS
+        ]
+    )
+
+    # Degenerate distributions fall back to a spread proportional to the mean
+    fallback_std = pl.max_horizontal(pl.col("mean").abs() * 0.25, pl.lit(1.0))
+    long = long.with_columns(
+        pl.col("mean").fill_null(0.0).fill_nan(0.0),
+        pl.when(pl.col("std").is_null() | pl.col("std").is_nan() | (pl.col("std") <= 1e-6))
+        .then(fallback_std)
+        .otherwise(pl.col("std"))
+        .alias("std"),
+        pl.lit(min(season_list)).cast(pl.Int16).alias("season_start"),
+        pl.lit(max(season_list)).cast(pl.Int16).alias("season_end"),
+    )
+    return long.select(list(RATING_BASELINES_SCHEMA)).sort(["rating_key", "metric"])
+
+
+def baselines_to_mapping(frame: pl.DataFrame) -> dict[str, dict[str, tuple[float, float]]]:
+    """Convert a baselines frame into ``{rating_key: {metric: (mean, std)}}``."""
+
+    mapping: dict[str, dict[str, tuple[float, float]]] = {}
+    if frame.is_empty():
+        return mapping
+    for row in frame.iter_rows(named=True):
+        mean_val = float(row.get("mean") or 0.0)
+        std_val = float(row.get("std") or 0.0)
+        if not math.isfinite(std_val) or std_val <= 1e-6:
+            std_val = max(abs(mean_val) * 0.25, 1.0)
+        mapping.setdefault(str(row["rating_key"]), {})[str(row["metric"])] = (mean_val, std_val)
+    return mapping
+
+
+# ============================================================================
+# Batch Player Ratings
+# ============================================================================
+
+def _empty_player_ratings_frame() -> pl.DataFrame:
+    return pl.DataFrame(schema=PLAYER_RATINGS_SCHEMA)
+
+
+def clamp_rating_expr(expr: pl.Expr) -> pl.Expr:
+    """Vectorised equivalent of ``PlayerService._clamp_rating``.
+
+    Scores are bounded to 20–80, rounded half-to-even like Python's ``round``
+    and snapped to the nearest multiple of five.
+    """
+    bounded = expr.cast(pl.Float64).clip(20.0, 80.0)
+    floor = bounded.floor()
+    fraction = bounded - floor
+    rounded = (
+        pl.when(fraction > 0.5)
+        .then(floor + 1)
+        .when(fraction < 0.5)
+        .then(floor)
+        .otherwise(floor + floor % 2)
+        .cast(pl.Int16)
+    )
+    remainder = rounded % 5
+    return (
+        pl.when(remainder < 3)
+        .then(rounded - remainder)
+        .otherwise(rounded + (5 - remainder))
+        .clip(20, 80)
+        .cast(pl.Int16)
+    )
+
+
+def rating_score_expr(value: pl.Expr, mean: pl.Expr, std: pl.Expr) -> pl.Expr:
+    """Vectorised equivalent of ``PlayerService._calculate_rating_score``."""
+    fallback_std = pl.max_horizontal(mean.abs() * 0.25, pl.lit(1.0))
+    safe_std = (
+        pl.when(std.is_null() | std.is_nan() | (std <= 0))
+        .then(fallback_std)
+        .otherwise(std)
+    )
+    return clamp_rating_expr(50 + 10 * ((value - mean) / safe_std))
+
+
+def _rating_key_expr(position: pl.Expr) -> pl.Expr:
+    position_keys = [key for key in RATING_CONFIG if key not in ("default_offense", "defense")]
+    return (
+        pl.when(position.is_in(position_keys))
+        .then(position)
+        .when(position.is_in(sorted(DEFENSE_POSITIONS)))
+        .then(pl.lit("defense"))
+        .otherwise(pl.lit("default_offense"))
+    )
+
+
+def _config_metrics(rating_key: str) -> list[str]:
+    return [
+        str(metric_cfg["key"])  # type: ignore[index]
+        for group_cfg in RATING_CONFIG[rating_key]
+        for metric_cfg in group_cfg["metrics"]  # type: ignore[index]
+    ]
+
+
+def compute_player_ratings(
+    player_seasons: pl.DataFrame | pl.LazyFrame,
+    baselines: pl.DataFrame,
+    *,
+    seasons: Sequence[int] | None = None,
+    window: int = RATING_BASELINE_SEASON_WINDOW,
+) -> pl.DataFrame:
+    """Rate every player-season against the league baselines in one pass.
+
+    Production for a player-season is summed over the trailing ``window``
+    seasons ending with that season (the same span the baselines describe),
+    so a season rates the player the way the baselines rate the league.
+    Metric scores, group scores and the overall rating follow the rules used
+    by the detail page: group score is the clamped mean of its metric scores
+    and ``overall`` the clamped mean of the group scores.
+
+    Args:
+        player_seasons: ``player_seasons`` table (eager or lazy).
+        baselines: Long baselines frame from :func:`compute_rating_baselines`.
+        seasons: Restrict the output to these seasons (earlier seasons still
+            feed the trailing windows).
+        window: Number of trailing seasons summed per rating.
+
+    Returns:
+        Frame matching :data:`PLAYER_RATINGS_SCHEMA`, sorted by player and season.
+    """
+    lf = player_seasons.lazy() if isinstance(player_seasons, pl.DataFrame) else player_seasons
+    columns = lf.collect_schema().names()
+    if "player_id" not in columns or "season" not in columns:
+        return _empty_player_ratings_frame()
+
+    position_sources = [pl.col(name) for name in ("position", "position_group") if name in columns]
+    position_expr = (
+        pl.coalesce(position_sources).fill_null("").str.to_uppercase()
+        if position_sources
+        else pl.lit("")
+    )
+
+    per_season = (
+        lf.select(
+            pl.col("player_id"),
+            pl.col("season").cast(pl.Int32, strict=False),
+            position_expr.alias("position"),
+            *rating_metric_exprs(columns),
+        )
+        .filter(pl.col("player_id").is_not_null() & pl.col("season").is_not_null())
+        .group_by(["player_id", "season"])
+        .agg(
+            pl.col("position").last(),
+            *[pl.col(metric).sum() for metric in RATING_METRICS],
+        )
+    )
+
+    # Each season contributes to its own window and the next ``window - 1`` ones
+    windowed = (
+        per_season.with_columns(
+            pl.int_ranges(pl.col("season"), pl.col("season") + max(window, 1)).alias("_target")
+        )
+        .explode("_target", empty_as_null=False)
+        .group_by(["player_id", "_target"])
+        .agg(*[pl.col(metric).sum() for metric in RATING_METRICS])
+        .rename({"_target": "season"})
+        .with_columns(pl.col("season").cast(pl.Int32))
+    )
+
+    rated = per_season.select("player_id", "season", "position").join(
+        windowed, on=["player_id", "season"], how="left"
+    )
+    if seasons is not None:
+        rated = rated.filter(pl.col("season").is_in([int(season) for season in seasons]))
+    rated = rated.with_columns(_rating_key_expr(pl.col("position")).alias("rating_key"))
+
+    # One row per rating key with mean/std columns for every metric
+    if baselines.height:
+        wide = baselines.group_by("rating_key").agg(
+            *[
+                expr
+                for metric in RATING_METRICS
+                for expr in (
+                    pl.col("mean").filter(pl.col("metric") == metric).first().alias(f"{metric}__mean"),
+                    pl.col("std").filter(pl.col("metric") == metric).first().alias(f"{metric}__std"),
+                )
+            ]
+        )
+    else:
+        wide = pl.DataFrame(
+            schema={
+                "rating_key": pl.Utf8,
+                **{f"{metric}__{stat}": pl.Float64 for metric in RATING_METRICS for stat in ("mean", "std")},
+            }
+        )
+    rated = rated.join(wide.lazy(), on="rating_key", how="left")
+
+    # Missing baselines fall back to (0, 1) like the detail page
+    metric_scores: list[pl.Expr] = []
+    for metric in RATING_METRICS:
+        keys_using_metric = [key for key in RATING_CONFIG if metric in _config_metrics(key)]
+        score = rating_score_expr(
+            pl.col(metric),
+            pl.col(f"{metric}__mean").fill_null(0.0),
+            pl.col(f"{metric}__std").fill_null(1.0),
+        )
+        metric_scores.append(
+            pl.when(pl.col("rating_key").is_in(keys_using_metric))
+            .then(score)
+            .otherwise(None)
+            .alias(f"rating_{metric}")
+        )
+    rated = rated.with_columns(metric_scores)
+
+    key_overalls: list[pl.Expr] = []
+    for rating_key, groups in RATING_CONFIG.items():
+        group_scores = [
+            clamp_rating_expr(
+                pl.mean_horizontal(
+                    [pl.col(f"rating_{metric_cfg['key']}") for metric_cfg in group_cfg["metrics"]]  # type: ignore[index]
+                )
+            )
+            for group_cfg in groups
+        ]
+        key_overall = clamp_rating_expr(pl.mean_horizontal(group_scores))
+        # Null for other keys, so coalescing picks the player's own key
+        key_overalls.append(pl.when(pl.col("rating_key") == rating_key).then(key_overall))
+    rated = rated.with_columns(pl.coalesce(key_overalls).alias("overall"))
+    rated = rated.with_columns(clamp_rating_expr(pl.col("overall") + 5).alias("potential"))
+
+    result = rated.select(
+        [pl.col(name).cast(dtype) for name, dtype in PLAYER_RATINGS_SCHEMA.items()]
+    ).sort(["player_id", "season"])
+    return result.collect()
+
+
+__all__ = [
+    "DEFENSE_POSITIONS",
+    "OFFENSE_POSITIONS",
+    "PLAYER_RATINGS_SCHEMA",
+    "RATING_BASELINES_SCHEMA",
+    "RATING_BASELINE_SEASON_WINDOW",
+    "RATING_CONFIG",
+    "RATING_METRICS",
+    "RATING_POSITION_GROUPS",
+    "baselines_to_mapping",
+    "clamp_rating_expr",
+    "compute_player_ratings",
+    "compute_rating_baselines",
+    "rating_metric_exprs",
+    "rating_score_expr",
+]
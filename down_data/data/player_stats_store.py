@@ -0,0 +1,295 @@
+"""Season-partitioned local stores for nflverse player stats.
+
+``nflreadpy`` only serves league-wide files, so looking up a single player
+used to download every requested season in full. These stores keep one
+parquet file per season and partition (the summary level for weekly stats,
+the stat type for Next Gen Stats), sorted by the player ID column so scans
+filtered to one player only decode the matching row groups. Callers read what
+is already on disk and download just the seasons that are missing.
+
+Layout::
+
+    data/cache/nflverse/player_stats/<summary_level>/season_<year>.parquet
+    data/cache/nflverse/nextgen_stats/<stat_type>/season_<year>.parquet
+
+Completed seasons never expire. Seasons at or after the current NFL season
+are refreshed once their file is older than ``current_season_max_age``.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import polars as pl
+
+try:  # pragma: no cover - runtime dependency
+    from nflreadpy import get_current_season
+except ImportError:  # pragma: no cover - fallback for environments without nflreadpy
+    get_current_season = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PLAYER_STATS_DIRECTORY = PROJECT_ROOT / "data" / "cache" / "nflverse" / "player_stats"
+NEXTGEN_STATS_DIRECTORY = PROJECT_ROOT / "data" / "cache" / "nflverse" / "nextgen_stats"
+
+# Rows per parquet row group; small enough for player_id statistics to prune well
+PLAYER_STATS_ROW_GROUP_SIZE = 8_192
+
+DEFAULT_CURRENT_SEASON_MAX_AGE = timedelta(hours=12)
+
+
+def current_season() -> int:
+    """Return the season nflreadpy treats as current (its default for stats)."""
+
+    if get_current_season is not None:
+        try:
+            return int(get_current_season())
+        except Exception:  # pragma: no cover - defensive
+            pass
+    today = date.today()
+    return today.year if today.month >= 9 else today.year - 1
+
+
+class PlayerStatsStore:
+    """Local, season-partitioned copy of nflverse player stats.
+
+    Args:
+        directory: Root directory of the store.
+        id_column: Player ID column used for sorting and filtering.
+        current_season_max_age: Age after which in-progress seasons are refreshed.
+        keep_in_memory: Keep each decoded season in memory so every lookup in
+            the session shares one copy instead of re-reading the file.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        id_column: str = "player_id",
+        current_season_max_age: timedelta = DEFAULT_CURRENT_SEASON_MAX_AGE,
+        keep_in_memory: bool = False,
+    ) -> None:
+        self._directory = directory or PLAYER_STATS_DIRECTORY
+        self._id_column = id_column
+        self._current_season_max_age = current_season_max_age
+        self._keep_in_memory = keep_in_memory
+        self._frames: dict[tuple[str, int], pl.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def id_column(self) -> str:
+        return self._id_column
+
+    def season_path(self, season: int, partition: str = "week") -> Path:
+        return self._directory / partition / f"season_{int(season)}.parquet"
+
+    # ------------------------------------------------------------------
+    # Coverage
+
+    def is_fresh(self, season: int, partition: str = "week") -> bool:
+        """Return ``True`` when ``season`` is stored and does not need a refresh."""
+
+        path = self.season_path(season, partition)
+        if not path.exists():
+            return False
+        if season < current_season():
+            return True
+        modified = datetime.fromtimestamp(path.stat().st_mtime)
+        return datetime.now() - modified <= self._current_season_max_age
+
+    def missing_seasons(self, seasons: Iterable[int], partition: str = "week") -> list[int]:
+        """Return the requested seasons that must be downloaded."""
+
+        return sorted(
+            {int(season) for season in seasons if not self.is_fresh(int(season), partition)}
+        )
+
+    # ------------------------------------------------------------------
+    # Reads
+
+    def scan(
+        self,
+        seasons: Sequence[int],
+        partition: str = "week",
+        *,
+        player_id: str | None = None,
+    ) -> pl.LazyFrame | None:
+        """Scan the stored seasons, pushing the ``player_id`` filter into the reader.
+
+        Returns ``None`` when none of the seasons are on disk.
+        """
+
+        paths = [
+            self.season_path(season, partition)
+            for season in sorted(set(seasons))
+            if self.season_path(season, partition).exists()
+        ]
+        if not paths:
+            return None
+        # nflverse column sets drift between seasons, so scan files separately
+        scans: list[pl.LazyFrame] = []
+        for path in paths:
+            lf = pl.scan_parquet(path)
+            if player_id and self._id_column in lf.collect_schema().names():
+                lf = lf.filter(pl.col(self._id_column) == player_id)
+            scans.append(lf)
+        return pl.concat(scans, how="diagonal_relaxed")
+
+    def load(
+        self,
+        seasons: Sequence[int],
+        partition: str = "week",
+        *,
+        player_id: str | None = None,
+    ) -> pl.DataFrame | None:
+        """Return stored rows for ``seasons``, optionally limited to one player.
+
+        With ``keep_in_memory`` each season file is decoded once and shared by
+        later calls; otherwise this collects :meth:`scan`.
+        """
+
+        if not self._keep_in_memory:
+            lf = self.scan(seasons, partition, player_id=player_id)
+            return lf.collect() if lf is not None else None
+
+        frames: list[pl.DataFrame] = []
+        for season in sorted(set(seasons)):
+            frame = self._season_frame(int(season), partition)
+            if frame is None:
+                continue
+            if player_id and self._id_column in frame.columns:
+                frame = frame.filter(pl.col(self._id_column) == player_id)
+            frames.append(frame)
+        if not frames:
+            return None
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def _season_frame(self, season: int, partition: str) -> pl.DataFrame | None:
+        key = (partition, season)
+        with self._lock:
+            frame = self._frames.get(key)
+        if frame is not None:
+            return frame
+        path = self.season_path(season, partition)
+        if not path.exists():
+            return None
+        frame = pl.read_parquet(path)
+        with self._lock:
+            self._frames[key] = frame
+        return frame
+
+    # ------------------------------------------------------------------
+    # Writes
+
+    def write(
+        self,
+        frame: pl.DataFrame,
+        partition: str = "week",
+        *,
+        seasons: Iterable[int] | None = None,
+    ) -> list[int]:
+        """Persist ``frame`` one file per season, replacing existing files.
+
+        Args:
+            frame: League-wide rows for one or more seasons.
+            partition: Summary level or stat type the rows belong to.
+            seasons: Seasons the frame was downloaded for. Any of them without
+                rows is stored as an empty file, so it counts as known-empty
+                (until it expires, for in-progress seasons) instead of being
+                downloaded again.
+
+        Returns:
+            Seasons written. Frames without a ``season`` column only store
+            the known-empty ``seasons``.
+        """
+
+        has_seasons = frame.height > 0 and "season" in frame.columns
+        present = (
+            {int(season) for season in frame.get_column("season").drop_nulls().unique().to_list()}
+            if has_seasons
+            else set()
+        )
+
+        written: list[int] = []
+        for season in sorted(present):
+            season_frame = frame.filter(pl.col("season") == season)
+            if self._id_column in season_frame.columns:
+                season_frame = season_frame.sort(self._id_column, nulls_last=True)
+            self._write_season(season_frame, season, partition)
+            written.append(season)
+
+        empty_seasons = sorted({int(season) for season in seasons or ()} - present)
+        if empty_seasons:
+            empty = frame.clear() if "season" in frame.columns else pl.DataFrame(
+                schema={self._id_column: pl.Utf8, "season": pl.Int32}
+            )
+            for season in empty_seasons:
+                self._write_season(empty, season, partition)
+                written.append(season)
+        logger.debug("Stored player stats for seasons %s (%s)", sorted(written), partition)
+        return sorted(written)
+
+    def _write_season(self, season_frame: pl.DataFrame, season: int, partition: str) -> None:
+        path = self.season_path(season, partition)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        season_frame.write_parquet(
+            tmp_path,
+            compression="zstd",
+            statistics=True,
+            row_group_size=PLAYER_STATS_ROW_GROUP_SIZE,
+        )
+        os.replace(tmp_path, path)
+        if self._keep_in_memory:
+            with self._lock:
+                self._frames[(partition, season)] = season_frame
+
+
+_default_store: PlayerStatsStore | None = None
+_nextgen_store: PlayerStatsStore | None = None
+
+
+def get_player_stats_store() -> PlayerStatsStore:
+    """Return the shared weekly player stats store."""
+
+    global _default_store
+    if _default_store is None:
+        _default_store = PlayerStatsStore()
+    return _default_store
+
+
+def get_nextgen_stats_store() -> PlayerStatsStore:
+    """Return the shared Next Gen Stats store (partitioned by stat type).
+
+    Next Gen tables are small, so decoded seasons stay in memory for the
+    session and every player view reads the same copy.
+    """
+
+    global _nextgen_store
+    if _nextgen_store is None:
+        _nextgen_store = PlayerStatsStore(
+            NEXTGEN_STATS_DIRECTORY,
+            id_column="player_gsis_id",
+            keep_in_memory=True,
+        )
+    return _nextgen_store
+
+
+__all__ = [
+    "NEXTGEN_STATS_DIRECTORY",
+    "PLAYER_STATS_DIRECTORY",
+    "PlayerStatsStore",
+    "current_season",
+    "get_nextgen_stats_store",
+    "get_player_stats_store",
+]
@@ -1,14 +1,24 @@
-"""Season-level cache that powers every player summary table."""
+"""Season-level cache that powers every player summary table.
+
+The cache is built one season at a time, end to end: weekly stats are
+aggregated, snap counts and bio fields merged, that season's play-by-play is
+reduced to EPA/WPA impacts, and the joined result is written as its own
+season part. Peak memory is therefore bounded by a single season, and a
+rebuild only recomputes the seasons asked for. The parts are then streamed
+into the single summary parquet the repositories read.
+"""
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Sequence
 import logging
 
 import polars as pl
 
 from . import basic_cache
+from . import impact_engine
 from . import player_impacts
 
 logger = logging.getLogger(__name__)
@@ -16,6 +26,7 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 CACHE_DIRECTORY = PROJECT_ROOT / "data" / "cache"
 CACHE_PATH = CACHE_DIRECTORY / "player_summary_stats.parquet"
+SEASON_PARTS_DIRECTORY = CACHE_DIRECTORY / "player_summary_stats"
 
 
 def cache_exists() -> bool:
@@ -36,45 +47,197 @@ def scan_player_summary_cache() -> pl.LazyFrame:
     return pl.scan_parquet(CACHE_PATH)
 
 
+def season_part_path(season: int, *, directory: Path | None = None) -> Path:
+    """Return the path of the summary part holding ``season``."""
+
+    return (directory or SEASON_PARTS_DIRECTORY) / f"season_{int(season)}.parquet"
+
+
 def build_player_summary_cache(
     *,
     seasons: Iterable[int] | None = None,
     force_refresh: bool = False,
-) -> pl.DataFrame:
-    """Build (or rebuild) the summary cache covering every player table stat."""
-
-    base = _load_basic_frame(seasons=seasons, force_refresh=force_refresh)
-    impacts = _load_impact_frame(seasons=seasons, force_refresh=force_refresh)
-    summary = _merge_with_impacts(base, impacts)
+    parts_directory: Path | None = None,
+    output_path: Path | None = None,
+    stats_loader: Callable[..., object] | None = None,
+    pbp_loader: Callable[..., object] | None = None,
+    include_pfr: bool = True,
+) -> int:
+    """Build (or rebuild) the summary cache covering every player table stat.
+
+    Each season is processed end to end and written as its own part; parts
+    already on disk are reused unless ``force_refresh`` is set, so a partial
+    rebuild only touches the requested seasons. Seasons already held by the
+    basic and impact caches are taken from them rather than downloaded again
+    (rebuild those caches to pull new source data). ``include_pfr`` controls
+    the snap-count and bio merges, which need roster and PFR access.
+
+    Returns:
+        Number of rows in the consolidated summary parquet, which holds the
+        requested seasons only.
+    """
+
+    parts_dir = parts_directory or SEASON_PARTS_DIRECTORY
+    target_seasons = sorted(
+        {int(season) for season in seasons} if seasons else basic_cache.DEFAULT_SEASONS
+    )
+    pending = [
+        season
+        for season in target_seasons
+        if force_refresh or not season_part_path(season, directory=parts_dir).exists()
+    ]
+
+    builder = _SeasonSummaryBuilder(
+        pending,
+        stats_loader=stats_loader,
+        pbp_loader=pbp_loader,
+        include_pfr=include_pfr,
+    )
+    for season in pending:
+        summary = builder.build(season)
+        if summary.is_empty():
+            logger.warning("No player stats for %s; no summary part written.", season)
+            continue
+        _write_atomic(summary, season_part_path(season, directory=parts_dir))
+        logger.info("Wrote %s summary rows for %s", summary.height, season)
 
-    CACHE_DIRECTORY.mkdir(parents=True, exist_ok=True)
-    summary.write_parquet(CACHE_PATH, compression="zstd")
-    logger.info("Wrote player summary cache with %s rows to %s", summary.height, CACHE_PATH)
-    return summary
+    parts = [season_part_path(season, directory=parts_dir) for season in target_seasons]
+    return _consolidate_parts([path for path in parts if path.exists()], output_path or CACHE_PATH)
 
 
-def _load_basic_frame(
+def build_season_summary(
+    season: int,
     *,
-    seasons: Iterable[int] | None,
-    force_refresh: bool,
+    stats_loader: Callable[..., object] | None = None,
+    pbp_loader: Callable[..., object] | None = None,
+    include_pfr: bool = True,
 ) -> pl.DataFrame:
-    if force_refresh or not basic_cache.cache_exists():
-        frame = basic_cache.build_basic_cache(seasons=seasons, force_refresh=force_refresh)
-    else:
-        frame = basic_cache.load_basic_cache()
-    return _filter_by_seasons(frame, seasons)
+    """Return the summary rows for one season (stats, snaps, bio and impacts)."""
+
+    return _SeasonSummaryBuilder(
+        [season],
+        stats_loader=stats_loader,
+        pbp_loader=pbp_loader,
+        include_pfr=include_pfr,
+    ).build(season)
+
+
+class _SeasonSummaryBuilder:
+    """Build season summaries, sharing the inputs every season needs.
+
+    The roster ID mapping and the PFR bio cache are loaded once per build
+    rather than once per season, and the existing basic and impact caches
+    are used for any season they already hold.
+    """
+
+    def __init__(
+        self,
+        seasons: Sequence[int],
+        *,
+        stats_loader: Callable[..., object] | None,
+        pbp_loader: Callable[..., object] | None,
+        include_pfr: bool,
+    ) -> None:
+        self._seasons = list(seasons)
+        self._stats_loader = stats_loader
+        self._pbp_loader = pbp_loader
+        self._include_pfr = include_pfr
+        self._id_mapping: pl.DataFrame | None = None
+        self._id_mapping_loaded = False
+        self._bio_cache: pl.DataFrame | None = None
+        # Explicit loaders always win over the on-disk caches
+        self._cached_stats = (
+            basic_cache.scan_basic_cache()
+            if stats_loader is None and basic_cache.cache_exists()
+            else None
+        )
+        self._cached_impacts = (
+            player_impacts.scan_player_impacts()
+            if pbp_loader is None and player_impacts.cache_exists()
+            else None
+        )
+
+    def build(self, season: int) -> pl.DataFrame:
+        base = _season_rows(self._cached_stats, season)
+        if base.is_empty():
+            # Cached basic rows already carry snaps and bio; fresh rows need both
+            base = self._load_base(season)
+            if base.is_empty():
+                return pl.DataFrame()
+            if self._include_pfr:
+                id_mapping = self._player_id_mapping()
+                base = basic_cache.merge_snap_counts(base, [season], id_mapping=id_mapping)
+                self._bio_cache = basic_cache.fetch_missing_player_bios(
+                    base,
+                    id_mapping=id_mapping,
+                    bio_cache=self._bio_cache,
+                )
+                base = basic_cache.merge_player_bio(base, id_mapping=id_mapping, bio_cache=self._bio_cache)
+
+        impacts = _season_rows(self._cached_impacts, season)
+        if impacts.is_empty():
+            impacts = _season_impacts(season, pbp_loader=self._pbp_loader)
+        return _merge_with_impacts(base, impacts)
+
+    def _load_base(self, season: int) -> pl.DataFrame:
+        load_stats = self._stats_loader or basic_cache.load_player_stats
+        if load_stats is None:
+            raise RuntimeError(
+                "nflreadpy is not installed. Install project dependencies to rebuild the summary cache."
+            )
+        try:
+            raw = basic_cache.to_polars(load_stats(seasons=[season]))
+        except Exception as exc:  # pragma: no cover - network/runtime fetch
+            logger.warning("Failed to load player stats for %s: %s", season, exc)
+            return pl.DataFrame()
+        if raw.is_empty():
+            return pl.DataFrame()
+        return basic_cache.aggregate_player_seasons(basic_cache.prepare_for_aggregation(raw, [season]))
 
+    def _player_id_mapping(self) -> pl.DataFrame | None:
+        if not self._id_mapping_loaded:
+            self._id_mapping = basic_cache.build_player_id_mapping(self._seasons)
+            self._id_mapping_loaded = True
+        return self._id_mapping
 
-def _load_impact_frame(
-    *,
-    seasons: Iterable[int] | None,
-    force_refresh: bool,
-) -> pl.DataFrame:
-    if force_refresh or not player_impacts.cache_exists():
-        frame = player_impacts.build_player_impacts_cache(seasons=seasons, force_refresh=force_refresh)
-    else:
-        frame = player_impacts.load_player_impacts()
-    return _filter_by_seasons(frame, seasons)
+
+def _season_rows(source: pl.LazyFrame | None, season: int) -> pl.DataFrame:
+    if source is None:
+        return pl.DataFrame()
+    return source.filter(pl.col("season") == season).collect()
+
+
+def _season_impacts(season: int, *, pbp_loader: Callable[..., object] | None) -> pl.DataFrame:
+    try:
+        return impact_engine.compute_season_impacts([season], loader=pbp_loader)
+    except RuntimeError as exc:
+        logger.warning("%s Impacts for %s default to zero.", exc, season)
+        return pl.DataFrame()
+
+
+def _write_atomic(frame: pl.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".parquet.tmp")
+    frame.write_parquet(tmp_path, compression="zstd")
+    os.replace(tmp_path, path)
+
+
+def _consolidate_parts(parts: Sequence[Path], output_path: Path) -> int:
+    """Stream the given season parts (in order) into ``output_path``."""
+
+    if not parts:
+        logger.warning("No summary parts to consolidate; summary cache not written.")
+        return 0
+
+    # Impact columns can differ between seasons, so align the parts by name
+    combined = pl.concat([pl.scan_parquet(path) for path in parts], how="diagonal_relaxed")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(".parquet.tmp")
+    combined.sink_parquet(tmp_path, compression="zstd")
+    os.replace(tmp_path, output_path)
+    rows = pl.scan_parquet(output_path).select(pl.len()).collect().item()
+    logger.info("Wrote player summary cache with %s rows to %s", rows, output_path)
+    return rows
 
 
 def _filter_by_seasons(frame: pl.DataFrame, seasons: Iterable[int] | None) -> pl.DataFrame:
@@ -144,10 +307,13 @@ def _merge_with_impacts(base: pl.DataFrame, impacts: pl.DataFrame) -> pl.DataFra
 
 __all__ = [
     "CACHE_PATH",
+    "SEASON_PARTS_DIRECTORY",
     "build_player_summary_cache",
+    "build_season_summary",
     "cache_exists",
     "load_player_summary_cache",
     "scan_player_summary_cache",
+    "season_part_path",
 ]
 
 
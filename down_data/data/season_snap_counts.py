@@ -0,0 +1,212 @@
+"""Season-level snap counts from nflverse, with PFR team pages as a gap filler.
+
+Scraping ``/teams/{slug}/{season}-snap-counts.htm`` costs one request per
+team and season (roughly 800 for a full historical rebuild). nflverse
+publishes the same PFR snap counts as one bulk file per season, so this
+module loads those first and only scrapes the team pages for team-seasons the
+bulk files do not cover (typically the in-progress week).
+
+Both sources are reduced to one row per ``(pfr_id, season, team)`` with
+``_snap_offense``, ``_snap_defense`` and ``_snap_st`` columns, which callers
+join onto ``player_seasons`` by ``pfr_id``.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Iterable
+
+import polars as pl
+
+try:  # pragma: no cover - optional dependency
+    from nflreadpy import load_snap_counts
+except ImportError:  # pragma: no cover - handled at runtime
+    load_snap_counts = None  # type: ignore[assignment]
+
+from .pfr.jobs import ScrapeJob
+from .pfr.snap_counts import fetch_snap_counts_many, fetch_snap_counts_resumable
+
+logger = logging.getLogger(__name__)
+
+# First season PFR (and therefore nflverse) publishes snap counts for
+SNAP_COUNTS_MIN_SEASON = 2012
+
+SEASON_SNAP_COUNTS_SCHEMA: dict[str, pl.DataType] = {
+    "pfr_id": pl.Utf8,
+    "season": pl.Int64,
+    "team": pl.Utf8,
+    "_snap_offense": pl.Int64,
+    "_snap_defense": pl.Int64,
+    "_snap_st": pl.Int64,
+}
+
+
+def _empty_season_snap_counts_frame() -> pl.DataFrame:
+    return pl.DataFrame(schema=SEASON_SNAP_COUNTS_SCHEMA)
+
+
+def _to_polars(frame) -> pl.DataFrame:
+    if isinstance(frame, pl.DataFrame):
+        return frame
+    return pl.from_pandas(frame)
+
+
+def aggregate_nflverse_snap_counts(weekly: pl.DataFrame) -> pl.DataFrame:
+    """Sum nflverse weekly (per-game) snap counts to regular-season totals."""
+
+    required = {"pfr_player_id", "season", "team"}
+    if weekly.is_empty() or not required.issubset(weekly.columns):
+        return _empty_season_snap_counts_frame()
+
+    frame = weekly
+    if "game_type" in frame.columns:
+        frame = frame.filter(pl.col("game_type") == "REG")
+
+    def _snaps(column: str) -> pl.Expr:
+        if column not in frame.columns:
+            return pl.lit(0, dtype=pl.Int64)
+        return pl.col(column).cast(pl.Float64, strict=False).fill_null(0).sum().cast(pl.Int64)
+
+    return (
+        frame.filter(pl.col("pfr_player_id").is_not_null() & (pl.col("pfr_player_id") != ""))
+        .group_by(
+            pl.col("pfr_player_id").cast(pl.Utf8).alias("pfr_id"),
+            pl.col("season").cast(pl.Int64),
+            pl.col("team").cast(pl.Utf8).str.to_uppercase(),
+        )
+        .agg(
+            _snaps("offense_snaps").alias("_snap_offense"),
+            _snaps("defense_snaps").alias("_snap_defense"),
+            _snaps("st_snaps").alias("_snap_st"),
+        )
+        .select(list(SEASON_SNAP_COUNTS_SCHEMA))
+    )
+
+
+def load_nflverse_snap_counts(
+    seasons: Iterable[int],
+    *,
+    loader: Callable[..., object] | None = None,
+) -> pl.DataFrame:
+    """Download the nflverse snap counts for ``seasons`` and aggregate them.
+
+    Returns an empty frame (so callers fall back to PFR) when nflreadpy is
+    unavailable or the download fails.
+    """
+
+    target = sorted({int(season) for season in seasons if int(season) >= SNAP_COUNTS_MIN_SEASON})
+    load = loader or load_snap_counts
+    if not target or load is None:
+        return _empty_season_snap_counts_frame()
+    try:
+        weekly = _to_polars(load(seasons=target))
+    except Exception as exc:  # pragma: no cover - network/runtime
+        logger.warning("Could not load nflverse snap counts for %s: %s", target, exc)
+        return _empty_season_snap_counts_frame()
+    return aggregate_nflverse_snap_counts(weekly)
+
+
+def snap_count_gaps(season_teams: pl.DataFrame, snaps: pl.DataFrame) -> pl.DataFrame:
+    """Return the ``(season, team)`` pairs in ``season_teams`` missing from ``snaps``."""
+
+    wanted = season_teams.select(
+        pl.col("season").cast(pl.Int64),
+        pl.col("team").cast(pl.Utf8).str.to_uppercase(),
+    ).unique()
+    covered = snaps.select(["season", "team"]).unique()
+    return wanted.join(covered, on=["season", "team"], how="anti").sort(["season", "team"])
+
+
+def _fetch_pfr_gaps(
+    gaps: pl.DataFrame,
+    *,
+    team_to_slug: Callable[[str], str | None],
+    job: ScrapeJob | None,
+) -> pl.DataFrame:
+    # (slug, season) -> team abbreviations sharing that PFR page
+    requested: dict[tuple[str, int], list[str]] = {}
+    for season, team in gaps.iter_rows():
+        slug = team_to_slug(team)
+        if not slug:
+            logger.debug("No PFR slug mapping for team '%s'; skipping.", team)
+            continue
+        requested.setdefault((slug, int(season)), []).append(team)
+    if not requested:
+        return _empty_season_snap_counts_frame()
+
+    if job is not None:
+        fetched = fetch_snap_counts_resumable(requested, job)
+    else:
+        fetched = {
+            result.key: result.value
+            for result in fetch_snap_counts_many(requested)
+            if result.ok and result.value is not None
+        }
+
+    frames = [
+        snaps.with_columns(
+            pl.lit(team).alias("team"),
+            pl.lit(season, dtype=pl.Int64).alias("season"),
+        )
+        for (slug, season), snaps in fetched.items()
+        if snaps.height
+        for team in requested[(slug, season)]
+    ]
+    if not frames:
+        return _empty_season_snap_counts_frame()
+    return (
+        pl.concat(frames, how="vertical_relaxed")
+        .filter(pl.col("pfr_id").is_not_null() & (pl.col("pfr_id") != ""))
+        .select([pl.col(name).cast(dtype, strict=False) for name, dtype in SEASON_SNAP_COUNTS_SCHEMA.items()])
+    )
+
+
+def collect_season_snap_counts(
+    season_teams: pl.DataFrame,
+    *,
+    team_to_slug: Callable[[str], str | None],
+    job: ScrapeJob | None = None,
+    loader: Callable[..., object] | None = None,
+    fill_gaps: bool = True,
+) -> pl.DataFrame:
+    """Return season snap totals for every ``(season, team)`` in ``season_teams``.
+
+    nflverse bulk files are the primary source; PFR team pages are fetched
+    (through ``job`` when given, so they are checkpointed) only for the
+    team-seasons nflverse does not cover. Rows from nflverse win when both
+    sources have a player.
+    """
+
+    season_teams = season_teams.filter(
+        pl.col("team").is_not_null()
+        & (pl.col("team").str.strip_chars() != "")
+        & (pl.col("season") >= SNAP_COUNTS_MIN_SEASON)
+    )
+    if season_teams.is_empty():
+        return _empty_season_snap_counts_frame()
+
+    seasons = season_teams.get_column("season").unique().to_list()
+    primary = load_nflverse_snap_counts(seasons, loader=loader)
+    gaps = snap_count_gaps(season_teams, primary)
+    logger.info(
+        "nflverse snap counts cover %s team-seasons; %s left for PFR",
+        primary.select(["season", "team"]).unique().height,
+        gaps.height,
+    )
+    if gaps.is_empty() or not fill_gaps:
+        return primary
+
+    fallback = _fetch_pfr_gaps(gaps, team_to_slug=team_to_slug, job=job)
+    return pl.concat([primary, fallback], how="vertical_relaxed").unique(
+        subset=["pfr_id", "season", "team"], keep="first", maintain_order=True
+    )
+
+
+__all__ = [
+    "SEASON_SNAP_COUNTS_SCHEMA",
+    "SNAP_COUNTS_MIN_SEASON",
+    "aggregate_nflverse_snap_counts",
+    "collect_season_snap_counts",
+    "load_nflverse_snap_counts",
+    "snap_count_gaps",
+]
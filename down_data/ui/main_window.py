@@ -57,7 +57,8 @@ class MainWindow(QMainWindow):
 
     def _build_pages(self) -> None:
         # Create the main content page with hierarchical navigation
-        self._pages["Content"] = ContentPage(service=self._service)
+        # Only the landing page is built up front; the detail page warms up when idle
+        self._pages["Content"] = ContentPage(service=self._service, warm_up_pages=("player_detail",))
 
     def page(self, title: str) -> QWidget:
         return self._pages[title]
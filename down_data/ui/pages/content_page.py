@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+from typing import Any, Callable, Sequence, cast
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QLabel, QStackedWidget, QVBoxLayout, QWidget
 
 from down_data.backend.player_service import PlayerService
@@ -37,6 +38,24 @@ class ContentPage(SectionPage):
         },
     }
 
+    # Page factories keyed by the page keys used in the navigation maps. Pages
+    # are built on first navigation (or during idle warmup), not at startup.
+    PAGE_FACTORIES: dict[str, Callable[["ContentPage"], QWidget]] = {
+        "players_find": lambda host: host._create_player_search_page(),
+        "players_list": lambda host: host._create_placeholder_page("NFL Player List"),
+        "players_compare": lambda host: host._create_placeholder_page("Compare Players"),
+        "teams_temp1": lambda host: host._create_placeholder_page("Teams - Temp1"),
+        "teams_temp2": lambda host: host._create_placeholder_page("Teams - Temp2"),
+        "teams_temp3": lambda host: host._create_placeholder_page("Teams - Temp3"),
+        "coaches_temp4": lambda host: host._create_placeholder_page("Coaches - Temp4"),
+        "coaches_temp5": lambda host: host._create_placeholder_page("Coaches - Temp5"),
+        "coaches_temp6": lambda host: host._create_placeholder_page("Coaches - Temp6"),
+        "player_detail": lambda host: host._create_player_detail_page(),
+    }
+
+    # Delay before idle warmup starts, so it runs after the first paint
+    WARMUP_DELAY_MS = 250
+
     PLAYER_DETAIL_NAVIGATION = {
         "Profile": {
             "Summary": {
@@ -72,10 +91,12 @@ class ContentPage(SectionPage):
         service: PlayerService,
         parent: QWidget | None = None,
         show_grid_debug: bool = False,
+        warm_up_pages: Sequence[str] = (),
     ) -> None:
         super().__init__(title="Content", parent=parent)
         self._service = service
         self._show_grid_debug = show_grid_debug
+        self._warmup_queue: list[str] = []
 
         self._history: list[dict[str, Any]] = []
         self._history_index: int = -1
@@ -111,6 +132,9 @@ class ContentPage(SectionPage):
         )
         self._apply_navigation_context("default", trigger=True)
 
+        if warm_up_pages:
+            self.schedule_warmup(warm_up_pages)
+
     def _build_navigation(self) -> None:
         """Build the navigation bars."""
         # Top NavBar spanning all 12 columns in row 0
@@ -154,58 +178,68 @@ class ContentPage(SectionPage):
         self._content_stack = QStackedWidget()
         content_layout.addWidget(self._content_stack)
 
-        # Create all pages and map them
+        # Pages are created on demand through PAGE_FACTORIES
         self._pages: dict[str, QWidget] = {}
 
-        # Players pages
-        self._pages["players_find"] = PlayerSearchPage(
-            service=self._service, parent=self._content_container
-        )
-        self._pages["players_list"] = PlaceholderPage(
-            "NFL Player List", parent=self._content_container
-        )
-        self._pages["players_compare"] = PlaceholderPage(
-            "Compare Players", parent=self._content_container
-        )
-
-        # Teams placeholder pages
-        self._pages["teams_temp1"] = PlaceholderPage(
-            "Teams - Temp1", parent=self._content_container
-        )
-        self._pages["teams_temp2"] = PlaceholderPage(
-            "Teams - Temp2", parent=self._content_container
-        )
-        self._pages["teams_temp3"] = PlaceholderPage(
-            "Teams - Temp3", parent=self._content_container
-        )
-
-        # Coaches placeholder pages
-        self._pages["coaches_temp4"] = PlaceholderPage(
-            "Coaches - Temp4", parent=self._content_container
-        )
-        self._pages["coaches_temp5"] = PlaceholderPage(
-            "Coaches - Temp5", parent=self._content_container
-        )
-        self._pages["coaches_temp6"] = PlaceholderPage(
-            "Coaches - Temp6", parent=self._content_container
-        )
-
-        detail_page = PlayerDetailPage(service=self._service, parent=self._content_container)
-        detail_page.backRequested.connect(self._on_player_detail_back)
-        self._pages["player_detail"] = detail_page
-
-        # Add all pages to stack
-        for page in self._pages.values():
-            self._content_stack.addWidget(page)
-
-        player_search_page = cast(PlayerSearchPage, self._pages["players_find"])
-        player_search_page.playerSelected.connect(self._show_player_detail)
-
         # Add content container to grid (rows 5-23)
         self._grid_layout.add_widget(
             self._content_container, GridCell(col=0, row=5, col_span=12, row_span=19)
         )
 
+    def _has_page(self, page_key: str) -> bool:
+        return page_key in self._pages or page_key in self.PAGE_FACTORIES
+
+    def _page(self, page_key: str) -> QWidget | None:
+        """Return the page for ``page_key``, building it on first use."""
+        page = self._pages.get(page_key)
+        if page is not None:
+            return page
+        factory = self.PAGE_FACTORIES.get(page_key)
+        if factory is None:
+            return None
+        page = factory(self)
+        self._pages[page_key] = page
+        self._content_stack.addWidget(page)
+        return page
+
+    def _create_player_search_page(self) -> QWidget:
+        page = PlayerSearchPage(service=self._service, parent=self._content_container)
+        page.playerSelected.connect(self._show_player_detail)
+        return page
+
+    def _create_player_detail_page(self) -> QWidget:
+        page = PlayerDetailPage(service=self._service, parent=self._content_container)
+        page.backRequested.connect(self._on_player_detail_back)
+        return page
+
+    def _create_placeholder_page(self, title: str) -> QWidget:
+        return PlaceholderPage(title, parent=self._content_container)
+
+    def schedule_warmup(self, page_keys: Sequence[str]) -> None:
+        """Build ``page_keys`` in the background of the event loop, one per turn.
+
+        Warmup starts after :attr:`WARMUP_DELAY_MS` so it does not delay the
+        first paint; pages the user opens in the meantime are skipped.
+        """
+        pending = [key for key in page_keys if key in self.PAGE_FACTORIES and key not in self._warmup_queue]
+        if not pending:
+            return
+        start = not self._warmup_queue
+        self._warmup_queue.extend(pending)
+        if start:
+            QTimer.singleShot(self.WARMUP_DELAY_MS, self._warm_up_next)
+
+    def _warm_up_next(self) -> None:
+        if not self._warmup_queue:
+            return
+        page_key = self._warmup_queue.pop(0)
+        page = self._page(page_key)
+        warm_up_panels = getattr(page, "warm_up_panels", None)
+        if callable(warm_up_panels):
+            warm_up_panels()
+        if self._warmup_queue:
+            QTimer.singleShot(0, self._warm_up_next)
+
     @staticmethod
     def _normalize_navigation_tree(
         tree: dict[str, dict[str | None, Any] | None]
@@ -410,7 +444,7 @@ class ContentPage(SectionPage):
             return
 
         page_key = target.get("page_key")
-        if not page_key or page_key not in self._pages:
+        if not page_key or not self._has_page(page_key):
             return
 
         view_state = target.get("view_state")
@@ -495,7 +529,8 @@ class ContentPage(SectionPage):
     def _render_entry(self, entry: dict[str, Any]) -> None:
         """Render the requested entry without altering history."""
         page_key = entry["page_key"]
-        if page_key not in self._pages:
+        widget = self._page(page_key)
+        if widget is None:
             return
 
         context_id = entry.get("context_id") or "default"
@@ -506,7 +541,7 @@ class ContentPage(SectionPage):
 
         if page_key == "player_detail":
             payload = dict(entry.get("payload") or self._player_detail_payload or {})
-            detail_page = cast(PlayerDetailPage, self._pages["player_detail"])
+            detail_page = cast(PlayerDetailPage, widget)
             if payload:
                 self._player_detail_payload = dict(payload)
             self._current_detail_title = entry.get("title") or self._current_detail_title
@@ -521,7 +556,6 @@ class ContentPage(SectionPage):
                 self._player_detail_payload = None
                 self._current_detail_title = None
 
-        widget = self._pages[page_key]
         self._content_stack.setCurrentWidget(widget)
         self._context_bar.set_title(entry["title"])
 
@@ -589,5 +623,5 @@ class ContentPage(SectionPage):
         """Handle resize events."""
         super().resizeEvent(event)
         if hasattr(self, "_grid_layout"):
-            self._grid_layout.update_layout()
+            self._grid_layout.schedule_update()
 
@@ -6,10 +6,10 @@ from dataclasses import dataclass
 from datetime import date, datetime
 import logging
 import math
-from typing import Any, Iterable, Mapping
+from typing import Any, Callable, Iterable, Mapping
 
 import polars as pl
-from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
@@ -31,6 +31,13 @@ from down_data.ui.widgets import (
     BasicRatingsWidget,
 )
 from down_data.core.ratings import RatingBreakdown
+from down_data.ui.task_scheduler import (
+    CancellationToken,
+    TaskCancelled,
+    TaskHandle,
+    TaskPriority,
+    get_task_scheduler,
+)
 
 from .base_page import SectionPage
 
@@ -52,30 +59,53 @@ class PlayerTypeFlags:
 
 
 @dataclass(frozen=True)
-class PlayerDetailComputationResult:
+class PlayerDetailProfileStage:
+    """Resolved player and table layout, published before any stats load."""
+
     token: int
     player: Player
+    flags: PlayerTypeFlags
     table_columns: list[str]
+
+
+@dataclass(frozen=True)
+class PlayerDetailTableStage:
+    """Season table rows (with impacts when ``fetch_impacts``) and career summary."""
+
+    token: int
     season_rows: list[list[str]]
     summary: dict[str, float]
-    basic_ratings: list[RatingBreakdown]
     stats_frame: pl.DataFrame
-    flags: PlayerTypeFlags
     fetch_impacts: bool
 
 
-class PlayerDetailWorkerSignals(QObject):
-    """Signals emitted by the player detail background worker."""
+@dataclass(frozen=True)
+class PlayerDetailRatingsStage:
+    token: int
+    basic_ratings: list[RatingBreakdown]
 
-    def __init__(self) -> None:
-        super().__init__()
 
-    finished = Signal(object)
-    error = Signal(str)
+@dataclass(frozen=True)
+class PlayerDetailComputationResult:
+    token: int
+    player: Player
+    table_columns: list[str]
+    season_rows: list[list[str]]
+    summary: dict[str, float]
+    basic_ratings: list[RatingBreakdown]
+    stats_frame: pl.DataFrame
+    flags: PlayerTypeFlags
+    fetch_impacts: bool
 
 
-class PlayerDetailWorker(QRunnable):
-    """Background job for loading player stats without blocking the UI thread."""
+class PlayerDetailWorker:
+    """Scheduled job for loading player details without blocking the UI thread.
+
+    Results are published stage by stage through the page's signals (profile,
+    season table, ratings; the advanced pass publishes impacts then ratings),
+    so each panel fills as soon as its data is ready. Before each stage the job
+    stops if it was cancelled or the page has moved on to another player.
+    """
 
     def __init__(
         self,
@@ -87,28 +117,60 @@ class PlayerDetailWorker(QRunnable):
         cached_player: Player | None = None,
         cached_stats: pl.DataFrame | None = None,
     ) -> None:
-        super().__init__()
         self._page = page
         self._payload = dict(payload)
         self._token = token
         self._fetch_impacts = fetch_impacts
         self._cached_player = cached_player
         self._cached_stats = cached_stats
-        self.signals = PlayerDetailWorkerSignals()
 
-    def run(self) -> None:  # pragma: no cover - executed in worker thread
-        try:
-            result = self._page._compute_player_detail(  # type: ignore[attr-defined]
-                self._payload,
-                token=self._token,
-                fetch_impacts=self._fetch_impacts,
-                cached_player=self._cached_player,
-                cached_stats=self._cached_stats,
-            )
-            self.signals.finished.emit(result)
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.debug("Player detail worker failed: %s", exc)
-            self.signals.error.emit(str(exc))
+    def __call__(
+        self, cancel_token: CancellationToken
+    ) -> PlayerDetailComputationResult:  # pragma: no cover - executed in worker thread
+        def _checkpoint() -> None:
+            cancel_token.raise_if_cancelled()
+            if self._page._payload_token != self._token:  # type: ignore[attr-defined]
+                raise TaskCancelled()
+
+        _checkpoint()
+        return self._page._compute_player_detail(  # type: ignore[attr-defined]
+            self._payload,
+            token=self._token,
+            fetch_impacts=self._fetch_impacts,
+            cached_player=self._cached_player,
+            cached_stats=self._cached_stats,
+            checkpoint=_checkpoint,
+            publish=True,
+        )
+
+
+class PlayerDetailViewModel:
+    """Detail data shared by every section scaffold.
+
+    Each field carries a revision number. Scaffolds remember the revision they
+    last rendered, so only the visible scaffold renders when data changes and
+    the others catch up when they become current.
+    """
+
+    FIELDS = ("columns", "rows", "personal_details", "basic_ratings")
+
+    def __init__(self) -> None:
+        self.columns: list[str] = ["Season", "Team", "Pos", "GP", "Snps"]
+        self.rows: list[list[str]] = []
+        self.personal_details: list[tuple[str, str]] = []
+        self.basic_ratings: list[RatingBreakdown] = []
+        self._revisions: dict[str, int] = dict.fromkeys(self.FIELDS, 0)
+
+    def set(self, field: str, value: Any) -> bool:
+        """Replace ``field``; returns ``False`` (no new revision) when unchanged."""
+        if getattr(self, field) == value:
+            return False
+        setattr(self, field, value)
+        self._revisions[field] += 1
+        return True
+
+    def revision(self, field: str) -> int:
+        return self._revisions[field]
 
 
 class PlayerDetailSectionScaffold(QWidget):
@@ -176,6 +238,7 @@ class PlayerDetailSectionScaffold(QWidget):
         self._table_panel: TablePanel | None = None
         self._personal_details_widget: PersonalDetailsWidget | None = None
         self._basic_ratings_widget: BasicRatingsWidget | None = None
+        self._synced_revisions: dict[str, int] = {}
         self._build_panels()
 
     def _build_panels(self) -> None:
@@ -192,6 +255,7 @@ class PlayerDetailSectionScaffold(QWidget):
                     columns=["Season", "Team", "Pos", "GP", "Snps"],
                     sortable=False,
                     alternating_rows=True,
+                    model_backed=True,
                     parent=self,
                 )
                 panel.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -200,7 +264,6 @@ class PlayerDetailSectionScaffold(QWidget):
                 table.horizontalHeader().setStretchLastSection(True)
                 table.verticalHeader().hide()
                 table.setShowGrid(False)
-                table.setRowCount(0)
                 if hasattr(table, "setPlaceholderText"):
                     table.setPlaceholderText("No regular-season stats available.")
 
@@ -238,20 +301,30 @@ class PlayerDetailSectionScaffold(QWidget):
 
         self._grid_layout.update_layout()
 
+    def sync(self, model: PlayerDetailViewModel) -> None:
+        """Render the fields of ``model`` that changed since the last sync."""
+
+        # Columns first so rows land in the right header layout
+        appliers = (
+            ("columns", self.update_table_columns),
+            ("rows", self.update_table_rows),
+            ("personal_details", self.update_personal_details),
+            ("basic_ratings", self.update_basic_ratings),
+        )
+        for field, apply in appliers:
+            revision = model.revision(field)
+            if self._synced_revisions.get(field) == revision:
+                continue
+            apply(getattr(model, field))
+            self._synced_revisions[field] = revision
+
     def update_table_rows(self, rows: list[list[str]]) -> None:
         """Populate the embedded table panel with the provided rows."""
 
         if self._table_panel is None:
             return
 
-        self._table_panel.clear_data()
-
-        if not rows:
-            self._table_panel.table.setRowCount(0)
-            return
-
-        for row in rows:
-            self._table_panel.add_row(row)
+        self._table_panel.set_data(rows)
 
     def update_table_columns(self, columns: list[str]) -> None:
         """Update the table header/columns."""
@@ -282,7 +355,7 @@ class PlayerDetailSectionScaffold(QWidget):
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         """Ensure panels stay aligned with the grid when the widget resizes."""
         super().resizeEvent(event)
-        self._grid_layout.update_layout()
+        self._grid_layout.schedule_update()
 
 
 class PlayerDetailPage(SectionPage):
@@ -515,6 +588,11 @@ class PlayerDetailPage(SectionPage):
     ]
 
     backRequested = Signal()
+    # Staged detail results; emitted from the worker thread, delivered queued
+    detailProfileReady = Signal(object)
+    detailTableReady = Signal(object)
+    detailRatingsReady = Signal(object)
+    detailImpactsReady = Signal(object)
 
     def __init__(
         self,
@@ -539,7 +617,8 @@ class PlayerDetailPage(SectionPage):
         self._is_punter: bool = False
         self._current_player: Player | None = None
         self._basic_ratings: list[RatingBreakdown] = []
-        self._thread_pool = QThreadPool.globalInstance()
+        self._scheduler = get_task_scheduler()
+        self._detail_handles: list[TaskHandle] = []
         self._advanced_worker_running: bool = False
         self._payload_token: int = 0
         self._last_stats_frame: pl.DataFrame | None = None
@@ -551,6 +630,7 @@ class PlayerDetailPage(SectionPage):
         self._active_subsection: str | None = self.PROFILE_SUBSECTIONS[0]
 
         self._content_stack = QStackedWidget(self)
+        self._view_model = PlayerDetailViewModel()
         self._content_panels: dict[tuple[str, str | None], QWidget] = {}
         self._initialize_content_panels()
 
@@ -570,6 +650,11 @@ class PlayerDetailPage(SectionPage):
         layout.addWidget(self._content_container, 1)
         layout.addWidget(self._back_button, alignment=Qt.AlignRight)
 
+        self.detailProfileReady.connect(self._on_detail_profile_ready)
+        self.detailTableReady.connect(self._on_detail_table_ready)
+        self.detailRatingsReady.connect(self._on_detail_ratings_ready)
+        self.detailImpactsReady.connect(self._on_detail_impacts_ready)
+
         self._update_table_views()
 
     def display_player(self, payload: dict[str, Any]) -> None:
@@ -583,6 +668,7 @@ class PlayerDetailPage(SectionPage):
         self._advanced_metrics_ready = False
         self._advanced_worker_running = False
         self._payload_token += 1
+        self._cancel_detail_tasks()
         self._update_personal_details_views()
         self._set_loading_state(True, "Loading player...")
         self._start_player_detail_worker(fetch_impacts=False)
@@ -592,6 +678,7 @@ class PlayerDetailPage(SectionPage):
         """Reset any stored payload and ensure the content area is empty."""
 
         self._payload_token += 1
+        self._cancel_detail_tasks()
         self._current_payload = None
         self._season_rows = []
         self._current_player = None
@@ -606,20 +693,42 @@ class PlayerDetailPage(SectionPage):
         self._show_content(self.PRIMARY_SECTIONS[0], self.PROFILE_SUBSECTIONS[0])
 
     def _initialize_content_panels(self) -> None:
-        """Create placeholder panels for each section/subsection combination."""
+        """Reset the section scaffolds; each is built on first display."""
+
+        self._content_panels.clear()
 
+    def _panel_keys(self) -> list[tuple[str, str | None]]:
+        """Return every section/subsection combination the page can show."""
+
+        keys: list[tuple[str, str | None]] = []
         for section in self.PRIMARY_SECTIONS:
             if section == "Profile":
-                for subsection in self.PROFILE_SUBSECTIONS:
-                    widget = self._create_placeholder_panel(section, subsection)
-                    key = (section, subsection)
-                    self._content_panels[key] = widget
-                    self._content_stack.addWidget(widget)
+                keys.extend((section, subsection) for subsection in self.PROFILE_SUBSECTIONS)
             else:
-                widget = self._create_placeholder_panel(section, None)
-                key = (section, None)
-                self._content_panels[key] = widget
-                self._content_stack.addWidget(widget)
+                keys.append((section, None))
+        return keys
+
+    def _ensure_content_panel(self, key: tuple[str, str | None]) -> QWidget | None:
+        """Return the scaffold for ``key``, creating it on first use.
+
+        New scaffolds render the shared view-model when they become current.
+        """
+
+        widget = self._content_panels.get(key)
+        if widget is not None or key not in self._panel_keys():
+            return widget
+
+        section, subsection = key
+        widget = self._create_placeholder_panel(section, subsection)
+        self._content_panels[key] = widget
+        self._content_stack.addWidget(widget)
+        return widget
+
+    def warm_up_panels(self) -> None:
+        """Build every section scaffold ahead of navigation (e.g. when idle)."""
+
+        for key in self._panel_keys():
+            self._ensure_content_panel(key)
 
     def _create_placeholder_panel(self, section: str, subsection: str | None) -> QWidget:
         """Return a scaffold widget containing placeholder panels."""
@@ -636,9 +745,10 @@ class PlayerDetailPage(SectionPage):
         self._active_subsection = subsection_key
 
         key = (section_key, subsection_key)
-        widget = self._content_panels.get(key)
+        widget = self._ensure_content_panel(key)
         if widget is not None:
             self._content_stack.setCurrentWidget(widget)
+            self._sync_current_panel()
 
     def set_view_state(self, section: str, subsection: str | None) -> None:
         """Update the displayed section/subsection."""
@@ -652,25 +762,27 @@ class PlayerDetailPage(SectionPage):
 
         self._show_content(normalized_section, normalized_subsection)
 
+    def _sync_current_panel(self) -> None:
+        """Render pending view-model changes into the visible scaffold only."""
+
+        widget = self._content_stack.currentWidget()
+        if isinstance(widget, PlayerDetailSectionScaffold):
+            widget.sync(self._view_model)
+
     def _update_table_views(self) -> None:
-        """Push the current table rows into every section scaffold."""
+        """Publish the current table columns and rows to the section scaffolds."""
 
-        for widget in self._content_panels.values():
-            if isinstance(widget, PlayerDetailSectionScaffold):
-                widget.update_table_columns(self._table_columns)
-                widget.update_table_rows(self._season_rows)
+        self._view_model.set("columns", list(self._table_columns))
+        self._view_model.set("rows", list(self._season_rows))
+        self._sync_current_panel()
 
     def _update_personal_details_views(self) -> None:
-        details = self._build_personal_detail_rows()
-        for widget in self._content_panels.values():
-            if isinstance(widget, PlayerDetailSectionScaffold):
-                widget.update_personal_details(details)
+        self._view_model.set("personal_details", self._build_personal_detail_rows())
+        self._sync_current_panel()
 
     def _update_basic_ratings_views(self) -> None:
-        ratings = self._basic_ratings if self._basic_ratings else []
-        for widget in self._content_panels.values():
-            if isinstance(widget, PlayerDetailSectionScaffold):
-                widget.update_basic_ratings(ratings)
+        self._view_model.set("basic_ratings", list(self._basic_ratings or []))
+        self._sync_current_panel()
 
     def _set_loading_state(self, loading: bool, message: str | None = None) -> None:
         """Track loading state for stats; message reserved for future UI hooks."""
@@ -698,32 +810,88 @@ class PlayerDetailPage(SectionPage):
             cached_player=cached_player,
             cached_stats=cached_stats,
         )
-        worker.signals.finished.connect(self._on_player_detail_loaded)
-        worker.signals.error.connect(self._on_player_detail_error)
         if fetch_impacts:
             self._advanced_worker_running = True
-        self._thread_pool.start(worker)
+        # Advanced metrics may scan play-by-play data; keep them out of the way of interactive loads
+        handle = self._scheduler.submit(
+            worker,
+            category="advanced" if fetch_impacts else "detail",
+            priority=TaskPriority.VISIBLE if fetch_impacts else TaskPriority.INTERACTIVE,
+            on_finished=self._on_player_detail_loaded,
+            on_error=self._on_player_detail_error,
+        )
+        self._detail_handles.append(handle)
+
+    def _cancel_detail_tasks(self) -> None:
+        """Cancel outstanding detail jobs for a previously displayed player."""
+
+        for handle in self._detail_handles:
+            handle.cancel()
+        self._detail_handles.clear()
+
+    def _on_detail_profile_ready(self, stage: object) -> None:
+        """Adopt the resolved player and switch the table to its columns."""
+
+        if not isinstance(stage, PlayerDetailProfileStage) or stage.token != self._payload_token:
+            return  # stale stage
+        self._current_player = stage.player
+        self._apply_player_flags(stage.flags)
+        self._table_columns = stage.table_columns
+        self._update_table_views()
+
+    def _on_detail_table_ready(self, stage: object) -> None:
+        """Show season rows and career figures derived from them."""
+
+        if not isinstance(stage, PlayerDetailTableStage) or stage.token != self._payload_token:
+            return  # stale stage
+        self._season_rows = stage.season_rows
+        self._last_stats_frame = stage.stats_frame.clone()
+        payload_enriched = self._merge_summary_into_payload(stage.summary, stage.stats_frame)
+
+        self._update_table_views()
+        if payload_enriched:
+            self._update_personal_details_views()
+        self._set_loading_state(False)
+
+    def _on_detail_ratings_ready(self, stage: object) -> None:
+        if not isinstance(stage, PlayerDetailRatingsStage) or stage.token != self._payload_token:
+            return  # stale stage
+        self._basic_ratings = stage.basic_ratings
+        self._update_basic_ratings_views()
+
+    def _on_detail_impacts_ready(self, stage: object) -> None:
+        """Replace the season rows with their EPA/WPA-enriched versions."""
+
+        if not isinstance(stage, PlayerDetailTableStage) or stage.token != self._payload_token:
+            return  # stale stage
+        self._season_rows = stage.season_rows
+        self._update_table_views()
 
     def _on_player_detail_loaded(self, payload: object) -> None:
-        """Handle completion of the background stats worker."""
+        """Handle completion of the background stats worker.
+
+        Stages have already been applied as they arrived; this applies any
+        stage that was not published (e.g. a directly computed result) and
+        queues the advanced pass.
+        """
 
         if not isinstance(payload, PlayerDetailComputationResult):
             return
         if payload.token != self._payload_token:
             return  # stale result
 
-        self._current_player = payload.player
-        self._apply_player_flags(payload.flags)
-        self._season_rows = payload.season_rows
-        self._table_columns = payload.table_columns
-        self._basic_ratings = payload.basic_ratings
-        self._last_stats_frame = payload.stats_frame.clone()
-        payload_enriched = self._merge_summary_into_payload(payload.summary, payload.stats_frame)
-
-        self._update_table_views()
-        self._update_basic_ratings_views()
-        if payload_enriched:
-            self._update_personal_details_views()
+        if self._current_player is not payload.player:
+            self._on_detail_profile_ready(
+                PlayerDetailProfileStage(payload.token, payload.player, payload.flags, payload.table_columns)
+            )
+        if self._season_rows is not payload.season_rows:
+            self._on_detail_table_ready(
+                PlayerDetailTableStage(
+                    payload.token, payload.season_rows, payload.summary, payload.stats_frame, payload.fetch_impacts
+                )
+            )
+        if self._basic_ratings is not payload.basic_ratings:
+            self._on_detail_ratings_ready(PlayerDetailRatingsStage(payload.token, payload.basic_ratings))
         self._set_loading_state(False)
 
         if payload.fetch_impacts:
@@ -1082,7 +1250,17 @@ class PlayerDetailPage(SectionPage):
         fetch_impacts: bool,
         cached_player: Player | None = None,
         cached_stats: pl.DataFrame | None = None,
+        checkpoint: Callable[[], None] | None = None,
+        publish: bool = False,
     ) -> PlayerDetailComputationResult:
+        """Load a player's detail data in stages.
+
+        ``checkpoint`` runs before each stage is published and may raise to
+        abandon the job. With ``publish`` each stage is emitted on its page
+        signal as soon as it is computed (the advanced pass publishes impacts
+        and ratings only).
+        """
+        checkpoint = checkpoint or (lambda: None)
         if self._service is None:
             raise RuntimeError("Player service unavailable.")
         if not payload:
@@ -1099,6 +1277,9 @@ class PlayerDetailPage(SectionPage):
 
         flags = self._determine_player_flags(player)
         table_columns = self._determine_table_columns(flags)
+        checkpoint()
+        if publish and not fetch_impacts:
+            self.detailProfileReady.emit(PlayerDetailProfileStage(token, player, flags, table_columns))
 
         stats = cached_stats.clone() if cached_stats is not None else self._load_stats_for_player(player, flags)
 
@@ -1107,12 +1288,19 @@ class PlayerDetailPage(SectionPage):
             summary: dict[str, float] = {}
         else:
             season_rows, summary = self._build_table_rows(player, stats, flags=flags, fetch_impacts=fetch_impacts)
+        checkpoint()
+        if publish:
+            table_stage = PlayerDetailTableStage(token, season_rows, summary, stats, fetch_impacts)
+            (self.detailImpactsReady if fetch_impacts else self.detailTableReady).emit(table_stage)
 
         basic_ratings = self._service.get_basic_ratings(
             player,
             summary=summary,
             is_defensive=flags.is_defensive,
         ) if summary else []
+        checkpoint()
+        if publish:
+            self.detailRatingsReady.emit(PlayerDetailRatingsStage(token, basic_ratings))
 
         return PlayerDetailComputationResult(
             token=token,
@@ -1213,6 +1401,10 @@ class PlayerDetailPage(SectionPage):
             summary_stats = self._service.get_player_summary_stats(player_id=player_id)
             if summary_stats.height > 0:
                 return summary_stats
+            # A complete local store means the player has no stats anywhere;
+            # skip the fallbacks, the last of which downloads every season
+            if self._service.has_authoritative_stats():
+                return summary_stats
             if flags.is_quarterback:
                 stats = self._service.get_basic_offense_stats(player_id=player_id)
             if stats.is_empty():
@@ -1999,7 +2191,13 @@ class PlayerDetailPage(SectionPage):
             )
 
         solo_expr = _stat_expr(["def_tackles_solo", "solo_tackles", "tackles_solo"], "_solo")
-        assist_expr = _stat_expr(["def_tackle_assists", "assist_tackles"], "_assist")
+        # Shared tackles count as assists, as in the weekly-stats path above
+        assist_expr = pl.sum_horizontal(
+            [
+                _stat_expr(["def_tackle_assists", "assist_tackles"], "_assist_credit"),
+                _stat_expr(["def_tackles_with_assist"], "_assist_shared"),
+            ]
+        ).alias("_assist")
         tfl_expr = _stat_expr(["def_tackles_for_loss", "tackles_for_loss"], "_tfl")
         sacks_expr = _stat_expr(["def_sacks", "sacks"], "_sacks")
         qb_hits_expr = _stat_expr(["def_qb_hits", "qb_hits"], "_qb_hits")
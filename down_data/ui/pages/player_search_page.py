@@ -10,7 +10,7 @@ import polars as pl
 
 from typing import Any
 
-from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QAbstractSpinBox,
     QComboBox,
@@ -28,6 +28,9 @@ from PySide6.QtWidgets import (
 )
 
 from down_data.backend.player_service import PlayerService
+from down_data.core import PlayerQuery
+from down_data.ui.startup_metrics import get_startup_metrics
+from down_data.ui.task_scheduler import CancellationToken, TaskHandle, TaskPriority, get_task_scheduler
 from down_data.ui.widgets import GridCell, GridLayoutManager, FilterPanel, RangeSelector, TablePanel
 
 from .base_page import SectionPage
@@ -65,33 +68,55 @@ class SearchCriteria:
     value_variant: str
 
 
-class SearchWorkerSignals(QObject):
-    """Signals emitted by the background search worker."""
+class SearchWorker:
+    """Execute player filtering as a scheduled background task."""
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, service: PlayerService, criteria: SearchCriteria) -> None:
+        self._service = service
+        self._criteria = criteria
 
-    finished = Signal(object)
-    error = Signal(str)
+    def __call__(self, token: CancellationToken) -> pl.DataFrame:  # pragma: no cover - background execution
+        raw_players_df = self._service.get_all_players()
+        token.raise_if_cancelled()
+        prepared = PlayerSearchPage._prepare_player_directory_frame(raw_players_df)
+        token.raise_if_cancelled()
+        ratings = self._service.get_player_ratings(latest_only=True)
+        prepared = PlayerSearchPage._attach_latest_ratings(prepared, ratings)
+        token.raise_if_cancelled()
+        return PlayerSearchPage._filter_players_by_criteria(prepared, self._criteria)
 
 
-class SearchWorker(QRunnable):
-    """Execute player filtering on a background thread."""
+@dataclass(frozen=True)
+class DirectoryFilterOptions:
+    """Filter dropdown choices derived from the player directory."""
 
-    def __init__(self, service: PlayerService, criteria: SearchCriteria) -> None:
-        super().__init__()
+    team_options: tuple[str, ...]
+    contract_year_signed_options: tuple[str, ...]
+    default_contract_year_signed: str
+
+
+class FilterOptionsWorker:
+    """Load the player directory and derive filter options as a background task."""
+
+    def __init__(self, service: PlayerService) -> None:
         self._service = service
-        self._criteria = criteria
-        self.signals = SearchWorkerSignals()
 
-    def run(self) -> None:  # pragma: no cover - background execution
-        try:
-            raw_players_df = self._service.get_all_players()
-            prepared = PlayerSearchPage._prepare_player_directory_frame(raw_players_df)
-            filtered = PlayerSearchPage._filter_players_by_criteria(prepared, self._criteria)
-            self.signals.finished.emit(filtered)
-        except Exception as exc:  # pragma: no cover - surfaced to UI
-            self.signals.error.emit(str(exc))
+    def __call__(self, token: CancellationToken) -> DirectoryFilterOptions:  # pragma: no cover - background execution
+        players_df = self._service.get_all_players()
+        token.raise_if_cancelled()
+        return PlayerSearchPage._directory_filter_options(players_df)
+
+
+class PlayerPrefetchWorker:
+    """Speculatively warm player detail caches for a visible search result."""
+
+    def __init__(self, service: PlayerService, query: PlayerQuery) -> None:
+        self._service = service
+        self._query = query
+
+    def __call__(self, token: CancellationToken) -> None:  # pragma: no cover - background execution
+        token.raise_if_cancelled()
+        self._service.prefetch_player_detail(self._query)
 
 
 class PlayerSearchPage(SectionPage):
@@ -107,6 +132,10 @@ class PlayerSearchPage(SectionPage):
     """
 
     playerSelected = Signal(dict)
+    filterOptionsLoaded = Signal(object)
+
+    # Number of leading rows on each results page whose details are prefetched
+    PREFETCH_ROW_COUNT = 10
 
     def __init__(
         self, 
@@ -153,12 +182,24 @@ class PlayerSearchPage(SectionPage):
             rows=24
         )
 
-        self._thread_pool = QThreadPool.globalInstance()
-        self._active_worker: SearchWorker | None = None
+        self._scheduler = get_task_scheduler()
+        self._active_search: TaskHandle | None = None
+        self._prefetch_handles: list[TaskHandle] = []
+        self._prefetched_queries: set[PlayerQuery] = set()
         
         # Build the UI panels
         self._build_filter_panel()
         self._build_results_table()
+
+        # Directory-derived options (teams, years signed) load off the GUI thread
+        self.filterOptionsLoaded.connect(self._apply_filter_options)
+        self._filter_options_task: TaskHandle | None = self._scheduler.submit(
+            FilterOptionsWorker(self._service),
+            category="startup",
+            priority=TaskPriority.VISIBLE,
+            on_finished=self.filterOptionsLoaded.emit,
+            on_error=self._on_filter_options_failed,
+        )
         
         # TODO: Add detail panel (optional right sidebar for preview)
 
@@ -196,26 +237,8 @@ class PlayerSearchPage(SectionPage):
             "FS",
         ]
 
-        # Team options - gather from player directory
+        # Team options are filled in once the player directory has loaded
         self._team_options = ["Any"]
-        players_df = None
-        try:
-            players_df = self._service.get_all_players()
-            if isinstance(players_df, pl.DataFrame) and players_df.height > 0:
-                team_values: set[str] = set()
-                for column in ["team_abbr", "current_team_abbr", "recent_team", "team"]:
-                    if column in players_df.columns:
-                        values = (
-                            players_df[column]
-                            .drop_nulls()
-                            .unique()
-                            .to_list()
-                        )
-                        team_values.update(str(value).upper() for value in values if value)
-                if team_values:
-                    self._team_options = ["Any"] + sorted(team_values)
-        except Exception as exc:
-            print(f"[Search] Warning: failed to load team options ({exc})")
 
         # Year options - current season plus previous 5 seasons
         current_year = datetime.now().year
@@ -225,10 +248,37 @@ class PlayerSearchPage(SectionPage):
             seasons.append(f"{start_year}-{end_year_two}")
         self._year_options = ["Any"] + seasons if seasons else ["Any"]
         self._default_year = seasons[-1] if seasons else "Any"
-        # Contract year signed options
+        # Contract year signed options (also filled in from the directory)
         self._contract_year_signed_options = ["Any"]
         self._default_contract_year_signed = "Any"
-        if isinstance(players_df, pl.DataFrame) and "year_signed" in players_df.columns:
+        # Draft round and pick options (defaults for fallback)
+        self._draft_round_options = ["Any"] + [str(i) for i in range(1, 8)] + ["Undrafted"]
+        self._draft_position_options = ["Any"] + [str(i) for i in range(1, 33)] + ["N/A"]
+        self._draft_team_options = self._team_options.copy()
+
+    @staticmethod
+    def _directory_filter_options(players_df: pl.DataFrame | None) -> DirectoryFilterOptions:
+        """Derive team and year-signed dropdown options from the player directory."""
+        team_options = ["Any"]
+        year_signed_options = ["Any"]
+        default_year_signed = "Any"
+        if not isinstance(players_df, pl.DataFrame) or players_df.height == 0:
+            return DirectoryFilterOptions(tuple(team_options), tuple(year_signed_options), default_year_signed)
+
+        team_values: set[str] = set()
+        for column in ["team_abbr", "current_team_abbr", "recent_team", "team"]:
+            if column in players_df.columns:
+                values = (
+                    players_df[column]
+                    .drop_nulls()
+                    .unique()
+                    .to_list()
+                )
+                team_values.update(str(value).upper() for value in values if value)
+        if team_values:
+            team_options = ["Any"] + sorted(team_values)
+
+        if "year_signed" in players_df.columns:
             years_signed = (
                 players_df["year_signed"]
                 .drop_nulls()
@@ -239,12 +289,51 @@ class PlayerSearchPage(SectionPage):
             )
             years_signed = [int(y) for y in years_signed if y is not None]
             if years_signed:
-                self._contract_year_signed_options = ["Any"] + [str(y) for y in years_signed]
-                self._default_contract_year_signed = str(years_signed[-1])
-        # Draft round and pick options (defaults for fallback)
-        self._draft_round_options = ["Any"] + [str(i) for i in range(1, 8)] + ["Undrafted"]
-        self._draft_position_options = ["Any"] + [str(i) for i in range(1, 33)] + ["N/A"]
+                year_signed_options = ["Any"] + [str(y) for y in years_signed]
+                default_year_signed = str(years_signed[-1])
+        return DirectoryFilterOptions(tuple(team_options), tuple(year_signed_options), default_year_signed)
+
+    @staticmethod
+    def _replace_combo_options(combo: QComboBox, options: list[str], selected: str) -> None:
+        """Swap ``combo``'s items without emitting change signals."""
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems(options)
+            if selected in options:
+                combo.setCurrentText(selected)
+            else:
+                combo.setCurrentIndex(0)
+        finally:
+            combo.blockSignals(False)
+
+    def _apply_filter_options(self, options: DirectoryFilterOptions) -> None:
+        """Populate directory-derived dropdowns once the background load finishes."""
+        self._filter_options_task = None
+        previous_default_signed = self._default_contract_year_signed
+        self._team_options = list(options.team_options)
         self._draft_team_options = self._team_options.copy()
+        self._contract_year_signed_options = list(options.contract_year_signed_options)
+        self._default_contract_year_signed = options.default_contract_year_signed
+
+        for combo in self._team_filters.values():
+            self._replace_combo_options(combo, self._team_options, combo.currentText())
+        for combo in self._draft_team_filters.values():
+            self._replace_combo_options(combo, self._draft_team_options, combo.currentText())
+        for combo in self._contract_year_signed_filters.values():
+            current = combo.currentText()
+            # Untouched dropdowns move to the newly known default season
+            if current == previous_default_signed:
+                current = self._default_contract_year_signed
+            self._replace_combo_options(combo, self._contract_year_signed_options, current)
+
+        elapsed = get_startup_metrics().mark("filter_options_loaded")
+        print(f"[Search] Filter options loaded ({len(self._team_options) - 1} teams) at {elapsed:.2f}s")
+
+    def _on_filter_options_failed(self, message: str) -> None:
+        """Keep the default dropdowns when the directory cannot be loaded."""
+        self._filter_options_task = None
+        print(f"[Search] Warning: failed to load team options ({message})")
 
     @staticmethod
     def _format_cell_value(value: Any) -> str:
@@ -368,6 +457,20 @@ class PlayerSearchPage(SectionPage):
 
         return prepared
 
+    @staticmethod
+    def _attach_latest_ratings(frame: pl.DataFrame, ratings: pl.DataFrame) -> pl.DataFrame:
+        """Add each player's most recent overall rating as ``rating_overall``."""
+        if frame.height == 0 or "gsis_id" not in frame.columns:
+            return frame
+        if ratings.height == 0 or not {"player_id", "overall"}.issubset(ratings.columns):
+            return frame.with_columns(pl.lit(None, dtype=pl.Int16).alias("rating_overall"))
+
+        latest = ratings.select(
+            pl.col("player_id").alias("gsis_id"),
+            pl.col("overall").alias("rating_overall"),
+        )
+        return frame.drop("rating_overall", strict=False).join(latest, on="gsis_id", how="left")
+
     def _build_filter_panel(self) -> None:
         """Create the left filter panel for search controls."""
         self._filter_panel = FilterPanel(title="FIND PLAYER", parent=self)
@@ -842,9 +945,10 @@ class PlayerSearchPage(SectionPage):
         """Create the center results table panel."""
         self._results_table = TablePanel(
             title="SEARCH RESULTS",
-            columns=["Name", "Position", "Team", "Age", "Height", "Weight", "College"],
+            columns=["Name", "Position", "Team", "Age", "Rating", "Height", "Weight", "College"],
             sortable=True,
             alternating_rows=True,
+            model_backed=True,
             parent=self
         )
 
@@ -881,7 +985,10 @@ class PlayerSearchPage(SectionPage):
             GridCell(col=3, row=0, col_span=9, row_span=24)
         )
         
-        self._results_table.table.cellClicked.connect(self._on_results_row_activated)
+        # Row signals report page rows in load order, independent of header sorting
+        self._results_table.rowClicked.connect(self._on_results_row_activated)
+        self._results_table.table.setMouseTracking(True)
+        self._results_table.rowHovered.connect(self._on_results_row_hovered)
 
         # Table starts empty - user must click SEARCH to populate
     
@@ -890,22 +997,26 @@ class PlayerSearchPage(SectionPage):
         criteria = self._build_search_criteria()
         if criteria is None:
             return
-        if self._active_worker is not None:
+        if self._active_search is not None:
             print("[Search] A search is already running; ignoring new request")
             return
 
+        self._cancel_prefetch()
         self._current_results_df = None
         self._total_pages = 0
         self._current_page = 0
         self._set_search_in_progress(True)
-        self._results_table.clear_data()
-        self._results_table.add_row(["Searching...", "", "", "", "", "", ""])
+        self._results_table.set_data([["Searching...", "", "", "", "", "", ""]])
         self._update_page_controls()
 
-        worker = SearchWorker(self._service, criteria)
-        worker.signals.finished.connect(self._on_search_finished)
-        worker.signals.error.connect(self._on_search_failed)
-        self._active_worker = worker
+        self._active_search = self._scheduler.submit(
+            SearchWorker(self._service, criteria),
+            category="search",
+            priority=TaskPriority.INTERACTIVE,
+            on_finished=self._on_search_finished,
+            on_error=self._on_search_failed,
+            on_cancelled=self._on_search_cancelled,
+        )
 
         print(
             "[Search] "
@@ -915,8 +1026,6 @@ class PlayerSearchPage(SectionPage):
             f"Draft Team: {criteria.draft_team_value}, Contract Variant: {criteria.value_variant}"
         )
 
-        self._thread_pool.start(worker)
-
     def _build_search_criteria(self) -> SearchCriteria | None:
         """Collect the current filter selections into a structured criteria object."""
         is_offense = self._position_tabs.currentIndex() == 0
@@ -993,7 +1102,7 @@ class PlayerSearchPage(SectionPage):
 
     def _on_search_finished(self, results_df: pl.DataFrame) -> None:
         """Handle completion of a background search."""
-        self._active_worker = None
+        self._active_search = None
         self._current_results_df = results_df
 
         total_rows = results_df.height if isinstance(results_df, pl.DataFrame) else 0
@@ -1010,17 +1119,27 @@ class PlayerSearchPage(SectionPage):
 
     def _on_search_failed(self, message: str) -> None:
         """Display errors raised during background search execution."""
-        self._active_worker = None
+        self._active_search = None
         self._current_results_df = None
         self._total_pages = 0
         self._current_page = 0
         print(f"[Search] Error: {message}")
 
-        self._results_table.clear_data()
-        self._results_table.add_row(["Error loading players", message, "", "", "", "", ""])
+        self._results_table.set_data([["Error loading players", message, "", "", "", "", ""]])
         self._update_page_controls()
         self._set_search_in_progress(False)
 
+    def _on_search_cancelled(self) -> None:
+        """Reset the search state when a running search is cancelled."""
+        self._active_search = None
+        self._current_results_df = None
+        self._total_pages = 0
+        self._current_page = 0
+        print("[Search] Search cancelled")
+
+        self._results_table.clear_data()
+        self._set_search_in_progress(False)
+
     def _set_search_in_progress(self, in_progress: bool) -> None:
         """Toggle UI affordances while a search is running."""
         self._search_in_progress = in_progress
@@ -1213,15 +1332,17 @@ class PlayerSearchPage(SectionPage):
 
     def _load_current_page(self) -> None:
         """Load the rows for the current page into the results table."""
-        self._results_table.clear_data()
+        self._cancel_prefetch()
 
         if self._current_results_df is None or self._total_pages == 0 or self._current_page == 0:
+            self._results_table.clear_data()
             self._update_page_controls()
             return
 
         start = (self._current_page - 1) * self._page_size
         page_df = self._current_results_df.slice(start, self._page_size)
 
+        rows: list[list[str]] = []
         for row in page_df.iter_rows(named=True):
             name_value = (
                 row.get("display_name")
@@ -1242,26 +1363,43 @@ class PlayerSearchPage(SectionPage):
             team = self._format_cell_value(team_value)
 
             age = self._format_cell_value(row.get("age"))
+            rating = self._format_cell_value(row.get("rating_overall"))
             height = self._format_cell_value(row.get("height"))
             weight = self._format_cell_value(row.get("weight"))
             college = self._format_cell_value(
                 row.get("college") or row.get("college_name")
             )
 
-            self._results_table.add_row([name, position, team, age, height, weight, college])
+            rows.append([name, position, team, age, rating, height, weight, college])
 
+        # One model reset per page instead of a row insert per player
+        self._results_table.set_data(rows)
         self._update_page_controls()
+        self._schedule_prefetch(
+            range(min(self.PREFETCH_ROW_COUNT, page_df.height)),
+            priority=TaskPriority.PREFETCH,
+        )
 
-    def _on_results_row_activated(self, row: int, _column: int) -> None:
+    def _on_results_row_activated(self, row: int) -> None:
         """Handle selection of a result row to show player details."""
-        if self._current_results_df is None or self._current_page <= 0:
+        player_info = self._player_info_for_row(row)
+        if player_info is None:
             return
 
-        self._results_table.table.selectRow(row)
+        self.playerSelected.emit(player_info)
+
+    def _on_results_row_hovered(self, row: int) -> None:
+        """Prefetch details for the row under the cursor."""
+        self._schedule_prefetch([row], priority=TaskPriority.VISIBLE)
+
+    def _player_info_for_row(self, row: int) -> dict[str, Any] | None:
+        """Build the player payload for a row on the current results page."""
+        if self._current_results_df is None or self._current_page <= 0:
+            return None
 
         global_index = (self._current_page - 1) * self._page_size + row
         if global_index < 0 or global_index >= self._current_results_df.height:
-            return
+            return None
 
         row_data = self._current_results_df.row(global_index, named=True)
         if hasattr(row_data, "as_dict"):
@@ -1271,7 +1409,7 @@ class PlayerSearchPage(SectionPage):
         else:
             record = dict(zip(self._current_results_df.columns, row_data))
 
-        player_info: dict[str, Any] = {
+        return {
             "full_name": record.get("display_name")
             or record.get("full_name")
             or record.get("name")
@@ -1289,7 +1427,46 @@ class PlayerSearchPage(SectionPage):
             "raw": record,
         }
 
-        self.playerSelected.emit(player_info)
+    @staticmethod
+    def _player_query_from_info(player_info: dict[str, Any]) -> PlayerQuery | None:
+        """Mirror the query the detail page builds so prefetched players are reused."""
+
+        def _text(value: Any) -> str:
+            return value.strip() if isinstance(value, str) else ""
+
+        full_name = _text(player_info.get("full_name") or player_info.get("name"))
+        if not full_name:
+            return None
+        team = _text(player_info.get("team"))
+        position = _text(player_info.get("position"))
+        return PlayerQuery(name=full_name, team=team or None, position=position or None)
+
+    def _schedule_prefetch(self, rows: Any, *, priority: TaskPriority) -> None:
+        """Queue low-priority tasks that warm detail caches for ``rows``."""
+        # Only pending and running prefetches need a handle for cancellation
+        self._prefetch_handles = [handle for handle in self._prefetch_handles if not handle.done]
+        for row in rows:
+            player_info = self._player_info_for_row(row)
+            if player_info is None:
+                continue
+            query = self._player_query_from_info(player_info)
+            if query is None or query in self._prefetched_queries:
+                continue
+            self._prefetched_queries.add(query)
+            handle = self._scheduler.submit(
+                PlayerPrefetchWorker(self._service, query),
+                category="prefetch",
+                priority=priority,
+            )
+            self._prefetch_handles.append(handle)
+
+    def _cancel_prefetch(self) -> None:
+        """Drop queued prefetches and signal running ones to stop."""
+        for handle in self._prefetch_handles:
+            handle.cancel()
+        self._prefetch_handles.clear()
+        # Cancelled queries may never have run; completed ones are cheap cache hits
+        self._prefetched_queries.clear()
 
     def _update_page_controls(self) -> None:
         """Update pagination controls based on current page and totals."""
@@ -1337,6 +1514,7 @@ class PlayerSearchPage(SectionPage):
     
     def _clear_table(self) -> None:
         """Clear all results from the table."""
+        self._cancel_prefetch()
         self._results_table.clear_data()
         self._current_results_df = None
         self._current_page = 0
@@ -1398,4 +1576,4 @@ class PlayerSearchPage(SectionPage):
         """Handle resize events to update grid layout."""
         super().resizeEvent(event)
         if hasattr(self, "_grid_layout"):
-            self._grid_layout.update_layout()
+            self._grid_layout.schedule_update()
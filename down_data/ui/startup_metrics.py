@@ -0,0 +1,105 @@
+"""Startup timing marks for the desktop client.
+
+Startup is staged: the window shell is shown first and the player directory
+loads on a worker afterwards. :class:`StartupMetrics` records named marks as
+seconds since the process started so each stage (window constructed, first
+paint, filter options loaded) can be tracked over time. Time-to-first-paint is
+captured by an event filter on the main window: a top-level window paints its
+whole widget tree while handling ``QEvent.UpdateRequest``, so the mark is taken
+on the next event-loop turn after the first one.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Signal
+from PySide6.QtWidgets import QWidget
+
+logger = logging.getLogger(__name__)
+
+# Approximates process start; this module is imported during application bootstrap
+_PROCESS_START = time.perf_counter()
+
+FIRST_PAINT = "first_paint"
+
+
+class StartupMetrics:
+    """Named startup marks in seconds since ``origin``."""
+
+    def __init__(self, *, origin: float | None = None) -> None:
+        self.origin = _PROCESS_START if origin is None else origin
+        self._marks: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, name: str) -> float:
+        """Record ``name`` (first occurrence wins) and return its elapsed time."""
+        elapsed = time.perf_counter() - self.origin
+        with self._lock:
+            if name in self._marks:
+                return self._marks[name]
+            self._marks[name] = elapsed
+        logger.info("Startup mark %s at %.3fs", name, elapsed)
+        return elapsed
+
+    def elapsed(self, name: str) -> float | None:
+        with self._lock:
+            return self._marks.get(name)
+
+    @property
+    def time_to_first_paint(self) -> float | None:
+        return self.elapsed(FIRST_PAINT)
+
+    def snapshot(self) -> dict[str, float]:
+        """Return a copy of every mark recorded so far."""
+        with self._lock:
+            return dict(self._marks)
+
+
+class FirstPaintWatcher(QObject):
+    """Event filter that records the first paint of a top-level widget, then detaches."""
+
+    painted = Signal(float)
+
+    def __init__(self, widget: QWidget, metrics: StartupMetrics) -> None:
+        super().__init__(widget)
+        self._widget = widget
+        self._metrics = metrics
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        if watched is self._widget and event.type() in (QEvent.Type.Paint, QEvent.Type.UpdateRequest):
+            self._widget.removeEventFilter(self)
+            # Mark once the event (and the paint it triggers) has been handled
+            QTimer.singleShot(0, self._record)
+        return False
+
+    def _record(self) -> None:
+        self.painted.emit(self._metrics.mark(FIRST_PAINT))
+
+
+def watch_first_paint(widget: QWidget, metrics: StartupMetrics | None = None) -> FirstPaintWatcher:
+    """Record :data:`FIRST_PAINT` when ``widget`` first paints."""
+    return FirstPaintWatcher(widget, metrics or get_startup_metrics())
+
+
+_default_metrics: StartupMetrics | None = None
+
+
+def get_startup_metrics() -> StartupMetrics:
+    """Return the application-wide startup metrics."""
+    global _default_metrics
+    if _default_metrics is None:
+        _default_metrics = StartupMetrics()
+    return _default_metrics
+
+
+__all__ = [
+    "FIRST_PAINT",
+    "FirstPaintWatcher",
+    "StartupMetrics",
+    "get_startup_metrics",
+    "watch_first_paint",
+]
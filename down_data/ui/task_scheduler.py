@@ -0,0 +1,340 @@
+"""Priority-aware background task scheduler for the UI layer.
+
+Pages submit callables instead of pushing raw ``QRunnable`` objects into the
+global thread pool. The scheduler orders pending work by priority
+(interactive > visible > prefetch), caps how many tasks of each category run
+at once, hands every task a cooperative :class:`CancellationToken` and records
+queue/run latency per category.
+
+Task callables run on a pool thread and receive the token as their only
+argument. Completion callbacks are delivered on the GUI thread; results of
+cancelled tasks are dropped and ``on_cancelled`` runs instead, so callers can
+reset any in-progress state.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from enum import IntEnum
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Mapping
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+
+class TaskPriority(IntEnum):
+    """Relative importance of a task; higher values run first."""
+
+    PREFETCH = 0
+    VISIBLE = 1
+    INTERACTIVE = 2
+
+
+# Default concurrency caps per task category. Unknown categories run one at a time.
+DEFAULT_CATEGORY_LIMITS: dict[str, int] = {
+    "search": 1,
+    "detail": 2,
+    "advanced": 1,
+    "prefetch": 1,
+    "startup": 1,
+}
+
+
+class TaskCancelled(Exception):
+    """Raised by :meth:`CancellationToken.raise_if_cancelled` to abort a task."""
+
+
+class CancellationToken:
+    """Thread-safe flag that task callables poll to stop early."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelled()
+
+
+@dataclass
+class TaskCategoryStats:
+    """Latency counters for one task category."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    total_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        started = self.completed + self.failed
+        return self.total_wait_seconds / started if started else 0.0
+
+    @property
+    def mean_run_seconds(self) -> float:
+        started = self.completed + self.failed
+        return self.total_run_seconds / started if started else 0.0
+
+
+class TaskHandle:
+    """Reference to a submitted task, used to cancel it."""
+
+    def __init__(
+        self,
+        *,
+        fn: Callable[[CancellationToken], Any],
+        category: str,
+        priority: TaskPriority,
+        on_finished: Callable[[Any], None] | None,
+        on_error: Callable[[str], None] | None,
+        on_cancelled: Callable[[], None] | None = None,
+    ) -> None:
+        self.fn = fn
+        self.category = category
+        self.priority = priority
+        self.token = CancellationToken()
+        self.on_finished = on_finished
+        self.on_error = on_error
+        self.on_cancelled = on_cancelled
+        self.submitted_at = time.perf_counter()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    def cancel(self) -> None:
+        """Request cancellation; pending tasks never start, running ones stop cooperatively."""
+        self.token.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    @property
+    def done(self) -> bool:
+        """``True`` once the task has run to completion or failed."""
+        return self.finished_at is not None
+
+
+class _TaskRunnableSignals(QObject):
+    """Signals emitted by the task runnable back to the scheduler."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    done = Signal(object)
+
+
+class _TaskRunnable(QRunnable):
+    """Execute a scheduled task on a pool thread."""
+
+    def __init__(self, handle: TaskHandle, signals: _TaskRunnableSignals) -> None:
+        super().__init__()
+        self._handle = handle
+        self._signals = signals
+
+    def run(self) -> None:  # pragma: no cover - background execution
+        handle = self._handle
+        handle.started_at = time.perf_counter()
+        try:
+            handle.token.raise_if_cancelled()
+            result = handle.fn(handle.token)
+            handle.token.raise_if_cancelled()
+            outcome = ("finished", result)
+        except TaskCancelled:
+            outcome = ("cancelled", None)
+        except Exception as exc:  # surfaced via on_error
+            logger.debug("Task in category %s failed: %s", handle.category, exc)
+            outcome = ("error", str(exc))
+        handle.finished_at = time.perf_counter()
+        self._signals.done.emit((handle, outcome))
+
+
+class TaskScheduler(QObject):
+    """Dispatch prioritised, category-capped tasks onto a ``QThreadPool``."""
+
+    def __init__(
+        self,
+        *,
+        thread_pool: QThreadPool | None = None,
+        category_limits: Mapping[str, int] | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._limits = dict(DEFAULT_CATEGORY_LIMITS)
+        if category_limits:
+            self._limits.update(category_limits)
+        self._pending: dict[str, list[tuple[int, int, TaskHandle]]] = {}
+        self._running: dict[str, int] = {}
+        self._active: set[TaskHandle] = set()
+        self._stats: dict[str, TaskCategoryStats] = {}
+        self._sequence = itertools.count()
+        self._signals = _TaskRunnableSignals()
+        self._signals.done.connect(self._on_task_done)
+
+    # Public API ------------------------------------------------------------
+    def submit(
+        self,
+        fn: Callable[[CancellationToken], Any],
+        *,
+        category: str,
+        priority: TaskPriority = TaskPriority.VISIBLE,
+        on_finished: Callable[[Any], None] | None = None,
+        on_error: Callable[[str], None] | None = None,
+        on_cancelled: Callable[[], None] | None = None,
+    ) -> TaskHandle:
+        """Queue ``fn`` for execution and return a handle for cancellation.
+
+        Args:
+            fn: Callable run on a pool thread; receives the task's cancellation token.
+            category: Concurrency bucket (e.g. ``"search"``, ``"prefetch"``).
+            priority: Ordering relative to other pending tasks.
+            on_finished: Called on the GUI thread with the task's return value.
+            on_error: Called on the GUI thread with the error message.
+            on_cancelled: Called on the GUI thread once a cancelled task is
+                dropped, whether it was still pending or already running.
+        """
+        handle = TaskHandle(
+            fn=fn,
+            category=category,
+            priority=priority,
+            on_finished=on_finished,
+            on_error=on_error,
+            on_cancelled=on_cancelled,
+        )
+        self._stats_for(category).submitted += 1
+        heapq.heappush(
+            self._pending.setdefault(category, []),
+            (-int(priority), next(self._sequence), handle),
+        )
+        self._dispatch(category)
+        return handle
+
+    def cancel_category(self, category: str) -> None:
+        """Cancel every pending and running task in ``category``."""
+        for _, _, handle in self._pending.get(category, []):
+            handle.cancel()
+        for handle in self._active:
+            if handle.category == category:
+                handle.cancel()
+        self._dispatch(category)
+
+    def set_category_limit(self, category: str, limit: int) -> None:
+        self._limits[category] = max(1, int(limit))
+        self._dispatch(category)
+
+    def metrics(self) -> dict[str, TaskCategoryStats]:
+        """Return a snapshot of latency counters per category."""
+        return {category: replace(stats) for category, stats in self._stats.items()}
+
+    def pending_count(self, category: str | None = None) -> int:
+        categories = [category] if category is not None else list(self._pending)
+        return sum(
+            1
+            for name in categories
+            for _, _, handle in self._pending.get(name, [])
+            if not handle.cancelled
+        )
+
+    def running_count(self, category: str | None = None) -> int:
+        if category is not None:
+            return self._running.get(category, 0)
+        return sum(self._running.values())
+
+    # Internals ---------------------------------------------------------------
+    def _stats_for(self, category: str) -> TaskCategoryStats:
+        stats = self._stats.get(category)
+        if stats is None:
+            stats = TaskCategoryStats()
+            self._stats[category] = stats
+        return stats
+
+    def _dispatch(self, category: str) -> None:
+        """Start pending tasks in ``category`` while it has free slots."""
+        queue = self._pending.get(category)
+        limit = self._limits.get(category, 1)
+        while queue and self._running.get(category, 0) < limit:
+            _, _, handle = heapq.heappop(queue)
+            if handle.cancelled:
+                self._drop_cancelled(handle)
+                continue
+            self._running[category] = self._running.get(category, 0) + 1
+            self._active.add(handle)
+            self._thread_pool.start(_TaskRunnable(handle, self._signals), int(handle.priority))
+
+    @Slot(object)
+    def _on_task_done(self, payload: object) -> None:
+        handle, (status, value) = payload  # type: ignore[misc]
+        category = handle.category
+        self._running[category] = max(0, self._running.get(category, 0) - 1)
+        self._active.discard(handle)
+
+        stats = self._stats_for(category)
+        if status == "cancelled" or handle.cancelled:
+            self._drop_cancelled(handle)
+        else:
+            started = handle.started_at or handle.submitted_at
+            finished = handle.finished_at or started
+            wait = started - handle.submitted_at
+            stats.total_wait_seconds += wait
+            stats.total_run_seconds += finished - started
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait)
+            logger.debug(
+                "Task %s finished (%s): waited %.3fs, ran %.3fs",
+                category,
+                status,
+                wait,
+                finished - started,
+            )
+            if status == "error":
+                stats.failed += 1
+                if handle.on_error is not None:
+                    handle.on_error(str(value))
+            else:
+                stats.completed += 1
+                if handle.on_finished is not None:
+                    handle.on_finished(value)
+
+        self._dispatch(category)
+
+    def _drop_cancelled(self, handle: TaskHandle) -> None:
+        self._stats_for(handle.category).cancelled += 1
+        if handle.on_cancelled is not None:
+            handle.on_cancelled()
+
+
+_default_scheduler: TaskScheduler | None = None
+
+
+def get_task_scheduler() -> TaskScheduler:
+    """Return the application-wide scheduler (created on first use)."""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = TaskScheduler()
+    return _default_scheduler
+
+
+__all__ = [
+    "CancellationToken",
+    "DEFAULT_CATEGORY_LIMITS",
+    "TaskCancelled",
+    "TaskCategoryStats",
+    "TaskHandle",
+    "TaskPriority",
+    "TaskScheduler",
+    "get_task_scheduler",
+]
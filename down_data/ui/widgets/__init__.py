@@ -18,6 +18,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from .player_detail_panels import PersonalDetailsWidget, BasicRatingsWidget
     from .range_selector import RangeSelector
     from .table_panel import TablePanel, create_stats_table, create_roster_table, create_results_table
+    from .frame_table_model import FrameTableModel
 
 __all__ = [
     "GridOverlay",
@@ -39,6 +40,7 @@ __all__ = [
     "create_stats_table",
     "create_roster_table",
     "create_results_table",
+    "FrameTableModel",
 ]
 
 
@@ -76,6 +78,9 @@ _LAZY_IMPORTS: Dict[str, Callable[[], object]] = {
     "create_results_table": lambda: __import__(
         "down_data.ui.widgets.table_panel", fromlist=["create_results_table"]
     ).create_results_table,
+    "FrameTableModel": lambda: __import__(
+        "down_data.ui.widgets.frame_table_model", fromlist=["FrameTableModel"]
+    ).FrameTableModel,
 }
 
 
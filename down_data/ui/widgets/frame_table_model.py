@@ -0,0 +1,212 @@
+"""Read-only Qt table model over a Polars frame.
+
+``QTableWidget`` allocates a ``QTableWidgetItem`` per cell, emits signals for
+every inserted row and sorts by comparing item strings. :class:`FrameTableModel`
+instead keeps each column as a Utf8 Polars series of display strings (plus a
+Float64 sort key for numeric columns), replaces its contents with a single
+model reset, and sorts by asking Polars for a permutation. Columns whose
+values parse as numbers (after stripping ``,``, ``$`` and ``%``) sort
+numerically and are right-aligned; the rest sort case-insensitively. Empty
+cells always sort last.
+
+Views address rows in sorted order; :meth:`FrameTableModel.source_row` maps a
+view row back to its position in the frame that was loaded.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import polars as pl
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
+
+_NUMERIC_CLEANUP = r"[,$%\s]"
+
+_ALIGN_NUMERIC = int(Qt.AlignRight | Qt.AlignVCenter)
+
+
+def _display_column(series: pl.Series) -> pl.Series:
+    """Return ``series`` as Utf8 display strings (nulls become empty strings)."""
+    if series.dtype != pl.Utf8:
+        series = series.cast(pl.Utf8, strict=False)
+    return series.fill_null("")
+
+
+def _blank_column(height: int) -> pl.Series:
+    return pl.repeat("", height, dtype=pl.Utf8, eager=True)
+
+
+def _numeric_values(text: pl.Series) -> pl.Series:
+    """Parse display strings as floats (``None`` where not numeric)."""
+    return (
+        text.str.replace_all(_NUMERIC_CLEANUP, "")
+        .replace("", None)
+        .cast(pl.Float64, strict=False)
+    )
+
+
+def _sort_key(text: pl.Series) -> pl.Series | None:
+    """Return a display column's numeric sort key (``None`` for text columns).
+
+    A column is numeric when every non-empty cell parses as a number.
+    """
+    numbers = _numeric_values(text)
+    if numbers.null_count() == (text.str.len_chars() == 0).sum():
+        return numbers
+    return None
+
+
+class FrameTableModel(QAbstractTableModel):
+    """Table model storing display values column-wise, sorted through Polars."""
+
+    def __init__(self, headers: Sequence[str] | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self._headers: list[str] = list(headers or [])
+        self._columns: list[pl.Series] = [_blank_column(0) for _ in self._headers]
+        self._sort_keys: list[pl.Series | None] = [_sort_key(column) for column in self._columns]
+        self._order: list[int] = []
+        self._sort_column: int | None = None
+        self._sort_order = Qt.AscendingOrder
+
+    # Loading -------------------------------------------------------------------
+    def headers(self) -> list[str]:
+        return list(self._headers)
+
+    def set_headers(self, headers: Sequence[str]) -> None:
+        """Replace the column headers, padding or truncating the loaded columns."""
+        headers = list(headers)
+        if headers == self._headers:
+            return
+        self.beginResetModel()
+        height = len(self._order)
+        columns = self._columns[: len(headers)]
+        columns.extend(_blank_column(height) for _ in range(len(headers) - len(columns)))
+        self._headers = headers
+        self._load_columns(columns, height=height)
+        self.endResetModel()
+
+    def set_frame(self, frame: pl.DataFrame, *, headers: Sequence[str] | None = None) -> None:
+        """Replace the contents with ``frame`` in one model reset.
+
+        Columns are shown positionally; ``headers`` defaults to the frame's
+        column names.
+        """
+        self.beginResetModel()
+        if headers is not None:
+            self._headers = list(headers)
+        elif not self._headers or len(self._headers) != frame.width:
+            self._headers = list(frame.columns)
+        self._load(frame, width=len(self._headers))
+        self.endResetModel()
+
+    def set_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Replace the contents with row-oriented display values in one model reset."""
+        width = len(self._headers) or max((len(row) for row in rows), default=0)
+        columns = [
+            pl.Series([str(row[index]) if index < len(row) else "" for row in rows], dtype=pl.Utf8)
+            for index in range(width)
+        ]
+        self.beginResetModel()
+        if not self._headers:
+            self._headers = [""] * width
+        self._load_columns(columns, height=len(rows))
+        self.endResetModel()
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        """Append a single row (prefer :meth:`set_rows` for bulk loads)."""
+        position = len(self._order)
+        text = pl.Series(
+            [str(row[index]) if index < len(row) else "" for index in range(len(self._columns))],
+            dtype=pl.Utf8,
+        )
+        numbers = _numeric_values(text)
+        self.beginInsertRows(QModelIndex(), position, position)
+        for index, column in enumerate(self._columns):
+            column.append(text[index : index + 1])
+            key = self._sort_keys[index]
+            if key is None:
+                continue
+            # A non-empty cell that does not parse turns the column into text
+            if numbers[index] is None and text[index]:
+                self._sort_keys[index] = None
+            else:
+                key.append(numbers[index : index + 1])
+        self._order.append(position)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._load(pl.DataFrame(), width=len(self._headers))
+        self.endResetModel()
+
+    def _load(self, frame: pl.DataFrame, *, width: int) -> None:
+        columns = [_display_column(frame.to_series(index)) for index in range(min(width, frame.width))]
+        # Pad missing columns with blanks so every header has a column
+        columns.extend(_blank_column(frame.height) for _ in range(width - len(columns)))
+        self._load_columns(columns, height=frame.height)
+
+    def _load_columns(self, columns: list[pl.Series], *, height: int) -> None:
+        self._columns = columns
+        self._sort_keys = [_sort_key(column) for column in columns]
+        self._order = list(range(height))
+        if self._sort_column is not None and self._sort_column < len(columns):
+            self._apply_sort(self._sort_column, self._sort_order)
+
+    # Row mapping ---------------------------------------------------------------
+    def source_row(self, row: int) -> int:
+        """Return the loaded-frame position of view row ``row``."""
+        return self._order[row]
+
+    def row_values(self, row: int) -> list[str]:
+        """Return the display values of view row ``row``."""
+        source = self._order[row]
+        return [column[source] for column in self._columns]
+
+    # Qt model API --------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if not index.isValid():
+            return None
+        column = index.column()
+        if column >= len(self._columns):
+            return None
+        source = self._order[index.row()]
+        if role == Qt.DisplayRole:
+            return self._columns[column][source]
+        if role == Qt.TextAlignmentRole:
+            # Right-align numeric columns, matching TablePanel's widget mode
+            return _ALIGN_NUMERIC if self._sort_keys[column] is not None else None
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return str(section + 1)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:  # type: ignore[override]
+        if not 0 <= column < len(self._columns):
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self._apply_sort(column, order)
+        self.layoutChanged.emit()
+
+    def _apply_sort(self, column: int, order: Qt.SortOrder) -> None:
+        if not self._order:
+            return
+        key = self._sort_keys[column]
+        if key is None:
+            key = self._columns[column].str.to_lowercase().replace("", None)
+        descending = order == Qt.DescendingOrder
+        self._order = key.arg_sort(descending=descending, nulls_last=True).to_list()
+
+
+__all__ = ["FrameTableModel"]
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QRect
+from collections import OrderedDict
+
+from PySide6.QtCore import QRect, QTimer
 from PySide6.QtWidgets import QWidget
 
+# Coalesce resize bursts into at most one layout pass per ~60 Hz frame
+FRAME_INTERVAL_MS = 16
+# Parent sizes whose cell rects stay memoised (a drag revisits recent sizes)
+RECT_CACHE_SIZES = 32
+
 
 class GridCell:
     """Represents a position in the grid with optional span."""
@@ -23,6 +30,9 @@ class GridCell:
         self.col_span = col_span
         self.row_span = row_span
 
+    def key(self) -> tuple[int, int, int, int]:
+        return (self.col, self.row, self.col_span, self.row_span)
+
 
 class GridLayoutManager:
     """Manages widget positioning in a responsive grid layout.
@@ -35,6 +45,10 @@ class GridLayoutManager:
     - At width = 2650 px → left/right margins = 16 px, column gutter = 10 px
     - At height = 1392 px → row gutter = 16 px, top margin = 0 px, bottom margin = 24 px
     - 12 columns, 24 rows (configurable)
+
+    Cell rects are memoised per parent size, widgets whose rect is unchanged
+    are not touched, and ``schedule_update`` coalesces a burst of resize events
+    (e.g. a window drag) into a single ``update_layout`` on the next frame.
     """
     
     def __init__(
@@ -80,6 +94,16 @@ class GridLayoutManager:
         
         # Track widgets managed by this layout
         self._managed_widgets: dict[QWidget, GridCell] = {}
+
+        # (width, height) -> (metrics, {cell key: rect}), least recently used first
+        self._rect_cache: OrderedDict[tuple[int, int], tuple[dict, dict[tuple[int, int, int, int], QRect]]] = (
+            OrderedDict()
+        )
+        self._layout_size: tuple[int, int] | None = None
+        self._update_timer = QTimer(parent)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(FRAME_INTERVAL_MS)
+        self._update_timer.timeout.connect(self.update_layout)
     
     def add_widget(self, widget: QWidget, cell: GridCell) -> None:
         """Add a widget to the grid at the specified cell.
@@ -88,6 +112,7 @@ class GridLayoutManager:
             widget: Widget to add to the grid
             cell: Grid cell position and span
         """
+        self._validate_cell(cell)
         widget.setParent(self.parent)
         self._managed_widgets[widget] = cell
         self._update_widget_geometry(widget, cell)
@@ -103,8 +128,26 @@ class GridLayoutManager:
     
     def update_layout(self) -> None:
         """Update all widget positions based on current parent size."""
+        self._update_timer.stop()
+        size = (self.parent.width(), self.parent.height())
+        self._layout_size = size
         for widget, cell in self._managed_widgets.items():
             self._update_widget_geometry(widget, cell)
+
+    def schedule_update(self) -> None:
+        """Request ``update_layout`` on the next frame (call from ``resizeEvent``).
+
+        Repeated requests before the frame elapses collapse into one pass, and
+        nothing is scheduled when the parent is still at the laid-out size.
+        """
+        if (self.parent.width(), self.parent.height()) == self._layout_size:
+            return
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    @property
+    def update_pending(self) -> bool:
+        return self._update_timer.isActive()
     
     def get_cell_rect(self, cell: GridCell) -> QRect:
         """Get the rectangle for a grid cell in parent coordinates.
@@ -115,11 +158,24 @@ class GridLayoutManager:
         Returns:
             QRect representing the cell bounds
         """
-        width = self.parent.width()
-        height = self.parent.height()
-        metrics = self._compute_metrics(width, height)
-        
-        # Validate cell position
+        size = (self.parent.width(), self.parent.height())
+        entry = self._rect_cache.get(size)
+        if entry is None:
+            entry = self._rect_cache[size] = (self._compute_metrics(*size), {})
+            if len(self._rect_cache) > RECT_CACHE_SIZES:
+                self._rect_cache.popitem(last=False)
+        else:
+            self._rect_cache.move_to_end(size)
+
+        metrics, rects = entry
+        key = cell.key()
+        rect = rects.get(key)
+        if rect is None:
+            self._validate_cell(cell)
+            rect = rects[key] = self._compute_cell_rect(cell, metrics)
+        return QRect(rect)
+
+    def _validate_cell(self, cell: GridCell) -> None:
         if cell.col < 0 or cell.col >= self.columns:
             raise ValueError(f"Column {cell.col} out of range [0, {self.columns})")
         if cell.row < 0 or cell.row >= self.rows:
@@ -128,7 +184,8 @@ class GridLayoutManager:
             raise ValueError(f"Column span {cell.col_span} exceeds grid at column {cell.col}")
         if cell.row + cell.row_span > self.rows:
             raise ValueError(f"Row span {cell.row_span} exceeds grid at row {cell.row}")
-        
+
+    def _compute_cell_rect(self, cell: GridCell, metrics: dict) -> QRect:
         # Calculate cell position
         col_w = metrics["col_w"]
         row_h = metrics["row_h"]
@@ -150,7 +207,8 @@ class GridLayoutManager:
     def _update_widget_geometry(self, widget: QWidget, cell: GridCell) -> None:
         """Update a widget's geometry to match its grid cell."""
         rect = self.get_cell_rect(cell)
-        widget.setGeometry(rect)
+        if widget.geometry() != rect:
+            widget.setGeometry(rect)
     
     def _compute_metrics(self, width: int, height: int) -> dict:
         """Compute scaled margins, gutters, and cell sizes for the current size.
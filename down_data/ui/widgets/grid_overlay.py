@@ -2,12 +2,59 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QWidget
 from typing import Literal
 
 
+@lru_cache(maxsize=256)
+def _fit_gap_and_box(content_size: int, slots: int, desired_gap: int) -> tuple[int, int]:
+    """Return ``(gap, box)`` so ``slots`` equal boxes fill ``content_size``.
+
+    The gap is chosen near ``desired_gap`` but adjusted if needed to achieve a
+    perfect fit; results are memoised since a resize revisits the same sizes.
+    """
+    if slots <= 1:
+        # Single box fills the space; no gap needed
+        return 0, max(1, content_size)
+
+    # Ensure at least 1px boxes
+    g_max = max(0, (content_size - slots) // (slots - 1))
+    if g_max < 1:
+        return 0, max(1, content_size // slots)
+
+    # We need g such that (content_size - (slots-1)*g) % slots == 0
+    # => g ≡ (-content_size) (mod slots)
+    r_needed = (-content_size) % slots
+    desired = max(1, desired_gap)
+    k_est = int(round((desired - r_needed) / slots))
+    best_g = None
+    best_diff = 10**9
+    for k in (k_est - 2, k_est - 1, k_est, k_est + 1, k_est + 2):
+        g = r_needed + k * slots
+        if g < 1 or g > g_max:
+            continue
+        numer = content_size - (slots - 1) * g
+        if numer <= 0:
+            continue
+        if numer % slots == 0:
+            diff = abs(g - desired)
+            if diff < best_diff:
+                best_diff = diff
+                best_g = g
+    if best_g is not None:
+        box = (content_size - (slots - 1) * best_g) // slots
+        return best_g, max(1, box)
+
+    # Fallback: clamp gap and compute integer box (may leave remainder off-screen)
+    g_fallback = min(max(1, desired), max(1, g_max))
+    box = max(1, (content_size - (slots - 1) * g_fallback) // slots)
+    return g_fallback, box
+
+
 class GridOverlay(QWidget):
     """Draws a visual grid overlay for design alignment, scaling from a
     reference design size so your Figma placements translate 1:1.
@@ -16,6 +63,9 @@ class GridOverlay(QWidget):
     - At width = 2650 px → left/right margins = 16 px, column gutter = 10 px
     - At height = 1392 px → row gutter = 16 px, top margin = 0 px, bottom margin = 24 px
     - 12 columns, 24 rows
+
+    The overlay is rendered into a pixmap cached per size and drawing mode;
+    paints blit that pixmap until the size or mode changes.
     """
 
     def __init__(
@@ -52,6 +102,9 @@ class GridOverlay(QWidget):
         self._show_margins_override: bool | None = show_margins
         # Track last logged geometry/gap to avoid spamming the console
         self._last_pink_log: tuple[int, int, int, int, int, int, int, int, int, int] | None = None
+        # Rendered overlay and the (size, pixel ratio, mode, margins) it was drawn for
+        self._cached_pixmap: QPixmap | None = None
+        self._cached_key: tuple | None = None
 
         # Make the overlay transparent to mouse events
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
@@ -59,8 +112,25 @@ class GridOverlay(QWidget):
         self.raise_()
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
-        """Draw the grid overlay."""
+        """Draw the grid overlay (from the cached pixmap when still valid)."""
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio, self._mode, self._show_margins_override)
+        if self._cached_pixmap is None or self._cached_key != key:
+            self._cached_pixmap = self._render_pixmap(ratio)
+            self._cached_key = key
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cached_pixmap)
+        painter.end()
+
+    def _render_pixmap(self, ratio: float) -> QPixmap:
+        """Render the overlay for the current size and mode into a pixmap."""
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
         width = self.width()
@@ -90,6 +160,9 @@ class GridOverlay(QWidget):
         if draw_margins:
             self._draw_margins(painter, width, height, metrics)
 
+        painter.end()
+        return pixmap
+
     # Public API ------------------------------------------------------------
     def set_mode(self, mode: Literal["both", "rows", "columns", "margins"]) -> None:
         """Set which grid axes to render.
@@ -234,46 +307,8 @@ class GridOverlay(QWidget):
         desired_gap_x = int(round(m["gutter_col"]))
         desired_gap_y = int(round(m["gutter_row"]))
 
-        def choose_gap_and_box(content_size: int, slots: int, desired_gap: int) -> tuple[int, int]:
-            if slots <= 1:
-                # Single box fills the space; no gap needed
-                return 0, max(1, content_size)
-
-            # Ensure at least 1px boxes
-            g_max = max(0, (content_size - slots) // (slots - 1))
-            if g_max < 1:
-                return 0, max(1, content_size // slots)
-
-            # We need g such that (content_size - (slots-1)*g) % slots == 0
-            # => g ≡ (-content_size) (mod slots)
-            r_needed = (-content_size) % slots
-            desired = max(1, desired_gap)
-            k_est = int(round((desired - r_needed) / slots))
-            best_g = None
-            best_diff = 10**9
-            for k in (k_est - 2, k_est - 1, k_est, k_est + 1, k_est + 2):
-                g = r_needed + k * slots
-                if g < 1 or g > g_max:
-                    continue
-                numer = content_size - (slots - 1) * g
-                if numer <= 0:
-                    continue
-                if numer % slots == 0:
-                    diff = abs(g - desired)
-                    if diff < best_diff:
-                        best_diff = diff
-                        best_g = g
-            if best_g is not None:
-                box = (content_size - (slots - 1) * best_g) // slots
-                return best_g, max(1, box)
-
-            # Fallback: clamp gap and compute integer box (may leave remainder off-screen)
-            g_fallback = min(max(1, desired), max(1, g_max))
-            box = max(1, (content_size - (slots - 1) * g_fallback) // slots)
-            return g_fallback, box
-
-        gap_x, box_w = choose_gap_and_box(content_w, self.columns, desired_gap_x)
-        gap_y, box_h = choose_gap_and_box(content_h, self.rows, desired_gap_y)
+        gap_x, box_w = _fit_gap_and_box(content_w, self.columns, desired_gap_x)
+        gap_y, box_h = _fit_gap_and_box(content_h, self.rows, desired_gap_y)
 
         # One-time log per distinct geometry/gap combination
         current_log = (width, height, gap_x, gap_y, box_w, box_h, left, right, top, bottom)
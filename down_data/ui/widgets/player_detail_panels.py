@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QGridLayout,
     QHBoxLayout,
@@ -58,8 +58,25 @@ class PersonalDetailsWidget(QWidget):
                 label.setText(value if value else "—")
 
 
+_BAR_BACKGROUND = QColor("#1B1F24")
+_BAR_BORDER = QColor("#2F3B45")
+_BAR_POTENTIAL = QColor("#2E3A46")
+_RATING_COLORS = (
+    (70, QColor("#3C8DFF")),  # elite -> blue
+    (55, QColor("#4CAF50")),  # above average -> green
+    (45, QColor("#D4C23D")),  # average -> yellow
+    (35, QColor("#E6862E")),  # below average -> orange
+)
+_POOR_RATING_COLOR = QColor("#D9534F")  # poor -> red
+
+
 class _RatingBar(QWidget):
-    """Custom horizontal bar visualising current and potential ratings."""
+    """Custom horizontal bar visualising current and potential ratings.
+
+    Bars are rendered once per (size, pixel ratio, values) into the shared
+    ``QPixmapCache``, so repaints while scrolling or resizing a long ratings
+    list blit a pixmap instead of redrawing, and equal bars share one pixmap.
+    """
 
     def __init__(self, *, max_rating: int = 80, compact: bool = False, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -76,31 +93,53 @@ class _RatingBar(QWidget):
         return QSize(120, base_height)
 
     def set_values(self, current: int, potential: int) -> None:
-        self._current = max(0, min(current, self._max_rating))
-        self._potential = max(self._current, min(potential, self._max_rating))
+        current = max(0, min(current, self._max_rating))
+        potential = max(current, min(potential, self._max_rating))
+        if (current, potential) == (self._current, self._potential):
+            return
+        self._current = current
+        self._potential = potential
         self.update()
 
     @staticmethod
     def _rating_color(rating: int) -> QColor:
-        if rating >= 70:
-            return QColor("#3C8DFF")  # elite -> blue
-        if rating >= 55:
-            return QColor("#4CAF50")  # above average -> green
-        if rating >= 45:
-            return QColor("#D4C23D")  # average -> yellow
-        if rating >= 35:
-            return QColor("#E6862E")  # below average -> orange
-        return QColor("#D9534F")  # poor -> red
+        for threshold, color in _RATING_COLORS:
+            if rating >= threshold:
+                return color
+        return _POOR_RATING_COLOR
+
+    def _cache_key(self) -> str:
+        ratio = self.devicePixelRatioF()
+        return (
+            f"down_data.rating_bar:{self.width()}x{self.height()}@{ratio:g}:"
+            f"{self._current}/{self._potential}/{self._max_rating}"
+        )
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
-        rect = self.rect()
+        if self.width() <= 0 or self.height() <= 0:
+            return
+        key = self._cache_key()
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._render_pixmap()
+            QPixmapCache.insert(key, pixmap)
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+
+    def _render_pixmap(self) -> QPixmap:
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        rect = self.rect()
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        background_color = QColor("#1B1F24")
-        painter.fillRect(rect, background_color)
+        painter.fillRect(rect, _BAR_BACKGROUND)
 
-        border_pen = QPen(QColor("#2F3B45"))
+        border_pen = QPen(_BAR_BORDER)
         border_pen.setWidth(1)
         painter.setPen(border_pen)
         painter.drawRect(rect.adjusted(0, 0, -1, -1))
@@ -112,7 +151,7 @@ class _RatingBar(QWidget):
             potential_width = int(width * (self._potential / self._max_rating))
             potential_rect = rect.adjusted(1, 1, -1, -1)
             potential_rect.setWidth(max(potential_width - 2, 0))
-            painter.fillRect(potential_rect, QColor("#2E3A46"))
+            painter.fillRect(potential_rect, _BAR_POTENTIAL)
 
         if self._current > 0:
             current_width = int(width * (self._current / self._max_rating))
@@ -121,6 +160,7 @@ class _RatingBar(QWidget):
             painter.fillRect(current_rect, self._rating_color(self._current))
 
         painter.end()
+        return pixmap
 
 
 class BasicRatingsWidget(QWidget):
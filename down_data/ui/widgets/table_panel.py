@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QHeaderView, QTableWidget, QTableWidgetItem, QWidget
+import polars as pl
+from PySide6.QtCore import QModelIndex, Qt, Signal
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView, QTableWidget, QTableWidgetItem, QWidget
 
+from .frame_table_model import FrameTableModel
 from .panel import ContentPanel
 
+# Item role holding a widget-mode row's position in load order
+_SOURCE_ROW_ROLE = Qt.UserRole
+
 
 class TablePanel(ContentPanel):
     """Reusable panel with an embedded read-only table.
@@ -31,8 +36,18 @@ class TablePanel(ContentPanel):
             ["Patrick Mahomes", "KC", "QB", "4,839", "37"],
             ["Josh Allen", "BUF", "QB", "4,283", "35"],
         ])
+
+    With ``model_backed=True`` the panel shows a ``QTableView`` over a
+    :class:`FrameTableModel` instead of a ``QTableWidget``: ``set_data`` and
+    ``set_frame`` replace the rows in one model reset, sorting runs through
+    Polars, and no per-cell items are created. ``rowClicked``/``rowHovered``
+    report rows in load order in either mode, so callers can index their
+    source data without tracking the current sort.
     """
 
+    rowClicked = Signal(int)
+    rowHovered = Signal(int)
+
     def __init__(
         self,
         *,
@@ -40,6 +55,7 @@ class TablePanel(ContentPanel):
         columns: list[str] | None = None,
         sortable: bool = True,
         alternating_rows: bool = True,
+        model_backed: bool = False,
         parent: QWidget | None = None,
     ) -> None:
         """Initialize table panel.
@@ -49,18 +65,32 @@ class TablePanel(ContentPanel):
             columns: Column headers (list of strings)
             sortable: Enable column sorting by clicking headers
             alternating_rows: Use alternating row colors for readability
+            model_backed: Use a QTableView over a FrameTableModel
             parent: Parent widget
         """
         super().__init__(title=title, parent=parent)
         
-        # Create table widget
-        self._table = QTableWidget(self)
+        # Create table widget (or a view over a frame model)
+        self._model: FrameTableModel | None = None
+        if model_backed:
+            self._model = FrameTableModel(parent=self)
+            self._table: QTableWidget | QTableView = QTableView(self)
+            self._table.setModel(self._model)
+            self._table.clicked.connect(self._emit_row_clicked)
+            self._table.entered.connect(self._emit_row_hovered)
+            # ResizeToContents otherwise samples 1000 rows through Python data()
+            # calls after every reset or sort; measure the visible rows only
+            self._table.horizontalHeader().setResizeContentsPrecision(0)
+        else:
+            self._table = QTableWidget(self)
+            self._table.cellClicked.connect(lambda row, _col: self.rowClicked.emit(self.source_row(row)))
+            self._table.cellEntered.connect(lambda row, _col: self.rowHovered.emit(self.source_row(row)))
         self._table.setObjectName("DataTable")
         
         # Configure table
-        self._table.setEditTriggers(QTableWidget.NoEditTriggers)  # Read-only
-        self._table.setSelectionBehavior(QTableWidget.SelectRows)  # Select full rows
-        self._table.setSelectionMode(QTableWidget.SingleSelection)  # Single row at a time
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Read-only
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)  # Select full rows
+        self._table.setSelectionMode(QAbstractItemView.SingleSelection)  # Single row at a time
         self._table.setSortingEnabled(sortable)
         self._table.setAlternatingRowColors(alternating_rows)
         
@@ -79,8 +109,11 @@ class TablePanel(ContentPanel):
         Args:
             columns: List of column header strings
         """
-        self._table.setColumnCount(len(columns))
-        self._table.setHorizontalHeaderLabels(columns)
+        if self._model is not None:
+            self._model.set_headers(columns)
+        else:
+            self._table.setColumnCount(len(columns))
+            self._table.setHorizontalHeaderLabels(columns)
         
         # Auto-resize columns to content
         header = self._table.horizontalHeader()
@@ -94,11 +127,23 @@ class TablePanel(ContentPanel):
         Args:
             data: List of cell values (strings)
         """
+        if self._model is not None:
+            self._model.append_row(data)
+            return
+        # A sorted table would move the row as soon as its first item lands
+        sorting = self._table.isSortingEnabled()
+        self._table.setSortingEnabled(False)
+        self._insert_row(data)
+        self._table.setSortingEnabled(sorting)
+    
+    def _insert_row(self, data: list[str]) -> None:
         row_position = self._table.rowCount()
         self._table.insertRow(row_position)
         
         for col, value in enumerate(data):
             item = QTableWidgetItem(str(value))
+            # Remember the load order so clicks map back after sorting
+            item.setData(_SOURCE_ROW_ROLE, row_position)
             
             # Right-align numeric columns (simple heuristic)
             if self._is_numeric(value):
@@ -112,13 +157,55 @@ class TablePanel(ContentPanel):
         Args:
             rows: List of rows, where each row is a list of cell values
         """
+        if self._model is not None:
+            self._model.set_rows(rows)
+            return
         self.clear_data()
+        sorting = self._table.isSortingEnabled()
+        self._table.setSortingEnabled(False)
         for row in rows:
-            self.add_row(row)
+            self._insert_row(row)
+        self._table.setSortingEnabled(sorting)
     
     def clear_data(self) -> None:
         """Remove all rows from the table (keeps column headers)."""
-        self._table.setRowCount(0)
+        if self._model is not None:
+            self._model.clear()
+        else:
+            self._table.setRowCount(0)
+
+    def set_frame(self, frame: pl.DataFrame) -> None:
+        """Show ``frame``'s columns positionally under the current headers.
+
+        Model-backed panels load the frame in one reset; widget panels fall
+        back to ``set_data``.
+        """
+        if self._model is not None:
+            self._model.set_frame(frame, headers=self._model.headers() or None)
+        else:
+            self.set_data([[("" if value is None else value) for value in row] for row in frame.iter_rows()])
+
+    def row_count(self) -> int:
+        """Return the number of rows currently shown."""
+        if self._model is not None:
+            return self._model.rowCount()
+        return self._table.rowCount()
+
+    def source_row(self, row: int) -> int:
+        """Map a view row to its position in the loaded rows."""
+        if self._model is not None:
+            return self._model.source_row(row)
+        item = self._table.item(row, 0)
+        source = item.data(_SOURCE_ROW_ROLE) if item is not None else None
+        return row if source is None else source
+
+    def _emit_row_clicked(self, index: QModelIndex) -> None:
+        if index.isValid():
+            self.rowClicked.emit(self.source_row(index.row()))
+
+    def _emit_row_hovered(self, index: QModelIndex) -> None:
+        if index.isValid():
+            self.rowHovered.emit(self.source_row(index.row()))
     
     # Utility Methods -----------------------------------------------------------
     
@@ -148,10 +235,15 @@ class TablePanel(ContentPanel):
     # Access to underlying table ------------------------------------------------
     
     @property
-    def table(self) -> QTableWidget:
-        """Access the underlying QTableWidget for advanced customization."""
+    def table(self) -> QTableWidget | QTableView:
+        """Access the underlying table (QTableView when model-backed)."""
         return self._table
 
+    @property
+    def model(self) -> FrameTableModel | None:
+        """The frame model behind a model-backed panel (``None`` otherwise)."""
+        return self._model
+
 
 # Convenience factory functions for common table types -------------------------
 
@@ -101,6 +101,12 @@ def parse_args() -> argparse.Namespace:
         help="Skip building EPA/WPA impact metrics (faster)",
     )
     
+    parser.add_argument(
+        "--stream-pbp",
+        action="store_true",
+        help="Cache play-by-play parquet locally and aggregate impacts with streaming (low memory)",
+    )
+    
     parser.add_argument(
         "--skip-snaps",
         action="store_true",
@@ -209,6 +215,8 @@ def create_results_panel(stats: dict[str, Any]) -> Panel:
     table.add_row("⚡ Impact Records Added", f"{stats['impacts_added']:,}")
     table.add_row("👤 Bio Records Updated", f"{stats['bio_updated']:,}")
     table.add_row("🏃 Snap Count Teams", f"{stats.get('snap_teams_fetched', 0):,}")
+    table.add_row("📐 Rating Baselines", f"{stats.get('rating_baselines', 0):,}")
+    table.add_row("⭐ Player Ratings", f"{stats.get('player_ratings', 0):,}")
     
     if stats['errors']:
         table.add_row("", "")
@@ -237,6 +245,7 @@ class RichDataBuilder:
         skip_impacts: bool,
         skip_snaps: bool,
         bio_batch: int = 100,
+        stream_pbp: bool = False,
     ):
         self.store = store
         self.seasons = seasons
@@ -245,6 +254,7 @@ class RichDataBuilder:
         self.skip_impacts = skip_impacts
         self.skip_snaps = skip_snaps
         self.bio_batch = bio_batch
+        self.stream_pbp = stream_pbp
         
         self.stats = {
             "players_added": 0,
@@ -252,6 +262,8 @@ class RichDataBuilder:
             "impacts_added": 0,
             "bio_updated": 0,
             "snap_teams_fetched": 0,
+            "rating_baselines": 0,
+            "player_ratings": 0,
             "errors": [],
         }
     
@@ -274,7 +286,7 @@ class RichDataBuilder:
             target_seasons = list(range(DEFAULT_SEASON_START, DEFAULT_SEASON_END + 1))
         
         # Calculate total steps
-        total_steps = 3  # init + players + seasons
+        total_steps = 5  # init + players + seasons + baselines + ratings
         if not self.skip_impacts:
             total_steps += len(target_seasons)
         if not self.skip_snaps:
@@ -304,6 +316,7 @@ class RichDataBuilder:
             try:
                 players_added = self._build_players(target_seasons, progress)
                 self.stats["players_added"] = players_added
+                self.store.record_coverage("players", target_seasons)
             except Exception as exc:
                 self.stats["errors"].append({"table": "players", "error": str(exc)})
                 console.print(f"[red]Error building players: {exc}[/]")
@@ -314,6 +327,7 @@ class RichDataBuilder:
             try:
                 seasons_added = self._build_player_seasons(target_seasons, progress)
                 self.stats["player_seasons_added"] = seasons_added
+                self.store.record_coverage("player_seasons", target_seasons)
             except Exception as exc:
                 self.stats["errors"].append({"table": "player_seasons", "error": str(exc)})
                 console.print(f"[red]Error building player seasons: {exc}[/]")
@@ -330,6 +344,24 @@ class RichDataBuilder:
                     console.print(f"[yellow]Warning fetching snap counts: {exc}[/]")
                 progress.advance(main_task)
             
+            # Step 4b: Refresh rating baselines once seasons and snaps are final
+            progress.update(main_task, description="[cyan]Computing rating baselines...")
+            try:
+                self.stats["rating_baselines"] = self.store.rebuild_rating_baselines()
+            except Exception as exc:
+                self.stats["errors"].append({"table": "rating_baselines", "error": str(exc)})
+                console.print(f"[red]Error computing rating baselines: {exc}[/]")
+            progress.advance(main_task)
+            
+            # Step 4c: Re-rate every player-season against the refreshed baselines
+            progress.update(main_task, description="[cyan]Computing player ratings...")
+            try:
+                self.stats["player_ratings"] = self.store.rebuild_player_ratings()
+            except Exception as exc:
+                self.stats["errors"].append({"table": "player_ratings", "error": str(exc)})
+                console.print(f"[red]Error computing player ratings: {exc}[/]")
+            progress.advance(main_task)
+            
             # Step 5: Build impacts (if not skipped)
             if not self.skip_impacts:
                 impacts_task = progress.add_task(
@@ -339,6 +371,7 @@ class RichDataBuilder:
                 try:
                     impacts_added = self._build_player_impacts(target_seasons, progress, impacts_task)
                     self.stats["impacts_added"] = impacts_added
+                    self.store.record_coverage("player_impacts", target_seasons)
                 except Exception as exc:
                     self.stats["errors"].append({"table": "player_impacts", "error": str(exc)})
                     console.print(f"[red]Error building impacts: {exc}[/]")
@@ -503,6 +536,7 @@ class RichDataBuilder:
             "fumbles_lost": ["fumbles_lost"],
             "def_tackles_solo": ["def_tackles_solo"],
             "def_tackle_assists": ["def_tackle_assists"],
+            "def_tackles_with_assist": ["def_tackles_with_assist"],
             "def_sacks": ["def_sacks"],
             "def_interceptions": ["def_interceptions"],
             "def_pass_defended": ["def_pass_defended"],
@@ -711,8 +745,8 @@ class RichDataBuilder:
         if drop_cols:
             merged = merged.drop(drop_cols)
         
-        # Save updated data
-        self.store._save_player_seasons(merged)
+        # Save updated data (the summary view is rebuilt for the merged seasons)
+        self.store._save_player_seasons(merged, summary_seasons=snap_seasons)
         
         return teams_fetched
     
@@ -723,161 +757,24 @@ class RichDataBuilder:
         task: Any,
     ) -> int:
         """Build player impacts table."""
-        from nflreadpy import load_pbp
-        import polars as pl
-        from down_data.data.nfl_datastore import PLAYER_IMPACTS_SCHEMA, _to_polars
-        
-        aggregated_frames = []
-        
-        for season in seasons:
-            progress.update(task, description=f"[yellow]Processing {season} play-by-play...")
-            
-            try:
-                pbp = _to_polars(load_pbp(seasons=[season]))
-                if pbp.is_empty():
-                    progress.advance(task)
-                    continue
-                
-                if "season_type" in pbp.columns:
-                    pbp = pbp.filter(pl.col("season_type").str.to_uppercase() == "REG")
-                
-                if pbp.is_empty():
-                    progress.advance(task)
-                    continue
-                
-                frames = []
-                
-                # QB impacts - only if columns exist
-                if "passer_player_id" in pbp.columns and "qb_epa" in pbp.columns:
-                    qb_agg = [pl.col("qb_epa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("qb_epa")]
-                    if "qb_wpa" in pbp.columns:
-                        qb_agg.append(pl.col("qb_wpa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("qb_wpa"))
-                    
-                    qb_data = (
-                        pbp.filter(pl.col("passer_player_id").is_not_null())
-                        .group_by("passer_player_id")
-                        .agg(qb_agg)
-                        .rename({"passer_player_id": "player_id"})
-                        .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-                    )
-                    if qb_data.height > 0:
-                        frames.append(qb_data)
-                
-                # Skill impacts (rusher/receiver) - use general epa/wpa
-                if "epa" in pbp.columns:
-                    for player_col in ["rusher_player_id", "receiver_player_id"]:
-                        if player_col not in pbp.columns:
-                            continue
-                        
-                        skill_agg = [pl.col("epa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("skill_epa")]
-                        if "wpa" in pbp.columns:
-                            skill_agg.append(pl.col("wpa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("skill_wpa"))
-                        
-                        skill_data = (
-                            pbp.filter(pl.col(player_col).is_not_null())
-                            .group_by(player_col)
-                            .agg(skill_agg)
-                            .rename({player_col: "player_id"})
-                            .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-                        )
-                        if skill_data.height > 0:
-                            frames.append(skill_data)
-                
-                # Defensive impacts
-                if "epa" in pbp.columns:
-                    def_cols = ["solo_tackle_1_player_id", "interception_player_id", "sack_player_id"]
-                    for player_col in def_cols:
-                        if player_col not in pbp.columns:
-                            continue
-                        
-                        def_agg = [pl.col("epa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("def_epa")]
-                        if "wpa" in pbp.columns:
-                            def_agg.append(pl.col("wpa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("def_wpa"))
-                        
-                        def_data = (
-                            pbp.filter(pl.col(player_col).is_not_null())
-                            .group_by(player_col)
-                            .agg(def_agg)
-                            .rename({player_col: "player_id"})
-                            .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-                        )
-                        if def_data.height > 0:
-                            frames.append(def_data)
-                
-                # Kicker impacts
-                if "kicker_player_id" in pbp.columns and "epa" in pbp.columns:
-                    kick_agg = [pl.col("epa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("kicker_epa")]
-                    if "wpa" in pbp.columns:
-                        kick_agg.append(pl.col("wpa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("kicker_wpa"))
-                    
-                    kicker_data = (
-                        pbp.filter(pl.col("kicker_player_id").is_not_null())
-                        .group_by("kicker_player_id")
-                        .agg(kick_agg)
-                        .rename({"kicker_player_id": "player_id"})
-                        .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-                    )
-                    if kicker_data.height > 0:
-                        frames.append(kicker_data)
-                
-                # Punter impacts
-                if "punter_player_id" in pbp.columns and "epa" in pbp.columns:
-                    punt_agg = [pl.col("epa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("punter_epa")]
-                    if "wpa" in pbp.columns:
-                        punt_agg.append(pl.col("wpa").cast(pl.Float64, strict=False).fill_null(0.0).sum().alias("punter_wpa"))
-                    
-                    punter_data = (
-                        pbp.filter(pl.col("punter_player_id").is_not_null())
-                        .group_by("punter_player_id")
-                        .agg(punt_agg)
-                        .rename({"punter_player_id": "player_id"})
-                        .with_columns(pl.lit(season).cast(pl.Int16).alias("season"))
-                    )
-                    if punter_data.height > 0:
-                        frames.append(punter_data)
-                
-                if frames:
-                    # Merge all frames for this season
-                    merged = frames[0]
-                    for frame in frames[1:]:
-                        new_cols = [c for c in frame.columns if c not in {"player_id", "season"} and c not in merged.columns]
-                        if new_cols:
-                            merged = merged.join(
-                                frame.select(["player_id", "season"] + new_cols),
-                                on=["player_id", "season"],
-                                how="full",
-                                coalesce=True,
-                            )
-                        else:
-                            # Same columns - need to aggregate
-                            common_cols = [c for c in frame.columns if c not in {"player_id", "season"}]
-                            if common_cols:
-                                # Just concat and group
-                                merged = pl.concat([merged, frame], how="diagonal_relaxed")
-                                agg_exprs = [pl.col(c).sum().alias(c) for c in merged.columns if c not in {"player_id", "season"}]
-                                merged = merged.group_by(["player_id", "season"]).agg(agg_exprs)
-                    
-                    merged = merged.filter(pl.col("player_id").is_not_null() & (pl.col("player_id") != ""))
-                    if merged.height > 0:
-                        aggregated_frames.append(merged)
-                        console.print(f"[dim green]  ✓ {season}: {merged.height} impact records[/]")
-                
-            except Exception as exc:
-                console.print(f"[yellow]Warning: Failed to process {season}: {exc}[/]")
-            
+        from down_data.data.impact_engine import ImpactProgress
+        from down_data.data.nfl_datastore import NFLDataBuilder
+        
+        def _report(event: ImpactProgress) -> None:
+            if event.stage == "loading":
+                progress.update(task, description=f"[yellow]Processing {event.season} play-by-play...")
+                return
+            if event.stage == "done":
+                console.print(f"[dim green]  ✓ {event.season}: {event.rows} impact records[/]")
+            elif event.stage == "failed":
+                console.print(f"[yellow]Warning: Failed to process {event.season}: {event.error}[/]")
             progress.advance(task)
         
-        if not aggregated_frames:
-            return 0
-        
-        combined = pl.concat(aggregated_frames, how="diagonal_relaxed")
-        combined = combined.with_columns(pl.lit(datetime.now()).alias("_last_updated"))
-        
-        for col, dtype in PLAYER_IMPACTS_SCHEMA.items():
-            if col not in combined.columns:
-                combined = combined.with_columns(pl.lit(None).cast(dtype).alias(col))
-        
-        return self.store.upsert_player_impacts(combined)
+        return NFLDataBuilder(self.store)._build_player_impacts(
+            seasons,
+            progress=_report,
+            streaming=self.stream_pbp,
+        )
     
     def _update_bio_data(self, progress: Progress, batch_size: int = 100) -> int:
         """Update bio data for players."""
@@ -1028,6 +925,7 @@ def main() -> int:
             args.skip_impacts,
             args.skip_snaps,
             args.bio_batch,
+            args.stream_pbp,
         )
         stats = builder.run()
         
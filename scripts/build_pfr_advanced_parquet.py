@@ -0,0 +1,69 @@
+"""Convert the PFR advanced stats CSV exports into consolidated parquet tables."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from down_data.data.pfr_advanced import (  # noqa: E402
+    PFR_ADVANCED_FILE_PREFIXES,
+    convert_pfr_advanced_exports,
+)
+
+
+def configure_logging(verbose: bool) -> None:
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--stat-type",
+        action="append",
+        dest="stat_types",
+        choices=sorted(PFR_ADVANCED_FILE_PREFIXES),
+        help="Convert only this stat type (repeatable). Defaults to all stat types.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Rebuild the parquet files even if they are up to date.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging for debugging.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv or sys.argv[1:])
+    configure_logging(args.verbose)
+
+    try:
+        results = convert_pfr_advanced_exports(args.stat_types, force=args.refresh)
+    except Exception as exc:  # pragma: no cover - CLI surface
+        logging.getLogger(__name__).exception("Failed to convert PFR exports: %s", exc)
+        return 1
+
+    for stat_type, path in results.items():
+        if path is None:
+            logging.warning("No CSV exports found for %s", stat_type)
+        else:
+            logging.info("%s ready at %s", stat_type, path)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry
+    raise SystemExit(main())
@@ -31,6 +31,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Force a rebuild even when the cache already exists.",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Cache play-by-play parquet locally and aggregate with the streaming engine.",
+    )
     return parser.parse_args()
 
 
@@ -40,11 +45,16 @@ def main() -> None:
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     logger.info(
-        "Starting player impact cache build (force=%s, seasons=%s).",
+        "Starting player impact cache build (force=%s, stream=%s, seasons=%s).",
         args.force,
+        args.stream,
         seasons or "full range",
     )
-    player_impacts.build_player_impacts_cache(seasons=seasons, force_refresh=args.force)
+    player_impacts.build_player_impacts_cache(
+        seasons=seasons,
+        force_refresh=args.force,
+        streaming=args.stream,
+    )
 
 
 if __name__ == "__main__":
@@ -28,7 +28,7 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser.add_argument(
         "--refresh",
         action="store_true",
-        help="Rebuild every source cache before generating the summary parquet.",
+        help="Recompute every requested season instead of reusing stored season parts.",
     )
     parser.add_argument(
         "--season",
@@ -50,12 +50,12 @@ def main(argv: Sequence[str] | None = None) -> int:
     _configure_logging(args.verbose)
 
     try:
-        frame = build_player_summary_cache(seasons=args.seasons, force_refresh=args.refresh)
+        rows = build_player_summary_cache(seasons=args.seasons, force_refresh=args.refresh)
     except Exception as exc:  # pragma: no cover - CLI surface
         logging.getLogger(__name__).exception("Failed to build player summary cache: %s", exc)
         return 1
 
-    logging.info("Player summary cache ready with %s rows at %s", frame.height, CACHE_PATH)
+    logging.info("Player summary cache ready with %s rows at %s", rows, CACHE_PATH)
     return 0
 
 
@@ -0,0 +1,71 @@
+"""Re-parse archived Pro-Football-Reference snap-count pages offline."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from down_data.data.pfr.archive import PAGE_ARCHIVE_DIRECTORY, PageArchive  # noqa: E402
+from down_data.data.pfr.snap_counts import reparse_archived_snap_counts  # noqa: E402
+
+
+def configure_logging(verbose: bool) -> None:
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=PAGE_ARCHIVE_DIRECTORY,
+        help="Archive directory (defaults to data/cache/pfr_pages).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="Parquet file to write the re-parsed snap counts to.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parser processes (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging for debugging.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv or sys.argv[1:])
+    configure_logging(args.verbose)
+
+    try:
+        frame = reparse_archived_snap_counts(PageArchive(args.archive), max_workers=args.workers)
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        frame.write_parquet(args.output, compression="zstd")
+    except Exception as exc:  # pragma: no cover - CLI surface
+        logging.getLogger(__name__).exception("Failed to re-parse archived pages: %s", exc)
+        return 1
+
+    logging.info("Wrote %s snap-count rows to %s", frame.height, args.output)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import threading
+import time
+
+import polars as pl
+import pytest
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture
+def wait_until() -> Callable[..., None]:
+    """Process Qt events until a predicate holds, failing after ``timeout`` seconds."""
+
+    def _wait(predicate: Callable[[], object], timeout: float = 5.0) -> None:
+        app = QApplication.instance() or QApplication([])
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                pytest.fail("Timed out waiting for queued Qt work")
+            app.processEvents()
+            time.sleep(0.005)
+
+    return _wait
+
+
+@pytest.fixture
+def players_frame() -> Callable[[dict[str, str]], pl.DataFrame]:
+    """Factory for players-table rows from ``{player_id: full_name}``."""
+
+    def _build(names: dict[str, str]) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "player_id": list(names),
+                "full_name": list(names.values()),
+                "college": ["State"] * len(names),
+                "_bio_fetched": [False] * len(names),
+            }
+        )
+
+    return _build
+
+
+@pytest.fixture
+def seasons_frame() -> Callable[[list[tuple[str, int, int]]], pl.DataFrame]:
+    """Factory for player_seasons rows from ``(player_id, season, games_played)`` tuples."""
+
+    def _build(rows: list[tuple[str, int, int]]) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "player_id": [row[0] for row in rows],
+                "season": [row[1] for row in rows],
+                "games_played": [row[2] for row in rows],
+            },
+            schema_overrides={"season": pl.Int16, "games_played": pl.Int16},
+        )
+
+    return _build
+
+
+class SlowDirectoryService:
+    """Player service stub whose directory load blocks like a cold network fetch.
+
+    ``get_all_players`` returns once ``release`` is set or ``load_seconds``
+    have passed, recording the thread that performed each load.
+    """
+
+    def __init__(self, load_seconds: float) -> None:
+        self.load_seconds = load_seconds
+        self.release = threading.Event()
+        self.load_threads: list[threading.Thread] = []
+
+    def get_all_players(self) -> pl.DataFrame:
+        self.load_threads.append(threading.current_thread())
+        self.release.wait(self.load_seconds)
+        return pl.DataFrame(
+            {
+                "team_abbr": ["buf", "KC", None],
+                "year_signed": [2021, 2023, None],
+            }
+        )
+
+
+@pytest.fixture
+def slow_directory_service() -> Iterator[Callable[[float], SlowDirectoryService]]:
+    """Factory for :class:`SlowDirectoryService` stubs, released on teardown."""
+
+    services: list[SlowDirectoryService] = []
+
+    def _build(load_seconds: float = 5.0) -> SlowDirectoryService:
+        service = SlowDirectoryService(load_seconds)
+        services.append(service)
+        return service
+
+    yield _build
+    for service in services:
+        service.release.set()
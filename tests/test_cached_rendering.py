@@ -0,0 +1,94 @@
+"""Tests for pixmap-cached rating bars and grid overlay rendering."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from PySide6.QtGui import QPixmapCache
+from PySide6.QtWidgets import QApplication
+
+from down_data.ui.widgets.grid_overlay import GridOverlay, _fit_gap_and_box
+from down_data.ui.widgets.player_detail_panels import _RatingBar
+
+
+class RatingBarCacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        QPixmapCache.clear()
+
+    def _bar(self, current: int, potential: int) -> _RatingBar:
+        bar = _RatingBar()
+        self.addCleanup(bar.deleteLater)
+        bar.resize(160, 20)
+        bar.set_values(current, potential)
+        return bar
+
+    def test_equal_bars_share_one_rendered_pixmap(self) -> None:
+        bars = [self._bar(62, 70) for _ in range(3)]
+
+        with mock.patch.object(_RatingBar, "_render_pixmap", autospec=True, side_effect=_RatingBar._render_pixmap) as render:
+            first = bars[0].grab().toImage()
+            for bar in bars:
+                bar.grab()
+
+        self.assertEqual(render.call_count, 1)
+        # The cached blit matches a fresh render pixel for pixel
+        rendered = bars[0]._render_pixmap().toImage().convertToFormat(first.format())
+        self.assertEqual(first, rendered)
+
+    def test_new_values_or_size_render_again(self) -> None:
+        bar = self._bar(40, 50)
+
+        with mock.patch.object(_RatingBar, "_render_pixmap", autospec=True, side_effect=_RatingBar._render_pixmap) as render:
+            bar.grab()
+            bar.set_values(41, 50)
+            bar.grab()
+            bar.resize(200, 20)
+            bar.grab()
+
+        self.assertEqual(render.call_count, 3)
+
+    def test_unchanged_values_do_not_schedule_a_repaint(self) -> None:
+        bar = self._bar(55, 60)
+
+        with mock.patch.object(bar, "update") as update:
+            bar.set_values(55, 60)
+            bar.set_values(57, 60)
+
+        self.assertEqual(update.call_count, 1)
+
+
+class GridOverlayCacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    def test_overlay_renders_once_per_size_and_mode(self) -> None:
+        overlay = GridOverlay(mode="margins")
+        self.addCleanup(overlay.deleteLater)
+        overlay.resize(1325, 696)
+
+        with mock.patch.object(GridOverlay, "_render_pixmap", autospec=True, side_effect=GridOverlay._render_pixmap) as render:
+            overlay.grab()
+            overlay.grab()
+            overlay.resize(1400, 700)
+            overlay.grab()
+            overlay.set_mode("both")
+            overlay.grab()
+
+        self.assertEqual(render.call_count, 3)
+
+    def test_pink_box_fit_fills_the_content_exactly(self) -> None:
+        gap, box = _fit_gap_and_box(1293, 12, 5)
+
+        self.assertEqual(box * 12 + gap * 11, 1293)
+        self.assertLessEqual(abs(gap - 5), 12)
+        self.assertEqual(_fit_gap_and_box(100, 1, 5), (0, 100))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
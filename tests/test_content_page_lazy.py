@@ -0,0 +1,82 @@
+"""Tests for on-demand page and section scaffold construction and rendering."""
+
+from __future__ import annotations
+
+import unittest
+
+import polars as pl
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from down_data.ui.pages.content_page import ContentPage
+from down_data.ui.pages.player_detail_page import PlayerDetailPage
+
+
+class _StubService:
+    def get_all_players(self) -> pl.DataFrame:
+        return pl.DataFrame()
+
+
+class ContentPageLazyConstructionTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    @pytest.fixture(autouse=True)
+    def _use_wait_until(self, wait_until) -> None:
+        self._wait_until = wait_until
+
+    def test_only_the_landing_page_is_built_at_startup(self) -> None:
+        page = ContentPage(service=_StubService())
+        self.addCleanup(page.deleteLater)
+
+        self.assertEqual(list(page._pages), ["players_find"])
+
+        page._apply_navigation_context("default", main_menu="Teams", submenu="Temp2", trigger=True)
+
+        self.assertEqual(set(page._pages), {"players_find", "teams_temp2"})
+        self.assertIs(page._content_stack.currentWidget(), page._pages["teams_temp2"])
+
+    def test_idle_warmup_builds_detail_page_and_its_scaffolds(self) -> None:
+        page = ContentPage(service=_StubService(), warm_up_pages=("player_detail",))
+        self.addCleanup(page.deleteLater)
+        self.assertNotIn("player_detail", page._pages)
+
+        self._wait_until(lambda: "player_detail" in page._pages)
+
+        detail = page._pages["player_detail"]
+        self.assertIsInstance(detail, PlayerDetailPage)
+        self.assertEqual(len(detail._content_panels), len(detail._panel_keys()))
+
+    def test_detail_scaffolds_are_created_on_first_display(self) -> None:
+        detail = PlayerDetailPage(service=_StubService())
+        self.addCleanup(detail.deleteLater)
+        self.assertEqual(detail._content_panels, {})
+
+        detail.set_view_state("Stats", None)
+
+        self.assertEqual(list(detail._content_panels), [("Stats", None)])
+        self.assertIs(detail._content_stack.currentWidget(), detail._content_panels[("Stats", None)])
+
+    def test_only_the_visible_scaffold_renders_new_rows(self) -> None:
+        detail = PlayerDetailPage(service=_StubService())
+        self.addCleanup(detail.deleteLater)
+        detail.set_view_state("Profile", "Summary")
+        detail.warm_up_panels()
+        summary = detail._content_panels[("Profile", "Summary")]
+        stats = detail._content_panels[("Stats", None)]
+
+        detail._season_rows = [["2023", "BUF", "QB", "17", "1000"], ["2024", "BUF", "QB", "16", "950"]]
+        detail._update_table_views()
+
+        self.assertEqual(summary._table_panel.row_count(), 2)
+        self.assertEqual(stats._table_panel.row_count(), 0)
+
+        detail.set_view_state("Stats", None)
+
+        self.assertEqual(stats._table_panel.row_count(), 2)
+        self.assertEqual(stats._table_panel.model.row_values(1)[0], "2024")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for the data store generation and the caches keyed by it."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import polars as pl
+
+from down_data.backend.nfl_data_repository import NFLDataRepository
+from down_data.backend.player_service import PlayerService
+from down_data.data.nfl_datastore import NFLDataStore
+
+
+def test_every_table_write_bumps_a_persisted_generation(tmp_path, players_frame, seasons_frame):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    start = store.generation()
+
+    store.upsert_players(players_frame({"P1": "First"}))
+    after_players = store.generation()
+    # The players write is followed by the player_summary view rebuild
+    assert start < store.table_generation("players") < store.table_generation("player_summary") == after_players
+
+    store.upsert_player_seasons(seasons_frame([("P1", 2023, 17)]))
+
+    assert after_players < store.table_generation("player_seasons") < store.generation()
+    assert store.table_generation("players") < after_players
+
+    before = store.generation()
+    reopened = NFLDataStore(data_dir=tmp_path)
+    assert reopened.generation() == before
+    reopened.initialize(force=True)
+    assert reopened.generation() > before
+    # The first instance notices the rewrite through metadata.json
+    assert store.generation() == reopened.generation()
+
+
+def test_frames_cached_in_one_process_reload_after_another_writes(tmp_path, players_frame, seasons_frame):
+    reader = NFLDataStore(data_dir=tmp_path)
+    reader.initialize()
+    writer = NFLDataStore(data_dir=tmp_path)
+    writer.upsert_players(players_frame({"P1": "First"}))
+    writer.upsert_player_seasons(seasons_frame([("P1", 2023, 17)]))
+    seasons = reader.load_player_seasons()
+    assert reader.load_player_seasons() is seasons
+
+    writer.upsert_players(players_frame({"P1": "Renamed"}))
+
+    # Only the rewritten table is re-read
+    assert reader.load_player_seasons() is seasons
+    assert reader.load_players()["full_name"].to_list() == ["Renamed"]
+
+
+def _service(store: NFLDataStore) -> PlayerService:
+    service = PlayerService(directory=MagicMock())
+    service._use_nfl_datastore = lambda: True  # type: ignore[method-assign]
+    service._nfl_data_repository = NFLDataRepository(store, auto_initialize=False)
+    return service
+
+
+def test_service_drops_only_caches_derived_from_rewritten_tables(tmp_path, players_frame, seasons_frame):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    store.upsert_players(players_frame({"P1": "First"}))
+    store.upsert_player_seasons(seasons_frame([("P1", 2023, 17)]))
+    service = _service(store)
+    schedule = pl.DataFrame({"season": [2023]})
+
+    assert service.get_player_summary_stats(player_id="P1")["full_name"].to_list() == ["First"]
+    service._schedule_cache[2023] = schedule
+
+    # A players-only write leaves season-derived caches alone
+    store.upsert_players(players_frame({"P1": "Renamed"}))
+
+    assert service.get_player_summary_stats(player_id="P1")["full_name"].to_list() == ["Renamed"]
+    assert service._load_schedule(2023) is schedule
+
+    store.upsert_player_seasons(seasons_frame([("P1", 2024, 9)]))
+    service._sync_data_generation()
+    assert service._schedule_cache == {}
+    assert service.get_player_summary_stats(player_id="P1")["season"].to_list() == [2023, 2024]
+
+
+def test_unchanged_generation_keeps_serving_cached_results(tmp_path, players_frame, seasons_frame):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    store.upsert_players(players_frame({"P1": "First"}))
+    store.upsert_player_seasons(seasons_frame([("P1", 2023, 17)]))
+    service = _service(store)
+    service.get_player_summary_stats(player_id="P1")
+
+    store.get_player_summary = MagicMock(side_effect=AssertionError("cache bypassed"))  # type: ignore[method-assign]
+
+    assert service.get_player_summary_stats(player_id="P1").height == 1
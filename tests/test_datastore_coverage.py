@@ -0,0 +1,114 @@
+"""Tests for the data store coverage manifest and authoritative empty results."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+
+from down_data.backend.nfl_data_repository import NFLDataRepository
+from down_data.backend.player_service import PlayerService
+from down_data.data.nfl_datastore import DEFAULT_SEASON_START, DataStoreMetadata, NFLDataStore
+from down_data.ui.pages.player_detail_page import PlayerDetailPage, PlayerTypeFlags
+
+
+def _complete_store(tmp_path, *, seasons=None) -> NFLDataStore:
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    metadata = store.load_metadata()
+    seasons = list(seasons or range(DEFAULT_SEASON_START, metadata.season_end + 1))
+    metadata.mark_covered("players", seasons)
+    metadata.mark_covered("player_seasons", seasons)
+    store._save_metadata()
+    return store
+
+
+def test_coverage_manifest_round_trips_through_metadata_json(tmp_path):
+    _complete_store(tmp_path, seasons=[2024, 2023])
+
+    metadata = NFLDataStore(data_dir=tmp_path).load_metadata()
+
+    assert metadata.covered_seasons("player_seasons") == [2023, 2024]
+    assert metadata.is_covered("players", [2023])
+    assert not metadata.is_covered("players", [2022, 2023])
+    assert not metadata.is_covered("player_impacts", [2023])
+    # Metadata written before the manifest existed loads with no coverage
+    assert DataStoreMetadata.from_dict({"schema_version": "1.0.0"}).coverage == {}
+
+
+def test_store_is_authoritative_only_when_every_season_is_covered(tmp_path):
+    assert _complete_store(tmp_path).is_authoritative()
+
+    partial = _complete_store(tmp_path / "partial", seasons=range(2010, 2025))
+    assert not partial.is_authoritative()
+    assert partial.is_authoritative(seasons=[2020, 2021])
+
+
+def test_record_coverage_marks_only_seasons_present_in_the_table(tmp_path):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    # An empty download leaves the requested seasons unmarked
+    assert store.record_coverage("player_seasons", [2022, 2023]) == []
+    assert store.record_coverage("players", [2022, 2023]) == []
+
+    store.upsert_players(pl.DataFrame({"player_id": ["P1"], "full_name": ["First"]}))
+    store.upsert_player_seasons(
+        pl.DataFrame({"player_id": ["P1"], "season": [2023]}, schema_overrides={"season": pl.Int16})
+    )
+
+    assert store.record_coverage("player_seasons", [2022, 2023]) == [2023]
+    assert store.record_coverage("players", [2022, 2023]) == [2022, 2023]
+    assert store.load_metadata().covered_seasons("player_seasons") == [2023]
+
+
+def _service_for(store: NFLDataStore) -> PlayerService:
+    service = PlayerService(directory=MagicMock())
+    service._use_nfl_datastore = lambda: True  # type: ignore[method-assign]
+    service._nfl_data_repository = NFLDataRepository(store, auto_initialize=False)
+    return service
+
+
+def test_complete_store_answers_unknown_players_without_fallbacks(tmp_path):
+    service = _service_for(_complete_store(tmp_path))
+
+    with patch.object(service._player_summary_repository, "query") as legacy:
+        result = service.get_player_summary_stats(player_id="00-ROOKIE")
+
+    assert result.is_empty()
+    legacy.assert_not_called()
+    assert service.has_authoritative_stats()
+
+
+def test_incomplete_store_still_falls_back_to_the_legacy_cache(tmp_path):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    service = _service_for(store)
+    legacy_rows = pl.DataFrame({"player_id": ["00-OLD"], "season": [2001]})
+
+    with patch.object(service._player_summary_repository, "query", return_value=legacy_rows) as legacy:
+        result = service.get_player_summary_stats(player_id="00-OLD")
+
+    legacy.assert_called_once()
+    assert result.height == 1
+    assert not service.has_authoritative_stats()
+
+
+def test_detail_page_skips_the_network_load_when_the_store_is_authoritative():
+    service = MagicMock()
+    service.get_player_summary_stats.return_value = pl.DataFrame()
+    service.has_authoritative_stats.return_value = True
+    page = SimpleNamespace(_service=service)
+    player = SimpleNamespace(profile=SimpleNamespace(gsis_id="00-ROOKIE", position="WR"))
+
+    stats = PlayerDetailPage._load_stats_for_player(page, player, PlayerTypeFlags(is_receiver=True))
+
+    assert stats.is_empty()
+    service.get_basic_player_stats.assert_not_called()
+    service.get_player_stats.assert_not_called()
+
+    service.has_authoritative_stats.return_value = False
+    service.get_basic_player_stats.return_value = pl.DataFrame()
+    service.get_player_stats.return_value = pl.DataFrame()
+    PlayerDetailPage._load_stats_for_player(page, player, PlayerTypeFlags(is_receiver=True))
+    service.get_player_stats.assert_called_once()
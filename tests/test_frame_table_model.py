@@ -0,0 +1,130 @@
+"""Tests for the frame-backed table model and TablePanel's model mode."""
+
+from __future__ import annotations
+
+import unittest
+
+import polars as pl
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QTableView
+
+from down_data.ui.widgets.frame_table_model import FrameTableModel
+from down_data.ui.widgets.table_panel import TablePanel
+
+
+def _column(model: FrameTableModel, column: int) -> list[str]:
+    return [model.index(row, column).data() for row in range(model.rowCount())]
+
+
+class FrameTableModelTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    def test_set_rows_loads_in_a_single_reset(self) -> None:
+        model = FrameTableModel(["Name", "Yards"])
+        resets: list[bool] = []
+        inserts: list[bool] = []
+        model.modelReset.connect(lambda: resets.append(True))
+        model.rowsInserted.connect(lambda *_: inserts.append(True))
+
+        model.set_rows([["A", "1"], ["B", "2"], ["C", "3"]])
+
+        self.assertEqual((len(resets), len(inserts)), (1, 0))
+        self.assertEqual(model.rowCount(), 3)
+        self.assertEqual(model.headerData(1, Qt.Horizontal), "Yards")
+
+    def test_numeric_columns_sort_by_value(self) -> None:
+        model = FrameTableModel(["Player", "Yards"])
+        model.set_rows([["A", "950"], ["B", "1,200"], ["C", ""], ["D", "87"]])
+
+        model.sort(1, Qt.DescendingOrder)
+        self.assertEqual(_column(model, 1), ["1,200", "950", "87", ""])
+
+        model.sort(1, Qt.AscendingOrder)
+        self.assertEqual(_column(model, 1), ["87", "950", "1,200", ""])
+        self.assertEqual([model.source_row(row) for row in range(4)], [3, 0, 1, 2])
+
+    def test_text_columns_sort_case_insensitively(self) -> None:
+        model = FrameTableModel(["Name"])
+        model.set_rows([["bravo"], ["Alpha"], ["charlie"]])
+
+        model.sort(0, Qt.AscendingOrder)
+
+        self.assertEqual(_column(model, 0), ["Alpha", "bravo", "charlie"])
+
+    def test_sort_is_reapplied_when_new_rows_load(self) -> None:
+        model = FrameTableModel(["Season", "GP"])
+        model.sort(0, Qt.DescendingOrder)
+
+        model.set_frame(pl.DataFrame({"season": [2022, 2024, 2023], "gp": [17, None, 16]}))
+
+        self.assertEqual(_column(model, 0), ["2024", "2023", "2022"])
+        self.assertEqual(_column(model, 1), ["", "16", "17"])
+        self.assertEqual(model.headerData(0, Qt.Horizontal), "Season")
+
+    def test_numeric_cells_are_right_aligned(self) -> None:
+        model = FrameTableModel(["Name", "Pct"])
+        model.set_rows([["A", "61.5%"]])
+
+        self.assertIsNone(model.index(0, 0).data(Qt.TextAlignmentRole))
+        self.assertEqual(model.index(0, 1).data(Qt.TextAlignmentRole), int(Qt.AlignRight | Qt.AlignVCenter))
+
+
+    def test_appended_rows_update_column_sort_keys(self) -> None:
+        model = FrameTableModel(["Name", "Yards"])
+        model.append_row(["A", "950"])
+        model.append_row(["B", "1,200"])
+        model.append_row(["C", "87"])
+
+        model.sort(1, Qt.DescendingOrder)
+        self.assertEqual(_column(model, 1), ["1,200", "950", "87"])
+
+        model.append_row(["D", "n/a"])
+        model.sort(1, Qt.AscendingOrder)
+        self.assertEqual(_column(model, 1), ["1,200", "87", "950", "n/a"])
+        self.assertIsNone(model.index(0, 1).data(Qt.TextAlignmentRole))
+
+
+class ModelBackedTablePanelTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    def test_row_clicks_report_load_order_after_sorting(self) -> None:
+        panel = TablePanel(columns=["Name", "Age"], model_backed=True)
+        self.addCleanup(panel.deleteLater)
+        self.assertIsInstance(panel.table, QTableView)
+        panel.set_data([["Young", "22"], ["Old", "35"], ["Mid", "28"]])
+        clicked: list[int] = []
+        panel.rowClicked.connect(clicked.append)
+
+        panel.table.sortByColumn(1, Qt.DescendingOrder)
+        panel.table.clicked.emit(panel.model.index(0, 0))
+
+        self.assertEqual(panel.model.row_values(0), ["Old", "35"])
+        self.assertEqual(clicked, [1])
+        self.assertEqual(panel.row_count(), 3)
+
+        panel.clear_data()
+        self.assertEqual(panel.row_count(), 0)
+
+
+    def test_widget_mode_row_clicks_report_load_order_after_sorting(self) -> None:
+        panel = TablePanel(columns=["Name", "Age"])
+        self.addCleanup(panel.deleteLater)
+        panel.set_data([["Young", "22"], ["Old", "35"]])
+        panel.add_row(["Mid", "28"])
+        clicked: list[int] = []
+        panel.rowClicked.connect(clicked.append)
+
+        panel.table.sortByColumn(0, Qt.AscendingOrder)
+        panel.table.cellClicked.emit(0, 1)
+
+        self.assertEqual(panel.table.item(0, 0).text(), "Mid")
+        self.assertEqual(panel.table.item(0, 1).text(), "28")
+        self.assertEqual(clicked, [2])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
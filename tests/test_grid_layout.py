@@ -0,0 +1,108 @@
+"""Tests for GridLayoutManager's memoised and coalesced geometry updates."""
+
+from __future__ import annotations
+
+import time
+import unittest
+
+from PySide6.QtCore import QRect
+from PySide6.QtWidgets import QApplication, QWidget
+
+from down_data.ui.widgets.grid_layout import GridCell, GridLayoutManager
+
+
+class _CountingGrid(GridLayoutManager):
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self.metric_calls = 0
+        self.layout_passes = 0
+
+    def _compute_metrics(self, width: int, height: int) -> dict:
+        self.metric_calls += 1
+        return super()._compute_metrics(width, height)
+
+    def update_layout(self) -> None:
+        self.layout_passes += 1
+        super().update_layout()
+
+
+class _ResizingHost(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.grid = _CountingGrid(self)
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self.grid.schedule_update()
+
+
+class GridLayoutManagerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    def _host(self) -> _ResizingHost:
+        host = _ResizingHost()
+        self.addCleanup(host.deleteLater)
+        host.resize(1325, 696)
+        return host
+
+    def test_cell_rects_are_memoised_per_size(self) -> None:
+        host = self._host()
+        grid = host.grid
+
+        first = grid.get_cell_rect(GridCell(col=3, row=0, col_span=9, row_span=24))
+        grid.get_cell_rect(GridCell(col=0, row=0, col_span=3, row_span=12))
+        again = grid.get_cell_rect(GridCell(col=3, row=0, col_span=9, row_span=24))
+
+        self.assertEqual(first, again)
+        self.assertEqual(grid.metric_calls, 1)
+        # Callers get copies, so mutating a result cannot corrupt the cache
+        again.setWidth(1)
+        self.assertEqual(grid.get_cell_rect(GridCell(col=3, row=0, col_span=9, row_span=24)), first)
+
+    def test_invalid_cells_are_rejected_when_added(self) -> None:
+        host = self._host()
+
+        with self.assertRaises(ValueError):
+            host.grid.add_widget(QWidget(), GridCell(col=10, row=0, col_span=3))
+
+    def test_unchanged_rects_skip_set_geometry(self) -> None:
+        host = self._host()
+        child = QWidget()
+        host.grid.add_widget(child, GridCell(col=0, row=0, col_span=6, row_span=12))
+        applied: list[QRect] = []
+        original = child.setGeometry
+        child.setGeometry = lambda rect: (applied.append(rect), original(rect))  # type: ignore[method-assign]
+
+        host.grid.update_layout()
+        self.assertEqual(applied, [])
+
+        host.resize(1400, 700)
+        host.grid.update_layout()
+        self.assertEqual(len(applied), 1)
+
+    def test_resize_burst_coalesces_into_one_layout_pass(self) -> None:
+        host = self._host()
+        child = QWidget()
+        host.grid.add_widget(child, GridCell(col=0, row=0, col_span=12, row_span=24))
+        host.show()
+        self._app.processEvents()
+        host.grid.update_layout()
+        host.grid.layout_passes = 0
+
+        for width in range(1300, 1400, 10):
+            host.resize(width, 700)
+        self.assertTrue(host.grid.update_pending)
+
+        deadline = time.monotonic() + 2
+        while host.grid.update_pending and time.monotonic() < deadline:
+            self._app.processEvents()
+            time.sleep(0.005)
+
+        self.assertEqual(host.grid.layout_passes, 1)
+        self.assertEqual(child.geometry(), host.grid.get_cell_rect(GridCell(col=0, row=0, col_span=12, row_span=24)))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
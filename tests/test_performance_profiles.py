@@ -7,14 +7,21 @@ improved after refactors.
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 import statistics
 import time
 
+import pandas as pd
 import polars as pl
 import pytest
+from bs4 import BeautifulSoup, Comment
 
+from down_data.data.pfr.html import flatten_columns
+from down_data.data.pfr.tables import list_table_ids, read_table
 
+
+PFR_FIXTURES = Path(__file__).resolve().parent / "data" / "pfr"
 SUMMARY_CACHE_PATH = Path(__file__).resolve().parents[1] / "data" / "cache" / "player_summary_stats.parquet"
 
 POSITION_GROUPS = {
@@ -183,3 +190,205 @@ def test_basic_ratings_across_positions(perf_report: PerformanceReport) -> None:
     _profile_basic_ratings(frame, perf_report)
 
 
+def _soup_pandas_read_table(html: str, table_id: str) -> pl.DataFrame:
+    """Previous parsing path: full soup, comment re-parsing, pandas round trip."""
+
+    soup = BeautifulSoup(html, "lxml")
+    table = soup.find("table", id=table_id)
+    if table is None:
+        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+            table = BeautifulSoup(comment, "lxml").find("table", id=table_id)
+            if table is not None:
+                break
+    frame = pd.read_html(io.StringIO(str(table)))[0]
+    return pl.from_pandas(flatten_columns(frame))
+
+
+@pytest.mark.performance
+def test_pfr_table_parsers(perf_report: PerformanceReport) -> None:
+    for path in sorted(PFR_FIXTURES.glob("*.html")):
+        html = path.read_text(encoding="utf-8")
+        for table_id in list_table_ids(html):
+            fast = read_table(html, table_id)
+            legacy = _soup_pandas_read_table(html, table_id)
+            assert fast.columns == legacy.columns
+            # read_html keeps PFR's repeated header rows; the lxml path drops them
+            assert fast.height <= legacy.height
+
+            label = f"{path.stem}/{table_id}"
+            perf_report.record("PFR table (lxml)", label, _measure(lambda: read_table(html, table_id), iterations=20))
+            perf_report.record(
+                "PFR table (soup+pandas)",
+                label,
+                _measure(lambda: _soup_pandas_read_table(html, table_id), iterations=20),
+            )
+
+
+@pytest.mark.performance
+def test_search_page_time_to_first_paint(perf_report: PerformanceReport, slow_directory_service) -> None:
+    from PySide6.QtWidgets import QApplication
+
+    from down_data.ui.pages.player_search_page import PlayerSearchPage
+    from down_data.ui.startup_metrics import StartupMetrics, watch_first_paint
+
+    app = QApplication.instance() or QApplication([])
+    metrics = StartupMetrics(origin=time.perf_counter())
+    service = slow_directory_service(0.5)
+    page = PlayerSearchPage(service=service)
+    metrics.mark("page_constructed")
+    watch_first_paint(page, metrics)
+    page.show()
+
+    team_combo = next(iter(page._team_filters.values()))
+    deadline = time.monotonic() + 10
+    while team_combo.count() == 1 and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    metrics.mark("filter_options_loaded")
+    page.deleteLater()
+
+    first_paint = metrics.time_to_first_paint
+    assert first_paint is not None
+    # The shell paints without waiting for the directory load
+    assert first_paint < service.load_seconds
+    perf_report.record("Search page startup", "construct", metrics.elapsed("page_constructed"))
+    perf_report.record("Search page startup", "first paint", first_paint)
+    perf_report.record("Search page startup", "filter options", metrics.elapsed("filter_options_loaded"))
+
+
+@pytest.mark.performance
+def test_table_panel_fill_modes(perf_report: PerformanceReport) -> None:
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+
+    from down_data.ui.widgets.table_panel import TablePanel
+
+    app = QApplication.instance() or QApplication([])
+    columns = ["Name", "Position", "Team", "Age", "Rating", "Height", "Weight", "College"]
+    rows = [[f"Player {i}", "WR", "KC", str(20 + i % 15), str(i % 99), "6-1", "205", "State"] for i in range(2000)]
+
+    def _fill(panel: TablePanel) -> None:
+        panel.set_data(rows)
+        app.processEvents()
+
+    def _sort(panel: TablePanel) -> None:
+        panel.table.sortByColumn(4, Qt.DescendingOrder)
+        app.processEvents()
+
+    for label, model_backed in (("frame model", True), ("item widget", False)):
+        panel = TablePanel(columns=columns, model_backed=model_backed)
+        panel.resize(1200, 800)
+        panel.show()
+        fill_seconds = _measure(lambda: _fill(panel))
+        sort_seconds = _measure(lambda: _sort(panel))
+        assert panel.row_count() == len(rows)
+        perf_report.record("TablePanel 2000 rows", f"{label} fill", fill_seconds)
+        perf_report.record("TablePanel 2000 rows", f"{label} sort", sort_seconds)
+        panel.deleteLater()
+
+
+def _resize_drag(app, window, sizes, *, events_per_frame: int, eager: bool = False) -> None:
+    grids = _page_grids(window)
+    for index, (width, height) in enumerate(sizes, start=1):
+        window.resize(width, height)
+        if eager:
+            # Pre-coalescing behaviour: a full layout pass per resize event
+            for grid in grids:
+                grid.update_layout()
+        if index % events_per_frame == 0:
+            app.processEvents()
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline and any(grid.update_pending for grid in grids):
+        app.processEvents()
+
+
+def _page_grids(window) -> list:
+    from PySide6.QtWidgets import QWidget
+
+    widgets = [window, *window.findChildren(QWidget)]
+    return [widget._grid_layout for widget in widgets if hasattr(widget, "_grid_layout")]
+
+
+@pytest.mark.performance
+def test_resize_drag_across_pages(perf_report: PerformanceReport, slow_directory_service) -> None:
+    from PySide6.QtWidgets import QApplication
+
+    from down_data.ui.pages.content_page import ContentPage
+
+    app = QApplication.instance() or QApplication([])
+    window = ContentPage(service=slow_directory_service(0.5))
+    window._content_stack.setCurrentWidget(window._page("player_detail"))
+    window._pages["player_detail"].set_view_state("Stats", None)
+    window.resize(1600, 900)
+    window.show()
+    app.processEvents()
+
+    # A drag delivers several resize events per frame; step 4 px per event
+    sizes = [(1600 + step * 4, 900 + step * 2) for step in range(120)]
+    sizes += list(reversed(sizes))
+    for page_key in ("players_find", "player_detail"):
+        window._content_stack.setCurrentWidget(window._page(page_key))
+        app.processEvents()
+        for label, eager in (("eager", True), ("coalesced", False)):
+            seconds = _measure(lambda: _resize_drag(app, window, sizes, events_per_frame=4, eager=eager))
+            perf_report.record("Resize drag (240 events)", f"{page_key} {label}", seconds)
+    window.deleteLater()
+
+
+@pytest.mark.performance
+def test_rating_bar_repaint(perf_report: PerformanceReport) -> None:
+    from PySide6.QtGui import QPixmapCache
+    from PySide6.QtWidgets import QApplication
+
+    from down_data.core.ratings import RatingBreakdown
+    from down_data.ui.widgets.player_detail_panels import BasicRatingsWidget
+
+    app = QApplication.instance() or QApplication([])
+    ratings = [
+        RatingBreakdown(
+            label=f"Rating {index}",
+            current=30 + index % 50,
+            potential=40 + index % 40,
+            subratings=tuple(RatingBreakdown(label=f"Sub {sub}", current=35 + sub, potential=60) for sub in range(4)),
+        )
+        for index in range(40)
+    ]
+    widget = BasicRatingsWidget()
+    widget.set_ratings(ratings)
+    widget.resize(480, 4000)
+    widget.show()
+    app.processEvents()
+
+    QPixmapCache.clear()
+    cold_seconds = _measure(widget.grab)
+    warm_seconds = _measure(widget.grab, iterations=5)
+    perf_report.record("Rating bars (200 rows)", "cold repaint", cold_seconds)
+    perf_report.record("Rating bars (200 rows)", "cached repaint", warm_seconds)
+    widget.deleteLater()
+
+
+@pytest.mark.performance
+def test_player_summary_view_reads(perf_report: PerformanceReport, tmp_path: Path) -> None:
+    from down_data.data.nfl_datastore import NFLDataStore
+
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    player_ids = [f"00-{index:07d}" for index in range(8000)]
+    seasons = list(range(2000, 2025))
+    store.upsert_players(pl.DataFrame({"player_id": player_ids, "full_name": player_ids, "college": "State"}))
+    career = pl.DataFrame({"player_id": player_ids}).join(
+        pl.DataFrame({"season": seasons}, schema={"season": pl.Int16}), how="cross"
+    ).filter(pl.col("player_id").str.slice(-1).cast(pl.Int16) <= pl.col("season") % 10)
+    store.upsert_player_seasons(career.with_columns(pl.lit(16, dtype=pl.Int16).alias("games_played")))
+    store.upsert_player_impacts(career.with_columns(pl.lit(1.5).alias("qb_epa")))
+    sample = player_ids[::400]
+
+    def _read_all() -> None:
+        for player_id in sample:
+            store.get_player_summary(player_id)
+
+    view_seconds = _measure(_read_all, iterations=3)
+    store.player_summary_path.unlink()
+    composed_seconds = _measure(_read_all, iterations=3)
+    perf_report.record("Player summary (20 reads)", "materialised view", view_seconds)
+    perf_report.record("Player summary (20 reads)", "three scans + joins", composed_seconds)
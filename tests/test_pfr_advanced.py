@@ -0,0 +1,65 @@
+"""Tests for the consolidated PFR advanced stats parquet tables."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from down_data.data import pfr_advanced
+
+
+def _write_exports(directory) -> None:
+    pl.DataFrame(
+        {"player": ["A", "B"], "ttt": [2.5, 2.9], "pfr_player_id": ["AaaaA00", "BbbbB00"]}
+    ).write_csv(directory / "pfr_passing_advanced_2019.csv")
+    pl.DataFrame(
+        {"player": ["B", "A"], "ttt": [3.0, 2.6], "pfr_player_id": ["BbbbB00", "AaaaA00"]}
+    ).write_csv(directory / "pfr_passing_advanced_2020.csv")
+
+
+def test_build_consolidates_exports_sorted_by_pfr_id(tmp_path):
+    _write_exports(tmp_path)
+
+    path = pfr_advanced.build_pfr_advanced_parquet("passing", directory=tmp_path)
+
+    frame = pl.read_parquet(path)
+    assert frame["pfr_id"].to_list() == ["AaaaA00", "AaaaA00", "BbbbB00", "BbbbB00"]
+    assert frame["season"].to_list() == [2019, 2020, 2019, 2020]
+    assert frame.schema["season"] == pl.Int16
+
+
+def test_scan_filters_by_player_and_season(tmp_path):
+    _write_exports(tmp_path)
+
+    scan = pfr_advanced.scan_pfr_advanced_stats(
+        "passing", pfr_id="AaaaA00", seasons=[2020], directory=tmp_path
+    )
+
+    result = scan.collect()
+    assert result["ttt"].to_list() == [2.6]
+    assert pfr_advanced.pfr_advanced_parquet_path("passing", directory=tmp_path).exists()
+
+
+def test_scan_returns_none_without_exports(tmp_path):
+    assert pfr_advanced.scan_pfr_advanced_stats("rushing", directory=tmp_path) is None
+
+
+def test_unreadable_export_is_retried_on_the_next_build(tmp_path, monkeypatch):
+    _write_exports(tmp_path)
+    read_csv = pl.read_csv
+
+    def _flaky_read_csv(path, **kwargs):
+        if path.name.endswith("_2020.csv"):
+            raise OSError("locked")
+        return read_csv(path, **kwargs)
+
+    monkeypatch.setattr(pfr_advanced.pl, "read_csv", _flaky_read_csv)
+    path = pfr_advanced.build_pfr_advanced_parquet("passing", directory=tmp_path)
+    assert pl.read_parquet(path)["season"].unique().to_list() == [2019]
+
+    # A failed rebuild keeps the existing parquet instead of overwriting it
+    assert pfr_advanced.build_pfr_advanced_parquet("passing", directory=tmp_path, force=True) == path
+    assert pl.read_parquet(path)["season"].unique().to_list() == [2019]
+
+    monkeypatch.setattr(pfr_advanced.pl, "read_csv", read_csv)
+    pfr_advanced.build_pfr_advanced_parquet("passing", directory=tmp_path)
+    assert pl.read_parquet(path)["season"].unique().sort().to_list() == [2019, 2020]
@@ -0,0 +1,55 @@
+"""Tests for the compressed raw PFR page archive."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+import tempfile
+import unittest
+
+from down_data.data.pfr.archive import PageArchive
+from down_data.data.pfr.snap_counts import reparse_archived_snap_counts
+
+
+FIXTURES = Path(__file__).resolve().parent / "data" / "pfr"
+SNAP_URL = "https://www.pro-football-reference.com/teams/buf/2023-snap-counts.htm"
+
+
+class PageArchiveTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.archive = PageArchive(Path(tmp.name))
+        self.snap_html = (FIXTURES / "snap_counts.html").read_text(encoding="utf-8")
+
+    def test_round_trip_is_compressed_and_content_addressed(self) -> None:
+        entry = self.archive.put(SNAP_URL, self.snap_html, fetched_on=date(2024, 1, 2))
+        self.archive.put("https://example.com/copy.htm", self.snap_html)
+
+        blobs = list((self.archive.directory / "blobs").rglob("*.zst"))
+        self.assertEqual(len(blobs), 1)
+        self.assertLess(blobs[0].stat().st_size, entry.size)
+        self.assertEqual(self.archive.get(SNAP_URL), self.snap_html)
+
+    def test_versions_are_kept_by_fetch_date(self) -> None:
+        self.archive.put(SNAP_URL, "<html>old</html>", fetched_on=date(2023, 9, 1))
+        self.archive.put(SNAP_URL, "<html>new</html>", fetched_on=date(2024, 1, 2))
+
+        reopened = PageArchive(self.archive.directory)
+        self.assertEqual(reopened.get(SNAP_URL), "<html>new</html>")
+        self.assertEqual(reopened.get(SNAP_URL, fetched_on=date(2023, 12, 31)), "<html>old</html>")
+        self.assertEqual(len(reopened.entries(all_versions=True)), 2)
+
+    def test_reparse_reads_archived_pages_without_network(self) -> None:
+        self.archive.put(SNAP_URL, self.snap_html)
+        self.archive.put("https://www.pro-football-reference.com/players/A/AlleJo02.htm", "<html></html>")
+
+        frame = reparse_archived_snap_counts(self.archive, max_workers=2, processes=False)
+
+        self.assertEqual(frame["pfr_id"].to_list(), ["AlleJo02", "MillVo00"])
+        self.assertEqual(set(frame["team_slug"].to_list()), {"buf"})
+        self.assertEqual(set(frame["season"].to_list()), {2023})
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
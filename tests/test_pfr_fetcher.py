@@ -0,0 +1,118 @@
+"""Tests for the concurrent, rate-limited PFR fetcher."""
+
+from __future__ import annotations
+
+import threading
+import types
+import unittest
+
+import requests
+
+from down_data.data.pfr.fetcher import ConcurrentPFRFetcher, TokenBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _StubClient:
+    """Minimal PFRClient stand-in returning canned pages."""
+
+    def __init__(self, pages: dict[str, list[object]], lock: threading.Lock) -> None:
+        self._pages = pages
+        self._lock = lock
+        self.session = types.SimpleNamespace()
+        self.closed = False
+
+    def build_url(self, path: str) -> str:
+        return path
+
+    def get(self, path: str):
+        with self._lock:
+            outcome = self._pages[path].pop(0)
+        if isinstance(outcome, int):
+            response = requests.Response()
+            response.status_code = outcome
+            raise requests.HTTPError(response=response)
+        return types.SimpleNamespace(text=outcome)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TokenBucketTestCase(unittest.TestCase):
+    def test_acquire_waits_for_refill_at_configured_rate(self) -> None:
+        clock = _FakeClock()
+        bucket = TokenBucket(2.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_pause_blocks_every_caller(self) -> None:
+        clock = _FakeClock()
+        bucket = TokenBucket(10.0, capacity=5, clock=clock, sleep=clock.sleep)
+
+        bucket.pause(3.0)
+        bucket.acquire()
+
+        self.assertGreaterEqual(clock.now, 3.0)
+
+
+class ConcurrentPFRFetcherTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.lock = threading.Lock()
+        self.pages: dict[str, list[object]] = {
+            "/a": ["alpha"],
+            "/b": [429, "bravo"],
+            "/c": [404],
+        }
+        self.clients: list[_StubClient] = []
+
+        def _factory() -> _StubClient:
+            client = _StubClient(self.pages, self.lock)
+            self.clients.append(client)
+            return client
+
+        self.fetcher = ConcurrentPFRFetcher(
+            rate=1000.0,
+            burst=10,
+            max_workers=2,
+            backoff=0.0,
+            client_factory=_factory,  # type: ignore[arg-type]
+        )
+        self.addCleanup(self.fetcher.close)
+
+    def test_fetch_many_retries_rate_limits_and_reports_failures(self) -> None:
+        results = self.fetcher.fetch_many(
+            ["a", "b", "c"],
+            path_for=lambda key: f"/{key}",
+            parse=lambda key, html: html.upper(),
+        )
+
+        self.assertEqual([result.key for result in results], ["a", "b", "c"])
+        self.assertEqual(results[0].value, "ALPHA")
+        self.assertEqual(results[1].value, "BRAVO")
+        self.assertFalse(results[2].ok)
+        self.assertIsInstance(results[2].error, requests.HTTPError)
+
+    def test_close_closes_worker_clients(self) -> None:
+        self.fetcher.fetch_many(["a"], path_for=lambda key: f"/{key}", parse=lambda _k, html: html)
+        self.fetcher.close()
+
+        self.assertTrue(self.clients)
+        self.assertTrue(all(client.closed for client in self.clients))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Tests for resumable, checkpointed PFR scrape jobs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import polars as pl
+
+from down_data.data.nfl_datastore import NFLDataBuilder, NFLDataStore
+from down_data.data.pfr.fetcher import FetchResult
+from down_data.data.pfr.jobs import ScrapeJob
+from down_data.data.pfr.snap_counts import fetch_snap_counts_resumable
+
+
+class _StubFetcher:
+    """Records requested keys and returns a frame (or an error) per key."""
+
+    def __init__(self, failing: set[tuple[str, int]] | None = None) -> None:
+        self.failing = failing or set()
+        self.requested: list[tuple[str, int]] = []
+
+    def fetch_many(self, items, *, path_for, parse, on_result=None):
+        results = []
+        for key in items:
+            self.requested.append(key)
+            if key in self.failing:
+                result = FetchResult(key=key, error=RuntimeError("boom"))
+            else:
+                result = FetchResult(key=key, value=pl.DataFrame({"pfr_id": [f"{key[0]}{key[1]}"]}))
+            if on_result is not None:
+                on_result(result)
+            results.append(result)
+        return results
+
+
+class ScrapeJobTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = Path(tmp.name)
+
+    def test_reopened_job_resumes_with_unfinished_items(self) -> None:
+        job = ScrapeJob("bio", directory=self.directory)
+        self.assertEqual(job.enqueue(["a", "b", "c"]), 3)
+        job.mark_done("a", {"handedness": "Right"})
+
+        resumed = ScrapeJob("bio", directory=self.directory)
+
+        self.assertEqual(resumed.enqueue(["a", "b", "c"]), 0)
+        self.assertEqual(resumed.pending(), ["b", "c"])
+        self.assertEqual(resumed.result("a"), {"handedness": "Right"})
+
+    def test_failures_are_parked_after_max_attempts(self) -> None:
+        job = ScrapeJob("bio", directory=self.directory, max_attempts=2)
+        job.enqueue(["a"])
+        job.mark_failed("a", "timeout")
+        self.assertEqual(job.pending(), ["a"])
+        job.mark_failed("a", "timeout")
+
+        self.assertEqual(job.pending(), [])
+        self.assertEqual(job.failed(), ["a"])
+        self.assertEqual(job.retry_failed(), 1)
+        self.assertEqual(ScrapeJob("bio", directory=self.directory, max_attempts=2).pending(), ["a"])
+
+    def test_reopened_items_are_pending_again(self) -> None:
+        job = ScrapeJob("bio", directory=self.directory)
+        job.enqueue(["a", "b"])
+        job.mark_done("a", {})
+        job.mark_done("b", {"handedness": "Left"})
+
+        self.assertEqual(job.reopen(["a", "missing"]), 1)
+
+        self.assertEqual(ScrapeJob("bio", directory=self.directory).pending(), ["a"])
+
+    def test_empty_bio_results_are_retried_not_checkpointed(self) -> None:
+        store = NFLDataStore(data_dir=self.directory / "store")
+        store.initialize()
+        store.upsert_players(
+            pl.DataFrame(
+                {"player_id": ["00A"], "pfr_id": ["AbcdXx00"], "handedness": [None], "_bio_fetched": [False]},
+                schema_overrides={"handedness": pl.Utf8},
+            )
+        )
+        # An earlier run checkpointed an empty result as done
+        ScrapeJob("pfr_bio", directory=store.scrape_jobs_dir).mark_done("AbcdXx00", {})
+        results = [{}, {"handedness": "Left", "birth_city": "Town"}]
+
+        with patch("down_data.data.pfr.client.PFRClient", MagicMock()), patch(
+            "down_data.data.pfr.archive.get_page_archive", return_value=None
+        ), patch("down_data.data.pfr.players.fetch_player_bio_fields", side_effect=results) as fetch:
+            self.assertEqual(NFLDataBuilder(store)._update_bio_data(), 0)
+            self.assertEqual(NFLDataBuilder(store)._update_bio_data(), 1)
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(store.load_players()["handedness"].to_list(), ["Left"])
+
+    def test_truncated_checkpoint_line_is_ignored(self) -> None:
+        job = ScrapeJob("bio", directory=self.directory)
+        job.enqueue(["a"])
+        job.mark_done("a", {})
+        with open(job.checkpoint_path, "a", encoding="utf-8") as handle:
+            handle.write('{"event": "done", "key": "b"')
+
+        self.assertTrue(ScrapeJob("bio", directory=self.directory).is_done("a"))
+
+    def test_resumable_snap_counts_skip_completed_pages(self) -> None:
+        job = ScrapeJob("snaps", directory=self.directory)
+        first = _StubFetcher(failing={("nyg", 2023)})
+
+        frames = fetch_snap_counts_resumable([("buf", 2023), ("nyg", 2023)], job, fetcher=first)
+
+        self.assertEqual(list(frames), [("buf", 2023)])
+
+        second = _StubFetcher()
+        frames = fetch_snap_counts_resumable(
+            [("buf", 2023), ("nyg", 2023)],
+            ScrapeJob("snaps", directory=self.directory),
+            fetcher=second,
+        )
+
+        self.assertEqual(second.requested, [("nyg", 2023)])
+        self.assertEqual(set(frames), {("buf", 2023), ("nyg", 2023)})
+        self.assertEqual(frames[("buf", 2023)]["pfr_id"].to_list(), ["buf2023"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Tests for the lxml-based PFR table parser."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import unittest
+
+import polars as pl
+
+from down_data.data.pfr.snap_counts import parse_snap_counts_html
+from down_data.data.pfr.tables import find_table_html, list_table_ids, read_table
+
+
+FIXTURES = Path(__file__).resolve().parent / "data" / "pfr"
+
+
+class PFRTablesTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.team_html = (FIXTURES / "team_page.html").read_text(encoding="utf-8")
+        self.snap_html = (FIXTURES / "snap_counts.html").read_text(encoding="utf-8")
+
+    def test_list_table_ids_includes_comment_wrapped_tables(self) -> None:
+        self.assertEqual(list_table_ids(self.team_html), ["games", "team_stats"])
+
+    def test_read_table_flattens_headers_and_types_numbers(self) -> None:
+        frame = read_table(self.team_html, "team_stats")
+
+        self.assertEqual(
+            frame.columns,
+            [
+                "Team Offense_Points For",
+                "Team Offense_Yards",
+                "Team Defense_Points Against",
+                "Team Defense_Yards Allowed",
+            ],
+        )
+        self.assertEqual(frame.schema["Team Offense_Yards"], pl.Int64)
+        self.assertEqual(frame.row(0), (454, 6200, 320, 5100))
+
+    def test_read_table_keeps_row_header_cells(self) -> None:
+        frame = read_table(self.team_html, "games")
+
+        self.assertEqual(frame["Week"].to_list(), [1, 2])
+        self.assertEqual(frame["Opp"].to_list(), ["NYJ", "BUF"])
+
+    def test_missing_table_raises(self) -> None:
+        self.assertIsNone(find_table_html(self.team_html, "nonexistent"))
+        with self.assertRaises(ValueError):
+            read_table(self.team_html, "nonexistent")
+
+    def test_snap_counts_skip_separator_and_total_rows(self) -> None:
+        frame = parse_snap_counts_html(self.snap_html)
+
+        self.assertEqual(frame["pfr_id"].to_list(), ["AlleJo02", "MillVo00"])
+        self.assertEqual(frame["_snap_offense"].to_list(), [1102, 0])
+        self.assertEqual(frame["_snap_defense"].to_list(), [0, 512])
+        self.assertEqual(frame["_snap_st"].to_list(), [3, 18])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
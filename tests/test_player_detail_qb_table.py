@@ -47,6 +47,9 @@ class _StubService:
     ) -> pl.DataFrame:
         return self._cached
 
+    def has_authoritative_stats(self) -> bool:
+        return False
+
     def get_basic_ratings(self, player, *, summary, is_defensive):
         return []
 
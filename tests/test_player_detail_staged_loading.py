@@ -0,0 +1,126 @@
+"""Tests for staged (incremental) player detail loading."""
+
+from __future__ import annotations
+
+from datetime import date
+import threading
+import unittest
+
+import polars as pl
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from down_data.core.ratings import RatingBreakdown
+from down_data.ui.pages.player_detail_page import PlayerDetailPage
+
+
+class _StubProfile:
+    def __init__(self, name: str) -> None:
+        self.full_name = name
+        self.position = "LS"
+        self.position_group = "LS"
+        self.birth_date = date(1995, 1, 1)
+        self.gsis_id = f"00-{name}"
+
+
+class _StubPlayer:
+    def __init__(self, name: str) -> None:
+        self.profile = _StubProfile(name)
+
+    def is_defensive(self) -> bool:
+        return False
+
+
+class _GatedService:
+    """Service stub whose stats and ratings loads block until released."""
+
+    def __init__(self) -> None:
+        self.release_stats = threading.Event()
+        self.release_ratings = threading.Event()
+
+    def load_player(self, query) -> _StubPlayer:
+        return _StubPlayer(query.name)
+
+    def get_player_summary_stats(self, *, player_id: str) -> pl.DataFrame:
+        self.release_stats.wait(5)
+        return pl.DataFrame(
+            {
+                "player_id": [player_id, player_id],
+                "season": [2022, 2023],
+                "season_type": ["REG", "REG"],
+                "team": ["BUF", "BUF"],
+                "position": ["LS", "LS"],
+                "games": [17, 16],
+            }
+        )
+
+    def has_authoritative_stats(self) -> bool:
+        return True
+
+    def get_basic_ratings(self, player, *, summary, is_defensive) -> list[RatingBreakdown]:
+        self.release_ratings.wait(5)
+        return [RatingBreakdown(label="Overall", current=60, potential=65)]
+
+    def fetch_player_bio_details(self, player) -> dict[str, str]:
+        return {}
+
+    def get_player_impacts(self, *args, **kwargs) -> pl.DataFrame:
+        return pl.DataFrame()
+
+
+class PlayerDetailStagedLoadingTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    @pytest.fixture(autouse=True)
+    def _use_wait_until(self, wait_until) -> None:
+        self._wait_until = wait_until
+
+    def _page(self, service: _GatedService) -> PlayerDetailPage:
+        page = PlayerDetailPage(service=service)
+        self.addCleanup(page.deleteLater)
+        self.addCleanup(service.release_ratings.set)
+        self.addCleanup(service.release_stats.set)
+        return page
+
+    def test_stages_arrive_in_order_without_waiting_for_slower_ones(self) -> None:
+        service = _GatedService()
+        page = self._page(service)
+
+        page.display_player({"full_name": "Snapper", "team": "BUF", "position": "LS"})
+
+        # Profile is published while the stats load is still blocked
+        self._wait_until(lambda: page._current_player is not None)
+        self.assertEqual(page._current_player.profile.full_name, "Snapper")
+        self.assertEqual(page._season_rows, [])
+
+        service.release_stats.set()
+        self._wait_until(lambda: len(page._season_rows) == 2)
+        self.assertEqual(page._basic_ratings, [])
+
+        service.release_ratings.set()
+        self._wait_until(lambda: len(page._basic_ratings) == 1)
+        self.assertEqual(page._view_model.basic_ratings[0].label, "Overall")
+
+    def test_stages_for_a_replaced_player_are_dropped(self) -> None:
+        service = _GatedService()
+        page = self._page(service)
+
+        page.display_player({"full_name": "First", "team": "BUF", "position": "LS"})
+        self._wait_until(lambda: page._current_player is not None)
+        page.display_player({"full_name": "Second", "team": "BUF", "position": "LS"})
+        stale_rows: list[object] = []
+        page.detailTableReady.connect(lambda stage: stale_rows.append(stage) if stage.token != page._payload_token else None)
+
+        # The first job resumes, notices it was superseded and stops publishing
+        service.release_stats.set()
+        service.release_ratings.set()
+        self._wait_until(lambda: len(page._basic_ratings) == 1)
+        self.assertEqual(page._current_player.profile.full_name, "Second")
+        self.assertEqual(len(page._season_rows), 2)
+        self.assertEqual(stale_rows, [])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+import tempfile
 import unittest
 from unittest.mock import patch
 
 import polars as pl
 
 from down_data.core.player import Player
+from down_data.data.player_stats_store import PlayerStatsStore
 
 
 class PlayerFetchStatsTestCase(unittest.TestCase):
@@ -27,7 +30,19 @@ class PlayerFetchStatsTestCase(unittest.TestCase):
         )
         self.addCleanup(finder_patch.stop)
         finder_patch.start()
-        self.player = Player(name="Test Player")
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.store = PlayerStatsStore(Path(tmp_dir.name) / "stats")
+        self.nextgen_store = PlayerStatsStore(
+            Path(tmp_dir.name) / "nextgen",
+            id_column="player_gsis_id",
+            keep_in_memory=True,
+        )
+        self.player = Player(
+            name="Test Player",
+            stats_store=self.store,
+            nextgen_store=self.nextgen_store,
+        )
 
     def test_fetch_stats_falls_back_when_summary_level_not_supported(self) -> None:
         """Ensure a TypeError for summary_level does not break stat loading."""
@@ -87,6 +102,82 @@ class PlayerFetchStatsTestCase(unittest.TestCase):
         self.assertEqual(result.height, 1)
         self.assertListEqual(result["season_type"].to_list(), ["REG"])
 
+    def test_fetch_stats_reads_stored_seasons_and_downloads_only_missing(self) -> None:
+        """Seasons are downloaded once, written back, then served from the store."""
+
+        def fake_loader(**kwargs):
+            seasons = kwargs["seasons"]
+            return pl.DataFrame(
+                {
+                    "player_id": ["00TEST", "00OTHER"] * len(seasons),
+                    "season": [season for season in seasons for _ in range(2)],
+                    "season_type": ["REG"] * (2 * len(seasons)),
+                    "week": [1] * (2 * len(seasons)),
+                }
+            )
+
+        with patch("down_data.core.player.load_player_stats", side_effect=fake_loader) as loader:
+            first = self.player.fetch_stats(seasons=[2020, 2021])
+            second = self.player.fetch_stats(seasons=[2020, 2021, 2022])
+
+        self.assertEqual(loader.call_count, 2)
+        self.assertListEqual(loader.call_args_list[0].kwargs["seasons"], [2020, 2021])
+        self.assertListEqual(loader.call_args_list[1].kwargs["seasons"], [2022])
+        self.assertListEqual(first["season"].to_list(), [2020, 2021])
+        self.assertListEqual(sorted(second["season"].to_list()), [2020, 2021, 2022])
+        self.assertListEqual(second["player_id"].unique().to_list(), ["00TEST"])
+        self.assertTrue(self.store.season_path(2022).exists())
+
+    def test_fetch_stats_all_seasons_runs_through_the_current_season(self) -> None:
+        """``seasons=True`` follows nflreadpy's current season, not a fixed year."""
+
+        with patch("down_data.core.player.current_season", return_value=2031), patch(
+            "down_data.core.player.load_player_stats", return_value=pl.DataFrame()
+        ) as loader:
+            self.player.fetch_stats(seasons=True)
+            self.player.fetch_stats(seasons=[2031])
+
+        self.assertEqual(loader.call_args_list[0].kwargs["seasons"][-1], 2031)
+
+    def test_fetch_stats_stores_empty_seasons_as_known_empty(self) -> None:
+        """A season that downloads no rows is not requested again."""
+
+        data = pl.DataFrame({"player_id": ["00TEST"], "season": [2020], "week": [1]})
+
+        with patch("down_data.core.player.load_player_stats", return_value=data) as loader:
+            self.player.fetch_stats(seasons=[2020, 2021])
+            result = self.player.fetch_stats(seasons=[2020, 2021])
+
+        self.assertEqual(loader.call_count, 1)
+        self.assertTrue(self.store.is_fresh(2021))
+        self.assertListEqual(result["season"].to_list(), [2020])
+
+    def test_nextgen_stats_are_shared_and_matched_on_gsis_id(self) -> None:
+        """Next Gen seasons download once per stat type and match on player_gsis_id."""
+
+        data = pl.DataFrame(
+            {
+                "player_gsis_id": ["00TEST", "00OTHER"],
+                "player_display_name": ["T. Player", "Test Player"],
+                "season": [2023, 2023],
+                "week": [0, 0],
+                "avg_time_to_throw": [2.7, 3.1],
+            }
+        )
+
+        with patch("down_data.core.player.load_nextgen_stats", return_value=data) as loader:
+            first = self.player.fetch_nextgen_stats(seasons=[2023], stat_type="passing")
+            other_view = Player(
+                name="Test Player",
+                stats_store=self.store,
+                nextgen_store=self.nextgen_store,
+            )
+            second = other_view.fetch_nextgen_stats(seasons=[2023], stat_type="passing")
+
+        self.assertEqual(loader.call_count, 1)
+        self.assertListEqual(first["avg_time_to_throw"].to_list(), [2.7])
+        self.assertTrue(second.equals(first))
+
 
 if __name__ == "__main__":
     unittest.main()
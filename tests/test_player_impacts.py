@@ -1,7 +1,12 @@
+from datetime import timedelta
+import os
+import time
+
 import polars as pl
 import pytest
 
-from down_data.data import player_impacts
+from down_data.data import impact_engine, pbp_cache, player_impacts
+from down_data.data.nfl_datastore import NFLDataBuilder, NFLDataStore
 
 
 def _sample_pbp() -> pl.DataFrame:
@@ -64,3 +69,72 @@ def test_aggregate_player_impacts_returns_expected_metrics():
     assert pytest.approx(punter_row["punter_epa"]) == -0.05
     assert pytest.approx(punter_row["punter_wpa"]) == -0.005
 
+
+def test_compute_season_impacts_reports_progress_per_season():
+    events = []
+
+    def _loader(*, seasons):
+        return _sample_pbp().drop("_pbp_row_id") if seasons == [2020] else pl.DataFrame({"season": []})
+
+    impacts = impact_engine.compute_season_impacts([2021, 2020], loader=_loader, progress=events.append)
+
+    assert [(event.season, event.stage) for event in events] == [
+        (2020, "loading"),
+        (2020, "done"),
+        (2021, "loading"),
+        (2021, "skipped"),
+    ]
+    assert events[1].rows == impacts.height
+    assert impacts.equals(player_impacts.aggregate_player_impacts(_sample_pbp()))
+
+
+def test_datastore_builder_uses_shared_engine(tmp_path):
+    builder = NFLDataBuilder(NFLDataStore(tmp_path))
+    pbp = _sample_pbp()
+
+    assert builder._aggregate_impacts_from_pbp(pbp, 2020).equals(player_impacts.aggregate_player_impacts(pbp))
+
+
+def test_streaming_mode_scans_cached_parquet(tmp_path):
+    downloads = []
+
+    def _downloader(season, path):
+        downloads.append(season)
+        _sample_pbp().drop("_pbp_row_id").write_parquet(path)
+
+    def _scanner(season):
+        return pbp_cache.scan_pbp_season(season, directory=tmp_path, downloader=_downloader)
+
+    first = impact_engine.compute_season_impacts([2020], streaming=True, scanner=_scanner)
+    second = impact_engine.compute_season_impacts([2020], streaming=True, scanner=_scanner)
+
+    assert downloads == [2020]
+    assert pbp_cache.pbp_season_path(2020, directory=tmp_path).exists()
+    assert first.equals(player_impacts.aggregate_player_impacts(_sample_pbp()))
+    assert second.equals(first)
+
+
+def test_current_season_play_by_play_is_refreshed_once_stale(tmp_path, monkeypatch):
+    monkeypatch.setattr(pbp_cache, "current_season", lambda: 2024)
+    downloads = []
+
+    def _downloader(season, path):
+        downloads.append(season)
+        path.write_bytes(b"pbp")
+
+    for season in (2023, 2024):
+        path = pbp_cache.pbp_season_path(season, directory=tmp_path)
+        path.write_bytes(b"old")
+        os.utime(path, (time.time() - 86_400, time.time() - 86_400))
+
+    for season in (2023, 2024, 2024):
+        pbp_cache.ensure_pbp_season(season, directory=tmp_path, downloader=_downloader)
+
+    # Completed seasons never expire; the current one refreshes once
+    assert downloads == [2024]
+
+    def _offline(season, path):
+        raise OSError("offline")
+
+    stale = pbp_cache.ensure_pbp_season(2024, directory=tmp_path, downloader=_offline, max_age=timedelta(0))
+    assert stale.read_bytes() == b"pbp"
@@ -0,0 +1,159 @@
+import polars as pl
+import pytest
+
+from down_data.backend.player_service import PlayerService
+from down_data.data import player_ratings
+from down_data.data.nfl_datastore import NFLDataStore
+
+
+def _sample_player_seasons() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "player_id": ["QB1", "QB1", "QB2", "QB3", "WR1", "CB1"],
+            "season": [2019, 2023, 2023, 2022, 2023, 2023],
+            "position": ["QB", "QB", "QB", "QB", "WR", "CB"],
+            "passing_yards": [9999, 4000, 3000, 2000, 0, 0],
+            "passing_tds": [99, 30, 20, 10, 0, 0],
+            "rushing_tds": [0, 2, 0, 0, 0, 0],
+            "receiving_yards": [0, 0, 0, 0, 1200, 0],
+            "receiving_tds": [0, 0, 0, 0, 9, 0],
+            "def_tackles_solo": [0, 0, 0, 0, 0, 60],
+            "def_tackle_assists": [0, 0, 0, 0, 0, 20],
+            "def_interceptions": [0, 0, 0, 0, 0, 4],
+        },
+        schema_overrides={"passing_tds": pl.Int8, "season": pl.Int16},
+    )
+
+
+def test_compute_rating_baselines_uses_trailing_window_per_position_group():
+    baselines = player_ratings.compute_rating_baselines(_sample_player_seasons())
+    mapping = player_ratings.baselines_to_mapping(baselines)
+
+    # 2019 falls outside the three-season window ending in 2023
+    mean_yards, std_yards = mapping["QB"]["pass_yards"]
+    assert mean_yards == pytest.approx(3000.0)
+    assert std_yards == pytest.approx(1000.0)
+    assert mapping["QB"]["total_touchdowns"][0] == pytest.approx(62 / 3)
+
+    # Offensive players also feed the catch-all offensive baseline
+    qb_rows = baselines.filter(pl.col("rating_key") == "default_offense")
+    assert qb_rows["sample_size"].max() == 4
+
+    # Single-sample groups fall back to a proportional spread
+    assert mapping["defense"]["def_tackles_total"] == pytest.approx((80.0, 20.0))
+    assert set(baselines["season_start"].to_list()) == {2022}
+
+
+def test_store_persists_and_reloads_rating_baselines(tmp_path):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    store.upsert_player_seasons(_sample_player_seasons())
+
+    assert store.rebuild_rating_baselines() > 0
+    assert store.rating_baselines_path.exists()
+    assert store.load_metadata().rating_baselines_last_updated is not None
+
+    reloaded = NFLDataStore(data_dir=tmp_path).load_rating_baselines()
+    assert reloaded.equals(store.load_rating_baselines())
+
+
+def test_store_recomputes_baselines_after_player_seasons_refresh(tmp_path):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    store.upsert_player_seasons(_sample_player_seasons())
+    store.rebuild_rating_baselines()
+    assert set(store.load_rating_baselines()["season_end"].to_list()) == {2023}
+
+    next_season = _sample_player_seasons().head(1).with_columns(pl.lit(2024, dtype=pl.Int16).alias("season"))
+    store.upsert_player_seasons(next_season)
+
+    assert set(store.load_rating_baselines()["season_end"].to_list()) == {2024}
+    assert store.table_generation("rating_baselines") > store.table_generation("player_seasons")
+
+
+def test_clamp_rating_expr_matches_service_rounding():
+    values = [12.0, 20.4, 52.5, 53.5, 57.4, 62.5, 67.6, 79.9, 95.0, -3.0]
+    vectorised = pl.DataFrame({"value": values}).select(
+        player_ratings.clamp_rating_expr(pl.col("value"))
+    )["value"].to_list()
+
+    assert vectorised == [PlayerService._clamp_rating(value) for value in values]
+
+
+def test_compute_player_ratings_rates_every_player_season_in_one_pass():
+    seasons = _sample_player_seasons()
+    baselines = player_ratings.compute_rating_baselines(seasons)
+    mapping = player_ratings.baselines_to_mapping(baselines)
+
+    ratings = player_ratings.compute_player_ratings(seasons, baselines)
+
+    assert ratings.height == seasons.height
+    assert ratings.columns == list(player_ratings.PLAYER_RATINGS_SCHEMA)
+    assert dict(zip(ratings["player_id"], ratings["rating_key"]))["CB1"] == "defense"
+
+    # QB1 2023 sums 2021-2023 only, so the 2019 season is ignored
+    qb1 = ratings.filter((pl.col("player_id") == "QB1") & (pl.col("season") == 2023)).row(0, named=True)
+    service = PlayerService()
+    mean_val, std_val = mapping["QB"]["pass_yards"]
+    assert qb1["rating_pass_yards"] == service._calculate_rating_score(4000.0, mean_val, std_val)
+    assert qb1["rating_def_interceptions"] is None
+
+    passing_group = service._clamp_rating(
+        (qb1["rating_pass_yards"] + qb1["rating_total_touchdowns"]) / 2
+    )
+    expected_overall = service._clamp_rating((passing_group + qb1["rating_rush_yards"]) / 2)
+    assert qb1["overall"] == expected_overall
+    assert qb1["potential"] == service._calculate_rating_potential(expected_overall)
+
+
+def test_store_rebuilds_and_filters_player_ratings(tmp_path):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    store.upsert_player_seasons(_sample_player_seasons())
+    store.rebuild_rating_baselines()
+
+    assert store.rebuild_player_ratings() == 6
+    assert store.player_ratings_path.exists()
+    assert store.load_metadata().player_ratings_last_updated is not None
+
+    latest = NFLDataStore(data_dir=tmp_path).get_player_ratings(player_ids=["QB1"], latest_only=True)
+    assert latest["season"].to_list() == [2023]
+
+
+def test_store_rerates_after_player_seasons_refresh(tmp_path):
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    store.upsert_player_seasons(_sample_player_seasons())
+    store.rebuild_player_ratings()
+    assert store.load_player_ratings().height == 6
+
+    next_season = _sample_player_seasons().head(1).with_columns(pl.lit(2024, dtype=pl.Int16).alias("season"))
+    store.upsert_player_seasons(next_season)
+
+    reloaded = NFLDataStore(data_dir=tmp_path)
+    assert reloaded.load_player_ratings().height == 7
+    assert reloaded.table_generation("player_ratings") > reloaded.table_generation("player_seasons")
+    assert store.load_player_ratings().height == 7
+
+
+def test_stored_and_fallback_baselines_count_tackles_the_same_way(monkeypatch):
+    weekly = pl.DataFrame(
+        {
+            "player_id": ["CB1", "CB2"],
+            "position": ["CB", "CB"],
+            "season": [2023, 2023],
+            "def_tackles_solo": [60, 40],
+            "def_tackle_assists": [20, 10],
+            "def_tackles_with_assist": [6, 2],
+        },
+        schema_overrides={"season": pl.Int16},
+    )
+    monkeypatch.setattr("down_data.backend.player_service.load_player_stats", lambda seasons: weekly)
+    metrics = ["def_tackles_total", "def_tackles_assisted"]
+
+    fallback = PlayerService()._build_rating_baseline("defense", metrics)
+    stored = player_ratings.baselines_to_mapping(player_ratings.compute_rating_baselines(weekly))["defense"]
+
+    assert fallback["def_tackles_total"][0] == pytest.approx(69.0)
+    for metric in metrics:
+        assert stored[metric] == pytest.approx(fallback[metric])
@@ -0,0 +1,119 @@
+"""Tests for the staged (non-blocking) player search page startup."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from down_data.backend.player_service import PlayerDirectory
+from down_data.ui.pages.player_search_page import PlayerSearchPage
+from down_data.ui.startup_metrics import FIRST_PAINT, StartupMetrics, watch_first_paint
+
+
+class PlayerSearchStartupTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    @pytest.fixture(autouse=True)
+    def _use_slow_directory_service(self, slow_directory_service) -> None:
+        self._slow_directory_service = slow_directory_service
+
+    @pytest.fixture(autouse=True)
+    def _use_wait_until(self, wait_until) -> None:
+        self._wait_until = wait_until
+
+    def test_page_paints_before_directory_loads_then_fills_dropdowns(self) -> None:
+        service = self._slow_directory_service()
+        page = PlayerSearchPage(service=service)
+        self.addCleanup(page.deleteLater)
+        metrics = StartupMetrics()
+        watch_first_paint(page, metrics)
+
+        page.show()
+        self._wait_until(lambda: metrics.elapsed(FIRST_PAINT) is not None)
+
+        self.assertNotIn(threading.main_thread(), service.load_threads)
+        team_combo = next(iter(page._team_filters.values()))
+        self.assertEqual([team_combo.itemText(i) for i in range(team_combo.count())], ["Any"])
+
+        service.release.set()
+        self._wait_until(lambda: team_combo.count() > 1)
+
+        self.assertEqual([team_combo.itemText(i) for i in range(team_combo.count())], ["Any", "BUF", "KC"])
+        year_signed = next(iter(page._contract_year_signed_filters.values()))
+        self.assertEqual(year_signed.currentText(), "2023")
+        draft_team = next(iter(page._draft_team_filters.values()))
+        self.assertEqual(draft_team.count(), 3)
+
+    def test_cancelled_search_resets_the_page_for_the_next_search(self) -> None:
+        service = self._slow_directory_service()
+        page = PlayerSearchPage(service=service)
+        self.addCleanup(page.deleteLater)
+
+        page._perform_search()
+        search = page._active_search
+        self.assertIsNotNone(search)
+        self.assertFalse(page._search_button.isEnabled())
+
+        search.cancel()
+        service.release.set()
+        self._wait_until(lambda: page._active_search is None)
+
+        self.assertTrue(page._search_button.isEnabled())
+        self.assertEqual(page._results_table.row_count(), 0)
+        page._perform_search()
+        self.assertIsNotNone(page._active_search)
+        self.assertIsNot(page._active_search, search)
+        page._active_search.cancel()
+        self._wait_until(lambda: page._active_search is None)
+
+    def test_concurrent_directory_reads_load_the_players_once(self) -> None:
+        calls: list[threading.Thread] = []
+
+        def slow_load_players() -> pl.DataFrame:
+            calls.append(threading.current_thread())
+            time.sleep(0.05)
+            return pl.DataFrame(
+                {
+                    "full_name": ["Test Player"],
+                    "display_name": ["Test Player"],
+                    "position": ["QB"],
+                    "recent_team": ["BUF"],
+                }
+            )
+
+        directory = PlayerDirectory()
+        frames: list[pl.DataFrame] = []
+        with patch("down_data.backend.player_service.load_players", slow_load_players), patch(
+            "down_data.backend.player_service.load_contracts", None
+        ):
+            readers = [threading.Thread(target=lambda: frames.append(directory.frame)) for _ in range(4)]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(frames), 4)
+        self.assertTrue(all(frame is frames[0] for frame in frames))
+
+    def test_first_paint_mark_is_recorded_once(self) -> None:
+        metrics = StartupMetrics(origin=time.perf_counter())
+        self.assertIsNone(metrics.time_to_first_paint)
+
+        first = metrics.mark(FIRST_PAINT)
+        second = metrics.mark(FIRST_PAINT)
+
+        self.assertEqual(first, second)
+        self.assertEqual(metrics.snapshot(), {FIRST_PAINT: first})
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
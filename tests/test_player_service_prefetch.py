@@ -0,0 +1,92 @@
+"""Unit tests for the PlayerService detail prefetch caches."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+import polars as pl
+
+from down_data.backend.player_service import PlayerService
+from down_data.core import PlayerQuery
+
+
+class PlayerServicePrefetchTestCase(unittest.TestCase):
+    """Ensure prefetching warms the caches the detail page reads from."""
+
+    def setUp(self) -> None:
+        self._player_row = {
+            "gsis_id": "00TEST",
+            "full_name": "Test Player",
+            "display_name": "Test Player",
+            "position": "QB",
+            "position_group": "QB",
+        }
+        finder_patch = patch(
+            "down_data.core.player.PlayerFinder.resolve",
+            return_value=self._player_row,
+        )
+        self.addCleanup(finder_patch.stop)
+        self.resolve_mock = finder_patch.start()
+
+        self.service = PlayerService()
+        self.service._use_nfl_datastore = lambda: False  # type: ignore[method-assign]
+
+        summary = pl.DataFrame({"player_id": ["00TEST"], "season": [2023], "passing_yards": [4000]})
+        impacts = pl.DataFrame(
+            {"player_id": ["00TEST", "00TEST"], "season": [2022, 2023], "qb_epa": [10.0, 12.5]}
+        )
+        summary_patch = patch.object(
+            self.service._player_summary_repository, "query", return_value=summary
+        )
+        impacts_patch = patch.object(
+            self.service._player_impact_repository, "query", return_value=impacts
+        )
+        self.addCleanup(summary_patch.stop)
+        self.addCleanup(impacts_patch.stop)
+        self.summary_mock = summary_patch.start()
+        self.impacts_mock = impacts_patch.start()
+
+    def test_prefetch_warms_player_summary_and_impacts(self) -> None:
+        query = PlayerQuery(name="Test Player", team="KC", position="QB")
+
+        prefetched = self.service.prefetch_player_detail(query)
+
+        self.assertIsNotNone(prefetched)
+        self.assertIs(self.service.load_player(query), prefetched)
+        self.assertEqual(self.resolve_mock.call_count, 1)
+
+        summary = self.service.get_player_summary_stats(player_id="00TEST")
+        self.assertEqual(summary.height, 1)
+        self.assertEqual(self.summary_mock.call_count, 1)
+
+        impacts = self.service._load_cached_impacts(prefetched, [2023])
+        self.assertEqual(impacts["qb_epa"].to_list(), [12.5])
+        self.assertEqual(self.impacts_mock.call_count, 1)
+
+    def test_empty_results_are_looked_up_again(self) -> None:
+        self.summary_mock.return_value = pl.DataFrame()
+        self.impacts_mock.return_value = pl.DataFrame()
+
+        for _ in range(2):
+            self.service.get_player_summary_stats(player_id="00TEST")
+            self.service._get_player_impact_frame("00TEST")
+
+        self.assertEqual(self.summary_mock.call_count, 2)
+        self.assertEqual(self.impacts_mock.call_count, 2)
+
+    def test_detail_caches_keep_only_the_most_recent_players(self) -> None:
+        with patch("down_data.backend.player_service.DETAIL_CACHE_SIZE", 2):
+            for player_id in ("00A", "00B", "00A", "00C"):
+                self.service._get_player_impact_frame(player_id)
+
+        self.assertEqual(list(self.service._impact_frame_cache), ["00A", "00C"])
+
+    def test_prefetch_swallows_resolution_errors(self) -> None:
+        self.resolve_mock.side_effect = RuntimeError("boom")
+
+        self.assertIsNone(self.service.prefetch_player_detail(PlayerQuery(name="Nobody")))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -1,6 +1,6 @@
 import polars as pl
 
-from down_data.data import player_summary_cache
+from down_data.data import basic_cache, impact_engine, player_impacts, player_summary_cache
 
 
 def test_merge_with_impacts_adds_totals_and_impacts():
@@ -46,3 +46,128 @@ def test_filter_by_seasons_limits_rows():
     assert filtered["season"].to_list() == [2020, 2021]
 
 
+def _weekly_stats(season: int) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "season": [season, season],
+            "season_type": ["REG", "REG"],
+            "week": [1, 2],
+            "player_id": ["p1", "p1"],
+            "player_display_name": ["Test Player", "Test Player"],
+            "recent_team": ["ABC", "ABC"],
+            "position": ["QB", "QB"],
+            "position_group": ["QB", "QB"],
+            "passing_yards": [250.0, 300.0],
+            "passing_tds": [2, 1],
+        }
+    )
+
+
+def test_build_player_summary_cache_streams_seasons_into_parts(tmp_path):
+    loaded: list[list[int]] = []
+
+    def stats_loader(*, seasons):
+        loaded.append(seasons)
+        return _weekly_stats(seasons[0])
+
+    kwargs = dict(
+        parts_directory=tmp_path / "parts",
+        output_path=tmp_path / "summary.parquet",
+        stats_loader=stats_loader,
+        pbp_loader=lambda *, seasons: pl.DataFrame(),
+        include_pfr=False,
+    )
+
+    rows = player_summary_cache.build_player_summary_cache(seasons=[2021, 2022], **kwargs)
+
+    assert rows == 2
+    assert loaded == [[2021], [2022]]
+    assert player_summary_cache.season_part_path(2021, directory=tmp_path / "parts").exists()
+    summary = pl.read_parquet(tmp_path / "summary.parquet")
+    assert summary["season"].to_list() == [2021, 2022]
+    assert summary["passing_yards"].to_list() == [550, 550]
+
+    # Stored seasons are reused; only the new season is processed
+    loaded.clear()
+    rows = player_summary_cache.build_player_summary_cache(seasons=[2021, 2023], **kwargs)
+
+    assert loaded == [[2023]]
+    # Only the requested seasons are consolidated, though 2022 stays on disk
+    assert rows == 2
+    assert pl.read_parquet(tmp_path / "summary.parquet")["season"].to_list() == [2021, 2023]
+    assert player_summary_cache.season_part_path(2022, directory=tmp_path / "parts").exists()
+
+
+def test_build_loads_the_id_mapping_and_bios_once(tmp_path, monkeypatch):
+    calls = {"mapping": 0, "bios": 0}
+
+    def build_mapping(seasons):
+        calls["mapping"] += 1
+        return pl.DataFrame({"gsis_id": ["p1"], "pfr_id": ["TestPl00"]})
+
+    def load_bios():
+        calls["bios"] += 1
+        return pl.DataFrame(
+            {
+                "pfr_id": ["TestPl00"],
+                "handedness": ["Right"],
+                "birth_city": ["Town"],
+                "birth_state": ["ST"],
+                "birth_country": ["USA"],
+            }
+        )
+
+    monkeypatch.setattr(basic_cache, "build_player_id_mapping", build_mapping)
+    monkeypatch.setattr(basic_cache, "load_player_bio_cache", load_bios)
+    monkeypatch.setattr(basic_cache, "merge_snap_counts", lambda frame, seasons, *, id_mapping: frame)
+
+    player_summary_cache.build_player_summary_cache(
+        seasons=[2021, 2022, 2023],
+        parts_directory=tmp_path / "parts",
+        output_path=tmp_path / "summary.parquet",
+        stats_loader=lambda *, seasons: _weekly_stats(seasons[0]),
+        pbp_loader=lambda *, seasons: pl.DataFrame(),
+    )
+
+    assert calls == {"mapping": 1, "bios": 1}
+    summary = pl.read_parquet(tmp_path / "summary.parquet")
+    assert summary["handedness"].to_list() == ["Right"] * 3
+
+
+def test_build_reuses_the_basic_and_impact_caches(tmp_path, monkeypatch):
+    basic_path = tmp_path / "basic.parquet"
+    impacts_path = tmp_path / "impacts.parquet"
+    pl.DataFrame(
+        {
+            "player_id": ["p1"],
+            "player_name": ["Test Player"],
+            "team": ["ABC"],
+            "season": [2021],
+            "passing_tds": [3],
+            "handedness": ["Left"],
+        },
+        schema_overrides={"season": pl.Int16},
+    ).write_parquet(basic_path)
+    pl.DataFrame(
+        {"player_id": ["p1"], "season": [2021], "qb_epa": [7.5]},
+        schema_overrides={"season": pl.Int16},
+    ).write_parquet(impacts_path)
+    monkeypatch.setattr(basic_cache, "CACHE_PATH", basic_path)
+    monkeypatch.setattr(player_impacts, "CACHE_PATH", impacts_path)
+    monkeypatch.setattr(basic_cache, "load_player_stats", None)
+
+    def no_download(*args, **kwargs):
+        raise AssertionError("cached season was downloaded again")
+
+    monkeypatch.setattr(impact_engine, "compute_season_impacts", no_download)
+
+    rows = player_summary_cache.build_player_summary_cache(
+        seasons=[2021],
+        force_refresh=True,
+        parts_directory=tmp_path / "parts",
+        output_path=tmp_path / "summary.parquet",
+    )
+
+    assert rows == 1
+    row = pl.read_parquet(tmp_path / "summary.parquet").row(0, named=True)
+    assert (row["handedness"], row["total_touchdowns"], row["qb_epa"]) == ("Left", 3, 7.5)
@@ -0,0 +1,103 @@
+"""Tests for the materialised player_summary view in the NFL data store."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from down_data.data.nfl_datastore import NFLDataStore
+
+
+@pytest.fixture
+def store(tmp_path, players_frame, seasons_frame) -> NFLDataStore:
+    store = NFLDataStore(data_dir=tmp_path)
+    store.initialize()
+    store.upsert_players(players_frame({"P2": "Second", "P1": "First"}))
+    store.upsert_player_seasons(seasons_frame([("P2", 2023, 15), ("P1", 2023, 17), ("P1", 2022, 16)]))
+    store.upsert_player_impacts(
+        pl.DataFrame(
+            {"player_id": ["P1"], "season": [2023], "qb_epa": [41.5]},
+            schema_overrides={"season": pl.Int16},
+        )
+    )
+    return store
+
+
+def test_view_is_materialised_sorted_by_player_with_bio_and_impacts(store):
+    view = pl.read_parquet(store.player_summary_path)
+    assert view.select("player_id", "season").rows() == [("P1", 2022), ("P1", 2023), ("P2", 2023)]
+
+    summary = store.get_player_summary("P1")
+    assert summary["season"].to_list() == [2022, 2023]
+    assert summary["full_name"].to_list() == ["First", "First"]
+    assert summary["qb_epa"].to_list() == [None, 41.5]
+    assert store.get_player_summary("P1", seasons=[2023])["games_played"].to_list() == [17]
+
+
+def test_summary_matches_on_the_fly_composition_without_a_view(store):
+    materialised = store.get_player_summary("P1")
+
+    store.player_summary_path.unlink()
+    composed = store.get_player_summary("P1")
+
+    # The view also carries the empty initial tables' full schema
+    assert materialised.select(composed.columns).equals(composed)
+
+
+def test_players_without_seasons_return_their_bio_row(store, players_frame):
+    store.upsert_players(players_frame({"R1": "Rookie"}))
+
+    rookie = store.get_player_summary("R1")
+
+    assert rookie["full_name"].to_list() == ["Rookie"]
+    assert store.get_player_summary("UNKNOWN").is_empty()
+
+
+def test_upserts_rebuild_only_the_seasons_they_touch(store, seasons_frame):
+    # Rename P1 behind the store's back, so only recomposed rows pick it up
+    players = store.load_players().with_columns(
+        pl.when(pl.col("player_id") == "P1").then(pl.lit("Renamed")).otherwise(pl.col("full_name")).alias("full_name")
+    )
+    players.write_parquet(store.players_path)
+    store._invalidate_cache(["players"])
+
+    store.upsert_player_seasons(seasons_frame([("P1", 2023, 12)]))
+
+    summary = store.get_player_summary("P1")
+    assert summary["full_name"].to_list() == ["First", "Renamed"]
+    assert summary["games_played"].to_list() == [16, 12]
+
+
+def test_bio_updates_refresh_every_season_of_that_player(store):
+    store.update_player_bios({"P1": {"college": "Tech"}})
+
+    assert store.get_player_summary("P1")["college"].to_list() == ["Tech", "Tech"]
+    assert store.get_player_summary("P2")["college"].to_list() == ["State"]
+
+
+def test_direct_table_saves_refresh_the_view(store):
+    seasons = store.load_player_seasons().with_columns(pl.lit(900, dtype=pl.Int32).alias("offense_snaps"))
+
+    store._save_player_seasons(seasons)
+
+    assert store.player_summary_is_current()
+    assert store.get_player_summary("P1")["offense_snaps"].to_list() == [900, 900]
+
+
+def test_stale_view_falls_back_to_composing_the_summary(store):
+    # A source write whose view rebuild never happened
+    seasons = store.load_player_seasons().with_columns(pl.lit(900, dtype=pl.Int32).alias("offense_snaps"))
+    seasons.write_parquet(store.player_seasons_path)
+    store._invalidate_cache(["player_seasons"])
+    store.load_metadata().bump_generation("player_seasons")
+
+    assert not store.player_summary_is_current()
+    assert store.get_player_summary("P1")["offense_snaps"].to_list() == [900, 900]
+
+    # The next scoped write rebuilds the whole stale view, not just its scope
+    store.upsert_player_impacts(
+        pl.DataFrame({"player_id": ["P2"], "season": [2023], "qb_epa": [1.0]}, schema_overrides={"season": pl.Int16})
+    )
+    assert store.player_summary_is_current()
+    view = pl.read_parquet(store.player_summary_path).filter(pl.col("player_id") == "P1")
+    assert view["offense_snaps"].to_list() == [900, 900]
@@ -0,0 +1,79 @@
+"""Tests for nflverse-first season snap counts with PFR gap filling."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+
+from down_data.data.pfr.jobs import ScrapeJob
+from down_data.data.season_snap_counts import (
+    aggregate_nflverse_snap_counts,
+    collect_season_snap_counts,
+    snap_count_gaps,
+)
+
+
+def _weekly_snaps() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "season": [2023, 2023, 2023],
+            "game_type": ["REG", "REG", "POST"],
+            "week": [1, 2, 19],
+            "pfr_player_id": ["AlleJo02", "AlleJo02", "AlleJo02"],
+            "team": ["BUF", "BUF", "BUF"],
+            "offense_snaps": [70.0, 65.0, 72.0],
+            "defense_snaps": [0.0, None, 0.0],
+            "st_snaps": [1.0, 2.0, 0.0],
+        }
+    )
+
+
+def test_aggregate_nflverse_snap_counts_sums_regular_season() -> None:
+    season = aggregate_nflverse_snap_counts(_weekly_snaps())
+
+    assert season.rows() == [("AlleJo02", 2023, "BUF", 135, 0, 3)]
+
+
+def test_snap_count_gaps_lists_uncovered_team_seasons() -> None:
+    season_teams = pl.DataFrame({"season": [2023, 2023], "team": ["BUF", "NYG"]})
+    snaps = aggregate_nflverse_snap_counts(_weekly_snaps())
+
+    assert snap_count_gaps(season_teams, snaps).rows() == [(2023, "NYG")]
+
+
+def test_collect_season_snap_counts_fills_gaps_from_pfr(tmp_path: Path) -> None:
+    job = ScrapeJob("pfr_snap_counts", directory=tmp_path)
+    # Checkpointed page from an earlier run: no request is needed for it
+    job.enqueue(["nyg/2023"])
+    job.complete_with_frame(
+        "nyg/2023",
+        pl.DataFrame(
+            {
+                "pfr_id": ["JoneDa05"],
+                "player_name": ["Daniel Jones"],
+                "position": ["QB"],
+                "_snap_offense": [500],
+                "_snap_defense": [0],
+                "_snap_st": [0],
+            }
+        ),
+    )
+    loads: list[list[int]] = []
+
+    def _loader(*, seasons):
+        loads.append(seasons)
+        return _weekly_snaps()
+
+    snaps = collect_season_snap_counts(
+        pl.DataFrame({"season": [2023, 2023, 2011], "team": ["BUF", "NYG", "BUF"]}),
+        team_to_slug=lambda team: {"NYG": "nyg", "BUF": "buf"}.get(team),
+        job=job,
+        loader=_loader,
+    )
+
+    assert loads == [[2023]]
+    assert sorted(snaps.rows()) == [
+        ("AlleJo02", 2023, "BUF", 135, 0, 3),
+        ("JoneDa05", 2023, "NYG", 500, 0, 0),
+    ]
@@ -0,0 +1,116 @@
+"""Unit tests for the UI background task scheduler."""
+
+from __future__ import annotations
+
+import threading
+import unittest
+
+import pytest
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from down_data.ui.task_scheduler import TaskCancelled, TaskPriority, TaskScheduler
+
+
+class TaskSchedulerTestCase(unittest.TestCase):
+    """Validate ordering, concurrency caps and cancellation."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(4)
+        self.scheduler = TaskScheduler(thread_pool=self.pool, category_limits={"work": 1})
+
+    def tearDown(self) -> None:
+        self.pool.waitForDone(5000)
+
+    @pytest.fixture(autouse=True)
+    def _use_wait_until(self, wait_until) -> None:
+        self._wait_until = wait_until
+
+    def test_pending_tasks_run_by_priority_within_category_cap(self) -> None:
+        gate = threading.Event()
+        order: list[str] = []
+
+        self.scheduler.submit(lambda token: gate.wait(5), category="work")
+        for label, priority in (
+            ("prefetch", TaskPriority.PREFETCH),
+            ("interactive", TaskPriority.INTERACTIVE),
+            ("visible", TaskPriority.VISIBLE),
+        ):
+            self.scheduler.submit(
+                lambda token, label=label: label,
+                category="work",
+                priority=priority,
+                on_finished=order.append,
+            )
+
+        self.assertEqual(self.scheduler.running_count("work"), 1)
+        self.assertEqual(self.scheduler.pending_count("work"), 3)
+        gate.set()
+        self._wait_until(lambda: len(order) == 3)
+
+        self.assertEqual(order, ["interactive", "visible", "prefetch"])
+        stats = self.scheduler.metrics()["work"]
+        self.assertEqual(stats.submitted, 4)
+        self.assertEqual(stats.completed, 4)
+
+    def test_cancelled_tasks_do_not_deliver_results(self) -> None:
+        gate = threading.Event()
+        started = threading.Event()
+        delivered: list[object] = []
+        dropped: list[str] = []
+
+        def _cooperative(token) -> str:
+            started.set()
+            gate.wait(5)
+            token.raise_if_cancelled()
+            return "running"
+
+        running = self.scheduler.submit(
+            _cooperative,
+            category="work",
+            on_finished=delivered.append,
+            on_cancelled=lambda: dropped.append("running"),
+        )
+        pending = self.scheduler.submit(
+            lambda token: "pending",
+            category="work",
+            on_finished=delivered.append,
+            on_cancelled=lambda: dropped.append("pending"),
+        )
+        started.wait(5)
+
+        running.cancel()
+        pending.cancel()
+        gate.set()
+        self._wait_until(lambda: self.scheduler.running_count("work") == 0)
+
+        self.assertEqual(delivered, [])
+        self.assertEqual(dropped, ["running", "pending"])
+        self.assertEqual(self.scheduler.metrics()["work"].cancelled, 2)
+
+    def test_errors_are_reported_on_error_callback(self) -> None:
+        errors: list[str] = []
+
+        def _fail(token) -> None:
+            raise ValueError("boom")
+
+        self.scheduler.submit(_fail, category="work", on_error=errors.append)
+        self._wait_until(lambda: bool(errors))
+
+        self.assertEqual(errors, ["boom"])
+        self.assertEqual(self.scheduler.metrics()["work"].failed, 1)
+
+    def test_token_raises_once_cancelled(self) -> None:
+        handle = self.scheduler.submit(lambda token: None, category="other")
+        handle.cancel()
+        with self.assertRaises(TaskCancelled):
+            handle.token.raise_if_cancelled()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()